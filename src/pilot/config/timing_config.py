@@ -44,6 +44,12 @@ class TimingConfig:
     accessibility_retry_count: int = 3
     """Number of retries for accessibility API queries"""
 
+    accessibility_walk_time_budget: float = 3.0
+    """Seconds a streamed element walk may run before returning partial results"""
+
+    accessibility_walk_node_budget: int = 5000
+    """Nodes a streamed element walk may visit before returning partial results"""
+
     # Timeouts
     applescript_timeout: int = 2
     """Timeout for AppleScript commands (seconds)"""
@@ -52,7 +52,10 @@ class ComputerUseCrew:
     @classmethod
     def request_cancellation(cls) -> None:
         """Request cancellation of current task execution."""
+        from .utils.threading.worker import cancel_accessibility_work
+
         cls._cancellation_requested = True
+        cancel_accessibility_work()
 
     @classmethod
     def clear_cancellation(cls) -> None:
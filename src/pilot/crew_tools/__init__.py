@@ -13,6 +13,7 @@ from .gui_basic_tools import (
     CheckAppRunningTool,
     GetAccessibleElementsTool,
     SearchElementsTool,
+    ExpandContainerTool,
     GetWindowImageTool,
     RequestHumanInputTool,
 )
@@ -38,6 +39,7 @@ __all__ = [
     "CheckAppRunningTool",
     "GetAccessibleElementsTool",
     "SearchElementsTool",
+    "ExpandContainerTool",
     "GetWindowImageTool",
     "RequestHumanInputTool",
     "WebAutomationTool",
@@ -12,7 +12,13 @@ from .instrumented_tool import InstrumentedBaseTool
 from ..schemas.actions import ActionResult
 from ..config.timing_config import get_timing_config
 from ..services.state import get_app_state
-from ..utils.ui import ActionType, action_spinner, dashboard, print_action_result
+from ..utils.ui import (
+    ActionType,
+    action_spinner,
+    dashboard,
+    print_action_result,
+    print_verbose_only,
+)
 
 
 def check_cancellation() -> Optional[ActionResult]:
@@ -282,9 +288,12 @@ class OpenApplicationTool(InstrumentedBaseTool):
                     error=result.get("message", "Launch failed"),
                 )
 
-            get_app_state().set_target_app(app_name)
+            app_state = get_app_state()
+            app_state.set_target_app(app_name, prefetch=False)
 
             app_ready = self._wait_for_app_ready(app_name, timeout=5.0)
+            if app_ready:
+                app_state.prefetch_elements(app_name, fresh=True)
             is_focused = self._ensure_app_focused(app_name, process_tool)
 
             if app_ready and is_focused:
@@ -352,10 +361,19 @@ class ReadScreenInput(BaseModel):
 
 
 class ReadScreenTextTool(InstrumentedBaseTool):
-    """Extract text from screen using OCR."""
+    """
+    Extract text from the screen or an app window.
+
+    For an app window, backends that read document text through the
+    accessibility API are tried first; OCR is the fallback.
+    """
 
     name: str = "read_screen_text"
-    description: str = "Extract text from screen or app window via OCR."
+    description: str = (
+        "Extract text from screen or app window. For an app window the text is "
+        "read through the accessibility API when available, otherwise via OCR."
+    )
+    max_accessible_chars: int = 20_000
     args_schema: type[BaseModel] = ReadScreenInput
 
     def _run(
@@ -374,6 +392,11 @@ class ReadScreenTextTool(InstrumentedBaseTool):
         if cancelled := check_cancellation():
             return cancelled
 
+        if app_name and not region:
+            result = self._read_accessible_text(app_name)
+            if result is not None:
+                return result
+
         screenshot_tool = self._tool_registry.get_tool("screenshot")
         ocr_tool = self._tool_registry.get_tool("ocr")
 
@@ -443,6 +466,55 @@ class ReadScreenTextTool(InstrumentedBaseTool):
                 error=str(e),
             )
 
+    def _read_accessible_text(self, app_name: str) -> Optional[ActionResult]:
+        """
+        Read an app's text through the accessibility API, without OCR.
+
+        Consumes the text stream only up to max_accessible_chars, so the
+        rest of a long document is never read.
+
+        Returns:
+            ActionResult, or None if the backend cannot read document text
+            or found none (the caller falls back to OCR)
+        """
+        accessibility_tool = self._tool_registry.get_tool("accessibility")
+        if not accessibility_tool or not accessibility_tool.available:
+            return None
+        if not getattr(accessibility_tool, "supports_text_extraction", False):
+            return None
+
+        pieces: list[str] = []
+        length = 0
+        truncated = False
+        try:
+            for piece in accessibility_tool.stream_text(app_name):
+                if length >= self.max_accessible_chars:
+                    truncated = True
+                    break
+                pieces.append(piece)
+                length += len(piece) + 1
+        except Exception:
+            return None
+
+        full_text = "\n".join(p.rstrip("\n") for p in pieces)
+        if not full_text.strip():
+            return None
+
+        from ..utils.ui.core.responsive import ResponsiveWidth
+
+        text_preview = ResponsiveWidth.truncate(full_text, max_ratio=0.8, min_width=60)
+        return ActionResult(
+            success=True,
+            action_taken=f"Read text from {app_name} window: {text_preview}",
+            method_used="accessibility",
+            confidence=1.0,
+            data={
+                "text": full_text[: self.max_accessible_chars],
+                "count": len(pieces),
+                "truncated": truncated,
+            },
+        )
+
 
 class ScrollInput(BaseModel):
     """Input for scrolling."""
@@ -647,6 +719,26 @@ class GetAccessibleElementsInput(BaseModel):
         default=None,
         description="Filter by element role/type (TextField, TextArea, Button, CheckBox, MenuItem, etc.)",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor from a previous partial scan. Continues that scan and returns only the remaining elements.",
+    )
+    scope: Optional[str] = Field(
+        default=None,
+        description=(
+            "Limit the scan: 'app' (default, all windows), 'window' (focused window), "
+            "'dialog' (topmost dialog), 'subtree' (element_id and its descendants) "
+            "or 'region' (elements intersecting region). Faster than a full scan."
+        ),
+    )
+    element_id: Optional[str] = Field(
+        default=None,
+        description="Root element for scope='subtree' (e.g. a toolbar or panel ID)",
+    )
+    region: Optional[dict[str, int]] = Field(
+        default=None,
+        description="Screen region for scope='region': {x, y, width, height}",
+    )
 
 
 _get_elements_state = {"last_hash": "", "repeat_count": 0}
@@ -673,6 +765,78 @@ since they're commonly needed for interaction (typing, form filling).
 """
 
 
+def _container_fields(elem: dict) -> dict:
+    """Fields of a collapsed container or table, or {} for other elements."""
+    fields: dict = {}
+    if elem.get("collapsed"):
+        fields.update(
+            collapsed=True,
+            child_count=elem.get("child_count", 0),
+            preview=list(elem.get("preview") or []),
+        )
+    if elem.get("table"):
+        fields["table"] = elem["table"]
+    return fields
+
+
+def _to_display_element(elem: dict) -> dict:
+    """Project a raw accessibility element onto the fields shown to the LLM."""
+    label = elem.get("label", "") or elem.get("role", "")
+    title = elem.get("title", "") or elem.get("role", "")
+
+    return {
+        "element_id": elem.get("element_id", ""),
+        "label": label,
+        "title": title,
+        "role": elem.get("role", ""),
+        "identifier": elem.get("identifier", ""),
+        "bounds": list(elem.get("bounds", [])),
+        "center": list(elem.get("center", [])),
+        "category": elem.get("category", "interactive"),
+        "focused": elem.get("focused", False),
+        "is_bottom": elem.get("is_bottom", False),
+        **_container_fields(elem),
+    }
+
+
+def _stream_display_elements(
+    accessibility_tool: Any, app_name: str, cursor: Optional[str]
+) -> Optional[tuple]:
+    """
+    Read elements through a budgeted stream, formatting them as they arrive.
+
+    Args:
+        accessibility_tool: Platform accessibility tool
+        app_name: Application name
+        cursor: Resume cursor from a previous partial scan
+
+    Returns:
+        Tuple of (elements, display_elements, stream), or None if the
+        backend does not provide an element stream
+    """
+    from ..tools.accessibility.traversal import ElementStream, TraversalBudget
+
+    timing = get_timing_config()
+    stream = accessibility_tool.stream_elements(
+        app_name,
+        interactive_only=True,
+        budget=TraversalBudget(
+            max_nodes=timing.accessibility_walk_node_budget,
+            max_seconds=timing.accessibility_walk_time_budget,
+        ),
+        cursor=cursor,
+    )
+    if not isinstance(stream, ElementStream):
+        return None
+
+    elements = []
+    display_elements = []
+    for elem in stream:
+        elements.append(elem)
+        display_elements.append(_to_display_element(elem))
+    return elements, display_elements, stream
+
+
 def _get_element_priority(element: dict) -> tuple:
     """Get sort priority for element - input fields first, then by position."""
     role = (element.get("role") or "").lower()
@@ -817,35 +981,34 @@ def _apply_ocr_labels(
     if not screen_items:
         return
 
-    for elem in elements:
-        label = (elem.get("label") or "").strip()
-        if _is_meaningful_label(label):
-            continue
-
-        bounds = elem.get("bounds") or []
-        if len(bounds) != 4:
-            continue
-
-        x, y, w, h = bounds
-        best_text = None
-        best_conf = -1.0
-        best_len = 9999
-
-        for item in screen_items:
-            cx, cy = item["center"]
-            if not (x <= cx <= x + w and y <= cy <= y + h):
-                continue
-            text = item["text"]
-            conf = item["confidence"]
-            text_len = len(text)
-            if conf > best_conf or (conf == best_conf and text_len < best_len):
-                best_text = text
-                best_conf = conf
-                best_len = text_len
+    from ..tools.accessibility.spatial_index import SpatialIndex
 
-        if best_text:
-            elem["label"] = best_text
-            elem["title"] = best_text
+    unlabeled = [
+        elem
+        for elem in elements
+        if not _is_meaningful_label((elem.get("label") or "").strip())
+        and len(elem.get("bounds") or []) == 4
+    ]
+    index = SpatialIndex(unlabeled)
+    best: dict = {}
+
+    for item in screen_items:
+        text = item["text"]
+        conf = item["confidence"]
+        for elem in index.containing(*item["center"]):
+            current = best.get(id(elem))
+            if (
+                current is None
+                or conf > current[1]
+                or (conf == current[1] and len(text) < len(current[0]))
+            ):
+                best[id(elem)] = (text, conf)
+
+    for elem in unlabeled:
+        match = best.get(id(elem))
+        if match:
+            elem["label"] = match[0]
+            elem["title"] = match[0]
 
 
 def _format_label_id(label: str, element_id: str, max_len: int = 22) -> str:
@@ -866,6 +1029,62 @@ def _format_label_id(label: str, element_id: str, max_len: int = 22) -> str:
     return f"{lbl}({element_id})"
 
 
+def _format_container_handle(elem: dict) -> str:
+    """
+    Format a collapsed container with its child count and preview.
+
+    Returns:
+        String like: "List: Inbox(e_1234567) [250 items: Re: Budget, Lunch, …]"
+    """
+    role = elem.get("role") or "Container"
+    label = (elem.get("label") or "").strip() or "[unlabeled]"
+    count = elem.get("child_count", 0)
+    preview = [p for p in (elem.get("preview") or []) if p]
+    items = f"{count} items"
+    if preview:
+        shown = ", ".join(_format_preview(p) for p in preview)
+        items += f": {shown}" + (", …" if count > len(preview) else "")
+    return f"{role}: {_format_label_id(label, elem.get('element_id') or '')} [{items}]"
+
+
+def _format_table(elem: dict, max_rows: int = 10) -> list[str]:
+    """
+    Format a table snapshot: a summary line, then its first visible rows.
+
+    Returns:
+        Lines like:
+        "Table: Messages(e_1234567) [250 rows × 3 columns: From | Subject | Date]"
+        "  row 12: Alice | Lunch | Mon"
+    """
+    from ..tools.accessibility.tables import TableSnapshot
+
+    snapshot = TableSnapshot.from_dict(elem["table"])
+    role = elem.get("role") or "Table"
+    label = _format_label_id(
+        (elem.get("label") or "").strip() or "[unlabeled]",
+        elem.get("element_id") or "",
+    )
+    headers = " | ".join(_format_preview(h) for h in snapshot.columns if h)
+    shape = f"{snapshot.rows} rows × {len(snapshot.columns)} columns"
+    if headers:
+        shape += f": {headers}"
+    lines = [f"{role}: {label} [{shape}]"]
+    for offset, cells in enumerate(snapshot.cells[:max_rows]):
+        texts = " | ".join(_format_preview(text) for text in cells)
+        lines.append(f"  row {snapshot.first_row + offset}: {texts}")
+    shown = min(len(snapshot.cells), max_rows)
+    if shown < snapshot.rows:
+        last = snapshot.first_row + shown - 1
+        lines.append(f"  (rows {snapshot.first_row}-{last} of {snapshot.rows} shown)")
+    return lines
+
+
+def _format_preview(label: str, max_len: int = 20) -> str:
+    """Truncate a preview label."""
+    label = label.strip()
+    return label if len(label) <= max_len else label[: max_len - 1].rstrip() + "…"
+
+
 def _select_smart_compact_elements(
     elements: list, max_total: int = 20
 ) -> tuple[list[dict], int]:
@@ -876,6 +1095,8 @@ def _select_smart_compact_elements(
 
     Strategy:
     - ALWAYS include ALL input fields (TextField, TextArea) - these are critical
+    - Then collapsed containers and tables, which stand for everything
+      inside them
     - Then include labeled interactive elements by role priority
     - Prefer unique labels and top-to-bottom layout ordering
 
@@ -893,6 +1114,7 @@ def _select_smart_compact_elements(
 
     by_role: dict[str, list[dict]] = defaultdict(list)
     input_elements: list[dict] = []
+    containers: list[dict] = []
     label_counts: dict[str, int] = {}
 
     for e in elements:
@@ -900,6 +1122,9 @@ def _select_smart_compact_elements(
         role_lower = role.lower()
         label = (e.get("label") or "").strip()
 
+        if e.get("collapsed") or e.get("table"):
+            containers.append(e)
+            continue
         if _is_meaningful_label(label):
             label_counts[label] = label_counts.get(label, 0) + 1
             by_role[role].append(e)
@@ -923,7 +1148,7 @@ def _select_smart_compact_elements(
     selected: list[dict] = []
     seen_ids: set[str] = set()
 
-    for e in input_elements:
+    for e in input_elements + sorted(containers, key=_get_element_priority):
         eid = e.get("element_id") or ""
         if eid and eid not in seen_ids:
             selected.append(e)
@@ -970,7 +1195,9 @@ def _format_elements_smart_compact(selected: list[dict], hidden_count: int) -> s
     """
     Format a smart-compact list of elements for minimal token usage.
 
-    Separates INPUT FIELDS (where you type) from other UI elements for clarity.
+    Separates INPUT FIELDS (where you type) from other UI elements for clarity,
+    and lists collapsed containers with their item counts and tables with
+    their visible rows.
 
     Args:
         selected: Selected elements to display
@@ -980,6 +1207,8 @@ def _format_elements_smart_compact(selected: list[dict], hidden_count: int) -> s
         Multi-line formatted summary with input fields prominently displayed
     """
     input_fields: list[str] = []
+    containers: list[str] = []
+    tables: list[str] = []
     by_role: dict[str, list[str]] = {}
 
     for e in selected:
@@ -988,6 +1217,12 @@ def _format_elements_smart_compact(selected: list[dict], hidden_count: int) -> s
         eid = e.get("element_id") or ""
         if not eid:
             continue
+        if e.get("table"):
+            tables.extend(_format_table(e))
+            continue
+        if e.get("collapsed"):
+            containers.append(_format_container_handle(e))
+            continue
 
         role_lower = role.lower()
         is_input_role = role_lower in INPUT_PRIORITY_ROLES
@@ -1052,6 +1287,16 @@ def _format_elements_smart_compact(selected: list[dict], hidden_count: int) -> s
         lines.extend(input_fields)
         lines.append("")
 
+    if containers:
+        lines.append("═══ COLLAPSED CONTAINERS (expand_container to list items) ═══")
+        lines.extend(containers)
+        lines.append("")
+
+    if tables:
+        lines.append("═══ TABLES (click_element with element_id, row, column) ═══")
+        lines.extend(tables)
+        lines.append("")
+
     for role in role_order:
         items = by_role.pop(role, [])
         if items:
@@ -1086,6 +1331,10 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
         app_name: Optional[str] = None,
         filter_text: Optional[str] = None,
         filter_role: Optional[str] = None,
+        cursor: Optional[str] = None,
+        scope: Optional[str] = None,
+        element_id: Optional[str] = None,
+        region: Optional[dict[str, int]] = None,
     ) -> ActionResult:
         """
         Get all accessible elements from app using comprehensive UI element detection.
@@ -1094,6 +1343,10 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
             app_name: Application name (optional, uses current target if not provided)
             filter_text: Optional text to filter elements by label/title
             filter_role: Optional role/type to filter elements by (TextField, Button, etc.)
+            cursor: Resume cursor from a previous partial scan
+            scope: Part of the app to scan (app, window, dialog, subtree, region)
+            element_id: Root element for the subtree scope
+            region: Screen region for the region scope
 
         Returns:
             ActionResult with categorized list of elements
@@ -1112,6 +1365,19 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
             )
         app_name = effective_app
 
+        from ..tools.accessibility.traversal import TraversalScope
+
+        try:
+            traversal_scope = TraversalScope.parse(scope, element_id, region)
+        except ValueError as e:
+            return ActionResult(
+                success=False,
+                action_taken=f"Invalid scope for {app_name}",
+                method_used="accessibility",
+                confidence=0.0,
+                error=str(e),
+            )
+
         if not hasattr(self, "_tool_registry") or self._tool_registry is None:
             return ActionResult(
                 success=False,
@@ -1143,29 +1409,63 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
             timing = get_timing_config()
             retry_count = max(1, timing.accessibility_retry_count)
             elements = []
+            display_elements = None
+            stream = None
             app_ref = None
             windows = []
+            if dashboard.is_verbose:
+                accessibility_tool.enable_profiling().reset()
             with action_spinner("Scanning", f"{app_name} UI"):
-                for attempt in range(retry_count):
-                    if attempt == 0:
-                        accessibility_tool.invalidate_cache(app_name)
-
-                    use_cache = attempt == 0
-                    elements = accessibility_tool.get_elements(
-                        app_name, interactive_only=True, use_cache=use_cache
+                if not traversal_scope.whole_app:
+                    elements = accessibility_tool.get_scoped_elements(
+                        app_name, traversal_scope, interactive_only=True
                     )
-                    if elements:
-                        break
+                else:
+                    for attempt in range(retry_count):
+                        streamed = None
+                        if attempt == 0:
+                            if not cursor:
+                                accessibility_tool.revalidate_cache(app_name)
+                            streamed = _stream_display_elements(
+                                accessibility_tool, app_name, cursor
+                            )
+
+                        if streamed is not None:
+                            elements, display_elements, stream = streamed
+                        else:
+                            display_elements = None
+                            stream = None
+                            use_cache = attempt == 0
+                            elements = accessibility_tool.get_elements(
+                                app_name, interactive_only=True, use_cache=use_cache
+                            )
+                        if elements:
+                            break
+
+                        app_ref = accessibility_tool.get_app(app_name, retry_count=1)
+                        windows = (
+                            accessibility_tool.get_windows(app_ref) if app_ref else []
+                        )
 
-                    app_ref = accessibility_tool.get_app(app_name, retry_count=1)
-                    windows = accessibility_tool.get_windows(app_ref) if app_ref else []
+                        if windows:
+                            time.sleep(timing.accessibility_api_delay)
+                        else:
+                            time.sleep(timing.app_launch_retry_interval)
 
-                    if windows:
-                        time.sleep(timing.accessibility_api_delay)
-                    else:
-                        time.sleep(timing.app_launch_retry_interval)
+                        accessibility_tool.invalidate_cache(app_name)
 
-                    accessibility_tool.invalidate_cache(app_name)
+            if not elements and not traversal_scope.whole_app:
+                return ActionResult(
+                    success=True,
+                    action_taken=(
+                        f"No elements found in the {traversal_scope.describe()} "
+                        f"of {app_name}. Call get_accessible_elements without "
+                        "scope to scan the whole app."
+                    ),
+                    method_used="accessibility",
+                    confidence=0.5,
+                    data={"elements": [], "count": 0, "scope": traversal_scope.kind},
+                )
 
             if not elements:
                 if app_ref is None:
@@ -1193,6 +1493,8 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
                         process_tool.focus_app(app_name)
                         time.sleep(timing.app_focus_delay)
                         accessibility_tool.invalidate_cache(app_name)
+                        display_elements = None
+                        stream = None
                         elements = accessibility_tool.get_elements(
                             app_name, interactive_only=True, use_cache=False
                         )
@@ -1221,6 +1523,15 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
                     )
 
             print_action_result(True, f"Found {len(elements)} elements")
+            if dashboard.is_verbose:
+                from ..tools.accessibility.cache_manager import format_cache_stats
+                from ..tools.accessibility.instrumentation import format_profile
+
+                profile = accessibility_tool.get_traversal_profile()
+                for line in format_profile(profile):
+                    print_verbose_only(line)
+                for line in format_cache_stats(accessibility_tool.get_cache_stats()):
+                    print_verbose_only(line)
 
             window_bounds = None
             if hasattr(accessibility_tool, "get_app_window_bounds"):
@@ -1233,27 +1544,10 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
             )
             _ = (window_y_start, window_height)
 
-            normalized_elements = []
-            for elem in elements:
-                bounds = list(elem.get("bounds", []))
-                center = list(elem.get("center", []))
-
-                label = elem.get("label", "") or elem.get("role", "")
-                title = elem.get("title", "") or elem.get("role", "")
-
-                normalized = {
-                    "element_id": elem.get("element_id", ""),
-                    "label": label,
-                    "title": title,
-                    "role": elem.get("role", ""),
-                    "identifier": elem.get("identifier", ""),
-                    "bounds": bounds,
-                    "center": center,
-                    "category": elem.get("category", "interactive"),
-                    "focused": elem.get("focused", False),
-                    "is_bottom": elem.get("is_bottom", False),
-                }
-                normalized_elements.append(normalized)
+            if display_elements is not None:
+                normalized_elements = display_elements
+            else:
+                normalized_elements = [_to_display_element(e) for e in elements]
 
             normalized_elements.sort(key=_get_element_priority)
 
@@ -1345,22 +1639,37 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
                         "label": e.get("label", ""),
                         "title": e.get("title", ""),
                         "center": e.get("center", []),
+                        **_container_fields(e),
                     }
                 )
 
+            truncated_msg = ""
+            data = {
+                "elements": data_elements,
+                "returned_count": len(data_elements),
+                "total_count": len(normalized_elements),
+            }
+            if not traversal_scope.whole_app:
+                data["scope"] = traversal_scope.kind
+            if stream is not None and stream.truncated:
+                truncated_msg = (
+                    f"\n\nPARTIAL SCAN: stopped after {stream.nodes_visited} nodes. "
+                    f"Call get_accessible_elements with cursor='{stream.cursor}' "
+                    "to continue the scan."
+                )
+                data["truncated"] = True
+                data["cursor"] = stream.cursor
+
             return ActionResult(
                 success=True,
                 action_taken=(
                     f"Found {len(normalized_elements)} elements in {app_name}: "
                     f"{brief_summary}{ui_changed_msg}\n\n{elements_summary}"
+                    f"{truncated_msg}"
                 ),
                 method_used="accessibility",
                 confidence=1.0,
-                data={
-                    "elements": data_elements,
-                    "returned_count": len(data_elements),
-                    "total_count": len(normalized_elements),
-                },
+                data=data,
             )
 
         except Exception as e:
@@ -1657,9 +1966,12 @@ class SearchElementsTool(InstrumentedBaseTool):
             )
 
         try:
-            elements = accessibility_tool.get_elements(
-                effective_app, interactive_only=True, use_cache=True
-            )
+            elements = accessibility_tool.get_skeleton_elements(effective_app)
+            from_skeleton = isinstance(elements, list) and bool(elements)
+            if not from_skeleton:
+                elements = accessibility_tool.get_elements(
+                    effective_app, interactive_only=True, use_cache=True
+                )
 
             if not elements:
                 return ActionResult(
@@ -1670,10 +1982,10 @@ class SearchElementsTool(InstrumentedBaseTool):
                     data={"results": [], "count": 0},
                 )
 
-            from ..services.element_index import index_elements, search_elements
+            from ..services.element_index import sync_app_elements
 
-            index_elements(elements)
-            results = search_elements(query, role_filter, max_results)
+            index = sync_app_elements(effective_app, elements)
+            results = index.search(query, role_filter, max_results)
 
             if not results:
                 return ActionResult(
@@ -1707,6 +2019,7 @@ class SearchElementsTool(InstrumentedBaseTool):
                     "results": result_list,
                     "count": len(results),
                     "total_indexed": len(elements),
+                    "from_skeleton": from_skeleton,
                 },
             )
 
@@ -1718,3 +2031,109 @@ class SearchElementsTool(InstrumentedBaseTool):
                 confidence=0.0,
                 error=str(e),
             )
+
+
+class ExpandContainerInput(BaseModel):
+    """Input for expanding a collapsed container."""
+
+    element_id: str = Field(
+        description="Element ID of a collapsed container from get_accessible_elements"
+    )
+    offset: int = Field(
+        default=0,
+        description="Index of the first item to list (use next_offset to page)",
+    )
+    limit: Optional[int] = Field(
+        default=None,
+        description="Number of items to list (default: 50)",
+    )
+
+
+class ExpandContainerTool(InstrumentedBaseTool):
+    """
+    List the items of a collapsed container, one page at a time.
+
+    get_accessible_elements does not walk into very large lists, trees and
+    outlines; it shows them as collapsed containers with an item count and
+    a preview. This tool reads a page of their items and returns element
+    IDs usable with click_element.
+    """
+
+    name: str = "expand_container"
+    description: str = (
+        "List items of a collapsed container (large list/tree), paginated."
+    )
+    args_schema: type[BaseModel] = ExpandContainerInput
+
+    def _run(
+        self, element_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> ActionResult:
+        """
+        Expand one page of a collapsed container.
+
+        Args:
+            element_id: Element ID of the container
+            offset: Index of the first item to list
+            limit: Number of items to list (None = backend page size)
+
+        Returns:
+            ActionResult with the page's elements and the next offset
+        """
+        if cancelled := check_cancellation():
+            return cancelled
+
+        accessibility_tool = self._tool_registry.get_tool("accessibility")
+        if not accessibility_tool or not accessibility_tool.available:
+            return ActionResult(
+                success=False,
+                action_taken="Accessibility not available",
+                method_used="expand_container",
+                confidence=0.0,
+                error="Accessibility API unavailable",
+            )
+
+        try:
+            page = accessibility_tool.expand_container(element_id, offset, limit)
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action_taken=f"Failed to expand {element_id}",
+                method_used="expand_container",
+                confidence=0.0,
+                error=str(e),
+            )
+
+        if page.error:
+            return ActionResult(
+                success=False,
+                action_taken=f"Could not expand {element_id}",
+                method_used="expand_container",
+                confidence=0.0,
+                error=page.error,
+            )
+
+        last = page.offset + page.children_read
+        lines = [
+            f"Items {page.offset + 1}-{last} of {page.total} in {element_id} "
+            f"({len(page.elements)} elements):"
+        ]
+        if page.elements:
+            lines.append(_format_elements_smart_compact(page.elements, 0))
+        if page.next_offset is not None:
+            lines.append(
+                f"\nMore items: expand_container(element_id='{element_id}', "
+                f"offset={page.next_offset})"
+            )
+
+        return ActionResult(
+            success=True,
+            action_taken="\n".join(lines),
+            method_used="expand_container",
+            confidence=1.0,
+            data={
+                "elements": [_to_display_element(e) for e in page.elements],
+                "offset": page.offset,
+                "total": page.total,
+                "next_offset": page.next_offset,
+            },
+        )
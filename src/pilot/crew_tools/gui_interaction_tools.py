@@ -4,7 +4,7 @@ Refactored for clarity: discovery separate from execution.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Union
 
 from .instrumented_tool import InstrumentedBaseTool
 from ..schemas.actions import ActionResult
@@ -58,6 +58,14 @@ class ClickInput(BaseModel):
         default=None,
         description="Spatial context for OCR fallback only.",
     )
+    row: Optional[int] = Field(
+        default=None,
+        description="Table row number (from 1) when element_id is a table.",
+    )
+    column: Optional[Union[int, str]] = Field(
+        default=None,
+        description="Table column header or number (from 1); default first column.",
+    )
     click_type: str = Field(
         default="single", description="Click type: single, double, or right"
     )
@@ -88,6 +96,7 @@ class ClickElementTool(InstrumentedBaseTool):
     name: str = "click_element"
     description: str = """Click element.
     BEST: element_id='<id>' from get_accessible_elements (native click, no duplicates)
+    TABLE CELL: element_id='<table id>', row=<n>, column='<header>' or <n>
     FALLBACK (only if allow_cursor_fallback=True): element=<dict with center>
     LAST (only if allow_cursor_fallback=True): OCR with target and visual_context"""
     args_schema: type[BaseModel] = ClickInput
@@ -99,6 +108,8 @@ class ClickElementTool(InstrumentedBaseTool):
         element_id: Optional[str] = None,
         element: Optional[dict] = None,
         visual_context: Optional[str] = None,
+        row: Optional[int] = None,
+        column: Optional[Union[int, str]] = None,
         click_type: str = "single",
         allow_cursor_fallback: bool = False,
         current_app: Optional[str] = None,
@@ -112,6 +123,8 @@ class ClickElementTool(InstrumentedBaseTool):
             element_id: Unique ID from get_accessible_elements (best method)
             element: Element dict with 'center' [x, y]
             visual_context: Spatial context for OCR fallback
+            row: Table row to click when element_id is a table
+            column: Table column (header or number) to click in that row
             click_type: single/double/right
             allow_cursor_fallback: Allow cursor/OCR fallback if accessibility fails
             current_app: Current app name
@@ -163,6 +176,20 @@ class ClickElementTool(InstrumentedBaseTool):
                     confidence=0.0,
                     error=f"Invalid element_id '{element_id}'. Use the element_id from get_accessible_elements (starts with 'e_').",
                 )
+            if row is not None:
+                with action_spinner("Clicking", target):
+                    success, message = accessibility_tool.click_table_cell(
+                        element_id, row, column, click_type=click_type
+                    )
+                print_action_result(success, message)
+                return ActionResult(
+                    success=success,
+                    action_taken=message,
+                    method_used="accessibility_native",
+                    confidence=1.0 if success else 0.0,
+                    error=None if success else message,
+                    data={"requires_verification": False},
+                )
             if hasattr(accessibility_tool, "click_by_id"):
                 with action_spinner("Clicking", target):
                     try:
@@ -580,13 +607,21 @@ class ClickElementTool(InstrumentedBaseTool):
         target_lower: str,
         window_bounds: Optional[tuple[int, int, int, int]],
     ) -> Optional[dict]:
+        """
+        Pick the element best matching a screen point and target text.
+
+        Only elements containing the point or centered within 400px of it
+        can score on distance, so only those are considered.
+        """
         import math
 
+        from ..tools.accessibility.spatial_index import SpatialIndex
+
         px, py = point
         best = None
         best_score = -1.0
 
-        for elem in elements:
+        for elem in SpatialIndex(elements).around(px, py, 400.0):
             bounds = elem.get("bounds") or []
             center = elem.get("center") or []
             if len(bounds) != 4 or len(center) != 2:
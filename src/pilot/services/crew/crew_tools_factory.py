@@ -27,6 +27,7 @@ class CrewToolsFactory:
         """
         from ...crew_tools.gui_basic_tools import (
             CheckAppRunningTool,
+            ExpandContainerTool,
             GetAccessibleElementsTool,
             GetWindowImageTool,
             ListRunningAppsTool,
@@ -57,6 +58,7 @@ class CrewToolsFactory:
             "get_window_image": GetWindowImageTool(),
             "find_application": FindApplicationTool(),
             "search_elements": SearchElementsTool(),
+            "expand_container": ExpandContainerTool(),
             "request_human_input": RequestHumanInputTool(),
             "analyze_image": AnalyzeImageTool(),
         }
@@ -4,11 +4,21 @@ Searchable element index for finding ANY element in an application.
 This service enables discovery of elements beyond the top 30 displayed
 by the get_accessible_elements tool. It provides fuzzy search and
 filtering capabilities.
+
+Each application keeps its own index. A new snapshot is applied with
+sync(), which only touches elements whose IDs were added or removed, so
+searches after a refresh do not rebuild the role and word maps. The
+number of indexed applications is bounded by an LRU.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import math
+from collections import Counter, OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 
+Document = Tuple[str, str]
+
 
 @dataclass
 class SearchResult:
@@ -28,18 +38,42 @@ class ElementIndex:
 
     This class stores ALL elements (not just top 30) and provides
     search capabilities for finding specific elements.
+
+    Searchable text is grouped into documents: elements with the same
+    label and identifier (e.g. thousands of "table cell" entries) share one
+    document, so word and trigram buckets stay small and ranking cost
+    follows the number of distinct texts. Buckets are insertion-ordered
+    dicts, so an element can be removed without scanning them.
     """
 
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    BM25_WEIGHT = 40.0
+    MIN_GRAM_OVERLAP = 0.5
+    MAX_EDIT_DISTANCE = 2
+    RERANK_FACTOR = 4
+    RERANK_MIN = 50
+
     def __init__(self):
         self._elements: Dict[str, Dict[str, Any]] = {}
-        self._by_role: Dict[str, List[str]] = {}
-        self._by_label_words: Dict[str, List[str]] = {}
+        self._by_role: Dict[str, Dict[str, None]] = {}
+        self._by_label_words: Dict[str, Dict[Document, None]] = {}
+        self._by_trigram: Dict[str, Dict[Document, None]] = {}
+        self._documents: Dict[Document, Dict[str, None]] = {}
+        self._keys: Dict[str, Tuple[str, str, str]] = {}
+        self._gram_counts: Dict[Document, int] = {}
+        self._total_grams = 0
 
     def clear(self) -> None:
         """Clear the index."""
         self._elements.clear()
         self._by_role.clear()
         self._by_label_words.clear()
+        self._by_trigram.clear()
+        self._documents.clear()
+        self._keys.clear()
+        self._gram_counts.clear()
+        self._total_grams = 0
 
     def index_elements(self, elements: List[Dict[str, Any]]) -> int:
         """
@@ -55,25 +89,112 @@ class ElementIndex:
 
         for elem in elements:
             element_id = elem.get("element_id", "")
-            if not element_id:
-                continue
+            if element_id and element_id not in self._elements:
+                self.add(element_id, elem)
 
-            self._elements[element_id] = elem
+        return len(self._elements)
 
-            role = (elem.get("role") or "").lower()
-            if role:
-                if role not in self._by_role:
-                    self._by_role[role] = []
-                self._by_role[role].append(element_id)
+    def sync(self, elements: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Make the index match a new snapshot, touching only what changed.
 
-            label = elem.get("label") or ""
-            words = self._extract_words(label)
-            for word in words:
-                if word not in self._by_label_words:
-                    self._by_label_words[word] = []
-                self._by_label_words[word].append(element_id)
+        Elements whose ID is still present with the same role and label
+        keep their map entries; only the stored dict is swapped.
 
-        return len(self._elements)
+        Args:
+            elements: Current element list (IDs assigned by the element store)
+
+        Returns:
+            Tuple of (added, removed) element counts
+        """
+        current: Dict[str, Dict[str, Any]] = {}
+        for elem in elements:
+            element_id = elem.get("element_id", "")
+            if element_id and element_id not in current:
+                current[element_id] = elem
+
+        removed = [eid for eid in self._elements if eid not in current]
+        for element_id in removed:
+            self.remove(element_id)
+
+        added = 0
+        for element_id, elem in current.items():
+            if element_id not in self._elements:
+                self.add(element_id, elem)
+                added += 1
+            elif self._keys[element_id] != self._key_of(elem):
+                self.remove(element_id)
+                self.add(element_id, elem)
+                added += 1
+            else:
+                self._elements[element_id] = elem
+
+        return added, len(removed)
+
+    def add(self, element_id: str, elem: Dict[str, Any]) -> None:
+        """Index one element under its role and label words."""
+        self._elements[element_id] = elem
+        key = self._key_of(elem)
+        self._keys[element_id] = key
+
+        role, label, identifier = key
+        if role:
+            self._by_role.setdefault(role, {})[element_id] = None
+
+        document = (label.lower(), identifier.lower())
+        members = self._documents.get(document)
+        if members is None:
+            members = self._documents[document] = {}
+            for word in self._extract_words(label):
+                self._by_label_words.setdefault(word, {})[document] = None
+            grams = self._trigrams(label, identifier)
+            for gram in grams:
+                self._by_trigram.setdefault(gram, {})[document] = None
+            self._gram_counts[document] = len(grams)
+            self._total_grams += len(grams)
+        members[element_id] = None
+
+    def remove(self, element_id: str) -> None:
+        """Drop one element and its role and word entries."""
+        if self._elements.pop(element_id, None) is None:
+            return
+        role, label, identifier = self._keys.pop(element_id)
+        self._discard(self._by_role, role, element_id)
+
+        document = (label.lower(), identifier.lower())
+        self._discard(self._documents, document, element_id)
+        if document in self._documents:
+            return
+        for word in self._extract_words(label):
+            self._discard(self._by_label_words, word, document)
+        for gram in self._trigrams(label, identifier):
+            self._discard(self._by_trigram, gram, document)
+        self._total_grams -= self._gram_counts.pop(document, 0)
+
+    @staticmethod
+    def _key_of(elem: Dict[str, Any]) -> Tuple[str, str, str]:
+        return (
+            (elem.get("role") or "").lower(),
+            elem.get("label") or "",
+            elem.get("identifier") or "",
+        )
+
+    def _trigrams(self, *texts: str) -> Set[str]:
+        """Trigrams of each word, padded so prefixes and suffixes count."""
+        grams: Set[str] = set()
+        for text in texts:
+            for word in self._extract_words(text):
+                padded = f" {word} "
+                grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+        return grams
+
+    @staticmethod
+    def _discard(buckets: Dict[Any, Dict[Any, None]], key: Any, member: Any) -> None:
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.pop(member, None)
+            if not bucket:
+                del buckets[key]
 
     def _extract_words(self, text: str) -> List[str]:
         """Extract searchable words from text."""
@@ -107,7 +228,13 @@ class ElementIndex:
         max_results: int = 20,
     ) -> List[SearchResult]:
         """
-        Search for elements matching a query using O(1) lookups.
+        Search for elements matching a query, tolerating partial words and typos.
+
+        Candidates come from label and identifier trigrams, weighted
+        BM25-style (rare trigrams count more, long labels are damped). If no
+        element shares enough trigrams, words within a small edit distance
+        of the query words are used instead. The best candidates are then
+        re-ranked with the _compute_score bonuses.
 
         Args:
             query: Search query (partial match on label)
@@ -122,59 +249,124 @@ class ElementIndex:
 
         query_lower = query.lower().strip()
         query_words = self._extract_words(query)
-        results: Dict[str, SearchResult] = {}
 
-        for word in query_words:
-            element_ids = self._by_label_words.get(word)
-            if element_ids:
-                for eid in element_ids:
-                    if eid in results:
-                        continue
-                    elem = self._elements.get(eid, {})
-                    if role_filter:
-                        elem_role = (elem.get("role") or "").lower()
-                        if role_filter.lower() not in elem_role:
-                            continue
-                    score = self._compute_score(elem, query_lower, query_words)
-                    results[eid] = SearchResult(
-                        element_id=eid,
-                        label=elem.get("label", ""),
-                        role=elem.get("role", ""),
-                        match_score=score,
-                        match_reason=f"word: {word}",
-                        element_info=elem,
-                    )
-                    if len(results) >= max_results:
-                        break
-
-        if len(results) < max_results:
-            for eid, elem in self._elements.items():
-                if eid in results:
+        relevance = self._trigram_candidates(query_lower)
+        reason = "trigram match"
+        if not relevance:
+            relevance = self._edit_distance_candidates(query_words)
+            reason = "fuzzy match"
+        if not relevance:
+            return []
+
+        shortlist = self._best_elements(
+            relevance,
+            role_filter.lower() if role_filter else None,
+            max(max_results * self.RERANK_FACTOR, self.RERANK_MIN),
+        )
+        ranked = []
+        for eid, value in shortlist:
+            elem = self._elements[eid]
+            score = self._compute_score(elem, query_lower, query_words)
+            ranked.append((score + self.BM25_WEIGHT * value, eid))
+
+        return [
+            SearchResult(
+                element_id=eid,
+                label=self._elements[eid].get("label", ""),
+                role=self._elements[eid].get("role", ""),
+                match_score=score,
+                match_reason=reason,
+                element_info=self._elements[eid],
+            )
+            for score, eid in heapq.nlargest(
+                max_results, ranked, key=lambda item: item[0]
+            )
+        ]
+
+    def _best_elements(
+        self, relevance: Dict[Document, float], role_lower: Optional[str], limit: int
+    ) -> List[Tuple[str, float]]:
+        """Expand the most relevant documents into up to limit element IDs."""
+        order = [(-value, document) for document, value in relevance.items()]
+        heapq.heapify(order)
+        shortlist: List[Tuple[str, float]] = []
+        while order and len(shortlist) < limit:
+            negative, document = heapq.heappop(order)
+            for eid in self._documents[document]:
+                if role_lower and role_lower not in self._keys[eid][0]:
                     continue
+                shortlist.append((eid, -negative))
+                if len(shortlist) >= limit:
+                    break
+        return shortlist
 
-                label = (elem.get("label") or "").lower()
-                identifier = (elem.get("identifier") or "").lower()
+    def _trigram_candidates(self, query: str) -> Dict[Document, float]:
+        """
+        Documents sharing enough trigrams with the query, with BM25 relevance.
 
-                if query_lower in label or query_lower in identifier:
-                    if role_filter:
-                        elem_role = (elem.get("role") or "").lower()
-                        if role_filter.lower() not in elem_role:
-                            continue
+        Returns:
+            Mapping of document to relevance in [0, 1]
+        """
+        grams = self._trigrams(query)
+        buckets = [self._by_trigram[g] for g in grams if g in self._by_trigram]
+        if not buckets:
+            return {}
+
+        hits: Counter = Counter()
+        for bucket in buckets:
+            hits.update(bucket.keys())
+        need = max(1, math.ceil(len(grams) * self.MIN_GRAM_OVERLAP))
+
+        total = len(self._documents)
+        average = self._total_grams / total if total else 1.0
+        weights = [
+            (bucket, math.log(1 + (total - len(bucket) + 0.5) / (len(bucket) + 0.5)))
+            for bucket in buckets
+        ]
+        ceiling = sum(weight for _, weight in weights) * (self.BM25_K1 + 1)
+        k1, b = self.BM25_K1, self.BM25_B
+
+        relevance: Dict[Document, float] = {}
+        for document, count in hits.items():
+            if count < need:
+                continue
+            idf = sum(weight for bucket, weight in weights if document in bucket)
+            length = self._gram_counts[document] / average
+            relevance[document] = (
+                idf * (k1 + 1) / (k1 * (1 - b + b * length) + 1) / ceiling
+            )
+        return relevance
 
-                    score = self._compute_score(elem, query_lower, query_words)
-                    results[eid] = SearchResult(
-                        element_id=eid,
-                        label=elem.get("label", ""),
-                        role=elem.get("role", ""),
-                        match_score=score,
-                        match_reason="substring match",
-                        element_info=elem,
-                    )
+    def _edit_distance_candidates(
+        self, query_words: List[str]
+    ) -> Dict[Document, float]:
+        """
+        Elements with a label word close to a query word.
 
-                    if len(results) >= max_results:
-                        break
+        A label word matches if the query word is its prefix (short queries
+        have no trigrams in common with longer words) or if it lies within
+        a small edit distance.
 
-        return sorted(results.values(), key=lambda r: -r.match_score)[:max_results]
+        Returns:
+            Mapping of document to relevance in [0, 1]
+        """
+        relevance: Dict[Document, float] = {}
+        for word in query_words:
+            limit = 1 if len(word) <= 4 else self.MAX_EDIT_DISTANCE
+            for vocab, documents in self._by_label_words.items():
+                if vocab.startswith(word):
+                    value = len(word) / len(vocab)
+                elif abs(len(vocab) - len(word)) > limit:
+                    continue
+                else:
+                    distance = bounded_edit_distance(word, vocab, limit)
+                    if distance > limit:
+                        continue
+                    value = 1.0 - distance / (limit + 1)
+                for document in documents:
+                    if value > relevance.get(document, 0.0):
+                        relevance[document] = value
+        return relevance
 
     def _compute_score(
         self, elem: Dict[str, Any], query_lower: str, query_words: List[str]
@@ -237,7 +429,7 @@ class ElementIndex:
     def get_by_role(self, role: str) -> List[Dict[str, Any]]:
         """Get all elements with a specific role."""
         role_lower = role.lower()
-        element_ids = self._by_role.get(role_lower, [])
+        element_ids = self._by_role.get(role_lower, {})
         return [self._elements[eid] for eid in element_ids if eid in self._elements]
 
     @property
@@ -250,7 +442,86 @@ class ElementIndex:
         return {role: len(ids) for role, ids in self._by_role.items()}
 
 
+class AppElementIndexes:
+    """
+    Per-application element indexes with least-recently-used eviction.
+
+    Switching between applications keeps each app's index, so returning to
+    an app only applies the changes since its last snapshot.
+    """
+
+    def __init__(self, max_apps: int = 8):
+        """
+        Initialize the cache.
+
+        Args:
+            max_apps: Maximum number of application indexes kept
+        """
+        self.max_apps = max_apps
+        self._indexes: "OrderedDict[str, ElementIndex]" = OrderedDict()
+
+    def get(self, app_name: str) -> ElementIndex:
+        """Return the index for an app, creating it if needed."""
+        key = app_name.lower().strip()
+        index = self._indexes.get(key)
+        if index is None:
+            index = ElementIndex()
+            self._indexes[key] = index
+            while len(self._indexes) > self.max_apps:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(key)
+        return index
+
+    def sync(self, app_name: str, elements: List[Dict[str, Any]]) -> ElementIndex:
+        """Apply a new snapshot to an app's index and return the index."""
+        index = self.get(app_name)
+        index.sync(elements)
+        return index
+
+    def drop(self, app_name: str) -> None:
+        """Forget an app's index."""
+        self._indexes.pop(app_name.lower().strip(), None)
+
+    @property
+    def apps(self) -> List[str]:
+        """Indexed app keys, least recently used first."""
+        return list(self._indexes)
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance between two strings, giving up past a limit.
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Largest distance of interest
+
+    Returns:
+        The distance, or limit + 1 if it exceeds the limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
 _global_index: Optional[ElementIndex] = None
+_app_indexes: Optional[AppElementIndexes] = None
 
 
 def get_element_index() -> ElementIndex:
@@ -261,6 +532,28 @@ def get_element_index() -> ElementIndex:
     return _global_index
 
 
+def get_app_indexes() -> AppElementIndexes:
+    """Get the per-application index cache singleton."""
+    global _app_indexes
+    if _app_indexes is None:
+        _app_indexes = AppElementIndexes()
+    return _app_indexes
+
+
+def sync_app_elements(app_name: str, elements: List[Dict[str, Any]]) -> ElementIndex:
+    """
+    Bring an application's index up to date with its latest elements.
+
+    Args:
+        app_name: Application name
+        elements: Elements from get_elements() (with element IDs)
+
+    Returns:
+        The application's index, ready to search
+    """
+    return get_app_indexes().sync(app_name, elements)
+
+
 def search_elements(
     query: str,
     role_filter: Optional[str] = None,
@@ -3,10 +3,12 @@ State management services for application and system state.
 """
 
 from .app_state import AppStateManager, get_app_state
+from .prefetch import ElementPrefetcher
 
 __all__ = [
     "AppStateManager",
     "get_app_state",
+    "ElementPrefetcher",
     "StateObserver",
     "SystemState",
     "ObservationScope",
@@ -9,6 +9,8 @@ import threading
 from dataclasses import dataclass
 from typing import Optional
 
+from .prefetch import ElementPrefetcher
+
 
 @dataclass
 class AppStateSnapshot:
@@ -44,15 +46,38 @@ class AppStateManager:
             return
         self._target_app: Optional[str] = None
         self._accessibility_tool = None
+        self._prefetcher: Optional[ElementPrefetcher] = None
         self._initialized = True
 
     def set_accessibility_tool(self, accessibility_tool) -> None:
-        """Set the accessibility tool for frontmost app queries."""
+        """Set the accessibility tool for frontmost app queries and prefetch."""
         self._accessibility_tool = accessibility_tool
+        self._prefetcher = ElementPrefetcher.create(accessibility_tool)
+
+    def set_target_app(self, app_name: str, prefetch: bool = True) -> None:
+        """
+        Set the current target application.
 
-    def set_target_app(self, app_name: str) -> None:
-        """Set the current target application."""
+        Args:
+            app_name: Application to target
+            prefetch: Start a background element snapshot when the target
+                changes (pass False if the app has no windows yet)
+        """
+        changed = (self._target_app or "").lower() != (app_name or "").lower()
         self._target_app = app_name
+        if changed and prefetch:
+            self.prefetch_elements(app_name)
+
+    def prefetch_elements(self, app_name: str, fresh: bool = False) -> None:
+        """
+        Queue a background element snapshot of an app, if enabled.
+
+        Args:
+            app_name: Application to snapshot
+            fresh: Ignore a cached snapshot (e.g. after the app launched)
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.prefetch(app_name, fresh=fresh)
 
     def get_target_app(self) -> Optional[str]:
         """Get the current target application."""
@@ -0,0 +1,78 @@
+"""
+Background element snapshots for the app the agent is about to use.
+
+After an app is opened or becomes the target, the next tool call is almost
+always get_accessible_elements on it. The prefetcher queues that walk right
+away on the backend's accessibility thread, so the tool call consumes the
+cached result or joins the walk still in flight instead of starting cold.
+"""
+
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional
+
+
+class ElementPrefetcher:
+    """
+    Queues background get_elements walks on an accessibility backend.
+
+    Only backends with supports_background_walks are used; on others
+    submit_elements() would walk in the calling thread.
+    """
+
+    ENV_VAR = "PILOT_PREFETCH"
+    """Set to "off" to disable prefetching."""
+
+    def __init__(self, accessibility_tool: Any):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            accessibility_tool: Accessibility backend to prefetch from
+        """
+        self._accessibility = accessibility_tool
+        self._lock = threading.Lock()
+        self.requested = 0
+
+    @classmethod
+    def create(cls, accessibility_tool: Any) -> Optional["ElementPrefetcher"]:
+        """
+        Create a prefetcher if the backend and PILOT_PREFETCH allow it.
+
+        Args:
+            accessibility_tool: Accessibility backend
+
+        Returns:
+            ElementPrefetcher, or None when prefetching is unavailable
+        """
+        if os.getenv(cls.ENV_VAR, "").strip().lower() in ("0", "off", "false", "no"):
+            return None
+        if not getattr(accessibility_tool, "supports_background_walks", False):
+            return None
+        return cls(accessibility_tool)
+
+    def prefetch(self, app_name: str, fresh: bool = False) -> Optional[Future]:
+        """
+        Queue a background snapshot of an app's interactive elements.
+
+        Args:
+            app_name: Application to snapshot
+            fresh: Walk even if a cached snapshot exists (use after the
+                app's windows changed, e.g. once it finished launching)
+
+        Returns:
+            Future of the snapshot, or None if nothing was queued
+        """
+        if not app_name or not getattr(self._accessibility, "available", False):
+            return None
+        try:
+            future = self._accessibility.submit_elements(
+                app_name, interactive_only=True, use_cache=not fresh
+            )
+        except Exception:
+            return None
+
+        with self._lock:
+            self.requested += 1
+        return future
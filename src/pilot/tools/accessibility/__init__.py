@@ -7,23 +7,31 @@ Platform-specific implementations are in their respective subdirectories:
 - windows/ - pywinauto-based implementation
 - linux/ - pyatspi-based implementation
 
-The shared modules (protocol.py, element_registry.py, cache_manager.py) are
-platform-agnostic and contain ZERO platform-specific code.
+The shared modules (protocol.py, element_registry.py, element_record.py,
+cache_manager.py, skeleton_cache.py, instrumentation.py, tables.py,
+app_registry.py) are platform-agnostic and contain ZERO platform-specific code.
 """
 
 import platform
 from typing import Optional
 
-from .cache_manager import AccessibilityCacheManager
+from .app_registry import AppEntry, AppRegistry
+from .cache_manager import AccessibilityCacheManager, CacheStats
+from .containers import ContainerPage, ExpansionOptions
+from .element_record import ElementRecord
 from .element_registry import (
-    ElementRecord,
+    RegistryEntry,
     VersionedElementRegistry,
     compute_element_id,
     shorten_role,
 )
+from .instrumentation import TraversalProfiler
 from .linux import LinuxAccessibility
 from .macos import MacOSAccessibility
 from .protocol import AccessibilityProtocol
+from .skeleton_cache import Skeleton, SkeletonCache
+from .tables import TableOptions, TableSnapshot
+from .traversal import TraversalScope
 from .windows import WindowsAccessibility
 
 
@@ -66,8 +74,20 @@ __all__ = [
     "WindowsAccessibility",
     "LinuxAccessibility",
     "VersionedElementRegistry",
+    "RegistryEntry",
     "ElementRecord",
     "AccessibilityCacheManager",
+    "CacheStats",
+    "Skeleton",
+    "SkeletonCache",
+    "TraversalProfiler",
+    "TraversalScope",
+    "ExpansionOptions",
+    "ContainerPage",
+    "TableOptions",
+    "AppRegistry",
+    "AppEntry",
+    "TableSnapshot",
     "shorten_role",
     "compute_element_id",
 ]
@@ -0,0 +1,366 @@
+"""
+Indexed registry of running applications for name, alias and PID lookups.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+Backends resolve an app name on almost every tool call. Scanning all running
+apps with a two-way substring test costs a round trip per app and returns
+whichever app happens to come first. The registry instead indexes each app's
+normalized name, aliases and executable name in a hash index and a prefix
+index, ranks matches deterministically and memoizes resolved queries until
+the set of apps changes. Backends keep it current with add() and remove()
+from platform events, and with sync() when they have to rescan.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "google chrome": ("chrome",),
+    "chromium browser": ("chromium",),
+    "visual studio code": ("code", "vscode"),
+    "microsoft edge": ("edge",),
+    "mozilla firefox": ("firefox",),
+    "gnome terminal": ("terminal",),
+}
+"""Extra names for common apps, keyed by normalized app or executable name."""
+
+EXACT_NAME = 0
+EXACT_ALIAS = 1
+PREFIX = 2
+WORD_PREFIX = 3
+CONTAINED = 4
+SUBSTRING = 5
+"""Match ranks, best first."""
+
+_SEPARATORS = re.compile(r"[\s_\-.]+")
+_SUFFIXES = (".exe", ".app", ".desktop")
+
+
+def normalize_app_name(name: str) -> str:
+    """
+    Normalize an app, alias or executable name for indexing.
+
+    Lowercases, drops executable and bundle suffixes and turns runs of
+    separators into single spaces ("Gnome-Terminal.exe" -> "gnome terminal").
+    """
+    text = (name or "").strip().lower()
+    for suffix in _SUFFIXES:
+        if text.endswith(suffix):
+            text = text[: -len(suffix)]
+            break
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+@dataclass
+class AppEntry:
+    """
+    One running application.
+
+    Attributes:
+        key: Backend identity of the app (native object or PID)
+        name: Display name
+        handle: Native app object returned by lookups
+        pid: Process ID, if known
+        executable: Executable name, if known
+        aliases: Extra names the app answers to
+    """
+
+    key: Any
+    name: str
+    handle: Any = None
+    pid: Optional[int] = None
+    executable: str = ""
+    aliases: Tuple[str, ...] = ()
+
+
+class AppRegistry:
+    """
+    Hash and prefix indexes over running apps.
+
+    A query is ranked against every indexed term: exact name, exact alias
+    or executable, prefix of a term, prefix of a later word of a term, a
+    term contained in the query as whole words, and finally the two-way
+    substring rule backends used before. Ties go to the shorter name, then
+    to the app registered first, so results are deterministic.
+
+    Attributes:
+        stale: True until the first sync() and whenever the backend could
+            not apply a change incrementally
+        hits: Queries answered from the memo table
+        misses: Queries resolved through the indexes
+    """
+
+    MAX_MEMO = 256
+
+    def __init__(self, aliases: Optional[Dict[str, Iterable[str]]] = None):
+        source = DEFAULT_ALIASES if aliases is None else aliases
+        self._aliases: Dict[str, Tuple[str, ...]] = {
+            normalize_app_name(name): tuple(normalize_app_name(a) for a in extra)
+            for name, extra in source.items()
+        }
+        self._entries: Dict[Any, AppEntry] = {}
+        self._order: Dict[Any, int] = {}
+        self._terms: Dict[Any, Dict[str, int]] = {}
+        self._exact: Dict[str, Dict[Any, int]] = {}
+        self._prefix: Dict[str, Dict[Any, int]] = {}
+        self._by_pid: Dict[int, Set[Any]] = {}
+        self._memo: Dict[str, List[Any]] = {}
+        self._next_order = 0
+        self.stale = True
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self) -> List[str]:
+        """Display names in registration order."""
+        return [entry.name for entry in self._entries.values()]
+
+    def get(self, key: Any) -> Optional[AppEntry]:
+        """Entry registered under a key."""
+        return self._entries.get(key)
+
+    def by_pid(self, pid: int) -> List[AppEntry]:
+        """Entries of a process, in registration order."""
+        keys = self._by_pid.get(pid, ())
+        return [self._entries[k] for k in sorted(keys, key=self._order.__getitem__)]
+
+    def add(self, entry: AppEntry) -> None:
+        """Register an app, replacing any entry with the same key."""
+        order = self._order.get(entry.key)
+        if order is not None:
+            self._unindex(entry.key)
+        else:
+            order = self._next_order
+            self._next_order += 1
+        self._entries[entry.key] = entry
+        self._order[entry.key] = order
+        self._index(entry)
+        self._memo.clear()
+
+    def remove(self, key: Any) -> Optional[AppEntry]:
+        """Forget an app; returns its entry if it was registered."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._unindex(key)
+        del self._entries[key]
+        del self._order[key]
+        self._memo.clear()
+        return entry
+
+    def remove_pid(self, pid: int) -> List[AppEntry]:
+        """Forget every app of a process that exited."""
+        return [self.remove(key) for key in list(self._by_pid.get(pid, ()))]
+
+    def sync(self, entries: Iterable[AppEntry]) -> Tuple[int, int]:
+        """
+        Make the registry hold exactly the given apps.
+
+        Unchanged entries keep their rank order and the memo table survives
+        when nothing changed.
+
+        Returns:
+            Tuple of (apps added or updated, apps removed)
+        """
+        current: Dict[Any, AppEntry] = {}
+        for entry in entries:
+            current.setdefault(entry.key, entry)
+
+        removed = [key for key in self._entries if key not in current]
+        for key in removed:
+            self.remove(key)
+        changed = 0
+        for key, entry in current.items():
+            if self._entries.get(key) != entry:
+                self.add(entry)
+                changed += 1
+        self.stale = False
+        return changed, len(removed)
+
+    def clear(self) -> None:
+        """Forget every app and mark the registry stale."""
+        for key in list(self._entries):
+            self.remove(key)
+        self.stale = True
+
+    def match(self, query: str) -> List[AppEntry]:
+        """
+        All apps matching a query, best first.
+
+        Args:
+            query: App name, alias or executable name as given by the caller
+
+        Returns:
+            Ranked entries (empty if none match)
+        """
+        normalized = normalize_app_name(query)
+        if not normalized:
+            return []
+        keys = self._memo.get(normalized)
+        if keys is not None:
+            self.hits += 1
+            return [self._entries[k] for k in keys]
+
+        self.misses += 1
+        ranks = self._rank(normalized)
+        keys = sorted(
+            ranks, key=lambda k: (ranks[k], self._sort_order(self._entries[k]))
+        )
+        if len(self._memo) >= self.MAX_MEMO:
+            self._memo.clear()
+        self._memo[normalized] = keys
+        return [self._entries[k] for k in keys]
+
+    def best(self, query: str) -> Optional[AppEntry]:
+        """Best match for a query, or None."""
+        matches = self.match(query)
+        return matches[0] if matches else None
+
+    def _rank(self, query: str) -> Dict[Any, int]:
+        """Best rank of each app matching a normalized query."""
+        ranks: Dict[Any, int] = {}
+
+        def offer(keys: Dict[Any, int]) -> None:
+            for key, rank in keys.items():
+                if rank < ranks.get(key, SUBSTRING + 1):
+                    ranks[key] = rank
+
+        offer(self._exact.get(query, {}))
+        offer(self._prefix.get(query, {}))
+
+        words = query.split(" ")
+        for start in range(len(words)):
+            for end in range(start + 1, len(words) + 1):
+                if end - start == len(words):
+                    continue
+                part = " ".join(words[start:end])
+                offer({key: CONTAINED for key in self._exact.get(part, {})})
+
+        if not ranks:
+            for key, terms in self._terms.items():
+                if any(query in term or term in query for term in terms):
+                    ranks[key] = SUBSTRING
+        return ranks
+
+    def _sort_order(self, entry: AppEntry) -> Tuple[int, int]:
+        return (len(entry.name), self._order[entry.key])
+
+    def _index(self, entry: AppEntry) -> None:
+        """Add an entry's terms to the hash and prefix indexes."""
+        terms: Dict[str, int] = {}
+        name = normalize_app_name(entry.name)
+        executable = normalize_app_name(entry.executable)
+        extra = list(entry.aliases) + [executable]
+        extra += self._aliases.get(name, ()) + self._aliases.get(executable, ())
+        for term, rank in [(name, EXACT_NAME)] + [
+            (normalize_app_name(a), EXACT_ALIAS) for a in extra
+        ]:
+            if term and rank < terms.get(term, SUBSTRING):
+                terms[term] = rank
+        self._terms[entry.key] = terms
+
+        for term, rank in terms.items():
+            self._exact.setdefault(term, {})[entry.key] = rank
+            for prefix, prefix_rank in self._prefixes(term):
+                slot = self._prefix.setdefault(prefix, {})
+                if prefix_rank < slot.get(entry.key, SUBSTRING + 1):
+                    slot[entry.key] = prefix_rank
+        if entry.pid is not None:
+            self._by_pid.setdefault(entry.pid, set()).add(entry.key)
+
+    def _unindex(self, key: Any) -> None:
+        """Remove a registered entry's terms from the indexes."""
+        entry = self._entries[key]
+        for term in self._terms.pop(key, {}):
+            self._discard(self._exact, term, key)
+            for prefix, _ in self._prefixes(term):
+                self._discard(self._prefix, prefix, key)
+        if entry.pid is not None:
+            keys = self._by_pid.get(entry.pid)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_pid[entry.pid]
+
+    @staticmethod
+    def _prefixes(term: str) -> Iterable[Tuple[str, int]]:
+        """Prefixes of a term (PREFIX) and of its later words (WORD_PREFIX)."""
+        for end in range(1, len(term) + 1):
+            yield term[:end], PREFIX
+        start = term.find(" ") + 1
+        while start > 0:
+            for end in range(start + 1, len(term) + 1):
+                yield term[start:end], WORD_PREFIX
+            start = term.find(" ", start) + 1
+
+    @staticmethod
+    def _discard(index: Dict[str, Dict[Any, int]], term: str, key: Any) -> None:
+        keys = index.get(term)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del index[term]
+
+
+class ProcessIndex:
+    """
+    Executable names of running processes, kept current by diffing PIDs.
+
+    refresh() lists PIDs and reads the name of new processes only. Without
+    psutil the index is empty and refresh() reports no changes.
+    """
+
+    def __init__(self):
+        try:
+            import psutil
+
+            self._psutil = psutil
+        except ImportError:
+            self._psutil = None
+        self._names: Dict[int, str] = {}
+
+    @property
+    def available(self) -> bool:
+        return self._psutil is not None
+
+    def refresh(self) -> Tuple[Set[int], Set[int]]:
+        """
+        Diff running PIDs against the previous refresh.
+
+        Returns:
+            Tuple of (started PIDs, exited PIDs)
+        """
+        if self._psutil is None:
+            return set(), set()
+        try:
+            pids = set(self._psutil.pids())
+        except Exception:
+            return set(), set()
+        known = set(self._names)
+        started, exited = pids - known, known - pids
+        for pid in exited:
+            del self._names[pid]
+        for pid in started:
+            self._names[pid] = self._read_name(pid)
+        return started, exited
+
+    def name(self, pid: Optional[int]) -> str:
+        """Executable name of a process ("" if unknown)."""
+        if pid is None or pid <= 0 or self._psutil is None:
+            return ""
+        if pid not in self._names:
+            self._names[pid] = self._read_name(pid)
+        return self._names[pid]
+
+    def _read_name(self, pid: int) -> str:
+        try:
+            return self._psutil.Process(pid).name() or ""
+        except Exception:
+            return ""
@@ -7,12 +7,19 @@ This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
 - Linux: No "AT-SPI", no pyatspi
 
 Manages cache TTLs based on interaction events rather than fixed timeouts.
-After actions that likely change UI state, use shorter TTLs.
+Each application keeps its own interaction time: a snapshot taken shortly
+after an interaction with that app gets the short TTL, while other apps
+keep the default one. Element lists are grouped by exact app key, so
+clearing "note" leaves "notepad" alone, and the cache is bounded by entry
+count and by an estimate of the bytes the cached element lists hold, with
+the least recently used entry evicted first.
 """
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -21,26 +28,141 @@ class CacheEntry:
 
     timestamp: float
     data: List[Dict[str, Any]]
+    app_key: str = ""
+    size: int = 0
+
+
+@dataclass
+class CacheStats:
+    """Counters and gauges describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    estimated_bytes: int = 0
+    apps: int = 0
+    oldest_age: float = 0.0
+    hit_age_total: float = 0.0
+    max_hit_age: float = 0.0
+    per_app: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of element lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def mean_hit_age(self) -> float:
+        """Average age in seconds of the entries returned on hits."""
+        return self.hit_age_total / self.hits if self.hits else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict including the derived hit rate and mean hit age."""
+        data = asdict(self)
+        data["hit_rate"] = self.hit_rate
+        data["mean_hit_age"] = self.mean_hit_age
+        return data
+
+
+def format_cache_stats(stats: Dict[str, Any]) -> List[str]:
+    """
+    Human-readable lines for get_cache_stats() (for verbose output).
+
+    Args:
+        stats: Result of a backend's get_cache_stats()
+
+    Returns:
+        Lines of text, empty if the backend has no cache
+    """
+    if not stats or "hits" not in stats:
+        return []
+    lines = [
+        f"Element cache: {stats['hits']} hits / {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%}), {stats['entries']} entries for "
+        f"{stats['apps']} app(s), {stats['evictions']} evicted, "
+        f"{stats['expirations']} expired",
+        f"Cache age: mean hit {stats['mean_hit_age']:.1f}s, "
+        f"max hit {stats['max_hit_age']:.1f}s, oldest entry {stats['oldest_age']:.1f}s",
+    ]
+    traversals = stats.get("traversals")
+    if traversals:
+        lines.append(
+            f"Walks: {traversals['walks']} for {traversals['requests']} requests "
+            f"({traversals['coalesced']} coalesced)"
+        )
+    return lines
+
+
+def app_key_of(cache_key: str) -> str:
+    """
+    App part of an element cache key.
+
+    Backends key element lists as "<app name>:<interactive_only>"; the app
+    is everything before the last colon.
+
+    Args:
+        cache_key: Element cache key
+
+    Returns:
+        Lowercased app key
+    """
+    app, sep, _ = cache_key.rpartition(":")
+    return (app if sep else cache_key).lower()
 
 
 class AccessibilityCacheManager:
     """
     Smart cache manager for accessibility elements.
 
-    TTL strategy:
-    - Default: 10s for normal observation
-    - Post-interaction: 2s short TTL
+    TTL strategy (per app):
+    - Default: 30s for normal observation
+    - Snapshots taken within 10s of an interaction with the app: 10s TTL
     - After successful action: Advance epoch in registry
+
+    Bounds:
+    - At most max_entries element lists and max_bytes estimated bytes,
+      least recently used evicted first
+    - At most max_apps app references
     """
 
     DEFAULT_TTL: float = 30.0
     POST_INTERACTION_TTL: float = 10.0
+    MAX_ENTRIES: int = 32
+    MAX_BYTES: int = 64 * 1024 * 1024
+    MAX_APPS: int = 32
+    ELEMENT_BYTES: int = 600
+    """Rough retained size of one cached element, used for the byte bound."""
 
-    def __init__(self):
-        self._element_cache: Dict[str, CacheEntry] = {}
-        self._app_cache: Dict[str, Any] = {}
-        self._current_ttl: float = self.DEFAULT_TTL
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_apps: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Element lists kept (None = MAX_ENTRIES)
+            max_bytes: Estimated bytes kept (None = MAX_BYTES)
+            max_apps: App references kept (None = MAX_APPS)
+        """
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        self.max_apps = max_apps or self.MAX_APPS
+        self._element_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._app_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._keys_by_app: Dict[str, Dict[str, None]] = {}
+        self._interactions: Dict[str, float] = {}
+        self._global_interaction: float = 0
         self._last_interaction_time: float = 0
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.RLock()
 
     def get_elements(
         self, cache_key: str
@@ -54,17 +176,24 @@ class AccessibilityCacheManager:
         Returns:
             Tuple of (timestamp, elements) if cache hit, None if miss/expired
         """
-        if cache_key not in self._element_cache:
-            return None
+        with self._lock:
+            entry = self._element_cache.get(cache_key)
+            if entry is None:
+                self._count(app_key_of(cache_key), "misses")
+                return None
 
-        entry = self._element_cache[cache_key]
-        age = time.time() - entry.timestamp
+            age = time.time() - entry.timestamp
+            if age > self._ttl_for_entry(entry):
+                self._drop(cache_key)
+                self._stats.expirations += 1
+                self._count(entry.app_key, "misses")
+                return None
 
-        if age > self._current_ttl:
-            del self._element_cache[cache_key]
-            return None
-
-        return (entry.timestamp, entry.data)
+            self._element_cache.move_to_end(cache_key)
+            self._stats.hit_age_total += age
+            self._stats.max_hit_age = max(self._stats.max_hit_age, age)
+            self._count(entry.app_key, "hits")
+            return (entry.timestamp, entry.data)
 
     def set_elements(self, cache_key: str, elements: List[Dict[str, Any]]) -> None:
         """
@@ -74,54 +203,157 @@ class AccessibilityCacheManager:
             cache_key: Cache key
             elements: Elements to cache
         """
-        self._element_cache[cache_key] = CacheEntry(
-            timestamp=time.time(),
-            data=elements,
-        )
+        with self._lock:
+            self._drop(cache_key)
+            entry = CacheEntry(
+                timestamp=time.time(),
+                data=elements,
+                app_key=app_key_of(cache_key),
+                size=len(elements) * self.ELEMENT_BYTES,
+            )
+            self._element_cache[cache_key] = entry
+            self._keys_by_app.setdefault(entry.app_key, {})[cache_key] = None
+            self._bytes += entry.size
+
+            while len(self._element_cache) > 1 and (
+                len(self._element_cache) > self.max_entries
+                or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._element_cache))
+                self._drop(oldest)
+                self._stats.evictions += 1
+
+    def invalidate_elements(self, cache_key: str) -> None:
+        """
+        Drop one cached element list without shortening the TTL.
+
+        Used when a backend learns from change notifications that exactly
+        this entry is out of date.
+
+        Args:
+            cache_key: Cache key to drop
+        """
+        with self._lock:
+            if self._drop(cache_key):
+                self._stats.invalidations += 1
+
+    def has_elements(self, app_name: str) -> bool:
+        """Check whether any unexpired element list is cached for an app."""
+        with self._lock:
+            now = time.time()
+            return any(
+                now - self._element_cache[key].timestamp
+                <= self._ttl_for_entry(self._element_cache[key])
+                for key in self._keys_by_app.get(app_name.lower(), ())
+            )
+
+    def renew(self, app_name: str) -> int:
+        """
+        Restart the TTL of an app's cached element lists.
+
+        Called when a probe confirmed the UI has not changed since the lists
+        were cached. Expired lists are not renewed.
+
+        Args:
+            app_name: Application name
+
+        Returns:
+            Number of element lists renewed
+        """
+        with self._lock:
+            now = time.time()
+            renewed = 0
+            for key in list(self._keys_by_app.get(app_name.lower(), ())):
+                entry = self._element_cache[key]
+                if now - entry.timestamp > self._ttl_for_entry(entry):
+                    continue
+                entry.timestamp = now
+                self._element_cache.move_to_end(key)
+                renewed += 1
+            return renewed
 
     def get_app(self, app_name: str) -> Optional[Any]:
         """Get cached app reference."""
-        return self._app_cache.get(app_name.lower())
+        with self._lock:
+            key = app_name.lower()
+            app_ref = self._app_cache.get(key)
+            if app_ref is not None:
+                self._app_cache.move_to_end(key)
+            return app_ref
 
     def set_app(self, app_name: str, app_ref: Any) -> None:
         """Cache app reference."""
-        self._app_cache[app_name.lower()] = app_ref
+        with self._lock:
+            key = app_name.lower()
+            self._app_cache[key] = app_ref
+            self._app_cache.move_to_end(key)
+            while len(self._app_cache) > self.max_apps:
+                self._app_cache.popitem(last=False)
 
     def invalidate_app(self, app_name: str) -> None:
         """Remove app from cache."""
-        self._app_cache.pop(app_name.lower(), None)
+        with self._lock:
+            self._app_cache.pop(app_name.lower(), None)
 
     def on_interaction(self, app_name: Optional[str] = None) -> None:
         """
         Called after user interactions (click, type).
 
-        Sets short TTL for next cache read and clears relevant caches.
+        Sets short TTL for the app's next snapshots and clears its cached
+        element lists.
 
         Args:
             app_name: App that was interacted with (or None for all)
         """
-        self._last_interaction_time = time.time()
-        self._current_ttl = self.POST_INTERACTION_TTL
+        with self._lock:
+            now = time.time()
+            self._last_interaction_time = now
 
-        if app_name:
-            prefix = app_name.lower()
-            keys_to_remove = [k for k in self._element_cache if k.startswith(prefix)]
-            for key in keys_to_remove:
-                del self._element_cache[key]
-        else:
-            self._element_cache.clear()
+            if app_name:
+                app_key = app_name.lower()
+                self._interactions[app_key] = now
+                keys = list(self._keys_by_app.get(app_key, ()))
+            else:
+                self._global_interaction = now
+                keys = list(self._element_cache)
 
-    def reset_ttl(self) -> None:
-        """Reset TTL to default (called after successful observation)."""
-        time_since_interaction = time.time() - self._last_interaction_time
-        if time_since_interaction > self.POST_INTERACTION_TTL:
-            self._current_ttl = self.DEFAULT_TTL
+            for key in keys:
+                self._drop(key)
+            self._stats.invalidations += len(keys)
+
+    def reset_ttl(self, app_name: Optional[str] = None) -> None:
+        """
+        Reset TTL to default (called after successful observation).
+
+        Only interactions older than POST_INTERACTION_TTL are forgotten, so
+        the UI still has time to settle.
+
+        Args:
+            app_name: App to reset, or None for all apps
+        """
+        with self._lock:
+            now = time.time()
+            keys = [app_name.lower()] if app_name else list(self._interactions)
+            if (
+                not app_name
+                and now - self._global_interaction > self.POST_INTERACTION_TTL
+            ):
+                self._global_interaction = 0
+            for key in keys:
+                when = self._interactions.get(key)
+                if when is not None and now - when > self.POST_INTERACTION_TTL:
+                    del self._interactions[key]
 
     def clear_all(self) -> None:
         """Clear all caches."""
-        self._element_cache.clear()
-        self._app_cache.clear()
-        self._current_ttl = self.DEFAULT_TTL
+        with self._lock:
+            self._stats.invalidations += len(self._element_cache)
+            self._element_cache.clear()
+            self._app_cache.clear()
+            self._keys_by_app.clear()
+            self._interactions.clear()
+            self._global_interaction = 0
+            self._bytes = 0
 
     def invalidate(self, app_name: Optional[str] = None) -> None:
         """
@@ -135,7 +367,83 @@ class AccessibilityCacheManager:
         else:
             self.clear_all()
 
+    def ttl_for(self, app_name: str) -> float:
+        """
+        TTL a snapshot of an app taken now would get.
+
+        Args:
+            app_name: Application name
+
+        Returns:
+            POST_INTERACTION_TTL right after an interaction, else DEFAULT_TTL
+        """
+        with self._lock:
+            return self._ttl_at(app_name.lower(), time.time())
+
+    def stats(self) -> CacheStats:
+        """
+        Snapshot of the cache counters.
+
+        Returns:
+            CacheStats copy; counters accumulate until reset_stats()
+        """
+        with self._lock:
+            now = time.time()
+            oldest = min(
+                (entry.timestamp for entry in self._element_cache.values()),
+                default=now,
+            )
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                expirations=self._stats.expirations,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._element_cache),
+                estimated_bytes=self._bytes,
+                apps=len(self._keys_by_app),
+                oldest_age=now - oldest,
+                hit_age_total=self._stats.hit_age_total,
+                max_hit_age=self._stats.max_hit_age,
+                per_app={app: dict(c) for app, c in self._stats.per_app.items()},
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the hit, miss, eviction and age counters."""
+        with self._lock:
+            self._stats = CacheStats()
+
     @property
     def current_ttl(self) -> float:
-        """Get current TTL value."""
-        return self._current_ttl
+        """TTL for the most recently interacted app (DEFAULT_TTL if none)."""
+        with self._lock:
+            now = time.time()
+            if now - self._last_interaction_time < self.POST_INTERACTION_TTL:
+                return self.POST_INTERACTION_TTL
+            return self.DEFAULT_TTL
+
+    def _ttl_at(self, app_key: str, when: float) -> float:
+        interaction = max(self._interactions.get(app_key, 0), self._global_interaction)
+        if interaction and when - interaction < self.POST_INTERACTION_TTL:
+            return self.POST_INTERACTION_TTL
+        return self.DEFAULT_TTL
+
+    def _ttl_for_entry(self, entry: CacheEntry) -> float:
+        return self._ttl_at(entry.app_key, entry.timestamp)
+
+    def _drop(self, cache_key: str) -> bool:
+        entry = self._element_cache.pop(cache_key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        keys = self._keys_by_app.get(entry.app_key)
+        if keys is not None:
+            keys.pop(cache_key, None)
+            if not keys:
+                del self._keys_by_app[entry.app_key]
+        return True
+
+    def _count(self, app_key: str, counter: str) -> None:
+        setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+        per_app = self._stats.per_app.setdefault(app_key, {"hits": 0, "misses": 0})
+        per_app[counter] += 1
@@ -0,0 +1,97 @@
+"""
+Collapsed container handles, expanded one page at a time.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+ExpansionOptions make a walk stop at large list-like containers (lists,
+trees, outlines, tables): the container is returned as a collapsed handle
+carrying its child count and a short preview, and its children are read
+later, one ContainerPage at a time, only if the caller expands it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ExpansionOptions:
+    """
+    Rules for returning large containers as collapsed handles.
+
+    A collapsed container is registered as an element (even when it is not
+    interactive itself) with "collapsed": True, "child_count" and
+    "preview" (labels of its first children); its children are not walked.
+    Backends only collapse list-like containers (lists, trees, outlines,
+    tables); top-level windows and layout panes are never collapsed.
+
+    Attributes:
+        min_children: Collapse containers with at least this many children
+            (0 = never collapse)
+        preview: Number of child labels in a handle's preview
+        page_size: Default number of children per expanded page
+    """
+
+    min_children: int = 100
+    preview: int = 3
+    page_size: int = 50
+
+    @property
+    def enabled(self) -> bool:
+        """True if containers can be collapsed."""
+        return self.min_children > 0
+
+    def collapses(self, depth: int, child_count: int) -> bool:
+        """True if a list-like node at depth with child_count children collapses."""
+        return self.enabled and depth > 0 and child_count >= self.min_children
+
+
+def mark_collapsed(
+    element: Dict[str, Any], child_count: int, preview: List[str]
+) -> Dict[str, Any]:
+    """
+    Annotate an element as a collapsed container handle.
+
+    Args:
+        element: Element of the container
+        child_count: Number of children the container has
+        preview: Labels of its first children
+
+    Returns:
+        The same element
+    """
+    element["collapsed"] = True
+    element["child_count"] = child_count
+    element["preview"] = [label for label in preview if label]
+    return element
+
+
+@dataclass
+class ContainerPage:
+    """
+    One page of an expanded container's children.
+
+    Attributes:
+        container_id: Element ID of the container handle
+        elements: Elements of the children in the page and their
+            descendants (large containers among them are collapsed too)
+        offset: Index of the first child in the page
+        total: Number of children the container has now
+        children_read: Number of children read for this page
+        error: Why the container could not be expanded, else ""
+    """
+
+    container_id: str
+    elements: List[Dict[str, Any]] = field(default_factory=list)
+    offset: int = 0
+    total: int = 0
+    children_read: int = 0
+    error: str = ""
+
+    @property
+    def next_offset(self) -> Optional[int]:
+        """Offset of the next page, or None after the last child."""
+        end = self.offset + self.children_read
+        return end if end < self.total else None
@@ -0,0 +1,151 @@
+"""
+Compact element record with a dict-compatible view.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+A snapshot can hold thousands of elements. As plain dicts, each one
+carries its own hash table with the same keys, stores the native reference
+twice ("_native_ref" and "_element") and the app name twice ("app_name"
+and "_app_name"). ElementRecord keeps the normalized fields in __slots__,
+interns the few distinct role strings, and holds the native reference in
+a single slot.
+
+It is a MutableMapping, so element["label"], element.get("center") and
+"focused" in element keep working for existing callers. Keys outside the
+schema are kept in a small per-record dict created on first use.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+FIELDS = (
+    "element_id",
+    "role",
+    "label",
+    "title",
+    "identifier",
+    "app_name",
+    "center",
+    "bounds",
+    "has_actions",
+    "enabled",
+    "focused",
+    "role_description",
+    "parent_path",
+    "is_bottom",
+    "category",
+)
+"""Schema fields stored in their own slot, in iteration order."""
+
+ALIASES = {
+    "_native_ref": "native_ref",
+    "_element": "native_ref",
+    "_app_name": "app_name",
+}
+"""Legacy keys that read and write another slot instead of their own."""
+
+INTERNED = frozenset({"role", "role_description", "app_name"})
+"""Fields with few distinct values, interned so records share the string."""
+
+_SLOTS: Dict[str, str] = {**{name: name for name in FIELDS}, **ALIASES}
+
+
+class ElementRecord(MutableMapping):
+    """
+    One normalized element, stored in slots.
+
+    Attributes mirror the schema keys (record.role, record.center, ...);
+    record.native_ref is the platform object exposed as "_native_ref" and
+    "_element" through the mapping view; "_app_name" reads app_name.
+    """
+
+    __slots__ = FIELDS + ("native_ref", "extra")
+
+    def __init__(self, fields: Optional[Mapping[str, Any]] = None, **kwargs: Any):
+        """
+        Initialize the record.
+
+        Args:
+            fields: Element dictionary (or record) to copy
+            **kwargs: Additional keys, applied after fields
+        """
+        if fields:
+            for key, value in fields.items():
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        slot = _SLOTS.get(key)
+        try:
+            if slot is not None:
+                return getattr(self, slot)
+            return self.extra[key]
+        except (AttributeError, KeyError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        slot = _SLOTS.get(key)
+        if slot is None:
+            try:
+                self.extra[key] = value
+            except AttributeError:
+                self.extra = {key: value}
+            return
+        if slot in INTERNED and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, key: str) -> None:
+        slot = _SLOTS.get(key)
+        try:
+            if slot is not None:
+                delattr(self, slot)
+            else:
+                del self.extra[key]
+        except (AttributeError, KeyError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for name in FIELDS:
+            if hasattr(self, name):
+                yield name
+        for alias, slot in ALIASES.items():
+            if hasattr(self, slot):
+                yield alias
+        extra = getattr(self, "extra", None)
+        if extra:
+            yield from extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"ElementRecord({self.get('element_id')!r}, {self.get('label')!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default if it is not set."""
+        slot = _SLOTS.get(key)
+        if slot is not None:
+            return getattr(self, slot, default)
+        extra = getattr(self, "extra", None)
+        return extra.get(key, default) if extra else default
+
+    def __contains__(self, key: object) -> bool:
+        slot = _SLOTS.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        extra = getattr(self, "extra", None)
+        return bool(extra) and key in extra
+
+    def copy(self) -> "ElementRecord":
+        """Shallow copy of the record."""
+        return ElementRecord(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with the same keys (including legacy aliases)."""
+        return dict(self.items())
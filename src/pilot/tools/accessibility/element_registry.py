@@ -14,108 +14,34 @@ Key improvements:
 2. Epoch-based versioning - marks elements stale instead of deleting
 3. Dynamic role shortening - NO HARDCODED DICTIONARIES
 4. Collision handling for elements with same semantic identity
+
+ID computation, collision handling and staleness live in element_store;
+VersionedElementRegistry is the epoch-flavoured API over that one store.
 """
 
-import hashlib
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, Tuple, List
-
-
-def shorten_role(role: str) -> str:
-    """
-    Dynamically generate short role name from ANY role string.
-
-    NO HARDCODED MAPPINGS. Works with ANY role - known or unknown.
-    This function handles roles that don't exist yet or custom roles.
-
-    Args:
-        role: Any role string (e.g., "Button", "CustomWidget", "FutureRole2030")
-
-    Returns:
-        Short 3-character role identifier (e.g., "but", "cus", "fut")
-    """
-    if not role:
-        return "unk"
-
-    clean = role.lower().strip()
-    if not clean:
-        return "unk"
-
-    return clean[:3] if len(clean) >= 3 else clean
-
-
-def normalize_label_for_id(label: str, max_length: int = 20) -> str:
-    """
-    Normalize label for use in element ID generation.
-
-    Args:
-        label: Raw label string
-        max_length: Maximum length of normalized label
-
-    Returns:
-        Cleaned label suitable for ID (alphanumeric + underscores only)
-    """
-    if not label:
-        return ""
-
-    normalized = label.lower().strip()
-    normalized = "".join(c if c.isalnum() else "_" for c in normalized)
-    normalized = "_".join(part for part in normalized.split("_") if part)
-
-    return normalized[:max_length]
-
-
-def compute_element_id(
-    role: str,
-    label: str,
-    identifier: str,
-    app_name: str,
-    parent_path: str = "",
-) -> str:
-    """
-    Generate stable, semantic element ID.
-
-    CRITICAL: Uses ONLY platform-agnostic normalized data.
-    The platform normalizer has ALREADY:
-    - Stripped AX prefix (macOS)
-    - Mapped Edit→TextField (Windows)
-    - Converted "push button"→Button (Linux)
-
-    ID is DETERMINISTIC: Same element → Same ID every time.
-
-    Args:
-        role: Element role (already normalized by platform normalizer)
-        label: Human-readable label (already normalized)
-        identifier: Platform-specific unique ID (for collision resolution)
-        app_name: Application name
-        parent_path: Hash of ancestor roles for context (optional)
-
-    Returns:
-        Stable element ID like "e_but_save_a1b2c3d4"
-    """
-    identity_parts = [
-        app_name.lower().strip(),
-        role.lower().strip(),
-        label.lower().strip()[:50],
-        identifier.strip(),
-        parent_path.strip(),
-    ]
-    identity = "|".join(identity_parts)
-
-    hash_suffix = hashlib.sha256(identity.encode()).hexdigest()[:8]
-
-    role_short = shorten_role(role)
-
-    label_clean = normalize_label_for_id(label, max_length=8)
-
-    if label_clean:
-        return f"e_{role_short}_{label_clean}_{hash_suffix}"
-    else:
-        return f"e_{role_short}_{hash_suffix}"
+from typing import Dict, Any, Optional, Set, Tuple, List
+
+from .element_store import (
+    NOT_FOUND,
+    STALE,
+    SimpleElementStore,
+    compute_element_id,
+    normalize_label_for_id,
+    shorten_role,
+)
+
+__all__ = [
+    "RegistryEntry",
+    "VersionedElementRegistry",
+    "compute_element_id",
+    "normalize_label_for_id",
+    "shorten_role",
+]
 
 
 @dataclass
-class ElementRecord:
+class RegistryEntry:
     """Record for a registered element."""
 
     element_id: str
@@ -126,7 +52,7 @@ class ElementRecord:
     is_stale: bool = False
 
 
-class VersionedElementRegistry:
+class VersionedElementRegistry(SimpleElementStore):
     """
     Platform-agnostic element registry with epoch-based versioning.
 
@@ -138,6 +64,10 @@ class VersionedElementRegistry:
     Instead of clearing the registry after each interaction, we advance an epoch
     and mark elements stale if they're not seen in subsequent refreshes. This
     allows stale element IDs to return helpful error messages instead of "not found".
+
+    Each refresh_elements() call is one store generation shared by all apps,
+    so marking unseen elements stale and pruning old ones never scans the
+    whole registry.
     """
 
     def __init__(self, max_stale_epochs: int = 5):
@@ -147,9 +77,11 @@ class VersionedElementRegistry:
         Args:
             max_stale_epochs: Number of epochs before element considered definitely stale
         """
-        self._registry: Dict[str, ElementRecord] = {}
+        super().__init__(max_stale_generations=max_stale_epochs * 2)
         self._current_epoch: int = 0
         self._max_stale_epochs: int = max_stale_epochs
+        self._epochs: Dict[str, Tuple[int, int]] = {}
+        self._current_ids: Set[str] = set()
 
     @property
     def current_epoch(self) -> int:
@@ -167,82 +99,9 @@ class VersionedElementRegistry:
             New epoch number
         """
         self._current_epoch += 1
-        self._prune_old_entries()
+        self._prune(self.PRUNE_STEP)
         return self._current_epoch
 
-    def _prune_old_entries(self) -> None:
-        """Remove entries that have been stale for too long."""
-        to_remove = []
-        for eid, record in self._registry.items():
-            if record.is_stale:
-                age = self._current_epoch - record.last_seen_epoch
-                if age > self._max_stale_epochs * 2:
-                    to_remove.append(eid)
-
-        for eid in to_remove:
-            del self._registry[eid]
-
-    def _is_same_element(self, existing: Dict[str, Any], new: Dict[str, Any]) -> bool:
-        """
-        Check if two element dicts represent the same UI element.
-
-        Same if: close position (within 50px) AND same role AND same label.
-
-        Args:
-            existing: Existing element info dict
-            new: New element info dict
-
-        Returns:
-            True if they represent the same element
-        """
-        if existing.get("role") != new.get("role"):
-            return False
-        if existing.get("label") != new.get("label"):
-            return False
-
-        old_center = existing.get("center", [0, 0])
-        new_center = new.get("center", [0, 0])
-
-        if old_center and new_center and len(old_center) >= 2 and len(new_center) >= 2:
-            dx = abs(old_center[0] - new_center[0])
-            dy = abs(old_center[1] - new_center[1])
-            return dx <= 50 and dy <= 50
-
-        return True
-
-    def _resolve_collision(self, computed_id: str, element_info: Dict[str, Any]) -> str:
-        """
-        Handle ID collisions by appending index.
-
-        If e_but_save_a1b2c3d4 already exists:
-        - Check if it's the SAME element (update it)
-        - If different element, use e_but_save_a1b2c3d4_1, then _2, etc.
-
-        Args:
-            computed_id: Pre-computed semantic ID
-            element_info: Element data dictionary
-
-        Returns:
-            Final element ID (may have collision index appended)
-        """
-        final_id = computed_id
-        collision_index = 0
-
-        while final_id in self._registry:
-            existing = self._registry[final_id]
-
-            if self._is_same_element(existing.element_info, element_info):
-                existing.element_info = element_info
-                existing.native_ref = element_info.get("_native_ref")
-                existing.last_seen_epoch = self._current_epoch
-                existing.is_stale = False
-                return final_id
-
-            collision_index += 1
-            final_id = f"{computed_id}_{collision_index}"
-
-        return final_id
-
     def register_element(self, normalized_element: Dict[str, Any]) -> str:
         """
         Register a normalized element.
@@ -264,29 +123,15 @@ class VersionedElementRegistry:
         Returns:
             Stable element ID
         """
-        element_id = compute_element_id(
-            role=normalized_element.get("role", ""),
-            label=normalized_element.get("label", ""),
-            identifier=normalized_element.get("identifier", ""),
-            app_name=normalized_element.get("app_name", ""),
-            parent_path=normalized_element.get("parent_path", ""),
+        element_id = self.store(
+            normalized_element, normalized_element.get("app_name", "")
         )
+        registered = self._epochs.get(element_id, (self._current_epoch,))[0]
+        self._epochs[element_id] = (registered, self._current_epoch)
+        self._current_ids.add(element_id)
+        return element_id
 
-        final_id = self._resolve_collision(element_id, normalized_element)
-
-        if final_id not in self._registry:
-            self._registry[final_id] = ElementRecord(
-                element_id=final_id,
-                element_info=normalized_element,
-                native_ref=normalized_element.get("_native_ref"),
-                registered_epoch=self._current_epoch,
-                last_seen_epoch=self._current_epoch,
-                is_stale=False,
-            )
-
-        return final_id
-
-    def get_element(self, element_id: str) -> Tuple[Optional[ElementRecord], str]:
+    def get_element(self, element_id: str) -> Tuple[Optional[RegistryEntry], str]:
         """
         Get element with staleness status.
 
@@ -299,16 +144,11 @@ class VersionedElementRegistry:
             - "stale": Element exists but may be outdated
             - "not_found": Element not in registry
         """
-        if element_id not in self._registry:
+        if self.status(element_id) == NOT_FOUND:
             return (None, "not_found")
 
-        record = self._registry[element_id]
-
-        if record.is_stale:
-            return (record, "stale")
-
-        epoch_age = self._current_epoch - record.last_seen_epoch
-        if epoch_age > self._max_stale_epochs:
+        record = self._entry(element_id)
+        if record.is_stale or self._epoch_age(record) > self._max_stale_epochs:
             return (record, "stale")
 
         return (record, "valid")
@@ -323,42 +163,46 @@ class VersionedElementRegistry:
         Returns:
             Stats dict with matched, new, and stale counts
         """
-        seen_ids = set()
+        previous_ids = self._current_ids
+        self._current_ids = set()
+        self.begin_generation("")
         stats = {"matched": 0, "new": 0, "stale": []}
 
         for elem_info in elements:
             eid = self.register_element(elem_info)
-            seen_ids.add(eid)
-
-            record = self._registry.get(eid)
-            if record and record.registered_epoch < self._current_epoch:
+            if self._epochs[eid][0] < self._current_epoch:
                 stats["matched"] += 1
             else:
                 stats["new"] += 1
 
-        for eid, record in self._registry.items():
-            if eid not in seen_ids and not record.is_stale:
-                record.is_stale = True
-                stats["stale"].append(eid)
-
+        stats["stale"] = [
+            eid
+            for eid in previous_ids
+            if eid not in self._current_ids and self.status(eid) == STALE
+        ]
         return stats
 
     def clear(self) -> None:
         """Clear all elements (use sparingly - prefer advance_epoch)."""
-        self._registry.clear()
+        self.clear_all()
         self._current_epoch = 0
 
-    def get_all_elements(self) -> Dict[str, ElementRecord]:
+    def clear_all(self) -> None:
+        """Clear all elements and their epoch stamps."""
+        super().clear_all()
+        self._epochs.clear()
+        self._current_ids.clear()
+
+    def get_all_elements(self) -> Dict[str, RegistryEntry]:
         """Get all registered elements (copy)."""
-        return self._registry.copy()
+        return {eid: self._entry(eid) for eid in self._elements}
 
-    def get_valid_elements(self) -> List[ElementRecord]:
+    def get_valid_elements(self) -> List[RegistryEntry]:
         """Get all non-stale elements."""
         return [
             record
-            for record in self._registry.values()
-            if not record.is_stale
-            and (self._current_epoch - record.last_seen_epoch) <= self._max_stale_epochs
+            for record in map(self._entry, self._current_ids)
+            if not record.is_stale and self._epoch_age(record) <= self._max_stale_epochs
         ]
 
     def search_elements(
@@ -366,7 +210,7 @@ class VersionedElementRegistry:
         query: str,
         role_filter: Optional[str] = None,
         include_stale: bool = False,
-    ) -> List[ElementRecord]:
+    ) -> List[RegistryEntry]:
         """
         Search elements by label or identifier.
 
@@ -376,29 +220,39 @@ class VersionedElementRegistry:
             include_stale: Whether to include stale elements
 
         Returns:
-            List of matching ElementRecords
+            List of matching RegistryEntries
         """
-        query_lower = query.lower()
-        results = []
-
-        for record in self._registry.values():
-            if not include_stale and record.is_stale:
-                continue
-
-            if not include_stale:
-                epoch_age = self._current_epoch - record.last_seen_epoch
-                if epoch_age > self._max_stale_epochs:
-                    continue
+        records = [
+            self._entry(elem["element_id"])
+            for elem in self.search(query, role_filter, include_stale=include_stale)
+        ]
+        if include_stale:
+            return records
+        return [r for r in records if self._epoch_age(r) <= self._max_stale_epochs]
 
-            info = record.element_info
-            label = (info.get("label") or "").lower()
-            identifier = (info.get("identifier") or "").lower()
-            role = info.get("role", "")
+    def _generation_key(self, app_key: str) -> str:
+        """All apps share one generation: a refresh covers the whole registry."""
+        return ""
 
-            if role_filter and role_filter.lower() not in role.lower():
-                continue
+    def _remove(self, element_id: str) -> None:
+        super()._remove(element_id)
+        self._epochs.pop(element_id, None)
+        self._current_ids.discard(element_id)
 
-            if query_lower in label or query_lower in identifier:
-                results.append(record)
+    def _entry(self, element_id: str) -> RegistryEntry:
+        """Build the RegistryEntry view of a stored element."""
+        element = self._elements[element_id]
+        registered, last_seen = self._epochs.get(
+            element_id, (self._current_epoch, self._current_epoch)
+        )
+        return RegistryEntry(
+            element_id=element_id,
+            element_info=element,
+            native_ref=element.get("_native_ref"),
+            registered_epoch=registered,
+            last_seen_epoch=last_seen,
+            is_stale=self.status(element_id) == STALE,
+        )
 
-        return results
+    def _epoch_age(self, record: RegistryEntry) -> int:
+        return self._current_epoch - record.last_seen_epoch
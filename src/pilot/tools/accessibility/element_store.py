@@ -1,19 +1,39 @@
 """
-Simple element storage for accessibility elements.
+Generation-based element storage for accessibility elements.
 
-Replaces the epoch-based VersionedElementRegistry with a simple dict-based store.
-No epochs, no staleness tracking - elements are stored until explicitly cleared
-or replaced by a new fetch.
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
 
 Key design:
 - Store elements in a simple dict by element_id
 - Track which elements belong to which app for targeted clearing
 - Generate stable, semantic element IDs based on role + label + context
-- Support direct native ref clicking without staleness checks
+- Support direct native ref clicking: a current element is clicked through
+  its stored reference without re-resolving it
+- Resolve ID collisions in O(1): elements sharing a base ID (e.g. unlabeled
+  table cells) get numbered suffixes from a counter, and re-stored elements
+  are matched by position through a grid of element centers
+- Staleness in O(1): each app has a generation counter that a new scan
+  advances, and every stored element is stamped with the generation it was
+  last seen in. An element with an older stamp is stale - kept so that
+  clicking it explains that the UI moved on rather than "not found".
+- Amortized pruning: stamps are queued in store order and a few queue
+  entries are examined per store() call, dropping elements that have been
+  stale for more than max_stale_generations scans.
 """
 
 import hashlib
-from typing import Dict, Any, Optional, Set
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+Stamp = Tuple[str, int]
+
+VALID = "valid"
+STALE = "stale"
+NOT_FOUND = "not_found"
 
 
 def shorten_role(role: str) -> str:
@@ -108,21 +128,50 @@ def compute_element_id(
 
 class SimpleElementStore:
     """
-    Simple element storage. No epochs, no staleness tracking.
+    Element storage with per-app scan generations.
 
     Elements are stored until:
     - clear_app() is called (clears elements for a specific app)
     - clear_all() is called (clears everything)
     - A new element with the same ID is registered (updates it)
+    - They have been stale for more than max_stale_generations scans
 
-    This design allows clicking multiple elements in sequence without
-    any of them becoming "stale" - just like the working test that
-    clicks 53 buttons in 9 seconds.
+    Interactions do not advance generations, so clicking multiple elements
+    in sequence never makes any of them stale - just like the working test
+    that clicks 53 buttons in 9 seconds. Only begin_generation() (a new
+    scan of the app) does.
     """
 
-    def __init__(self):
+    SAME_ELEMENT_DISTANCE = 10
+    """Max center offset (px, per axis) for two elements to be the same."""
+
+    MAX_STALE_GENERATIONS = 5
+    """Scans an element may be missing from before it is pruned."""
+
+    PRUNE_STEP = 4
+    """Queued stamps examined per store() call."""
+
+    def __init__(self, max_stale_generations: Optional[int] = None):
+        """
+        Initialize the store.
+
+        Args:
+            max_stale_generations: Scans before a stale element is pruned
+                (None = MAX_STALE_GENERATIONS)
+        """
+        self.max_stale_generations = (
+            self.MAX_STALE_GENERATIONS
+            if max_stale_generations is None
+            else max_stale_generations
+        )
         self._elements: Dict[str, Dict[str, Any]] = {}
         self._app_elements: Dict[str, Set[str]] = {}
+        self._next_suffix: Dict[str, Tuple[int, int]] = {}
+        self._cells: Dict[str, Dict[Cell, List[str]]] = {}
+        self._id_positions: Dict[str, Tuple[str, Optional[Cell]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._stamps: Dict[str, Stamp] = {}
+        self._expiry: Deque[Tuple[str, Stamp]] = deque()
 
     def store(self, element: Dict[str, Any], app_name: str) -> str:
         """
@@ -148,39 +197,210 @@ class SimpleElementStore:
             center=element.get("center"),
         )
 
-        final_id = self._resolve_collision(element_id, element)
+        app_key = app_name.lower()
+        generation_key = self._generation_key(app_key)
+        generation = self._generations.get(generation_key, 0)
+        final_id = self._resolve_collision(element_id, element, generation)
 
+        previous = self._stamps.get(final_id)
         element["element_id"] = final_id
         self._elements[final_id] = element
+        self._index_position(final_id, element_id, element)
 
-        app_key = app_name.lower()
         if app_key not in self._app_elements:
             self._app_elements[app_key] = set()
         self._app_elements[app_key].add(final_id)
 
+        stamp = (generation_key, generation)
+        if previous != stamp:
+            self._stamps[final_id] = stamp
+            self._expiry.append((final_id, stamp))
+        self._prune(self.PRUNE_STEP)
+
         return final_id
 
-    def _resolve_collision(self, computed_id: str, element: Dict[str, Any]) -> str:
+    def begin_generation(self, app_name: str) -> int:
         """
-        Handle ID collisions by appending index or updating existing.
+        Start a new scan of an app, making its stored elements stale.
 
-        If same element (same role, label, close position), update it.
-        If different element, append collision index.
+        Elements stored again during the scan become current; the rest stay
+        resolvable as stale until pruned. Runs in O(1).
+
+        Args:
+            app_name: Application about to be scanned
+
+        Returns:
+            The new generation number
+        """
+        key = self._generation_key(app_name.lower())
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        self._prune(self.PRUNE_STEP)
+        return generation
+
+    def generation(self, app_name: str) -> int:
+        """Current scan generation of an app."""
+        return self._generations.get(self._generation_key(app_name.lower()), 0)
+
+    def status(self, element_id: str) -> str:
         """
-        final_id = computed_id
-        collision_index = 0
+        Staleness of a stored element.
+
+        Args:
+            element_id: Element ID to check
 
-        while final_id in self._elements:
-            existing = self._elements[final_id]
+        Returns:
+            VALID, STALE (not seen in the app's latest scan) or NOT_FOUND
+        """
+        stamp = self._stamps.get(element_id)
+        if stamp is None or element_id not in self._elements:
+            return NOT_FOUND
+        if stamp[1] < self._generations.get(stamp[0], 0):
+            return STALE
+        return VALID
+
+    def resolve(self, element_id: str) -> Tuple[Optional[Dict[str, Any]], Any, str]:
+        """
+        Look up an element to act on through its native reference.
 
-            if self._is_same_element(existing, element):
-                return final_id
+        Shared by every platform's click path.
 
+        Args:
+            element_id: Element ID from get_elements()
+
+        Returns:
+            Tuple of (element, native_ref, error). error is empty when the
+            element is current and has a native reference.
+        """
+        element = self._elements.get(element_id)
+        if element is None:
+            return (
+                None,
+                None,
+                f"Element '{element_id}' not found. "
+                "Call get_accessible_elements() to refresh.",
+            )
+        if self.status(element_id) == STALE:
+            return (
+                element,
+                None,
+                f"Element '{element_id}' is stale: it was not in the latest scan "
+                "of the app. Call get_accessible_elements() to refresh.",
+            )
+        node = element.get("_native_ref") or element.get("_element")
+        if not node:
+            return (element, None, f"Element '{element_id}' has no native reference.")
+        return (element, node, "")
+
+    def _generation_key(self, app_key: str) -> str:
+        """Key whose generation counter an app's elements follow."""
+        return app_key
+
+    def _prune(self, steps: int) -> None:
+        """Examine up to steps queued stamps, removing long-stale elements."""
+        while steps > 0 and self._expiry:
+            steps -= 1
+            element_id, stamp = self._expiry[0]
+            if self._stamps.get(element_id) != stamp:
+                self._expiry.popleft()
+                continue
+            current = self._generations.get(stamp[0], 0)
+            if current - stamp[1] <= self.max_stale_generations:
+                return
+            self._expiry.popleft()
+            self._remove(element_id)
+
+    def _remove(self, element_id: str) -> None:
+        """Forget one element and its position and app entries."""
+        element = self._elements.pop(element_id, None)
+        self._stamps.pop(element_id, None)
+        position = self._id_positions.pop(element_id, None)
+        if position is not None:
+            self._unindex_position(element_id, position)
+        if element is not None:
+            for ids in self._app_elements.values():
+                ids.discard(element_id)
+
+    def _resolve_collision(
+        self, computed_id: str, element: Dict[str, Any], generation: int = 0
+    ) -> str:
+        """
+        Handle ID collisions by appending index or updating existing.
+
+        If same element (same role, label, close position), update it.
+        If different element, append the next collision index for the
+        base ID. Only stored elements in neighbouring grid cells are
+        compared, so the cost does not grow with the number of elements
+        sharing the base ID. Suffixes restart with each generation and
+        IDs held only by stale elements are reused, so a rescan hands out
+        the same IDs as the scan before it.
+        """
+        cell = self._cell_of(element)
+        if cell is not None:
+            cells = self._cells.get(computed_id)
+            if cells:
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for candidate in cells.get((cell[0] + dx, cell[1] + dy), ()):
+                            if self._is_same_element(
+                                self._elements[candidate], element
+                            ):
+                                return candidate
+
+        suffix_generation, collision_index = self._next_suffix.get(
+            computed_id, (generation, 0)
+        )
+        if suffix_generation != generation:
+            collision_index = 0
+        final_id = (
+            computed_id if collision_index == 0 else f"{computed_id}_{collision_index}"
+        )
+        while final_id in self._elements and self.status(final_id) != STALE:
             collision_index += 1
             final_id = f"{computed_id}_{collision_index}"
 
+        self._next_suffix[computed_id] = (generation, collision_index + 1)
         return final_id
 
+    def _cell_of(self, element: Dict[str, Any]) -> Optional[Cell]:
+        """Grid cell of an element's center, or None without a center."""
+        center = element.get("center")
+        if not center or len(center) < 2:
+            return None
+        size = self.SAME_ELEMENT_DISTANCE
+        return (int(center[0]) // size, int(center[1]) // size)
+
+    def _index_position(
+        self, element_id: str, computed_id: str, element: Dict[str, Any]
+    ) -> None:
+        """Record the grid cell of a stored element under its base ID."""
+        cell = self._cell_of(element)
+        previous = self._id_positions.get(element_id)
+        if previous == (computed_id, cell):
+            return
+        if previous is not None:
+            self._unindex_position(element_id, previous)
+
+        self._id_positions[element_id] = (computed_id, cell)
+        if cell is not None:
+            self._cells.setdefault(computed_id, {}).setdefault(cell, []).append(
+                element_id
+            )
+
+    def _unindex_position(
+        self, element_id: str, position: Tuple[str, Optional[Cell]]
+    ) -> None:
+        """Remove an element ID from the grid of its base ID."""
+        computed_id, cell = position
+        cells = self._cells.get(computed_id)
+        if cell is None or not cells:
+            return
+        ids = cells.get(cell)
+        if ids and element_id in ids:
+            ids.remove(element_id)
+            if not ids:
+                del cells[cell]
+
     def _is_same_element(self, existing: Dict[str, Any], new: Dict[str, Any]) -> bool:
         """
         Check if two element dicts represent the same UI element.
@@ -236,6 +456,11 @@ class SimpleElementStore:
 
         for eid in element_ids:
             self._elements.pop(eid, None)
+            self._stamps.pop(eid, None)
+            position = self._id_positions.pop(eid, None)
+            if position is not None:
+                self._next_suffix.pop(position[0], None)
+                self._cells.pop(position[0], None)
 
         return len(element_ids)
 
@@ -243,20 +468,33 @@ class SimpleElementStore:
         """Clear all elements from all apps."""
         self._elements.clear()
         self._app_elements.clear()
-
-    def get_app_elements(self, app_name: str) -> list[Dict[str, Any]]:
+        self._next_suffix.clear()
+        self._cells.clear()
+        self._id_positions.clear()
+        self._generations.clear()
+        self._stamps.clear()
+        self._expiry.clear()
+
+    def get_app_elements(
+        self, app_name: str, include_stale: bool = False
+    ) -> list[Dict[str, Any]]:
         """
         Get all elements for a specific app.
 
         Args:
             app_name: Application name
+            include_stale: Also return elements missing from the latest scan
 
         Returns:
             List of element dictionaries
         """
         app_key = app_name.lower()
         element_ids = self._app_elements.get(app_key, set())
-        return [self._elements[eid] for eid in element_ids if eid in self._elements]
+        return [
+            self._elements[eid]
+            for eid in element_ids
+            if eid in self._elements and (include_stale or self.status(eid) == VALID)
+        ]
 
     @property
     def count(self) -> int:
@@ -268,6 +506,7 @@ class SimpleElementStore:
         query: str,
         role_filter: Optional[str] = None,
         app_name: Optional[str] = None,
+        include_stale: bool = False,
     ) -> list[Dict[str, Any]]:
         """
         Search elements by label or identifier.
@@ -276,6 +515,7 @@ class SimpleElementStore:
             query: Search query (case-insensitive partial match)
             role_filter: Optional role to filter by
             app_name: Optional app to limit search to
+            include_stale: Also search elements missing from the latest scan
 
         Returns:
             List of matching element dictionaries
@@ -284,9 +524,13 @@ class SimpleElementStore:
         results = []
 
         if app_name:
-            elements = self.get_app_elements(app_name)
+            elements = self.get_app_elements(app_name, include_stale)
         else:
-            elements = list(self._elements.values())
+            elements = [
+                elem
+                for eid, elem in self._elements.items()
+                if include_stale or self.status(eid) == VALID
+            ]
 
         for elem in elements:
             label = (elem.get("label") or "").lower()
@@ -0,0 +1,66 @@
+"""
+Cheap UI fingerprints used to decide whether a cached snapshot is current.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+A fingerprint records, per window, its role, title, number of top-level
+children and whether it is active, plus the focused element. Backends
+read it with a few calls per window instead of walking the whole tree.
+Two equal fingerprints mean the cached element list can be reused; when
+they differ, changed_windows() names the windows worth walking again.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+
+class WindowFingerprint(NamedTuple):
+    """Top-level summary of one window."""
+
+    key: Any
+    role: str
+    title: str
+    child_count: int
+    active: bool
+
+
+@dataclass(frozen=True)
+class UIFingerprint:
+    """Window list and focus of an application at one point in time."""
+
+    windows: Tuple[WindowFingerprint, ...]
+    focused: Optional[Any] = None
+
+    def window_set_changed(self, previous: "UIFingerprint") -> bool:
+        """
+        Check whether windows were opened or closed.
+
+        Args:
+            previous: Fingerprint taken earlier
+
+        Returns:
+            True if the set of window keys differs
+        """
+        return {w.key for w in self.windows} != {w.key for w in previous.windows}
+
+    def changed_windows(self, previous: "UIFingerprint") -> List[Any]:
+        """
+        Keys of windows that are new or whose summary differs.
+
+        A focus change with otherwise identical windows is attributed to
+        the active windows.
+
+        Args:
+            previous: Fingerprint taken earlier
+
+        Returns:
+            Window keys in the current window order
+        """
+        before = {w.key: w for w in previous.windows}
+        changed = [w.key for w in self.windows if before.get(w.key) != w]
+        if not changed and self.focused != previous.focused:
+            changed = [w.key for w in self.windows if w.active]
+        return changed
@@ -0,0 +1,260 @@
+"""
+Optional traversal instrumentation: IPC counts, node timing, slow subtrees.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+A backend's profiler attribute is None unless profiling was enabled, and
+its walk only checks that attribute once per node, so disabled profiling
+costs nothing measurable. When enabled, the walk reports each node through
+enter() / visited() / leave() and routes native reads through wrap() (or
+count() for backends that batch their reads), and the profiler keeps:
+
+- IPC calls by type (method calls and property reads on native nodes)
+- a histogram of the time spent reading each node
+- per role path (e.g. "frame/panel/table/table row"), the number of nodes,
+  the time spent reading them and the time spent in their subtrees
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0)
+"""Upper bounds of the per-node time buckets; one more bucket holds the rest."""
+
+
+class CountingProxy:
+    """
+    Stand-in for a native node that counts every read made through it.
+
+    Method calls are counted when called, so hasattr() checks are free;
+    other attributes are counted when read. Objects returned by query*
+    methods (interfaces) are wrapped too, with their reads counted as
+    "Interface.member". Return values are otherwise the native objects.
+    """
+
+    __slots__ = ("_target", "_counts", "_prefix", "role_name")
+
+    def __init__(self, target: Any, counts: Counter, prefix: str = ""):
+        self._target = target
+        self._counts = counts
+        self._prefix = prefix
+        self.role_name: Optional[str] = None
+
+    @property
+    def target(self) -> Any:
+        """The wrapped native object."""
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        key = self._prefix + name
+        if not callable(value):
+            self._counts[key] += 1
+            return value
+
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            self._counts[key] += 1
+            result = value(*args, **kwargs)
+            if name.startswith("query") and result is not None:
+                return CountingProxy(result, self._counts, f"{name[5:]}.")
+            if name == "getRoleName":
+                self.role_name = result
+            return result
+
+        return counted
+
+    def __iter__(self):
+        self._counts[self._prefix + "__iter__"] += 1
+        return iter(self._target)
+
+    def __len__(self) -> int:
+        self._counts[self._prefix + "__len__"] += 1
+        return len(self._target)
+
+
+class _PathStats:
+    __slots__ = ("nodes", "self_time", "total_time")
+
+    def __init__(self):
+        self.nodes = 0
+        self.self_time = 0.0
+        self.total_time = 0.0
+
+
+class TraversalProfiler:
+    """
+    Collects instrumentation for the walks of one backend.
+
+    Counters accumulate over walks until reset(). Walks on different
+    threads are not expected (backends walk on a single thread), but the
+    report is built under a lock so it can be read from any thread.
+    """
+
+    def __init__(self, top_n: int = 10):
+        """
+        Initialize the profiler.
+
+        Args:
+            top_n: Number of slowest role paths included in report()
+        """
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self.ipc: Counter = Counter()
+            self.nodes = 0
+            self.walks = 0
+            self.histogram: List[int] = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+            self._paths: Dict[str, _PathStats] = {}
+            self._stack: List[str] = []
+
+    def wrap(self, node: Any) -> CountingProxy:
+        """Proxy a native node so its reads are counted as IPC."""
+        return CountingProxy(node, self.ipc)
+
+    def count(self, call_type: str, calls: int = 1) -> None:
+        """Record IPC calls made without a proxy (e.g. batched reads)."""
+        self.ipc[call_type] += calls
+
+    def begin_walk(self) -> None:
+        """Mark the start of a walk (for the walk counter)."""
+        self.walks += 1
+        self._stack.clear()
+
+    def enter(self) -> float:
+        """
+        Start timing a node. Must be paired with leave().
+
+        Returns:
+            Token to pass to visited() and leave()
+        """
+        self._stack.append("?")
+        return time.perf_counter()
+
+    def visited(self, started: float, role: Optional[str]) -> None:
+        """
+        Record the time spent reading a node and its role.
+
+        Args:
+            started: Token from enter()
+            role: Role name of the node (None if unknown)
+        """
+        elapsed = time.perf_counter() - started
+        self._stack[-1] = role or "?"
+        self.nodes += 1
+        self.histogram[self._bucket(elapsed * 1000)] += 1
+        stats = self._path_stats()
+        stats.nodes += 1
+        stats.self_time += elapsed
+
+    def leave(self, started: float) -> None:
+        """
+        Record the time spent in a node's whole subtree.
+
+        Args:
+            started: Token from enter()
+        """
+        self._path_stats().total_time += time.perf_counter() - started
+        self._stack.pop()
+
+    def report(self, top_n: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Summary of everything collected so far.
+
+        Role paths are ranked by the time spent reading their own nodes,
+        which points at the subtree where the walk spends its time rather
+        than at the windows containing it.
+
+        Args:
+            top_n: Number of role paths to include (default: self.top_n)
+
+        Returns:
+            Dictionary with walks, nodes, ipc, ipc_total, histogram and
+            slowest_subtrees
+        """
+        limit = self.top_n if top_n is None else top_n
+        with self._lock:
+            paths = sorted(
+                self._paths.items(), key=lambda item: item[1].self_time, reverse=True
+            )[:limit]
+            bounds = [*HISTOGRAM_BOUNDS_MS, None]
+            return {
+                "walks": self.walks,
+                "nodes": self.nodes,
+                "ipc": dict(self.ipc.most_common()),
+                "ipc_total": sum(self.ipc.values()),
+                "histogram": [
+                    {"le_ms": bound, "count": count}
+                    for bound, count in zip(bounds, self.histogram)
+                ],
+                "slowest_subtrees": [
+                    {
+                        "path": path,
+                        "nodes": stats.nodes,
+                        "self_ms": round(stats.self_time * 1000, 3),
+                        "total_ms": round(stats.total_time * 1000, 3),
+                    }
+                    for path, stats in paths
+                ],
+            }
+
+    def _path_stats(self) -> _PathStats:
+        path = "/".join(self._stack)
+        stats = self._paths.get(path)
+        if stats is None:
+            stats = _PathStats()
+            self._paths[path] = stats
+        return stats
+
+    @staticmethod
+    def _bucket(elapsed_ms: float) -> int:
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                return i
+        return len(HISTOGRAM_BOUNDS_MS)
+
+
+def format_profile(report: Dict[str, Any], top_n: int = 5) -> List[str]:
+    """
+    Human-readable lines for a profiler report (for verbose output).
+
+    Args:
+        report: Result of TraversalProfiler.report()
+        top_n: Number of IPC types and role paths to show
+
+    Returns:
+        Lines of text, empty if nothing was recorded
+    """
+    if not report or not report.get("nodes"):
+        return []
+    lines = [
+        f"Traversal: {report['nodes']} nodes, {report['ipc_total']} IPC calls "
+        f"over {report['walks']} walk(s)"
+    ]
+    top_ipc = list(report["ipc"].items())[:top_n]
+    if top_ipc:
+        lines.append("IPC: " + ", ".join(f"{name}={n}" for name, n in top_ipc))
+    buckets = []
+    for bucket in report["histogram"]:
+        if not bucket["count"]:
+            continue
+        if bucket["le_ms"] is None:
+            label = f">{HISTOGRAM_BOUNDS_MS[-1]}ms"
+        else:
+            label = f"<={bucket['le_ms']}ms"
+        buckets.append(f"{label}:{bucket['count']}")
+    lines.append("Per node: " + " ".join(buckets))
+    for entry in report["slowest_subtrees"][:top_n]:
+        lines.append(
+            f"  {entry['self_ms']:.1f}ms self / {entry['total_ms']:.1f}ms total, "
+            f"{entry['nodes']} nodes: {entry['path']}"
+        )
+    return lines
@@ -8,14 +8,44 @@ Design principles:
 - Consistent API with macOS/Windows implementations
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import Future
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+import os
 import threading
 import platform
 
+from ....utils.threading.single_flight import SingleFlight
+from ....utils.threading.worker import (
+    PRIORITY_ACTION,
+    PRIORITY_QUERY,
+    PRIORITY_SNAPSHOT,
+    get_accessibility_worker,
+)
 from ..protocol import AccessibilityProtocol
 from ..element_store import SimpleElementStore
 from ..cache_manager import AccessibilityCacheManager
-from .role_normalizer import normalize_linux_element
+from ..fingerprint import UIFingerprint
+from ..tables import TableColumn, TableOptions
+from ..skeleton_cache import SkeletonCache
+from ..containers import ContainerPage, ExpansionOptions
+from ..traversal import CullingOptions, ElementStream, TraversalBudget, TraversalScope
+from .app_lookup import AppLookup
+from .async_client import AsyncAtspiClient
+from .clicks import ClickActions
+from .collection import CollectionQuery
+from .container_expansion import ContainerExpander
+from .event_listener import AtspiEventListener
+from .focus_tracker import FocusTracker
+from .scopes import ScopedWalk
+from .snapshots import ElementSnapshots
+from .streaming import ElementStreamer
+from .subtree_cache import SubtreeCache
+from .subtree_repair import SubtreeRepair
+from .table_reader import TableReader
+from .text_cache import TextCache
+from .text_reader import TextReader
+from .walker import TreeWalker
+from .warm_start import WarmStart
 
 
 class LinuxAccessibility(AccessibilityProtocol):
@@ -24,8 +54,17 @@ class LinuxAccessibility(AccessibilityProtocol):
 
     Provides accurate element coordinates via AT-SPI APIs with stable
     semantic element IDs through the shared registry.
+
+    All AT-SPI calls run on a dedicated accessibility thread, so a long
+    walk never blocks the asyncio loop. Clicks are served ahead of queued
+    snapshots, and a cancelled snapshot stops walking at the next node.
     """
 
+    STREAM_BATCH = 50
+    APP_REFRESH_SECONDS = 2.0
+    supports_background_walks = True
+    supports_text_extraction = True
+
     def __init__(self, screen_width: int = 1920, screen_height: int = 1080):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -36,6 +75,31 @@ class LinuxAccessibility(AccessibilityProtocol):
         self._cache = AccessibilityCacheManager()
         self._max_depth = 25
         self._lock = threading.RLock()
+        self._worker = get_accessibility_worker()
+        self.call_timeout: Optional[float] = None
+        self._flights = SingleFlight()
+        self._walks = 0
+        self._subtrees = SubtreeCache()
+        self._events: Optional[AtspiEventListener] = None
+        self._collection: Optional[CollectionQuery] = None
+        self.use_collection = True
+        self._async_client: Optional[AsyncAtspiClient] = None
+        self._streams = ElementStreamer()
+        self.culling = CullingOptions()
+        self.expansion = ExpansionOptions()
+        self.table_extraction = TableOptions()
+        self._tables = TableReader()
+        self._containers = ContainerExpander()
+        self._walker = TreeWalker()
+        self._snapshots = ElementSnapshots()
+        self._clicks = ClickActions()
+        self._scopes = ScopedWalk()
+        self._texts = TextCache()
+        self._text_reader = TextReader(self._texts)
+        self._apps = AppLookup()
+        self._repair = SubtreeRepair()
+        self._focus = FocusTracker()
+        self._warm_start = WarmStart(SkeletonCache.from_env())
 
         if self.available:
             self._initialize_api()
@@ -54,6 +118,10 @@ class LinuxAccessibility(AccessibilityProtocol):
             self.pyatspi = pyatspi
             self.desktop = pyatspi.Registry.getDesktop(0)
             list(self.desktop)
+            self._collection = CollectionQuery(pyatspi)
+            self._start_event_listener()
+            if os.getenv("PILOT_ATSPI_ASYNC", "").lower() in ("1", "true", "yes"):
+                self._start_async_client()
         except Exception as e:
             from ....utils.ui import print_warning, print_info
 
@@ -61,338 +129,296 @@ class LinuxAccessibility(AccessibilityProtocol):
             print_info("Ensure accessibility is enabled in system settings")
             self.available = False
 
-    def _run_accessibility(self, func, *args, **kwargs):
-        from ....utils.threading.main_thread import run_on_main_thread
+    def _start_event_listener(self) -> None:
+        """Subscribe to AT-SPI change events that invalidate cached subtrees."""
+        listener = AtspiEventListener(self.pyatspi)
+        if listener.start() and self._attach_listener(listener):
+            self._events = listener
+        else:
+            listener.stop()
+
+    def _attach_listener(self, listener: AtspiEventListener) -> bool:
+        """Subscribe the subtree cache and focus tracking to a listener."""
+        if not listener.subscribe(SubtreeCache.EVENT_TYPES, self._subtrees.on_event):
+            return False
+        listener.subscribe(FocusTracker.EVENT_TYPES, self._focus.on_event)
+        listener.subscribe(TextCache.EVENT_TYPES, self._texts.on_event)
+        listener.subscribe(
+            ("object:children-changed",),
+            lambda event: self._apps.on_desktop_changed(self, event),
+        )
+        return True
+
+    def _start_async_client(self) -> None:
+        """Connect the pipelined D-Bus client (requires dbus-fast)."""
+        client = AsyncAtspiClient()
+        if client.connect():
+            self._async_client = client
 
+    @property
+    def tracks_changes(self) -> bool:
+        """True when AT-SPI events keep cached subtrees up to date."""
+        return self._events is not None and self._events.active
+
+    def _run_accessibility(self, func, *args, priority=PRIORITY_QUERY, **kwargs):
         def _call():
             with self._lock:
                 return func(*args, **kwargs)
 
-        return run_on_main_thread(_call)
+        return self._worker.call(_call, priority=priority, timeout=self.call_timeout)
+
+    def _cancelled(self) -> bool:
+        """True if the snapshot running on the worker has been cancelled."""
+        return self._worker.cancel_requested()
 
     def invalidate_cache(self, app_name: Optional[str] = None) -> None:
+        """
+        Invalidate cached elements for an app or all apps.
+
+        When change events are tracked, walked subtrees for a single app are
+        kept: the next get_elements() re-walks only branches that changed.
+        Invalidating all apps always drops every subtree.
+        """
         with self._lock:
             self._cache.invalidate(app_name)
             if app_name:
-                self._store.clear_app(app_name)
+                self._store.begin_generation(app_name)
+                if not self.tracks_changes:
+                    self._subtrees.drop(app_name)
             else:
                 self._store.clear_all()
+                self._subtrees.drop()
+                self._streams.clear()
+                self._repair.clear()
+                self._warm_start.clear()
+                self._tables.clear()
+                self._texts.clear()
+                self._apps.registry.stale = True
+                self._focus.reset()
 
     def get_app(self, app_name: str, retry_count: int = 3) -> Optional[Any]:
         return self._run_accessibility(self._get_app_impl, app_name, retry_count)
 
     def _get_app_impl(self, app_name: str, retry_count: int = 3) -> Optional[Any]:
-        if not self.available or not app_name:
-            return None
-
-        cache_key = app_name.lower()
-
-        cached = self._cache.get_app(cache_key)
-        if cached:
-            return cached
-
-        try:
-            for app in self.desktop:
-                name = getattr(app, "name", "")
-                if name and self._matches_name(name, app_name):
-                    self._cache.set_app(cache_key, app)
-                    return app
-        except Exception:
-            pass
-
-        return None
+        return self._apps.find(self, app_name)
 
     def get_windows(self, app: Any) -> List[Any]:
         return self._run_accessibility(self._get_windows_impl, app)
 
     def _get_windows_impl(self, app: Any) -> List[Any]:
-        if not app:
-            return []
-
-        windows = []
-        try:
-            for i in range(app.childCount):
-                try:
-                    child = app.getChildAtIndex(i)
-                    role = child.getRoleName().lower()
-                    if role in ("frame", "window", "dialog"):
-                        windows.append(child)
-                except Exception:
-                    continue
-        except Exception:
-            pass
-
-        return windows
+        return self._apps.windows(app)
 
     def get_elements(
         self, app_name: str, interactive_only: bool = True, use_cache: bool = True
     ) -> List[Dict[str, Any]]:
-        return self._run_accessibility(
-            self._get_elements_impl, app_name, interactive_only, use_cache
-        )
+        if self._worker.on_worker_thread():
+            return self._get_elements_impl(app_name, interactive_only, use_cache)
+        future = self.submit_elements(app_name, interactive_only, use_cache)
+        return future.result(timeout=self.call_timeout)
 
-    def _get_elements_impl(
+    def submit_elements(
         self, app_name: str, interactive_only: bool = True, use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
-        if not self.available:
-            return []
-
-        cache_key = f"{app_name.lower()}:{interactive_only}"
-
-        if use_cache:
-            cached = self._cache.get_elements(cache_key)
-            if cached:
-                return cached[1]
-
-        app = self.get_app(app_name)
-        if not app:
-            return []
-
-        elements: List[Dict[str, Any]] = []
-        app_name_lower = app_name.lower()
-        for window in self.get_windows(app):
-            self._traverse(window, elements, interactive_only, 0, app_name_lower)
-
-        self._cache.set_elements(cache_key, elements)
-        return elements
-
-    def _is_element_interactive(self, node: Any) -> bool:
+    ) -> Future:
         """
-        Check if element is interactive by querying the API, NOT by role name.
-
-        Uses actual AT-SPI methods to determine interactivity:
-        - queryAction().nActions: Does it have actions?
-        - getState().contains(STATE_ENABLED): Is it enabled?
-
-        Args:
-            node: pyatspi accessible node
+        Queue get_elements() on the accessibility thread without waiting.
 
-        Returns:
-            True if element appears to be interactive
+        Concurrent requests for the same app and interactive_only share one
+        walk. A request with use_cache=False only joins a walk that also
+        skips the cache. Cancelling the returned future drops the walk if
+        it has not started, or stops it early if it has, for every caller
+        sharing it.
         """
-        try:
-            has_actions = False
-            try:
-                action_iface = node.queryAction()
-                has_actions = action_iface.nActions > 0
-            except Exception:
-                pass
-
-            is_enabled = False
-            try:
-                state_set = node.getState()
-                is_enabled = state_set.contains(self.pyatspi.STATE_ENABLED)
-            except Exception:
-                pass
-
-            return has_actions or is_enabled
-        except Exception:
-            return False
 
-    def _traverse(
-        self,
-        node: Any,
-        elements: List[Dict[str, Any]],
-        interactive_only: bool,
-        depth: int = 0,
-        app_name: str = "",
-    ) -> None:
-        """
-        Traverse AT-SPI tree and register elements.
+        def _call():
+            with self._lock:
+                return self._get_elements_impl(app_name, interactive_only, use_cache)
 
-        Dynamic detection: Elements are registered based on their actual
-        capabilities (has_actions, is_enabled), NOT based on hardcoded role lists.
+        return self._flights.submit(
+            (app_name.lower(), interactive_only),
+            lambda: self._worker.submit(_call, priority=PRIORITY_SNAPSHOT),
+            tag=use_cache,
+            can_join=lambda shared_uses_cache: use_cache or not shared_uses_cache,
+        )
 
-        Args:
-            node: Current pyatspi accessible node
-            elements: List to accumulate elements
-            interactive_only: If True, only register interactive elements
-            depth: Current traversal depth
-            app_name: Application name
+    def get_cache_stats(self) -> Dict[str, Any]:
         """
-        if depth > self._max_depth:
-            return
-
-        try:
-            if not interactive_only or self._is_element_interactive(node):
-                self._register_element(node, app_name, elements)
-
-            for i in range(node.childCount):
-                try:
-                    child = node.getChildAtIndex(i)
-                    self._traverse(
-                        child, elements, interactive_only, depth + 1, app_name
-                    )
-                except Exception:
-                    continue
+        Element cache counters plus traversal counters.
 
-        except Exception:
-            pass
+        traversals.requests counts get_elements() calls, started the walks
+        queued for them, coalesced the calls that joined an in-flight walk,
+        and walks the calls that read the tree instead of the cache.
+        """
+        stats = super().get_cache_stats()
+        stats["traversals"] = dict(self._flights.stats().to_dict(), walks=self._walks)
+        return stats
 
-    def _register_element(
-        self, node: Any, app_name: str, elements: List[Dict[str, Any]]
-    ) -> None:
-        normalized = normalize_linux_element(
-            node, self.pyatspi, app_name, self.screen_width, self.screen_height
+    def get_scoped_elements(
+        self,
+        app_name: str,
+        scope: TraversalScope,
+        interactive_only: bool = True,
+    ) -> List[Dict[str, Any]]:
+        return self._run_accessibility(
+            self._get_scoped_elements_impl, app_name, scope, interactive_only
         )
-        if not normalized:
-            return
 
-        normalized["_native_ref"] = node
-        element_id = self._store.store(normalized, app_name)
-        normalized["element_id"] = element_id
+    def _get_scoped_elements_impl(
+        self, app_name: str, scope: TraversalScope, interactive_only: bool = True
+    ) -> List[Dict[str, Any]]:
+        if not self.available:
+            return []
+        if scope.whole_app:
+            return self._get_elements_impl(app_name, interactive_only)
+        return self._scopes.elements(self, app_name, scope, interactive_only)
 
-        is_bottom = (
-            normalized["center"][1] > self.screen_height * 0.75
-            if normalized["center"]
-            else False
+    def expand_container(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
+        return self._run_accessibility(
+            self._expand_container_impl, element_id, offset, limit, interactive_only
         )
-        normalized["is_bottom"] = is_bottom
-        normalized["title"] = normalized["label"]
-        normalized["_element"] = node
-        normalized["_app_name"] = app_name
-
-        elements.append(normalized)
 
-    def click_by_id(
-        self, element_id: str, click_type: str = "single"
-    ) -> Tuple[bool, str]:
-        return self._run_accessibility(self._click_by_id_impl, element_id, click_type)
-
-    def _click_by_id_impl(
-        self, element_id: str, click_type: str = "single"
-    ) -> Tuple[bool, str]:
+    def _expand_container_impl(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
         if not self.available:
-            return (False, "Accessibility not available")
+            page = ContainerPage(element_id, offset=max(0, offset))
+            page.error = "Accessibility is not available."
+            return page
+        return self._containers.expand(
+            self, element_id, offset, limit, interactive_only
+        )
 
-        element = self._store.get(element_id)
+    def _get_elements_impl(
+        self, app_name: str, interactive_only: bool = True, use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        if not self.available:
+            return []
+        return self._snapshots.get(self, app_name, interactive_only, use_cache)
 
-        if not element:
-            return (
-                False,
-                f"Element '{element_id}' not found. Call get_accessible_elements() to refresh.",
-            )
+    def get_skeleton_elements(self, app_name: str) -> List[Dict[str, Any]]:
+        return self._run_accessibility(
+            self._skeleton_elements_impl, app_name, priority=PRIORITY_SNAPSHOT
+        )
 
-        node = element.get("_native_ref") or element.get("_element")
-        label = element.get("label", element_id)
-        app_name = element.get("app_name", "")
+    def _skeleton_elements_impl(self, app_name: str) -> List[Dict[str, Any]]:
+        if not self.available:
+            return []
+        return self._warm_start.elements(self, app_name)
 
-        if not node:
-            return (False, f"Element '{element_id}' has no native reference.")
+    def stream_elements(
+        self,
+        app_name: str,
+        interactive_only: bool = True,
+        budget: Optional[TraversalBudget] = None,
+        cursor: Optional[str] = None,
+    ) -> ElementStream:
+        """
+        Walk breadth-first and yield elements while the walk runs.
 
-        try:
-            self._perform_click(node, click_type)
-            self._cache.on_interaction(app_name if app_name else None)
-            return (True, f"Clicked '{label}'")
-        except Exception as e:
-            return (
-                False,
-                f"Click failed for '{label}': {e}. UI may have changed - call get_accessible_elements() to refresh.",
+        Active and focused windows are visited first, then showing ones.
+        A cached or event-repaired element list is yielded directly.
+        """
+        return ElementStream(
+            lambda stream: self._streams.stream(
+                self,
+                stream,
+                app_name,
+                interactive_only,
+                budget or TraversalBudget(),
+                cursor,
             )
+        )
 
-    def _perform_click(self, node: Any, click_type: str = "single") -> None:
-        normalized = (click_type or "single").strip().lower()
+    def probe_fingerprint(self, app_name: str) -> Optional[UIFingerprint]:
+        """Read window titles, top-level child counts and focus; no full walk."""
+        return self._run_accessibility(
+            self._repair.probe, self, app_name, priority=PRIORITY_SNAPSHOT
+        )
 
-        action_iface = node.queryAction()
+    def revalidate_cache(self, app_name: str) -> bool:
+        """
+        Keep the cached snapshot if the UI fingerprint has not changed.
 
-        action_map = {
-            "single": ("click", "press", "activate"),
-            "double": ("double", "open", "activate"),
-            "right": ("context", "menu", "popup"),
-        }
+        On a match the cached element lists get a fresh TTL. Otherwise the
+        app's element lists are invalidated; without change events, walked
+        subtrees of unchanged windows are kept and only windows whose
+        fingerprint changed are walked again.
+        """
+        return self._run_accessibility(
+            self._repair.revalidate, self, app_name, priority=PRIORITY_SNAPSHOT
+        )
 
-        preferred = action_map.get(normalized, action_map["single"])
+    def _apply_pending_events(self) -> None:
+        """Drain queued AT-SPI events and drop element caches they affect."""
+        if not self.tracks_changes:
+            return
+        self._events.pump()
+        for cache_key in self._subtrees.take_dirty_keys():
+            self._cache.invalidate_elements(cache_key)
 
-        for i in range(action_iface.nActions):
-            action_name = action_iface.getName(i).lower()
-            if any(p in action_name for p in preferred):
-                action_iface.doAction(i)
-                return
+    def _store_element(self, element: Dict[str, Any], app_name: str) -> str:
+        """Register an element in the store and record its ID."""
+        element_id = self._store.store(element, app_name)
+        element["element_id"] = element_id
+        return element_id
 
-        for i in range(action_iface.nActions):
-            action_name = action_iface.getName(i).lower()
-            if "click" in action_name or "press" in action_name:
-                action_iface.doAction(i)
-                return
+    def click_by_id(
+        self, element_id: str, click_type: str = "single"
+    ) -> Tuple[bool, str]:
+        return self._run_accessibility(
+            self._clicks.by_id,
+            self,
+            element_id,
+            click_type,
+            priority=PRIORITY_ACTION,
+        )
 
-        raise Exception("No click/press action available")
+    def click_table_cell(
+        self,
+        element_id: str,
+        row: int,
+        column: TableColumn = None,
+        click_type: str = "single",
+    ) -> Tuple[bool, str]:
+        return self._run_accessibility(
+            self._clicks.table_cell,
+            self,
+            element_id,
+            row,
+            column,
+            click_type,
+            priority=PRIORITY_ACTION,
+        )
 
     def get_frontmost_app(self) -> Optional[str]:
-        return self._run_accessibility(self._get_frontmost_app_impl)
-
-    def _get_frontmost_app_impl(self) -> Optional[str]:
-        if not self.available:
-            return None
-
-        try:
-            for app in self.desktop:
-                for i in range(app.childCount):
-                    try:
-                        window = app.getChildAtIndex(i)
-                        state_set = window.getState()
-                        if state_set.contains(self.pyatspi.STATE_ACTIVE):
-                            return app.name
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        return None
+        return self._run_accessibility(self._apps.frontmost, self)
 
     def is_app_frontmost(self, app_name: str) -> bool:
         frontmost = self.get_frontmost_app()
-        return frontmost is not None and self._matches_name(frontmost, app_name)
+        if frontmost is None:
+            return False
+        return frontmost == self._run_accessibility(
+            self._apps.resolve_name, self, app_name
+        )
 
     def get_window_bounds(self, app_name: str) -> Optional[Tuple[int, int, int, int]]:
-        return self._run_accessibility(self._get_window_bounds_impl, app_name)
-
-    def _get_window_bounds_impl(
-        self, app_name: str
-    ) -> Optional[Tuple[int, int, int, int]]:
-        if not self.available:
-            return None
-
-        app = self.get_app(app_name)
-        if not app:
-            return None
-
-        windows = self.get_windows(app)
-        if not windows:
-            return None
-
-        try:
-            component = windows[0].queryComponent()
-            extents = component.getExtents(self.pyatspi.DESKTOP_COORDS)
-            x, y, w, h = extents.x, extents.y, extents.width, extents.height
-            return (int(x), int(y), int(w), int(h))
-        except Exception:
-            return None
+        return self._run_accessibility(self._apps.window_bounds, self, app_name)
 
     def get_running_apps(self) -> List[str]:
-        return self._run_accessibility(self._get_running_apps_impl)
-
-    def _get_running_apps_impl(self) -> List[str]:
-        if not self.available:
-            return []
-
-        apps = []
-        try:
-            for app in self.desktop:
-                name = getattr(app, "name", "")
-                if name:
-                    apps.append(name)
-        except Exception:
-            pass
-        return apps
+        return self._run_accessibility(self._apps.running, self)
 
     def is_app_running(self, app_name: str) -> bool:
         return self.get_app(app_name) is not None
 
-    def _matches_name(self, name1: str, name2: str) -> bool:
-        if not name1 or not name2:
-            return False
-        n1, n2 = name1.lower(), name2.lower()
-        return n1 in n2 or n2 in n1
-
     def find_element(
         self, app_name: str, label: str, exact_match: bool = False
     ) -> Optional[Dict[str, Any]]:
@@ -455,22 +481,13 @@ class LinuxAccessibility(AccessibilityProtocol):
         return (False, element)
 
     def get_text(self, app_name: str) -> List[str]:
-        if not self.available:
-            return []
-
-        texts = []
-        seen = set()
-
-        for elem in self.get_elements(
-            app_name, interactive_only=False, use_cache=False
-        ):
-            for key in ("label", "title", "description", "identifier"):
-                val = elem.get(key, "")
-                if val and val not in seen:
-                    texts.append(val)
-                    seen.add(val)
+        return list(self.stream_text(app_name))
 
-        return texts
+    def stream_text(self, app_name: str) -> Iterator[str]:
+        """Yield each label once, then document text in pieces; see TextReader."""
+        if not self.available:
+            return
+        yield from self._text_reader.stream(self, app_name)
 
     def get_element_by_id(self, element_id: str) -> Optional[Dict[str, Any]]:
         return self._store.get(element_id)
@@ -525,40 +542,13 @@ class LinuxAccessibility(AccessibilityProtocol):
     def click_element_or_parent(
         self, element_dict: Dict[str, Any], max_depth: int = 5
     ) -> Tuple[bool, str]:
-        if not self.available:
-            return (False, "unavailable")
-
-        node = element_dict.get("_native_ref") or element_dict.get("_element")
-        if not node:
-            return (False, "no_reference")
-
-        try:
-            self._perform_click(node)
-            self._cache.on_interaction()
-            return (True, "element")
-        except Exception:
-            pass
-
-        current = node
-        for depth in range(1, max_depth + 1):
-            try:
-                if hasattr(current, "getParent"):
-                    parent = current.getParent()
-                    if parent:
-                        try:
-                            self._perform_click(parent)
-                            self._cache.on_interaction()
-                            return (True, f"parent_{depth}")
-                        except Exception:
-                            current = parent
-                    else:
-                        break
-                else:
-                    break
-            except Exception:
-                break
-
-        return (False, "not_clickable")
+        return self._run_accessibility(
+            self._clicks.element_or_parent,
+            self,
+            element_dict,
+            max_depth,
+            priority=PRIORITY_ACTION,
+        )
 
     def try_click_element_or_parent(
         self, element_dict: Dict[str, Any], max_depth: int = 5
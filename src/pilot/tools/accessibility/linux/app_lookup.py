@@ -0,0 +1,188 @@
+"""
+Resolving AT-SPI applications, their windows and the frontmost app.
+
+Apps are looked up by name, alias or executable through an AppRegistry,
+kept current from desktop children-changed events (or rescanned every
+APP_REFRESH_SECONDS when events are not tracked), so repeated lookups
+cost no IPC. Exited processes are dropped from /proc.
+"""
+
+import time
+from typing import Any, List, Optional, Tuple
+
+from ..app_registry import AppEntry, AppRegistry, ProcessIndex
+from .subtree_cache import node_key
+
+
+class AppLookup:
+    """
+    App registry and app-level queries for one LinuxAccessibility backend.
+
+    Attributes:
+        registry: Running applications indexed by name, alias and PID
+        processes: Executable names of running processes
+    """
+
+    def __init__(self):
+        self.registry = AppRegistry()
+        self.processes = ProcessIndex()
+        self._checked = 0.0
+
+    def find(self, backend: Any, app_name: str) -> Optional[Any]:
+        """Application node of the best match for app_name, or None."""
+        if not backend.available or not app_name:
+            return None
+        self.refresh(backend)
+        entry = self.registry.best(app_name)
+        return entry.handle if entry is not None else None
+
+    def resolve_name(self, backend: Any, app_name: str) -> Optional[str]:
+        """Registered name of the best match for app_name, or None."""
+        if not backend.available or not app_name:
+            return None
+        self.refresh(backend)
+        entry = self.registry.best(app_name)
+        return entry.name if entry is not None else None
+
+    def running(self, backend: Any) -> List[str]:
+        """Names of the running applications."""
+        if not backend.available:
+            return []
+        self.refresh(backend)
+        return self.registry.names()
+
+    def refresh(self, backend: Any) -> None:
+        """Bring the app registry up to date before a lookup."""
+        now = time.monotonic()
+        due = now - self._checked >= backend.APP_REFRESH_SECONDS
+        if backend.tracks_changes:
+            backend._apply_pending_events()
+            if due:
+                self._checked = now
+                for pid in self.processes.refresh()[1]:
+                    self.registry.remove_pid(pid)
+            if not self.registry.stale:
+                return
+        elif not (self.registry.stale or due):
+            return
+
+        entries = []
+        try:
+            for app in backend.desktop:
+                entry = self._entry(app)
+                if entry is not None:
+                    entries.append(entry)
+        except Exception:
+            return
+        self.registry.sync(entries)
+        self._checked = now
+
+    def on_desktop_changed(self, backend: Any, event: Any) -> None:
+        """Apply an application being added to or removed from the desktop."""
+        source = getattr(event, "source", None)
+        if source is None or backend.desktop is None:
+            return
+        if node_key(source) != node_key(backend.desktop):
+            return
+        app = getattr(event, "any_data", None)
+        if app is None:
+            self.registry.stale = True
+        elif str(getattr(event, "type", "")).endswith("remove"):
+            self.registry.remove(node_key(app))
+        else:
+            entry = self._entry(app)
+            if entry is None:
+                self.registry.stale = True
+            else:
+                self.registry.add(entry)
+
+    @staticmethod
+    def windows(app: Any) -> List[Any]:
+        """Frame, window and dialog children of an application node."""
+        if not app:
+            return []
+
+        windows = []
+        try:
+            for i in range(app.childCount):
+                try:
+                    child = app.getChildAtIndex(i)
+                    role = child.getRoleName().lower()
+                    if role in ("frame", "window", "dialog"):
+                        windows.append(child)
+                except Exception:
+                    continue
+        except Exception:
+            pass
+
+        return windows
+
+    @staticmethod
+    def frontmost(backend: Any) -> Optional[str]:
+        """
+        Name of the app owning the active window.
+
+        Answered from focus events when they are tracked; otherwise every
+        app's windows are scanned and the result seeds the focus tracker.
+        """
+        if not backend.available:
+            return None
+
+        backend._apply_pending_events()
+        focus = backend._focus
+        if backend.tracks_changes and focus.known:
+            return focus.frontmost_app()
+
+        try:
+            for app in backend.desktop:
+                for i in range(app.childCount):
+                    try:
+                        window = app.getChildAtIndex(i)
+                        state_set = window.getState()
+                        if state_set.contains(backend.pyatspi.STATE_ACTIVE):
+                            focus.seed(app.name, window)
+                            return app.name
+                    except Exception:
+                        continue
+        except Exception:
+            return None
+        focus.seed(None)
+        return None
+
+    def window_bounds(
+        self, backend: Any, app_name: str
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Desktop extents of an app's first window, or None."""
+        windows = self.windows(self.find(backend, app_name))
+        if not windows:
+            return None
+
+        try:
+            component = windows[0].queryComponent()
+            extents = component.getExtents(backend.pyatspi.DESKTOP_COORDS)
+            x, y, w, h = extents.x, extents.y, extents.width, extents.height
+            return (int(x), int(y), int(w), int(h))
+        except Exception:
+            return None
+
+    def _entry(self, app: Any) -> Optional[AppEntry]:
+        """Registry entry for an application node, or None if it is unnamed."""
+        try:
+            name = app.name or ""
+        except Exception:
+            return None
+        if not name:
+            return None
+        try:
+            pid = app.get_process_id()
+        except Exception:
+            pid = None
+        if pid is not None and pid <= 0:
+            pid = None
+        return AppEntry(
+            key=node_key(app),
+            name=name,
+            handle=app,
+            pid=pid,
+            executable=self.processes.name(pid),
+        )
@@ -0,0 +1,400 @@
+"""
+Pipelined AT-SPI client speaking D-Bus directly through asyncio.
+
+pyatspi issues one blocking D-Bus call at a time, so a traversal costs one
+bus latency per attribute per node. This client keeps many calls in flight:
+all attributes of all nodes on a tree level are requested concurrently, so
+a walk costs roughly one latency per level instead of per call.
+
+Requires the optional dbus-fast package. The client runs its own event
+loop on a daemon thread and never touches the application's main loop.
+
+Results are AtspiSnapshot objects that expose the subset of the pyatspi
+Accessible API read by normalize_linux_element(), so the same normalizer
+and element schema are used for both clients.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+ObjectRef = Tuple[str, str]
+
+REGISTRY_BUS = "org.a11y.atspi.Registry"
+ROOT_PATH = "/org/a11y/atspi/accessible/root"
+NULL_PATH = "/org/a11y/atspi/null"
+ACCESSIBLE = "org.a11y.atspi.Accessible"
+COMPONENT = "org.a11y.atspi.Component"
+ACTION = "org.a11y.atspi.Action"
+PROPERTIES = "org.freedesktop.DBus.Properties"
+COORD_TYPE_SCREEN = 0
+WINDOW_ROLES = ("frame", "window", "dialog")
+
+
+def is_available() -> bool:
+    """Return True if the optional dbus-fast dependency is installed."""
+    import importlib.util
+
+    return importlib.util.find_spec("dbus_fast") is not None
+
+
+class _Extents:
+    """Extents in the shape returned by pyatspi's getExtents()."""
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+class _StateSet:
+    """State bitfield with pyatspi's contains() interface."""
+
+    def __init__(self, words: Sequence[int]):
+        self._bits = 0
+        for i, word in enumerate(words or ()):
+            self._bits |= int(word) << (32 * i)
+
+    def contains(self, state: Any) -> bool:
+        return bool(self._bits & (1 << int(state)))
+
+
+class _Component:
+    def __init__(self, extents: _Extents):
+        self._extents = extents
+
+    def getExtents(self, coord_type: Any) -> _Extents:
+        return self._extents
+
+
+class _Action:
+    """Action interface resolving names and invocations on demand."""
+
+    def __init__(self, snapshot: "AtspiSnapshot"):
+        self._snapshot = snapshot
+        self.nActions = snapshot.n_actions
+
+    def getName(self, index: int) -> str:
+        return (
+            self._snapshot.client.call_sync(
+                self._snapshot.ref, ACTION, "GetName", "i", [index]
+            )
+            or ""
+        )
+
+    def doAction(self, index: int) -> bool:
+        return bool(
+            self._snapshot.client.call_sync(
+                self._snapshot.ref, ACTION, "DoAction", "i", [index]
+            )
+        )
+
+
+class AtspiSnapshot:
+    """
+    Attributes of one accessible, fetched in a single pipelined batch.
+
+    Exposes the pyatspi Accessible methods used by the normalizer. Action
+    names and invocations go back to the bus when clicked.
+    """
+
+    def __init__(self, client: "AsyncAtspiClient", ref: ObjectRef, order: tuple):
+        self.client = client
+        self.ref = ref
+        self.order = order
+        self.role_name = ""
+        self.localized_role_name = ""
+        self.name = ""
+        self.description = ""
+        self.states = _StateSet(())
+        self.index_in_parent = -1
+        self.extents: Optional[_Extents] = None
+        self.n_actions = 0
+        self.child_refs: List[ObjectRef] = []
+
+    @property
+    def childCount(self) -> int:
+        return len(self.child_refs)
+
+    def getRoleName(self) -> str:
+        return self.role_name
+
+    def getLocalizedRoleName(self) -> str:
+        return self.localized_role_name
+
+    def getState(self) -> _StateSet:
+        return self.states
+
+    def getIndexInParent(self) -> int:
+        return self.index_in_parent
+
+    def getParent(self) -> None:
+        return None
+
+    def queryComponent(self) -> _Component:
+        if self.extents is None:
+            raise NotImplementedError("Component interface not implemented")
+        return _Component(self.extents)
+
+    def queryAction(self) -> _Action:
+        if self.n_actions <= 0:
+            raise NotImplementedError("Action interface not implemented")
+        return _Action(self)
+
+    def __hash__(self) -> int:
+        return hash(self.ref)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AtspiSnapshot) and other.ref == self.ref
+
+
+class AsyncAtspiClient:
+    """
+    AT-SPI client with many D-Bus requests in flight.
+
+    Use connect() once, then walk_app() from any thread; calls are
+    scheduled on the client's own loop and waited for synchronously.
+    """
+
+    MAX_IN_FLIGHT = 256
+    CALL_TIMEOUT = 10.0
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._bus: Optional[Any] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.calls = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._bus is not None
+
+    def connect(self) -> bool:
+        """
+        Start the client loop and connect to the accessibility bus.
+
+        Returns:
+            True if connected, False if dbus-fast or the bus is unavailable
+        """
+        if self.connected:
+            return True
+        if not is_available():
+            return False
+
+        self._start_loop()
+        try:
+            self._bus = self._run(self._connect_bus())
+        except Exception:
+            self.close()
+        return self.connected
+
+    def close(self) -> None:
+        """Disconnect and stop the client loop."""
+        if self._bus is not None:
+            try:
+                self._bus.disconnect()
+            except Exception:
+                pass
+            self._bus = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def walk_app(
+        self,
+        matches_name: Callable[[str], bool],
+        max_depth: int,
+    ) -> Optional[List[AtspiSnapshot]]:
+        """
+        Fetch every node of an application's windows, level by level.
+
+        Args:
+            matches_name: Predicate selecting the application by name
+            max_depth: Maximum depth below each window
+
+        Returns:
+            Snapshots in depth-first document order (windows first within
+            their subtree), or None if the app was not found
+        """
+        return self._run(self._walk_app(matches_name, max_depth))
+
+    def call_sync(
+        self,
+        ref: ObjectRef,
+        interface: str,
+        member: str,
+        signature: str = "",
+        body: Optional[list] = None,
+    ) -> Any:
+        """Perform one call from a foreign thread and return its result."""
+        return self._run(self._call(ref, interface, member, signature, body))
+
+    def _start_loop(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _serve() -> None:
+            asyncio.set_event_loop(loop)
+            self._semaphore = asyncio.Semaphore(self.MAX_IN_FLIGHT)
+            ready.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(
+            target=_serve, name="atspi-async-client", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def _run(self, coro: Any) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout=self.CALL_TIMEOUT * 6)
+
+    async def _connect_bus(self) -> Any:
+        from dbus_fast import Message
+        from dbus_fast.aio import MessageBus
+
+        session = await MessageBus().connect()
+        try:
+            reply = await session.call(
+                Message(
+                    destination="org.a11y.Bus",
+                    path="/org/a11y/bus",
+                    interface="org.a11y.Bus",
+                    member="GetAddress",
+                )
+            )
+            address = reply.body[0]
+        finally:
+            session.disconnect()
+        return await MessageBus(bus_address=address).connect()
+
+    async def _call(
+        self,
+        ref: ObjectRef,
+        interface: str,
+        member: str,
+        signature: str = "",
+        body: Optional[list] = None,
+    ) -> Any:
+        """Send one method call; returns the first reply value or None."""
+        from dbus_fast import Message, MessageType
+
+        async with self._semaphore:
+            self.calls += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            try:
+                reply = await asyncio.wait_for(
+                    self._bus.call(
+                        Message(
+                            destination=ref[0],
+                            path=ref[1],
+                            interface=interface,
+                            member=member,
+                            signature=signature,
+                            body=body or [],
+                        )
+                    ),
+                    self.CALL_TIMEOUT,
+                )
+            except Exception:
+                return None
+            finally:
+                self._in_flight -= 1
+
+        if reply is None or reply.message_type == MessageType.ERROR:
+            return None
+        if not reply.body:
+            return None
+        if len(reply.body) == 1:
+            return reply.body[0]
+        return tuple(reply.body)
+
+    async def _get_property(self, ref: ObjectRef, interface: str, name: str) -> Any:
+        value = await self._call(ref, PROPERTIES, "Get", "ss", [interface, name])
+        return getattr(value, "value", value)
+
+    async def _snapshot(self, ref: ObjectRef, order: tuple) -> AtspiSnapshot:
+        """Fetch all attributes of one node concurrently."""
+        (
+            role_name,
+            localized_role,
+            name,
+            description,
+            states,
+            index,
+            extents,
+            n_actions,
+            children,
+        ) = await asyncio.gather(
+            self._call(ref, ACCESSIBLE, "GetRoleName"),
+            self._call(ref, ACCESSIBLE, "GetLocalizedRoleName"),
+            self._get_property(ref, ACCESSIBLE, "Name"),
+            self._get_property(ref, ACCESSIBLE, "Description"),
+            self._call(ref, ACCESSIBLE, "GetState"),
+            self._call(ref, ACCESSIBLE, "GetIndexInParent"),
+            self._call(ref, COMPONENT, "GetExtents", "u", [COORD_TYPE_SCREEN]),
+            self._get_property(ref, ACTION, "NActions"),
+            self._call(ref, ACCESSIBLE, "GetChildren"),
+        )
+
+        snapshot = AtspiSnapshot(self, ref, order)
+        snapshot.role_name = role_name or ""
+        snapshot.localized_role_name = localized_role or ""
+        snapshot.name = name or ""
+        snapshot.description = description or ""
+        snapshot.states = _StateSet(states or ())
+        snapshot.index_in_parent = index if index is not None else -1
+        if extents is not None:
+            snapshot.extents = _Extents(*extents)
+        snapshot.n_actions = int(n_actions or 0)
+        snapshot.child_refs = [
+            (bus, path) for bus, path in (children or []) if path != NULL_PATH
+        ]
+        return snapshot
+
+    async def _find_app(self, matches_name: Callable[[str], bool]) -> Optional[Any]:
+        apps = await self._call((REGISTRY_BUS, ROOT_PATH), ACCESSIBLE, "GetChildren")
+        apps = [tuple(app) for app in apps or []]
+        names = await asyncio.gather(
+            *(self._get_property(app, ACCESSIBLE, "Name") for app in apps)
+        )
+        for app, name in zip(apps, names):
+            if name and matches_name(name):
+                return app
+        return None
+
+    async def _walk_app(
+        self, matches_name: Callable[[str], bool], max_depth: int
+    ) -> Optional[List[AtspiSnapshot]]:
+        app = await self._find_app(matches_name)
+        if app is None:
+            return None
+
+        top = await self._snapshot(app, ())
+        children = await asyncio.gather(
+            *(self._snapshot(tuple(ref), (i,)) for i, ref in enumerate(top.child_refs))
+        )
+        level = [c for c in children if c.role_name.lower() in WINDOW_ROLES]
+
+        collected: List[AtspiSnapshot] = []
+        depth = 0
+        while level:
+            collected.extend(level)
+            if depth >= max_depth:
+                break
+            pending = [
+                self._snapshot(tuple(ref), parent.order + (i,))
+                for parent in level
+                for i, ref in enumerate(parent.child_refs)
+            ]
+            level = list(await asyncio.gather(*pending))
+            depth += 1
+
+        collected.sort(key=lambda snapshot: snapshot.order)
+        return collected
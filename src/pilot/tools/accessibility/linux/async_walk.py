@@ -0,0 +1,86 @@
+"""
+Whole-app walks through the pipelined D-Bus client.
+
+The AsyncAtspiClient keeps many requests in flight, so a walk costs one
+latency per tree level instead of one per node. It is used for walks
+Collection cannot answer in a single round trip per window.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class AsyncWalk:
+    """Pipelined walks for one LinuxAccessibility backend."""
+
+    @staticmethod
+    def preferred(backend: Any, interactive_only: bool, app_name: str) -> bool:
+        """
+        Use the pipelined client for walks Collection cannot answer.
+
+        Collection stays preferred for interactive-only requests since it
+        needs a single round trip per window.
+        """
+        if backend._async_client is None:
+            return False
+        if not interactive_only or not backend.use_collection:
+            return True
+        if not backend._collection:
+            return True
+        return not backend._collection.is_supported(app_name)
+
+    @staticmethod
+    def walk(
+        backend: Any, app_name: str, interactive_only: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Walk an app with many D-Bus requests in flight.
+
+        Snapshots go through the same normalizer as pyatspi nodes. They are
+        not kept in the subtree cache since change events reference pyatspi
+        objects, so each call re-walks (one latency per tree level).
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            app_name: Application name
+            interactive_only: If True, only register interactive elements
+
+        Returns:
+            Elements in document order, or None if the walk failed
+        """
+        resolved = backend._apps.resolve_name(backend, app_name)
+        if resolved is None:
+            return None
+        try:
+            snapshots = backend._async_client.walk_app(
+                lambda name: name == resolved, backend._max_depth
+            )
+        except Exception:
+            return None
+        if snapshots is None:
+            return None
+
+        app_name_lower = app_name.lower()
+        elements: List[Dict[str, Any]] = []
+        clips: Dict[Any, Optional[Tuple[int, int, int, int]]] = {}
+        culled_prefix: Optional[tuple] = None
+        for snapshot in snapshots:
+            order = snapshot.order
+            if culled_prefix and order[: len(culled_prefix)] == culled_prefix:
+                continue
+            culled, element, clip = backend._walker.visit_node(
+                backend,
+                snapshot,
+                len(order) - 1,
+                interactive_only,
+                app_name_lower,
+                clips.get(order[0]),
+            )
+            if culled:
+                culled_prefix = order
+                continue
+            if len(order) == 1:
+                clips[order[0]] = clip
+            if element is not None:
+                backend._store_element(element, app_name_lower)
+                elements.append(element)
+        return elements
@@ -0,0 +1,145 @@
+"""
+Clicks through the AT-SPI Action interface.
+
+A click runs the node's action whose name matches the click type (click,
+double, context menu), falling back to any click or press action. After
+a click the element cache is told about the interaction so the next
+snapshot reflects the change.
+"""
+
+from typing import Any, Dict, Tuple
+
+from ..tables import TableColumn
+
+
+class ClickActions:
+    """Element, table cell and parent clicks for one LinuxAccessibility backend."""
+
+    ACTION_NAMES = {
+        "single": ("click", "press", "activate"),
+        "double": ("double", "open", "activate"),
+        "right": ("context", "menu", "popup"),
+    }
+
+    def by_id(
+        self, backend: Any, element_id: str, click_type: str = "single"
+    ) -> Tuple[bool, str]:
+        """
+        Click a registered element.
+
+        An ID served from a stored skeleton walks its app first, so it
+        resolves to a live node.
+        """
+        if not backend.available:
+            return (False, "Accessibility not available")
+
+        element, node, error = backend._store.resolve(element_id)
+        if element is None:
+            skeleton_app = backend._warm_start.claim_element(element_id)
+            if skeleton_app is not None:
+                backend._get_elements_impl(skeleton_app)
+                element, node, error = backend._store.resolve(element_id)
+        if error:
+            return (False, error)
+
+        label = element.get("label", element_id)
+        app_name = element.get("app_name", "")
+
+        try:
+            self.perform(node, click_type)
+            backend._cache.on_interaction(app_name if app_name else None)
+            return (True, f"Clicked '{label}'")
+        except Exception as e:
+            return (
+                False,
+                f"Click failed for '{label}': {e}. UI may have changed - call get_accessible_elements() to refresh.",
+            )
+
+    def table_cell(
+        self,
+        backend: Any,
+        element_id: str,
+        row: int,
+        column: TableColumn = None,
+        click_type: str = "single",
+    ) -> Tuple[bool, str]:
+        """Click one cell of a table element; see TableReader.click_cell()."""
+        if not backend.available:
+            return (False, "Accessibility not available")
+
+        element, node, error = backend._store.resolve(element_id)
+        if error:
+            return (False, error)
+        success, message = backend._tables.click_cell(
+            element_id, element, node, row, column, click_type, self.perform
+        )
+        if success:
+            app_name = element.get("app_name", "")
+            backend._cache.on_interaction(app_name if app_name else None)
+        return (success, message)
+
+    def element_or_parent(
+        self, backend: Any, element_dict: Dict[str, Any], max_depth: int = 5
+    ) -> Tuple[bool, str]:
+        """
+        Click an element's node, or its nearest ancestor that can be clicked.
+
+        Returns:
+            Tuple of (success, "element", "parent_<depth>" or a failure reason)
+        """
+        if not backend.available:
+            return (False, "unavailable")
+
+        node = element_dict.get("_native_ref") or element_dict.get("_element")
+        if not node:
+            return (False, "no_reference")
+
+        try:
+            self.perform(node)
+            backend._cache.on_interaction()
+            return (True, "element")
+        except Exception:
+            pass
+
+        current = node
+        for depth in range(1, max_depth + 1):
+            try:
+                if hasattr(current, "getParent"):
+                    parent = current.getParent()
+                    if parent:
+                        try:
+                            self.perform(parent)
+                            backend._cache.on_interaction()
+                            return (True, f"parent_{depth}")
+                        except Exception:
+                            current = parent
+                    else:
+                        break
+                else:
+                    break
+            except Exception:
+                break
+
+        return (False, "not_clickable")
+
+    def perform(self, node: Any, click_type: str = "single") -> None:
+        """Run the node's action matching click_type, or raise if it has none."""
+        normalized = (click_type or "single").strip().lower()
+
+        action_iface = node.queryAction()
+
+        preferred = self.ACTION_NAMES.get(normalized, self.ACTION_NAMES["single"])
+
+        for i in range(action_iface.nActions):
+            action_name = action_iface.getName(i).lower()
+            if any(p in action_name for p in preferred):
+                action_iface.doAction(i)
+                return
+
+        for i in range(action_iface.nActions):
+            action_name = action_iface.getName(i).lower()
+            if "click" in action_name or "press" in action_name:
+                action_iface.doAction(i)
+                return
+
+        raise Exception("No click/press action available")
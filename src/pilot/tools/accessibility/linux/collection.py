@@ -0,0 +1,205 @@
+"""
+Server-side filtered traversal through the AT-SPI Collection interface.
+
+Collection.GetMatches evaluates a match rule inside the application and
+returns every matching descendant in one round trip, instead of one
+childCount/getChildAtIndex pair per node. Toolkits that do not implement
+Collection raise on queryCollection(); callers then fall back to walking.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .subtree_cache import node_key
+
+MATCH_ALL = 1
+MATCH_ANY = 2
+SORT_ORDER_CANONICAL = 1
+
+
+class CollectionQuery:
+    """
+    Interactive-descendant queries for one pyatspi module.
+
+    "Interactive" mirrors the walk: a node is kept if it is enabled or
+    implements the Action interface. These are two match rules, each
+    answered in canonical (document) order, and their results are merged
+    back into document order.
+    """
+
+    MAX_PATH_HOPS = 64
+
+    def __init__(self, pyatspi_module: Any):
+        """
+        Initialize the query.
+
+        Args:
+            pyatspi_module: The imported pyatspi module
+        """
+        self._pyatspi = pyatspi_module
+        self._unsupported: set = set()
+        self.queries = 0
+
+    def is_supported(self, app_name: str) -> bool:
+        """Return False once an app has been seen without Collection."""
+        return app_name not in self._unsupported
+
+    def forget(self, app_name: Optional[str] = None) -> None:
+        """Retry Collection for an app (or all apps) on the next query."""
+        if app_name is None:
+            self._unsupported.clear()
+        else:
+            self._unsupported.discard(app_name)
+
+    def interactive_descendants(
+        self, node: Any, app_name: str, visible_only: bool = False
+    ) -> Optional[List[Any]]:
+        """
+        Fetch enabled or actionable descendants of a node in bulk.
+
+        Args:
+            node: pyatspi accessible node (usually a window)
+            app_name: Application name, used to remember unsupported apps
+            visible_only: Also require showing and visible states, so the
+                application skips hidden nodes before replying
+
+        Returns:
+            Matching descendants in document order, or None if the app
+            does not support Collection
+        """
+        if app_name in self._unsupported:
+            return None
+
+        visible = []
+        if visible_only:
+            visible = [self._pyatspi.STATE_SHOWING, self._pyatspi.STATE_VISIBLE]
+
+        try:
+            collection = node.queryCollection()
+            enabled = self._get_matches(
+                collection,
+                states=[self._pyatspi.STATE_ENABLED] + visible,
+                interfaces=[],
+            )
+            actionable = self._get_matches(
+                collection, states=visible, interfaces=["action"]
+            )
+        except Exception:
+            self._unsupported.add(app_name)
+            return None
+
+        self.queries += 1
+        return self._merge(node, list(enabled), list(actionable))
+
+    def _merge(self, root: Any, enabled: List[Any], actionable: List[Any]) -> List[Any]:
+        """
+        Merge two document-ordered match lists into one, without duplicates.
+
+        Nodes in both lists anchor the merge. An actionable node that is not
+        enabled belongs after the last anchor preceding it; when enabled-only
+        nodes also follow that anchor, its place among them is found by
+        comparing child-index paths from the root, with a binary search so
+        only a few paths are read.
+        """
+        merged: List[Any] = []
+        position: Dict[Any, int] = {}
+        for match in enabled:
+            key = node_key(match)
+            if key not in position:
+                position[key] = len(merged)
+                merged.append(match)
+
+        extras: Dict[int, List[Any]] = {}
+        bounds: Dict[int, int] = {}
+        seen = set()
+        anchor = -1
+        for match in actionable:
+            key = node_key(match)
+            index = position.get(key)
+            if index is not None:
+                bounds.setdefault(anchor, index)
+                anchor = index
+            elif key not in seen:
+                seen.add(key)
+                extras.setdefault(anchor, []).append(match)
+        if not extras:
+            return merged
+
+        root_key = node_key(root)
+        paths: Dict[Any, Optional[Tuple[int, ...]]] = {}
+        result: List[Any] = []
+        start = 0
+        for anchor in sorted(extras):
+            end = bounds.get(anchor, len(merged))
+            result.extend(merged[start : anchor + 1])
+            start = anchor + 1
+            for match in extras[anchor]:
+                lo, hi = start, end
+                path = self._path(match, root_key, paths)
+                while path is not None and lo < hi:
+                    mid = (lo + hi) // 2
+                    other = self._path(merged[mid], root_key, paths)
+                    if other is None:
+                        break
+                    if other < path:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                if path is None or lo < hi:
+                    lo = start
+                result.extend(merged[start:lo])
+                result.append(match)
+                start = lo
+        result.extend(merged[start:])
+        return result
+
+    def _path(
+        self, node: Any, root_key: Any, paths: Dict[Any, Optional[Tuple[int, ...]]]
+    ) -> Optional[Tuple[int, ...]]:
+        """Child-index path from the root to a node (None if unreadable)."""
+        key = node_key(node)
+        if key in paths:
+            return paths[key]
+        path: List[int] = []
+        current = node
+        try:
+            for _ in range(self.MAX_PATH_HOPS):
+                if node_key(current) == root_key:
+                    paths[key] = tuple(reversed(path))
+                    return paths[key]
+                path.append(current.getIndexInParent())
+                current = current.parent
+                if current is None:
+                    break
+        except Exception:
+            pass
+        paths[key] = None
+        return None
+
+    def _get_matches(
+        self, collection: Any, states: List[Any], interfaces: List[str]
+    ) -> List[Any]:
+        """Run one GetMatches call with a state and interface rule."""
+        constants = getattr(self._pyatspi, "Collection", None)
+        match_all = getattr(constants, "MATCH_ALL", MATCH_ALL)
+        match_any = getattr(constants, "MATCH_ANY", MATCH_ANY)
+        sort_order = getattr(constants, "SORT_ORDER_CANONICAL", SORT_ORDER_CANONICAL)
+
+        state_set = self._pyatspi.StateSet(*states)
+        rule = collection.createMatchRule(
+            state_set,
+            match_all,
+            {},
+            match_any,
+            [],
+            match_any,
+            interfaces,
+            match_all,
+            False,
+        )
+        try:
+            return collection.getMatches(rule, sort_order, 0, True) or []
+        finally:
+            try:
+                rule.unref()
+            except Exception:
+                pass
@@ -0,0 +1,118 @@
+"""
+Collapsed handles for large list-like containers, expanded page by page.
+
+A list, tree or table with many children is registered as one collapsed
+handle carrying its child count and a preview of the first labels, and
+its children are not walked. expand_container() later walks one page of
+them at a time, reading only the children in that page.
+"""
+
+from typing import Any, Dict, Optional
+
+from ..containers import ContainerPage, mark_collapsed
+
+
+class ContainerExpander:
+    """Collapse and page through list-like containers for one backend."""
+
+    COLLAPSIBLE_ROLES = frozenset({"list", "list box", "tree", "tree table", "table"})
+
+    def collapse(
+        self,
+        backend: Any,
+        node: Any,
+        element: Optional[Dict[str, Any]],
+        child_count: int,
+        app_name: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Turn a large list-like container's element into a collapsed handle.
+
+        Only called for nodes with enough children, so the extra role read
+        is rare. A container that was skipped as non-interactive is
+        normalized anyway, since the handle is how its children are reached.
+        Reads the labels of the first expansion.preview children.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            node: Container node
+            element: Element already built for it, or None
+            child_count: Number of children it has
+            app_name: Lowercase application name
+
+        Returns:
+            The handle, or None if the node is not list-like or cannot be
+            normalized (its children are then walked as usual)
+        """
+        try:
+            if node.getRoleName().lower() not in self.COLLAPSIBLE_ROLES:
+                return None
+        except Exception:
+            return None
+        if element is None:
+            element = backend._walker.build_element(backend, node, False, app_name)
+            if element is None:
+                return None
+        preview = []
+        for i in range(min(backend.expansion.preview, child_count)):
+            try:
+                preview.append(node.getChildAtIndex(i).name or "")
+            except Exception:
+                continue
+        return mark_collapsed(element, child_count, preview)
+
+    def expand(
+        self,
+        backend: Any,
+        element_id: str,
+        offset: int,
+        limit: Optional[int],
+        interactive_only: bool,
+    ) -> ContainerPage:
+        """
+        Walk one page of a container's children.
+
+        Only the children in the page are read. Hidden children are culled
+        as in a snapshot, but there is no window clip for offscreen culling
+        (children off the screen are still dropped by normalization).
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            element_id: ID of the collapsed handle (or any container)
+            offset: Index of the first child to read
+            limit: Children to read (None = expansion.page_size)
+            interactive_only: If True, only register interactive elements
+
+        Returns:
+            The page, with error set if the container cannot be read
+        """
+        page = ContainerPage(element_id, offset=max(0, offset))
+        container, node, error = backend._store.resolve(element_id)
+        if error:
+            page.error = error
+            return page
+
+        if limit is None:
+            limit = backend.expansion.page_size
+        app_name = str(container.get("app_name") or "").lower()
+        if backend.profiler is not None:
+            backend.profiler.begin_walk()
+        try:
+            page.total = node.childCount
+        except Exception as e:
+            page.error = f"Could not read the children of '{element_id}': {e}"
+            return page
+
+        end = min(page.total, page.offset + max(0, limit))
+        for i in range(page.offset, end):
+            if backend._cancelled():
+                break
+            page.children_read += 1
+            try:
+                child = node.getChildAtIndex(i)
+            except Exception:
+                continue
+            backend._walker.traverse(
+                backend, child, page.elements, interactive_only, 1, app_name
+            )
+        return page
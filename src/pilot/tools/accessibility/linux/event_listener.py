@@ -0,0 +1,129 @@
+"""
+AT-SPI event subscription for incremental cache maintenance.
+
+pyatspi delivers events through the GLib main loop. Instead of running a
+second loop on a background thread (libatspi is not thread-safe), queued
+events are drained on demand with pump(), on the same thread that performs
+every other accessibility call.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+EventHandler = Callable[[Any], None]
+
+
+class AtspiEventListener:
+    """
+    Fan-out of AT-SPI events to registered handlers.
+
+    Handlers subscribe to event type prefixes (e.g. "object:children-changed").
+    The listener registers each prefix with pyatspi once and dispatches every
+    matching event to all handlers of that prefix.
+    """
+
+    MAX_EVENTS_PER_PUMP = 5000
+
+    def __init__(self, pyatspi_module: Any):
+        """
+        Initialize the listener.
+
+        Args:
+            pyatspi_module: The imported pyatspi module
+        """
+        self._pyatspi = pyatspi_module
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._context: Optional[Any] = None
+        self.active = False
+        self.events_received = 0
+
+    def start(self) -> bool:
+        """
+        Attach to the GLib main context used by pyatspi.
+
+        Returns:
+            True if events can be received, False if GLib is unavailable
+        """
+        try:
+            from gi.repository import GLib
+
+            self._context = GLib.MainContext.default()
+            self.active = True
+        except Exception:
+            self._context = None
+            self.active = False
+        return self.active
+
+    def subscribe(self, event_types: Iterable[str], handler: EventHandler) -> bool:
+        """
+        Register a handler for one or more event type prefixes.
+
+        Args:
+            event_types: AT-SPI event types such as "object:state-changed"
+            handler: Callable receiving the pyatspi event
+
+        Returns:
+            True if every event type was registered with pyatspi
+        """
+        if not self.active:
+            return False
+
+        registered = True
+        for event_type in event_types:
+            handlers = self._handlers.get(event_type)
+            if handlers is None:
+                try:
+                    self._pyatspi.Registry.registerEventListener(
+                        self._dispatch, event_type
+                    )
+                except Exception:
+                    registered = False
+                    continue
+                handlers = []
+                self._handlers[event_type] = handlers
+            if handler not in handlers:
+                handlers.append(handler)
+        return registered
+
+    def stop(self) -> None:
+        """Deregister all event types from pyatspi."""
+        for event_type in list(self._handlers):
+            try:
+                self._pyatspi.Registry.deregisterEventListener(
+                    self._dispatch, event_type
+                )
+            except Exception:
+                pass
+        self._handlers.clear()
+        self.active = False
+
+    def pump(self) -> int:
+        """
+        Dispatch all queued events without blocking.
+
+        Returns:
+            Number of main context iterations that dispatched work
+        """
+        if not self.active or self._context is None:
+            return 0
+
+        dispatched = 0
+        try:
+            while self._context.pending() and dispatched < self.MAX_EVENTS_PER_PUMP:
+                self._context.iteration(False)
+                dispatched += 1
+        except Exception:
+            pass
+        return dispatched
+
+    def _dispatch(self, event: Any) -> None:
+        """Route an event to every handler whose prefix matches its type."""
+        self.events_received += 1
+        event_type = str(getattr(event, "type", "") or "")
+        for prefix, handlers in self._handlers.items():
+            if not event_type.startswith(prefix):
+                continue
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception:
+                    continue
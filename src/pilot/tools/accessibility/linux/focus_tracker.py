@@ -0,0 +1,131 @@
+"""
+Frontmost application and active window maintained from AT-SPI events.
+
+Scanning every app's top-level windows for STATE_ACTIVE costs a getState
+round trip per window. Window managers already announce activation changes
+as window:activate / window:deactivate (and object:state-changed:active on
+toolkits that skip those), so the tracker records the active window as the
+events arrive and answers frontmost-app queries without IPC.
+
+The tracked state is only trusted while it is known. It becomes unknown when
+the active window is deactivated without another one being activated (focus
+moved to an app outside AT-SPI) or when no event has been seen yet; callers
+then fall back to a full scan and seed the tracker with its result.
+"""
+
+from typing import Any, Optional
+
+from .subtree_cache import node_key
+
+
+class FocusTracker:
+    """
+    Event-fed record of the active window, its app and the focused node.
+
+    Attributes:
+        scans: Full scans reported through seed()
+        hits: Queries answered from tracked state
+    """
+
+    EVENT_TYPES = ("window:activate", "window:deactivate", "object:state-changed")
+    MAX_ANCESTOR_HOPS = 30
+
+    def __init__(self):
+        self._known = False
+        self._window: Any = None
+        self._app_name: Optional[str] = None
+        self.focused: Any = None
+        self.scans = 0
+        self.hits = 0
+
+    @property
+    def known(self) -> bool:
+        """True if the tracked frontmost app can be trusted."""
+        return self._known
+
+    def frontmost_app(self) -> Optional[str]:
+        """Tracked frontmost app name; only meaningful while known."""
+        self.hits += 1
+        return self._app_name
+
+    def seed(self, app_name: Optional[str], window: Any = None) -> None:
+        """
+        Record the result of a full scan.
+
+        Args:
+            app_name: App owning the active window (None if none is active)
+            window: The active window, if one was found
+        """
+        self.scans += 1
+        self._app_name = app_name
+        self._window = node_key(window) if window is not None else None
+        self._known = True
+
+    def reset(self) -> None:
+        """Forget tracked state so the next query scans."""
+        self._known = False
+        self._window = None
+        self._app_name = None
+
+    def on_event(self, event: Any) -> None:
+        """
+        Update tracked state from an AT-SPI event.
+
+        Args:
+            event: pyatspi event with type, source and detail1
+        """
+        event_type = str(getattr(event, "type", "") or "")
+        source = getattr(event, "source", None)
+        if source is None:
+            return
+
+        if event_type.startswith("object:state-changed"):
+            gained = bool(getattr(event, "detail1", 1))
+            if "focused" in event_type:
+                if gained:
+                    self.focused = node_key(source)
+                    self._activate_app_of(event)
+                return
+            if "active" not in event_type:
+                return
+            event_type = "window:activate" if gained else "window:deactivate"
+
+        if event_type.startswith("window:activate"):
+            self._window = node_key(source)
+            self._app_name = self._app_name_of(event)
+            self._known = self._app_name is not None
+        elif event_type.startswith("window:deactivate"):
+            if self._window is None or node_key(source) == self._window:
+                self.reset()
+
+    def _activate_app_of(self, event: Any) -> None:
+        """Follow focus into another app, e.g. when focus was stolen."""
+        app_name = self._app_name_of(event)
+        if app_name is not None and app_name != self._app_name:
+            self._app_name = app_name
+            self._window = None
+            self._known = True
+
+    def _app_name_of(self, event: Any) -> Optional[str]:
+        """Name of the application an event's source belongs to."""
+        app = getattr(event, "host_application", None)
+        if app is None:
+            app = self._application_of(event.source)
+        try:
+            return app.name if app is not None else None
+        except Exception:
+            return None
+
+    def _application_of(self, node: Any) -> Any:
+        """Walk up to the application node (the child of the desktop)."""
+        try:
+            for _ in range(self.MAX_ANCESTOR_HOPS):
+                parent = node.parent
+                if parent is None:
+                    return None
+                if parent.parent is None:
+                    return node
+                node = parent
+        except Exception:
+            pass
+        return None
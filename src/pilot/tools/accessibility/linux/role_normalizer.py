@@ -8,8 +8,9 @@ passing to the shared registry.
 This is the ONLY place where AT-SPI-specific role handling should exist.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Optional, Tuple
 
+from ..element_record import ElementRecord
 
 ATSPI_TO_COMMON = {
     "PushButton": "Button",
@@ -80,6 +81,64 @@ def normalize_linux_role(atspi_role: str) -> str:
     return ATSPI_TO_COMMON.get(pascal_case, pascal_case)
 
 
+def read_linux_extents(
+    node: Any, pyatspi_module: Any
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Read a node's desktop extents.
+
+    Args:
+        node: pyatspi accessible node
+        pyatspi_module: The pyatspi module (for constants)
+
+    Returns:
+        Tuple of (x, y, width, height), or None without a Component interface
+    """
+    try:
+        component = node.queryComponent()
+        extents = component.getExtents(pyatspi_module.DESKTOP_COORDS)
+        return (extents.x, extents.y, extents.width, extents.height)
+    except Exception:
+        return None
+
+
+def read_linux_capabilities(
+    node: Any, pyatspi_module: Any, state: Optional[Any] = None
+) -> Tuple[bool, bool, bool]:
+    """
+    Read action count and enabled/focused state of a node in one pass.
+
+    Callers that need these both for filtering and for normalization read
+    them once here and pass the result to normalize_linux_element().
+
+    Args:
+        node: pyatspi accessible node
+        pyatspi_module: The pyatspi module (for constants)
+        state: State set if already read, else fetched here
+
+    Returns:
+        Tuple of (has_actions, is_enabled, is_focused)
+    """
+    has_actions = False
+    try:
+        action_iface = node.queryAction()
+        has_actions = action_iface.nActions > 0
+    except Exception:
+        pass
+
+    is_enabled = False
+    is_focused = False
+    try:
+        if state is None:
+            state = node.getState()
+        is_enabled = state.contains(pyatspi_module.STATE_ENABLED)
+        is_focused = state.contains(pyatspi_module.STATE_FOCUSED)
+    except Exception:
+        pass
+
+    return has_actions, is_enabled, is_focused
+
+
 def normalize_linux_element(
     node: Any,
     pyatspi_module: Any,
@@ -87,7 +146,9 @@ def normalize_linux_element(
     screen_width: int,
     screen_height: int,
     parent_path: str = "",
-) -> Optional[Dict[str, Any]]:
+    capabilities: Optional[Tuple[bool, bool, bool]] = None,
+    extents: Optional[Tuple[int, int, int, int]] = None,
+) -> Optional[ElementRecord]:
     """
     Extract and normalize element data from pyatspi node.
 
@@ -104,21 +165,19 @@ def normalize_linux_element(
         screen_width: Screen width for bounds validation
         screen_height: Screen height for bounds validation
         parent_path: Hash of ancestor context (optional)
+        capabilities: Result of read_linux_capabilities() if already read
+        extents: Result of read_linux_extents() if already read
 
     Returns:
-        Normalized element dictionary matching shared registry schema,
-        or None if element should be skipped (invalid bounds, etc.)
+        Normalized ElementRecord (dict-compatible) matching shared registry
+        schema, or None if element should be skipped (invalid bounds, etc.)
     """
     try:
         role = node.getRoleName() if hasattr(node, "getRoleName") else ""
 
-        x, y, w, h = 0, 0, 0, 0
-        try:
-            component = node.queryComponent()
-            extents = component.getExtents(pyatspi_module.DESKTOP_COORDS)
-            x, y, w, h = extents.x, extents.y, extents.width, extents.height
-        except Exception:
-            pass
+        if extents is None:
+            extents = read_linux_extents(node, pyatspi_module)
+        x, y, w, h = extents or (0, 0, 0, 0)
 
         if w <= 0 or h <= 0:
             return None
@@ -130,21 +189,9 @@ def normalize_linux_element(
         description = getattr(node, "description", "") or ""
         label = name or description
 
-        has_actions = False
-        try:
-            action_iface = node.queryAction()
-            has_actions = action_iface.nActions > 0
-        except Exception:
-            pass
-
-        is_enabled = False
-        is_focused = False
-        try:
-            state = node.getState()
-            is_enabled = state.contains(pyatspi_module.STATE_ENABLED)
-            is_focused = state.contains(pyatspi_module.STATE_FOCUSED)
-        except Exception:
-            pass
+        if capabilities is None:
+            capabilities = read_linux_capabilities(node, pyatspi_module)
+        has_actions, is_enabled, is_focused = capabilities
 
         identifier = ""
         try:
@@ -167,20 +214,20 @@ def normalize_linux_element(
         except Exception:
             pass
 
-        return {
-            "role": normalize_linux_role(role),
-            "label": label,
-            "identifier": identifier,
-            "app_name": app_name,
-            "center": [int(x + w / 2), int(y + h / 2)],
-            "bounds": [int(x), int(y), int(w), int(h)],
-            "has_actions": has_actions,
-            "enabled": is_enabled,
-            "focused": is_focused,
-            "role_description": role_desc,
-            "parent_path": parent_path,
-            "_native_ref": node,
-        }
+        return ElementRecord(
+            role=normalize_linux_role(role),
+            label=label,
+            identifier=identifier,
+            app_name=app_name,
+            center=[int(x + w / 2), int(y + h / 2)],
+            bounds=[int(x), int(y), int(w), int(h)],
+            has_actions=has_actions,
+            enabled=is_enabled,
+            focused=is_focused,
+            role_description=role_desc,
+            parent_path=parent_path,
+            _native_ref=node,
+        )
 
     except Exception:
         return None
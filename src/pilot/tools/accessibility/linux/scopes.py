@@ -0,0 +1,119 @@
+"""
+Scoped walks: the focused window, the topmost dialog, a subtree or a region.
+
+Window, dialog and subtree roots are walked like windows, so for
+interactive-only requests a dialog costs one Collection.GetMatches round
+trip. For region scopes each window intersecting the region is walked with
+the region as its clip, which culls subtrees outside it.
+"""
+
+from typing import Any, Dict, List
+
+from ..traversal import TraversalScope, rect_intersection
+from .role_normalizer import read_linux_extents
+
+
+class ScopedWalk:
+    """Walks of one scope's roots for a LinuxAccessibility backend."""
+
+    DIALOG_ROLES = frozenset(
+        {"dialog", "alert", "file chooser", "color chooser", "font chooser"}
+    )
+    WINDOW_ROLES = frozenset({"frame", "window"}) | DIALOG_ROLES
+
+    def elements(
+        self,
+        backend: Any,
+        app_name: str,
+        scope: TraversalScope,
+        interactive_only: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Walk only the roots of a scope.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            app_name: Application name
+            scope: Scope to walk (whole-app scopes are not handled here)
+            interactive_only: If True, only register interactive elements
+
+        Returns:
+            Elements of the scope in walk order
+        """
+        app_name_lower = app_name.lower()
+        if backend.profiler is not None:
+            backend.profiler.begin_walk()
+        elements: List[Dict[str, Any]] = []
+
+        if scope.kind == "region":
+            app = backend._get_app_impl(app_name)
+            for window in backend._get_windows_impl(app) if app else []:
+                extents = read_linux_extents(window, backend.pyatspi)
+                if extents and rect_intersection(extents, scope.region) is None:
+                    continue
+                backend._walker.traverse(
+                    backend,
+                    window,
+                    elements,
+                    interactive_only,
+                    0,
+                    app_name_lower,
+                    scope.region,
+                )
+            return [e for e in elements if scope.contains(e)]
+
+        root = self.root(backend, app_name, scope)
+        if root is not None:
+            backend._walker.walk_window(
+                backend, root, elements, interactive_only, app_name_lower
+            )
+        return elements
+
+    def root(self, backend: Any, app_name: str, scope: TraversalScope) -> Any:
+        """
+        Native root of a window, dialog or subtree scope.
+
+        The focused window is the active top-level window, else the first
+        one. The topmost dialog is the active dialog (by role, or any modal
+        top-level window), else the last one the app created.
+
+        Returns:
+            Root node, or None if there is no such window or element
+        """
+        if scope.kind == "subtree":
+            _, node, error = backend._store.resolve(scope.element_id)
+            return None if error else node
+
+        app = backend._get_app_impl(app_name)
+        if not app:
+            return None
+        pyatspi = backend.pyatspi
+        modal = getattr(pyatspi, "STATE_MODAL", None)
+        candidates = []
+        active = None
+        try:
+            for i in range(app.childCount):
+                try:
+                    child = app.getChildAtIndex(i)
+                    role = child.getRoleName().lower()
+                    if role not in self.WINDOW_ROLES and scope.kind == "window":
+                        continue
+                    state = child.getState()
+                    is_dialog = role in self.DIALOG_ROLES or (
+                        modal is not None and state.contains(modal)
+                    )
+                    if scope.kind == "dialog" and not is_dialog:
+                        continue
+                    candidates.append(child)
+                    if state.contains(pyatspi.STATE_ACTIVE):
+                        active = child
+                except Exception:
+                    continue
+        except Exception:
+            pass
+
+        if active is not None:
+            return active
+        if not candidates:
+            return None
+        return candidates[0] if scope.kind == "window" else candidates[-1]
@@ -0,0 +1,105 @@
+"""
+Element snapshots of a whole app, from the cheapest source that is current.
+
+A snapshot is served from the element cache, else by repairing the cached
+subtrees, else (on the first walk of a session) by diffing a stored
+skeleton, else by a pipelined D-Bus walk when one is preferred, else by a
+full walk. Every snapshot is cached, and a full walk also keeps its tree
+for later repairs and saves its skeleton.
+"""
+
+from typing import Any, Dict, List
+
+from .async_walk import AsyncWalk
+from .subtree_cache import SubtreeRecord
+
+
+class ElementSnapshots:
+    """get_elements() for one LinuxAccessibility backend."""
+
+    def get(
+        self, backend: Any, app_name: str, interactive_only: bool, use_cache: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Elements of an app, walking only what the caches cannot answer.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            app_name: Application name
+            interactive_only: If True, only return interactive elements
+            use_cache: Whether cached elements and subtrees may be reused
+
+        Returns:
+            Elements in walk order (partial if the walk was cancelled)
+        """
+        cache_key = f"{app_name.lower()}:{interactive_only}"
+        backend._apply_pending_events()
+
+        if use_cache:
+            cached = backend._cache.get_elements(cache_key)
+            if cached:
+                return cached[1]
+
+        backend._walks += 1
+        if backend.profiler is not None:
+            backend.profiler.begin_walk()
+        app_name_lower = app_name.lower()
+        if use_cache and backend._repair.can_repair(backend, cache_key):
+            elements = backend._repair.refresh(
+                backend, cache_key, interactive_only, app_name_lower
+            )
+            if elements is not None:
+                self.store(backend, cache_key, app_name, elements)
+                return elements
+
+        first_walk = backend._warm_start.first_walk(cache_key)
+        if use_cache and first_walk:
+            elements = backend._warm_start.walk(backend, app_name, interactive_only)
+            if elements is not None:
+                self.store(backend, cache_key, app_name, elements)
+                return elements
+
+        if AsyncWalk.preferred(backend, interactive_only, app_name_lower):
+            elements = AsyncWalk.walk(backend, app_name, interactive_only)
+            if elements is not None:
+                self.store(backend, cache_key, app_name, elements)
+                return elements
+
+        return self._walk(backend, cache_key, app_name, interactive_only)
+
+    def store(
+        self,
+        backend: Any,
+        cache_key: str,
+        app_name: str,
+        elements: List[Dict[str, Any]],
+    ) -> None:
+        """Cache a walked element list and fingerprint the app if not yet done."""
+        backend._cache.set_elements(cache_key, elements)
+        backend._repair.remember(backend, app_name)
+
+    def _walk(
+        self, backend: Any, cache_key: str, app_name: str, interactive_only: bool
+    ) -> List[Dict[str, Any]]:
+        """Walk every window of the app, keeping the tree and the skeleton."""
+        app = backend._get_app_impl(app_name)
+        if not app:
+            return []
+
+        app_name_lower = app_name.lower()
+        elements: List[Dict[str, Any]] = []
+        root = SubtreeRecord(app, -1)
+        for window in backend._get_windows_impl(app):
+            record = backend._walker.walk_window(
+                backend, window, elements, interactive_only, app_name_lower
+            )
+            if record is not None:
+                root.children.append(record)
+
+        if backend._cancelled():
+            return elements
+
+        backend._subtrees.put(cache_key, root)
+        self.store(backend, cache_key, app_name, elements)
+        backend._warm_start.save(app, root, elements, interactive_only, app_name_lower)
+        return elements
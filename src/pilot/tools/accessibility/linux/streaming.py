@@ -0,0 +1,280 @@
+"""
+Resumable breadth-first walk for streaming Linux traversal.
+
+The walk keeps its frontier between steps so it can be paused when a
+traversal budget runs out and resumed later from a cursor. Each visited
+node becomes a SubtreeRecord below its parent, so a walk that eventually
+completes leaves a full tree for the event-driven subtree cache.
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from ....utils.threading.worker import PRIORITY_SNAPSHOT
+from ..traversal import ElementStream, TraversalBudget, TraversalCursors
+from .subtree_cache import SubtreeCache, SubtreeRecord
+
+FrontierEntry = Tuple[Any, int, SubtreeRecord, bool, int]
+
+
+class BreadthFirstWalk:
+    """
+    Paused or running breadth-first walk of one application.
+
+    Frontier entries are (node, depth, parent_record, is_bulk_match,
+    index_in_parent), with index -1 for windows and bulk matches.
+    Bulk matches come from a window's Collection query and are normalized
+    without expanding their children. Listing a large container's children
+    turns it into a collapsed handle, which is emitted even when the
+    container itself is not interactive.
+    """
+
+    def __init__(self, cache_key: str, app_name: str, interactive_only: bool, app: Any):
+        """
+        Initialize the walk.
+
+        Args:
+            cache_key: Element cache key ("app:interactive_only")
+            app_name: Lowercase application name
+            interactive_only: If True, only register interactive elements
+            app: Application node (root of the walk)
+        """
+        self.cache_key = cache_key
+        self.app_name = app_name
+        self.interactive_only = interactive_only
+        self.root = SubtreeRecord(app, -1)
+        self.frontier: Deque[FrontierEntry] = deque()
+        self.nodes_visited = 0
+
+    def add_windows(self, windows: List[Any]) -> None:
+        """Queue top-level windows in the order they should be visited."""
+        for window in windows:
+            self.frontier.append((window, 0, self.root, False, -1))
+
+    @property
+    def done(self) -> bool:
+        """True when every queued node has been visited."""
+        return not self.frontier
+
+    def step(self, backend: Any, limit: int) -> List[Dict[str, Any]]:
+        """
+        Visit up to limit nodes and return the elements they produced.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            limit: Maximum number of nodes to visit
+
+        Returns:
+            Registered elements in visiting order
+        """
+        elements: List[Dict[str, Any]] = []
+        while self.frontier and limit > 0:
+            node, depth, parent, is_match, index = self.frontier.popleft()
+            limit -= 1
+            self.nodes_visited += 1
+
+            culled, element, clip = backend._walker.visit_leaf(
+                backend,
+                node,
+                depth,
+                self.interactive_only and not is_match,
+                self.app_name,
+                parent.clip,
+            )
+            if culled:
+                continue
+            if is_match:
+                element = backend._tables.claim_bulk_match(backend, node, element, clip)
+
+            record = SubtreeRecord(node, depth, owner=parent if is_match else None)
+            record.clip = clip
+            record.index = index
+            parent.children.append(record)
+
+            if element is not None:
+                backend._store_element(element, self.app_name)
+                record.element = element
+                elements.append(element)
+
+            if is_match:
+                continue
+            if depth == 0 and self._queue_bulk_matches(backend, record):
+                continue
+            children = backend._repair.list_children(backend, record, self.app_name)
+            if element is None and record.element is not None:
+                backend._store_element(record.element, self.app_name)
+                elements.append(record.element)
+            for child_index, child in children:
+                self.frontier.append((child, depth + 1, record, False, child_index))
+
+        return elements
+
+    def _queue_bulk_matches(self, backend: Any, record: SubtreeRecord) -> bool:
+        """Queue a window's interactive descendants from one Collection query."""
+        if not (self.interactive_only and backend.use_collection):
+            return False
+        if backend._collection is None:
+            return False
+
+        matches = backend._collection.interactive_descendants(
+            record.node, self.app_name, visible_only=backend.culling.hidden
+        )
+        if matches is None:
+            return False
+
+        record.flat = True
+        for match in matches:
+            self.frontier.append((match, 1, record, True, -1))
+        return True
+
+
+class ElementStreamer:
+    """
+    Streams of one LinuxAccessibility backend, and cursors of paused walks.
+
+    Each batch of nodes runs through the backend's accessibility thread,
+    so consumers can format early elements while later ones are still
+    being read.
+    """
+
+    def __init__(self):
+        self.cursors = TraversalCursors()
+
+    def clear(self) -> None:
+        """Drop the walks of every outstanding cursor."""
+        self.cursors.clear()
+
+    def stream(
+        self,
+        backend: Any,
+        stream: ElementStream,
+        app_name: str,
+        interactive_only: bool,
+        budget: TraversalBudget,
+        cursor: Optional[str],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generator behind stream_elements().
+
+        A cached or event-repaired element list is yielded directly.
+        Otherwise the walk continued from cursor (or a new one) is stepped
+        until it completes or the budget runs out; in that case the stream
+        is marked truncated and given a cursor to the paused walk.
+        """
+        if not backend.available:
+            return
+
+        cache_key = f"{app_name.lower()}:{interactive_only}"
+        walk = self.cursors.take(cursor)
+        if walk is None or walk.cache_key != cache_key:
+            cached = backend._run_accessibility(
+                self._cached_elements,
+                backend,
+                app_name,
+                interactive_only,
+                priority=PRIORITY_SNAPSHOT,
+            )
+            if cached is not None:
+                yield from cached
+                return
+            walk = backend._run_accessibility(
+                self._open,
+                backend,
+                app_name,
+                interactive_only,
+                priority=PRIORITY_SNAPSHOT,
+            )
+            if walk is None:
+                return
+
+        started = time.monotonic()
+        while not walk.done:
+            allowance = budget.node_allowance(
+                stream.nodes_visited, backend.STREAM_BATCH
+            )
+            if allowance <= 0 or not budget.time_left(started):
+                stream.truncated = True
+                stream.cursor = self.cursors.save(walk)
+                return
+            before = walk.nodes_visited
+            batch = backend._run_accessibility(
+                walk.step, backend, allowance, priority=PRIORITY_SNAPSHOT
+            )
+            stream.nodes_visited += walk.nodes_visited - before
+            yield from batch
+
+        backend._run_accessibility(
+            self._finish, backend, walk, priority=PRIORITY_SNAPSHOT
+        )
+
+    @staticmethod
+    def _cached_elements(
+        backend: Any, app_name: str, interactive_only: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Elements from the element cache or repaired subtrees, if any."""
+        cache_key = f"{app_name.lower()}:{interactive_only}"
+        backend._apply_pending_events()
+
+        cached = backend._cache.get_elements(cache_key)
+        if cached:
+            return cached[1]
+
+        if not backend._repair.can_repair(backend, cache_key):
+            return None
+        elements = backend._repair.refresh(
+            backend, cache_key, interactive_only, app_name.lower()
+        )
+        if elements is not None:
+            backend._cache.set_elements(cache_key, elements)
+        return elements
+
+    def _open(
+        self, backend: Any, app_name: str, interactive_only: bool
+    ) -> Optional[BreadthFirstWalk]:
+        """Create a breadth-first walk with windows queued by priority."""
+        app = backend._get_app_impl(app_name)
+        if not app:
+            return None
+
+        walk = BreadthFirstWalk(
+            f"{app_name.lower()}:{interactive_only}",
+            app_name.lower(),
+            interactive_only,
+            app,
+        )
+        walk.add_windows(self._order_windows(backend, backend._get_windows_impl(app)))
+        return walk
+
+    @staticmethod
+    def _order_windows(backend: Any, windows: List[Any]) -> List[Any]:
+        """Sort windows: active/focused first, then showing/visible, then rest."""
+        pyatspi = backend.pyatspi
+
+        def rank(window: Any) -> int:
+            try:
+                state = window.getState()
+            except Exception:
+                return 2
+            if state.contains(pyatspi.STATE_ACTIVE) or state.contains(
+                pyatspi.STATE_FOCUSED
+            ):
+                return 0
+            if state.contains(pyatspi.STATE_SHOWING) or state.contains(
+                pyatspi.STATE_VISIBLE
+            ):
+                return 1
+            return 2
+
+        return sorted(windows, key=rank)
+
+    @staticmethod
+    def _finish(backend: Any, walk: BreadthFirstWalk) -> None:
+        """Cache the tree and element list of a completed walk."""
+        backend._subtrees.put(walk.cache_key, walk.root)
+        backend._snapshots.store(
+            backend,
+            walk.cache_key,
+            walk.app_name,
+            list(SubtreeCache.iter_elements(walk.root)),
+        )
@@ -0,0 +1,371 @@
+"""
+Per-app cache of walked AT-SPI subtrees with event-driven invalidation.
+
+A full traversal produces a tree of SubtreeRecords mirroring the accessible
+tree (the app node is the root, its windows are the first level). AT-SPI
+events mark individual records dirty; the next get_elements() call repairs
+only the dirty records and reuses every clean branch without any IPC.
+
+Dirty flags:
+- DIRTY_SELF: the node's own attributes changed (name, state) - re-normalize it
+- DIRTY_CHILDREN: the node's children changed - re-list them, walk only new ones
+
+A record's clip is the extents of its enclosing window, used to cull
+offscreen descendants when they are walked later. Its index is the node's
+position among its parent's children when a walk listed them (-1 when
+unknown), which lets a walk be saved as a skeleton of child paths. Its
+child_count is the number of children it had when they were last listed
+(-1 when they were not, e.g. for tables and collapsed containers).
+
+A flat record holds matching descendants (from a bulk query) as direct
+children instead of mirroring the tree. Those children point back to it as
+their owner, and structural changes below them re-query the owner.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+DIRTY_SELF = 1
+DIRTY_CHILDREN = 2
+
+CULLED = object()
+"""Returned by a repair build_element callback when the node is now culled."""
+
+SUBTREE_STATES = ("showing", "visible", "expanded", "collapsed")
+"""State changes that alter which descendants exist or are visible."""
+
+
+def node_key(node: Any) -> Any:
+    """
+    Return a dictionary key identifying an accessible node.
+
+    libatspi keeps one proxy object per remote accessible, so the proxy
+    itself identifies the node. Unhashable proxies fall back to id().
+    """
+    try:
+        hash(node)
+        return node
+    except TypeError:
+        return id(node)
+
+
+class SubtreeRecord:
+    """Cached result of walking one accessible node."""
+
+    __slots__ = (
+        "node",
+        "depth",
+        "element",
+        "children",
+        "dirty",
+        "flat",
+        "owner",
+        "clip",
+        "index",
+        "child_count",
+    )
+
+    def __init__(
+        self,
+        node: Any,
+        depth: int,
+        flat: bool = False,
+        owner: Optional["SubtreeRecord"] = None,
+    ):
+        self.node = node
+        self.depth = depth
+        self.element: Optional[Dict[str, Any]] = None
+        self.children: List["SubtreeRecord"] = []
+        self.dirty = 0
+        self.flat = flat
+        self.owner = owner
+        self.clip: Optional[Tuple[int, int, int, int]] = None
+        self.index = -1
+        self.child_count = -1
+
+
+class SubtreeCache:
+    """
+    Walked subtrees per cache key ("app:interactive_only").
+
+    Records are indexed by node so that an event source can be mapped to the
+    record that must be repaired. Sources that were never walked (beyond the
+    depth limit or created after the walk) are attributed to their nearest
+    walked ancestor.
+    """
+
+    EVENT_TYPES = (
+        "object:children-changed",
+        "object:state-changed",
+        "object:property-change",
+    )
+    MAX_ANCESTOR_HOPS = 30
+
+    def __init__(self):
+        self._trees: Dict[str, SubtreeRecord] = {}
+        self._index: Dict[Any, List[Tuple[str, SubtreeRecord]]] = {}
+        self._dirty_keys: Set[str] = set()
+        self.events_matched = 0
+        self.events_unmatched = 0
+        self.records_reused = 0
+        self.records_walked = 0
+
+    def get(self, cache_key: str) -> Optional[SubtreeRecord]:
+        """Get the cached root record for a cache key."""
+        return self._trees.get(cache_key)
+
+    def put(self, cache_key: str, root: SubtreeRecord) -> None:
+        """
+        Store a freshly walked tree, replacing any previous tree for the key.
+
+        Args:
+            cache_key: Cache key ("app:interactive_only")
+            root: Root record (the application node)
+        """
+        self.drop_key(cache_key)
+        self._trees[cache_key] = root
+        self._index_tree(cache_key, root)
+        self._dirty_keys.discard(cache_key)
+
+    def drop_key(self, cache_key: str) -> None:
+        """Forget the tree stored under a cache key."""
+        root = self._trees.pop(cache_key, None)
+        if root is not None:
+            self._unindex_tree(cache_key, root)
+        self._dirty_keys.discard(cache_key)
+
+    def drop(self, app_name: Optional[str] = None) -> None:
+        """
+        Forget cached trees for one app, or for every app.
+
+        Args:
+            app_name: App whose trees to drop, or None for all
+        """
+        if app_name is None:
+            self._trees.clear()
+            self._index.clear()
+            self._dirty_keys.clear()
+            return
+
+        prefix = f"{app_name.lower()}:"
+        for key in [k for k in self._trees if k.startswith(prefix)]:
+            self.drop_key(key)
+
+    def mark_dirty(self, node: Any, flags: int, rewalk: bool = False) -> bool:
+        """
+        Mark the records of a node dirty without an event.
+
+        Args:
+            node: Node whose records to mark
+            flags: DIRTY_SELF and/or DIRTY_CHILDREN
+            rewalk: Also forget the node's walked descendants, so the next
+                repair walks all of them again
+
+        Returns:
+            True if the node had a walked record
+        """
+        entries = self._index.get(node_key(node))
+        if not entries:
+            return False
+        for cache_key, record in list(entries):
+            if rewalk:
+                for child in record.children:
+                    self._unindex_tree(cache_key, child)
+                record.children = []
+                flags |= DIRTY_CHILDREN
+            record.dirty |= flags
+            self._dirty_keys.add(cache_key)
+        return True
+
+    def take_dirty_keys(self) -> Set[str]:
+        """Return and reset the cache keys that received events."""
+        keys = self._dirty_keys
+        self._dirty_keys = set()
+        return keys
+
+    def on_event(self, event: Any) -> None:
+        """
+        Mark the records affected by an AT-SPI event dirty.
+
+        Args:
+            event: pyatspi event with type and source
+        """
+        event_type = str(getattr(event, "type", "") or "")
+        source = getattr(event, "source", None)
+        if source is None:
+            return
+
+        if event_type.startswith("object:children-changed"):
+            flags = DIRTY_CHILDREN
+        elif event_type.startswith("object:state-changed"):
+            flags = DIRTY_SELF
+            if any(state in event_type for state in SUBTREE_STATES):
+                flags |= DIRTY_CHILDREN
+        else:
+            flags = DIRTY_SELF
+
+        entries = self._index.get(node_key(source))
+        if not entries:
+            entries = self._find_walked_ancestor(source)
+            flags = DIRTY_CHILDREN
+        if not entries:
+            self.events_unmatched += 1
+            return
+
+        self.events_matched += 1
+        for cache_key, record in entries:
+            if record.owner is not None and flags & DIRTY_CHILDREN:
+                record.owner.dirty |= DIRTY_CHILDREN
+                record.dirty |= flags & ~DIRTY_CHILDREN
+            else:
+                record.dirty |= flags
+            self._dirty_keys.add(cache_key)
+
+    def _find_walked_ancestor(
+        self, node: Any
+    ) -> Optional[List[Tuple[str, SubtreeRecord]]]:
+        """Walk up parents until a node with a cached record is found."""
+        if not self._index:
+            return None
+
+        current = node
+        for _ in range(self.MAX_ANCESTOR_HOPS):
+            try:
+                current = current.parent
+            except Exception:
+                return None
+            if current is None:
+                return None
+            entries = self._index.get(node_key(current))
+            if entries:
+                return entries
+        return None
+
+    def repair(
+        self,
+        cache_key: str,
+        build_element: Callable[[SubtreeRecord], Any],
+        list_children: Callable[[SubtreeRecord], List[Tuple[int, Any]]],
+        walk: Callable[[Any, SubtreeRecord], Optional[SubtreeRecord]],
+    ) -> Optional[SubtreeRecord]:
+        """
+        Repair dirty records of a cached tree in place.
+
+        Args:
+            cache_key: Cache key of the tree to repair
+            build_element: Re-normalizes a record's node. Returns the element,
+                None to skip it, or CULLED to also drop its subtree
+            list_children: Lists the current children of a record as
+                (index in parent, node) pairs, with -1 for nodes that are not
+                direct children (windows, bulk matches)
+            walk: Walks a new child node below the given parent record
+
+        Returns:
+            The repaired root record, or None if no tree is cached
+        """
+        root = self._trees.get(cache_key)
+        if root is None:
+            return None
+
+        stack = [root]
+        while stack:
+            record = stack.pop()
+            if record.dirty & DIRTY_SELF and record.depth >= 0:
+                element = build_element(record)
+                if element is CULLED:
+                    self._drop_children(cache_key, record)
+                    continue
+                record.element = element
+            if record.dirty & DIRTY_CHILDREN:
+                self._reconcile_children(cache_key, record, list_children, walk)
+            else:
+                self.records_reused += 1
+            record.dirty = 0
+            stack.extend(record.children)
+
+        self._dirty_keys.discard(cache_key)
+        return root
+
+    def _drop_children(self, cache_key: str, record: SubtreeRecord) -> None:
+        """Forget a culled record's element and descendants."""
+        for child in record.children:
+            self._unindex_tree(cache_key, child)
+        record.children = []
+        record.element = None
+        record.dirty = 0
+
+    def _reconcile_children(
+        self,
+        cache_key: str,
+        record: SubtreeRecord,
+        list_children: Callable[[SubtreeRecord], List[Tuple[int, Any]]],
+        walk: Callable[[Any, SubtreeRecord], Optional[SubtreeRecord]],
+    ) -> None:
+        """
+        Re-list a record's children, reusing records of surviving nodes.
+
+        Every listed record gets its current index, so child paths stay
+        valid after siblings were added or removed before it.
+        """
+        previous = {node_key(child.node): child for child in record.children}
+        children: List[SubtreeRecord] = []
+
+        for index, node in list_children(record):
+            existing = previous.pop(node_key(node), None)
+            if existing is not None:
+                existing.index = index
+                children.append(existing)
+                continue
+            walked = walk(node, record)
+            if walked is not None:
+                walked.index = index
+                self.records_walked += 1
+                self._index_tree(cache_key, walked)
+                children.append(walked)
+
+        for removed in previous.values():
+            self._unindex_tree(cache_key, removed)
+
+        record.children = children
+
+    @staticmethod
+    def iter_elements(root: SubtreeRecord) -> Iterator[Dict[str, Any]]:
+        """
+        Yield cached elements in depth-first document order.
+
+        Args:
+            root: Root record
+
+        Yields:
+            Normalized element dictionaries
+        """
+        stack = [root]
+        while stack:
+            record = stack.pop()
+            if record.element is not None:
+                yield record.element
+            stack.extend(reversed(record.children))
+
+    def _index_tree(self, cache_key: str, root: SubtreeRecord) -> None:
+        """Add a record and all its descendants to the node index."""
+        stack = [root]
+        while stack:
+            record = stack.pop()
+            self._index.setdefault(node_key(record.node), []).append(
+                (cache_key, record)
+            )
+            stack.extend(record.children)
+
+    def _unindex_tree(self, cache_key: str, root: SubtreeRecord) -> None:
+        """Remove a record and all its descendants from the node index."""
+        stack = [root]
+        while stack:
+            record = stack.pop()
+            key = node_key(record.node)
+            entries = self._index.get(key)
+            if entries:
+                entries[:] = [
+                    (k, r) for k, r in entries if not (k == cache_key and r is record)
+                ]
+                if not entries:
+                    del self._index[key]
+            stack.extend(record.children)
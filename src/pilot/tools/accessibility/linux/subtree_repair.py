@@ -0,0 +1,264 @@
+"""
+Repairing cached subtrees instead of walking an app again.
+
+With change events, dirty records of the SubtreeCache are re-normalized
+or re-listed and every clean branch is reused. Without them, a cheap UI
+fingerprint (window list, titles, top-level child counts, focus) decides
+whether a cached snapshot is still current; when it is not, only windows
+whose fingerprint changed are marked dirty and repaired once.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..containers import mark_collapsed
+from ..fingerprint import UIFingerprint, WindowFingerprint
+from .subtree_cache import (
+    CULLED,
+    DIRTY_CHILDREN,
+    DIRTY_SELF,
+    SubtreeCache,
+    SubtreeRecord,
+    node_key,
+)
+
+
+class SubtreeRepair:
+    """
+    Fingerprint revalidation and subtree repair for one backend.
+
+    Attributes:
+        fingerprints: Last fingerprint per lowercase app name
+        verified_keys: Cache keys revalidated since their last repair
+    """
+
+    def __init__(self):
+        self.fingerprints: Dict[str, UIFingerprint] = {}
+        self.verified_keys: Set[str] = set()
+
+    def clear(self) -> None:
+        """Forget every fingerprint and verified tree."""
+        self.fingerprints.clear()
+        self.verified_keys.clear()
+
+    def remember(self, backend: Any, app_name: str) -> None:
+        """
+        Fingerprint an app if it has no fingerprint yet.
+
+        revalidate() treats an app without a fingerprint as changed, so a
+        snapshot walked before its first call (a prefetch) would otherwise
+        be thrown away.
+        """
+        app_key = app_name.lower()
+        if app_key not in self.fingerprints:
+            fingerprint = self.probe(backend, app_name)
+            if fingerprint is not None:
+                self.fingerprints[app_key] = fingerprint
+
+    def probe(self, backend: Any, app_name: str) -> Optional[UIFingerprint]:
+        """
+        Read the window list, window titles, top-level child counts and focus.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            app_name: Application name
+
+        Returns:
+            UIFingerprint, or None if the app is not found
+        """
+        if not backend.available:
+            return None
+        app = backend._get_app_impl(app_name)
+        if not app:
+            return None
+
+        windows = []
+        try:
+            for i in range(app.childCount):
+                try:
+                    child = app.getChildAtIndex(i)
+                    role = child.getRoleName().lower()
+                    if role not in ("frame", "window", "dialog"):
+                        continue
+                    state = child.getState()
+                    windows.append(
+                        WindowFingerprint(
+                            node_key(child),
+                            role,
+                            child.name or "",
+                            child.childCount,
+                            state.contains(backend.pyatspi.STATE_ACTIVE),
+                        )
+                    )
+                except Exception:
+                    continue
+        except Exception:
+            return None
+        return UIFingerprint(tuple(windows), backend._focus.focused)
+
+    def revalidate(self, backend: Any, app_name: str) -> bool:
+        """
+        Keep the cached snapshot if the UI fingerprint has not changed.
+
+        Without change events, walked subtrees of unchanged windows are
+        kept when the fingerprint differs, and changed windows are marked
+        to be walked again by the next repair.
+
+        Returns:
+            True if the cached snapshot is still current
+        """
+        app_key = app_name.lower()
+        backend._apply_pending_events()
+        fingerprint = self.probe(backend, app_name)
+        previous = self.fingerprints.pop(app_key, None)
+        if fingerprint is None:
+            backend.invalidate_cache(app_name)
+            return False
+        self.fingerprints[app_key] = fingerprint
+
+        if previous == fingerprint and backend._cache.renew(app_name):
+            return True
+
+        if (
+            previous is None
+            or backend.tracks_changes
+            or not backend._cache.has_elements(app_name)
+        ):
+            backend.invalidate_cache(app_name)
+            return False
+
+        backend._cache.invalidate(app_name)
+        backend._store.begin_generation(app_name)
+        app = backend._get_app_impl(app_name)
+        if fingerprint.window_set_changed(previous):
+            backend._subtrees.mark_dirty(app, DIRTY_CHILDREN)
+        for window in fingerprint.changed_windows(previous):
+            backend._subtrees.mark_dirty(window, DIRTY_SELF, rewalk=True)
+        self.verified_keys.update(backend._subtrees.take_dirty_keys())
+        return False
+
+    def can_repair(self, backend: Any, cache_key: str) -> bool:
+        """
+        Whether a cached subtree may be repaired instead of walked again.
+
+        With change events the tree is always trustworthy. Without them,
+        only a tree that revalidate() just checked is reused, once.
+        """
+        if backend.tracks_changes:
+            return True
+        if cache_key in self.verified_keys:
+            self.verified_keys.discard(cache_key)
+            return True
+        return False
+
+    def refresh(
+        self, backend: Any, cache_key: str, interactive_only: bool, app_name: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Rebuild the element list from cached subtrees, re-walking dirty ones.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            cache_key: Cache key of the walked tree
+            interactive_only: Whether the tree holds only interactive elements
+            app_name: Lowercase application name
+
+        Returns:
+            Elements in traversal order, or None if no tree is cached
+        """
+        walker = backend._walker
+        root = backend._subtrees.repair(
+            cache_key,
+            build_element=lambda record: self._rebuild(
+                backend, record, interactive_only, app_name
+            ),
+            list_children=lambda record: self.list_children(backend, record, app_name),
+            walk=lambda node, parent: walker.walk_child(
+                backend, node, parent, interactive_only, app_name
+            ),
+        )
+        if root is None:
+            return None
+
+        elements: List[Dict[str, Any]] = []
+        for element in SubtreeCache.iter_elements(root):
+            backend._store_element(element, app_name)
+            elements.append(element)
+        return elements
+
+    def list_children(
+        self, backend: Any, record: SubtreeRecord, app_name: str
+    ) -> List[Tuple[int, Any]]:
+        """
+        List current children of a cached record (windows for the app).
+
+        Returns (index in parent, node) pairs; windows and bulk matches are
+        not addressed by index and get -1.
+
+        A list-like record that now has too many children becomes a
+        collapsed handle (record.element is replaced by it) and has no
+        children listed.
+        """
+        if record.depth < 0:
+            return [(-1, window) for window in backend.get_windows(record.node)]
+        if record.flat:
+            matches = backend._collection.interactive_descendants(
+                record.node, app_name, visible_only=backend.culling.hidden
+            )
+            if matches is None:
+                matches = [child.node for child in record.children]
+            return [(-1, match) for match in matches]
+        if record.depth >= backend._max_depth:
+            return []
+
+        if record.element is not None and "table" in record.element:
+            backend._tables.attach(backend, record.node, record.element, record.clip)
+            return []
+
+        children = []
+        try:
+            child_count = record.node.childCount
+            if backend.expansion.collapses(record.depth, child_count):
+                handle = backend._containers.collapse(
+                    backend, record.node, record.element, child_count, app_name
+                )
+                if handle is not None:
+                    record.element = handle
+                    record.child_count = -1
+                    return []
+            record.child_count = child_count
+            for i in range(child_count):
+                try:
+                    children.append((i, record.node.getChildAtIndex(i)))
+                except Exception:
+                    continue
+        except Exception:
+            pass
+        return children
+
+    @staticmethod
+    def _rebuild(
+        backend: Any, record: SubtreeRecord, interactive_only: bool, app_name: str
+    ) -> Any:
+        """
+        Re-normalize a dirty cached record, or report it as culled.
+
+        A collapsed handle stays collapsed, keeping its child count and
+        preview until its children change; a table keeps its snapshot.
+        """
+        previous = record.element
+        collapsed = previous is not None and previous.get("collapsed", False)
+        culled, element, _ = backend._walker.visit_node(
+            backend,
+            record.node,
+            record.depth,
+            interactive_only and record.owner is None and not collapsed,
+            app_name,
+            record.clip,
+        )
+        if culled:
+            return CULLED
+        if collapsed and element is not None:
+            mark_collapsed(element, previous["child_count"], previous["preview"])
+        if element is not None and previous is not None and "table" in previous:
+            element["table"] = previous["table"]
+        return element
@@ -0,0 +1,263 @@
+"""
+Bulk table reads through the AT-SPI Table interface.
+
+Walking a table costs a round trip per cell, and a message list or
+spreadsheet has thousands. The Table interface answers row and column
+counts, headers and any cell by coordinates, so a table is read as one
+element carrying a TableSnapshot of its visible rows. Cells are resolved
+to their node only when one is clicked.
+"""
+
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from ..tables import (
+    TableColumn,
+    TableSnapshot,
+    describe_cell,
+    resolve_column,
+    visible_row_range,
+)
+from ..traversal import rect_intersection
+from .role_normalizer import read_linux_extents
+from .subtree_cache import node_key
+
+
+class TableReader:
+    """
+    Table snapshots and cell clicks for one LinuxAccessibility backend.
+
+    Remembers which nodes were read as tables, so cells returned next to
+    their table by a Collection query can be dropped.
+    """
+
+    TABLE_ROLES = frozenset({"Table", "TreeTable"})
+    PART_ROLES = frozenset(
+        {
+            "TableCell",
+            "TableRow",
+            "ColumnHeader",
+            "RowHeader",
+            "TableColumnHeader",
+            "TableRowHeader",
+        }
+    )
+
+    def __init__(self):
+        self._nodes: Set[Any] = set()
+
+    def clear(self) -> None:
+        """Forget which nodes were read as tables."""
+        self._nodes.clear()
+
+    def attach(
+        self,
+        backend: Any,
+        node: Any,
+        element: Dict[str, Any],
+        clip: Optional[Tuple[int, int, int, int]],
+        probe: Any = None,
+    ) -> bool:
+        """
+        Store a table snapshot under element["table"] if the node is a table.
+
+        Only elements already normalized as tables are queried, so other
+        nodes cost no extra round trip.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            node: Table node
+            element: Element built for it
+            clip: Extents of the enclosing window
+            probe: Node to read through (a profiling proxy), default node
+
+        Returns:
+            True if a snapshot was stored (the table's cells are then not
+            walked)
+        """
+        if not backend.table_extraction.enabled:
+            return False
+        if element.get("role") not in self.TABLE_ROLES:
+            return False
+        snapshot = self.read(backend, probe or node, element, clip)
+        if snapshot is None:
+            return False
+        element["table"] = snapshot.to_dict()
+        self._nodes.add(node_key(node))
+        return True
+
+    def claim_bulk_match(
+        self,
+        backend: Any,
+        node: Any,
+        element: Optional[Dict[str, Any]],
+        clip: Optional[Tuple[int, int, int, int]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Attach a table snapshot to a bulk match, or drop a table cell.
+
+        Collection queries return a table's cells alongside the table.
+        Tables precede their cells in document order, so cells (and rows
+        and headers) whose parent or grandparent was already read as a
+        table are dropped.
+
+        Returns:
+            The element to register, or None
+        """
+        if element is None or self.attach(backend, node, element, clip):
+            return element
+        if self._nodes and element.get("role") in self.PART_ROLES:
+            current = node
+            for _ in range(2):
+                try:
+                    current = current.parent
+                except Exception:
+                    break
+                if current is None:
+                    break
+                if node_key(current) in self._nodes:
+                    return None
+        return element
+
+    def read(
+        self,
+        backend: Any,
+        node: Any,
+        element: Dict[str, Any],
+        clip: Optional[Tuple[int, int, int, int]],
+    ) -> Optional[TableSnapshot]:
+        """
+        Read a table's headers and the text of its visible rows.
+
+        The first visible row is found by binary search over row extents,
+        so only O(log rows) cells outside the visible range are read.
+
+        Returns:
+            The snapshot, or None if the node has no Table interface
+        """
+        try:
+            table = node.queryTable()
+            rows = table.nRows
+            column_count = table.nColumns
+        except Exception:
+            return None
+
+        options = backend.table_extraction
+        columns = []
+        for c in range(min(column_count, options.max_columns)):
+            columns.append(self._header(table, c))
+
+        viewport = tuple(element.get("bounds") or (0, 0, 0, 0))
+        if clip:
+            viewport = rect_intersection(viewport, clip) or viewport
+        cells: Dict[Tuple[int, int], Any] = {}
+
+        def cell(r: int, c: int) -> Any:
+            if (r, c) not in cells:
+                try:
+                    cells[(r, c)] = table.getAccessibleAt(r, c)
+                except Exception:
+                    cells[(r, c)] = None
+            return cells[(r, c)]
+
+        def row_extent(r: int) -> Optional[Tuple[int, int]]:
+            extents = read_linux_extents(cell(r, 0), backend.pyatspi)
+            return (extents[1], extents[3]) if extents else None
+
+        start, end = visible_row_range(rows, row_extent, viewport, options.max_rows)
+        snapshot = TableSnapshot(rows=rows, columns=columns, first_row=start + 1)
+        for r in range(start, end):
+            snapshot.cells.append(
+                [self._cell_text(cell(r, c)) for c in range(len(columns))]
+            )
+        try:
+            caption = table.caption
+            snapshot.caption = (caption.name or "") if caption is not None else ""
+        except Exception:
+            pass
+        return snapshot
+
+    def click_cell(
+        self,
+        element_id: str,
+        element: Dict[str, Any],
+        node: Any,
+        row: int,
+        column: TableColumn,
+        click_type: str,
+        click: Callable[[Any, str], None],
+    ) -> Tuple[bool, str]:
+        """
+        Click one cell of a table element, resolving it to its node now.
+
+        Cells without a click action are selected by selecting their row
+        (single clicks only).
+
+        Args:
+            element_id: ID the table element was resolved from
+            element: Table element carrying a "table" snapshot
+            node: Table node
+            row: Row number, from 1
+            column: Column header, number (from 1) or None for the first
+            click_type: Click type: single, double, or right
+            click: Function performing a click action on a node
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if "table" not in element:
+            return (False, f"'{element.get('label', element_id)}' is not a table")
+
+        columns = element["table"].get("columns") or []
+        try:
+            table = node.queryTable()
+            rows = table.nRows
+            column_count = table.nColumns
+        except Exception as e:
+            return (False, f"Could not read table '{element_id}': {e}")
+
+        if not 1 <= row <= rows:
+            return (False, f"Row {row} is out of range (table has {rows} rows)")
+        index = resolve_column(columns, column_count, column)
+        if index is None:
+            return (False, f"No column '{column}' in table '{element_id}'")
+
+        cell = describe_cell(columns, row, index)
+        try:
+            target = table.getAccessibleAt(row - 1, index)
+            try:
+                click(target, click_type)
+            except Exception:
+                if (click_type or "single").strip().lower() != "single":
+                    raise
+                if not table.addRowSelection(row - 1):
+                    raise
+            return (True, f"Clicked {cell} of '{element.get('label', element_id)}'")
+        except Exception as e:
+            return (
+                False,
+                f"Click failed for {cell}: {e}. UI may have changed - call get_accessible_elements() to refresh.",
+            )
+
+    @staticmethod
+    def _header(table: Any, column: int) -> str:
+        """Label of a column header, falling back to the column description."""
+        try:
+            header = table.getColumnHeader(column)
+            if header is not None and header.name:
+                return header.name
+        except Exception:
+            pass
+        try:
+            return table.getColumnDescription(column) or ""
+        except Exception:
+            return ""
+
+    @staticmethod
+    def _cell_text(cell: Any) -> str:
+        """Text shown in a table cell."""
+        if cell is None:
+            return ""
+        try:
+            return cell.name or cell.description or ""
+        except Exception:
+            return ""
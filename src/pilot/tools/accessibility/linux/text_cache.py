@@ -0,0 +1,91 @@
+"""
+Document text read through the AT-SPI Text interface, cached per node.
+
+Names and descriptions only label a node; the text of a document, editor or
+terminal is exposed by its Text interface. Reading it costs one getText
+round trip per chunk, so the text of each node is kept until an
+object:text-changed event reports that it changed. Entries are only
+trusted while events are tracked; without them callers re-read every time.
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .subtree_cache import node_key
+
+
+class TextCache:
+    """
+    Bounded store of node text, invalidated by text-changed events.
+
+    Attributes:
+        chunk_size: Characters requested per getText call
+        max_chars: Characters read per node (longer text is cut off)
+        hits: Reads answered from the cache
+        chunks_read: getText calls made
+    """
+
+    EVENT_TYPES = ("object:text-changed",)
+    MAX_NODES = 256
+
+    def __init__(self, chunk_size: int = 4096, max_chars: int = 200_000):
+        self.chunk_size = chunk_size
+        self.max_chars = max_chars
+        self._texts: "OrderedDict[Any, str]" = OrderedDict()
+        self.hits = 0
+        self.chunks_read = 0
+
+    def open(self, node: Any) -> Tuple[Optional[str], Any, int]:
+        """
+        Return a node's cached text, or its Text interface to read from.
+
+        Args:
+            node: pyatspi accessible node
+
+        Returns:
+            Tuple of (cached text or None, Text interface or None, number of
+            characters to read)
+        """
+        key = node_key(node)
+        text = self._texts.get(key)
+        if text is not None:
+            self._texts.move_to_end(key)
+            self.hits += 1
+            return text, None, 0
+        try:
+            iface = node.queryText()
+            count = iface.characterCount
+        except Exception:
+            return None, None, 0
+        return None, iface, min(count, self.max_chars)
+
+    def read(self, iface: Any, start: int, end: int) -> Optional[str]:
+        """
+        Read characters [start, end) of a Text interface.
+
+        Returns:
+            The text, or None if the read failed
+        """
+        self.chunks_read += 1
+        try:
+            return iface.getText(start, end) or ""
+        except Exception:
+            return None
+
+    def store(self, node: Any, text: str) -> None:
+        """Remember the complete text of a node, evicting the oldest entry."""
+        key = node_key(node)
+        self._texts[key] = text
+        self._texts.move_to_end(key)
+        while len(self._texts) > self.MAX_NODES:
+            self._texts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all cached text."""
+        self._texts.clear()
+
+    def on_event(self, event: Any) -> None:
+        """Drop the cached text of an event's source node."""
+        source = getattr(event, "source", None)
+        if source is not None:
+            self._texts.pop(node_key(source), None)
@@ -0,0 +1,111 @@
+"""
+Streaming an app's text: labels from a walk, documents from the Text interface.
+
+Labels come from the elements of a full walk. Documents, editors and
+terminals expose their content only through the Text interface, which is
+read in chunks and cut at line breaks, so the first lines of a long buffer
+are yielded while later chunks are still being read. Read text is kept in
+a TextCache until the node reports a change. Password fields are never
+read, and embedded-object characters (placeholders for child nodes, which
+are read on their own) are dropped.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .text_cache import TextCache
+
+
+class TextReader:
+    """
+    Text streams for one LinuxAccessibility backend.
+
+    Every AT-SPI call goes through the backend's accessibility thread, one
+    chunk at a time, so a stream never holds the thread between chunks.
+    """
+
+    TEXT_ROLES = frozenset({"TextField", "TextArea", "Document"})
+    EMBEDDED_OBJECT = "\ufffc"
+
+    def __init__(self, texts: TextCache):
+        """
+        Initialize the reader.
+
+        Args:
+            texts: Cache of node text, invalidated by text-changed events
+        """
+        self.texts = texts
+
+    def stream(self, backend: Any, app_name: str) -> Iterator[str]:
+        """
+        Yield each element's label once and the document text of text nodes.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            app_name: Application name
+
+        Yields:
+            Labels and document text in traversal order
+        """
+        seen: Set[str] = set()
+        for elem in backend.stream_elements(app_name, interactive_only=False):
+            for key in ("label", "title", "description", "identifier"):
+                val = elem.get(key, "")
+                if val and val not in seen:
+                    seen.add(val)
+                    yield val
+            if self.has_document_text(elem):
+                yield from self._stream_node(backend, elem.get("_native_ref"), seen)
+
+    def has_document_text(self, elem: Dict[str, Any]) -> bool:
+        """
+        True if an element's text is worth reading through the Text interface.
+
+        Named static text already carries its text in the label; unnamed
+        static text (paragraphs, whose label falls back to the role) does not.
+        """
+        if elem.get("_native_ref") is None:
+            return False
+        role = elem.get("role")
+        if role in self.TEXT_ROLES:
+            return True
+        return role == "StaticText" and elem.get("label") == elem.get(
+            "role_description"
+        )
+
+    def _stream_node(self, backend: Any, node: Any, labels: Set[str]) -> Iterator[str]:
+        """Yield a node's text, cached or read chunk by chunk."""
+        cached, iface, count = backend._run_accessibility(self._open, backend, node)
+        if cached is not None:
+            if cached and cached not in labels:
+                yield cached
+            return
+        if iface is None:
+            return
+
+        pieces: List[str] = []
+        pending = ""
+        for start in range(0, count, self.texts.chunk_size):
+            end = min(start + self.texts.chunk_size, count)
+            chunk = backend._run_accessibility(self.texts.read, iface, start, end)
+            if chunk is None:
+                return
+            chunk = chunk.replace(self.EMBEDDED_OBJECT, "")
+            pieces.append(chunk)
+            pending += chunk
+            cut = pending.rfind("\n") + 1
+            if cut:
+                yield pending[:cut]
+                pending = pending[cut:]
+
+        text = "".join(pieces)
+        if pending and text not in labels:
+            yield pending
+        if backend.tracks_changes:
+            backend._run_accessibility(self.texts.store, node, text)
+
+    def _open(self, backend: Any, node: Any) -> Tuple[Optional[str], Any, int]:
+        """Apply queued text-changed events, then open a node's text."""
+        backend._apply_pending_events()
+        if not backend.tracks_changes:
+            self.texts.clear()
+        return self.texts.open(node)
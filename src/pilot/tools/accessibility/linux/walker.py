@@ -0,0 +1,393 @@
+"""
+Recursive AT-SPI walks that cull, normalize and register elements.
+
+Each visited node is culled (hidden or offscreen subtrees) or normalized
+into an element, and the walk records a SubtreeRecord per node so the
+subtree cache can later re-walk only the branches that changed. Windows
+of interactive-only walks are answered by one Collection query when the
+app supports it.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..element_record import ElementRecord
+from ..instrumentation import TraversalProfiler
+from ..traversal import rect_intersection, rect_outside
+from .role_normalizer import (
+    normalize_linux_element,
+    read_linux_capabilities,
+    read_linux_extents,
+)
+from .subtree_cache import SubtreeRecord
+
+Clip = Optional[Tuple[int, int, int, int]]
+Visit = Tuple[bool, Optional[Dict[str, Any]], Clip]
+
+
+class TreeWalker:
+    """
+    Tree walks for one LinuxAccessibility backend.
+
+    Dynamic detection: elements are registered based on their actual
+    capabilities (has_actions, is_enabled), NOT based on hardcoded role lists.
+    """
+
+    def walk_window(
+        self,
+        backend: Any,
+        window: Any,
+        elements: List[Dict[str, Any]],
+        interactive_only: bool,
+        app_name: str,
+    ) -> Optional[SubtreeRecord]:
+        """
+        Register the elements of one window, in bulk when possible.
+
+        For interactive-only requests, Collection.GetMatches returns all
+        interactive descendants in one round trip and only those nodes are
+        normalized. Matches are not limited by the depth limit. Apps without
+        Collection support fall back to the recursive walk.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            window: Window node
+            elements: List to accumulate elements
+            interactive_only: If True, only register interactive elements
+            app_name: Lowercase application name
+
+        Returns:
+            Record of the window subtree
+        """
+        matches = None
+        if interactive_only and backend.use_collection and backend._collection:
+            matches = backend._collection.interactive_descendants(
+                window, app_name, visible_only=backend.culling.hidden
+            )
+        if matches is None:
+            return self.traverse(
+                backend, window, elements, interactive_only, 0, app_name
+            )
+
+        if backend.profiler is not None:
+            backend.profiler.count("Collection.GetMatches")
+        record = SubtreeRecord(window, 0, flat=True)
+        _, record.element, record.clip = self.visit_leaf(
+            backend, window, 0, interactive_only, app_name, None
+        )
+        if record.element is not None:
+            backend._store_element(record.element, app_name)
+            elements.append(record.element)
+
+        for match in matches:
+            child = self.walk_child(backend, match, record, interactive_only, app_name)
+            if child is None:
+                continue
+            if child.element is not None:
+                backend._store_element(child.element, app_name)
+                elements.append(child.element)
+            record.children.append(child)
+        return record
+
+    def walk_child(
+        self,
+        backend: Any,
+        node: Any,
+        parent: SubtreeRecord,
+        interactive_only: bool,
+        app_name: str,
+    ) -> Optional[SubtreeRecord]:
+        """
+        Walk a node that appeared below a cached record.
+
+        Children of a flat record are bulk matches and are normalized
+        without recursion (their descendants are matches of the same query).
+        """
+        if not parent.flat:
+            return self.traverse(
+                backend,
+                node,
+                [],
+                interactive_only,
+                parent.depth + 1,
+                app_name,
+                parent.clip,
+            )
+
+        culled, element, clip = self.visit_leaf(
+            backend, node, parent.depth + 1, False, app_name, parent.clip
+        )
+        if culled:
+            return None
+        element = backend._tables.claim_bulk_match(backend, node, element, clip)
+        record = SubtreeRecord(node, parent.depth + 1, owner=parent)
+        record.element = element
+        record.clip = clip
+        return record
+
+    def traverse(
+        self,
+        backend: Any,
+        node: Any,
+        elements: List[Dict[str, Any]],
+        interactive_only: bool,
+        depth: int = 0,
+        app_name: str = "",
+        clip: Clip = None,
+    ) -> Optional[SubtreeRecord]:
+        """
+        Traverse AT-SPI tree and register elements.
+
+        List-like containers with at least expansion.min_children children
+        are registered as collapsed handles and not descended into; see
+        ContainerExpander. Tables are read in bulk through the Table
+        interface and their cells are not walked; see TableReader.attach().
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            node: Current pyatspi accessible node
+            elements: List to accumulate elements
+            interactive_only: If True, only register interactive elements
+            depth: Current traversal depth
+            app_name: Application name
+            clip: Extents of the enclosing window (for offscreen culling)
+
+        Returns:
+            Record of the walked subtree, or None beyond the depth limit
+            or when the subtree was culled
+        """
+        if depth > backend._max_depth or backend._cancelled():
+            return None
+
+        profiler = backend.profiler
+        started = profiler.enter() if profiler is not None else 0.0
+        probe = profiler.wrap(node) if profiler is not None else node
+        record = SubtreeRecord(node, depth)
+        try:
+            culled, element, record.clip = self.visit_node(
+                backend, probe, depth, interactive_only, app_name, clip
+            )
+            if profiler is not None:
+                self._profile_visit(profiler, started, probe, element)
+            if culled:
+                return None
+            if element is not None and backend._tables.attach(
+                backend, node, element, record.clip, probe
+            ):
+                backend._store_element(element, app_name)
+                elements.append(element)
+                record.element = element
+                return record
+            child_count = probe.childCount
+            collapsed = False
+            if backend.expansion.collapses(depth, child_count):
+                handle = backend._containers.collapse(
+                    backend, probe, element, child_count, app_name
+                )
+                if handle is not None:
+                    handle.native_ref = node
+                    element = handle
+                    collapsed = True
+            if element is not None:
+                backend._store_element(element, app_name)
+                elements.append(element)
+                record.element = element
+            if collapsed:
+                return record
+
+            record.child_count = child_count
+            for i in range(child_count):
+                try:
+                    child = probe.getChildAtIndex(i)
+                    child_record = self.traverse(
+                        backend,
+                        child,
+                        elements,
+                        interactive_only,
+                        depth + 1,
+                        app_name,
+                        record.clip,
+                    )
+                    if child_record is not None:
+                        child_record.index = i
+                        record.children.append(child_record)
+                except Exception:
+                    continue
+
+        except Exception:
+            pass
+        finally:
+            if profiler is not None:
+                profiler.leave(started)
+
+        return record
+
+    def visit_node(
+        self,
+        backend: Any,
+        node: Any,
+        depth: int,
+        interactive_only: bool,
+        app_name: str,
+        clip: Clip,
+    ) -> Visit:
+        """
+        Cull or normalize one node during a walk.
+
+        Windows (depth 0) are never culled; their extents, narrowed to clip
+        when one is given (region scopes), become the clip for everything
+        below them. State and extents read for culling are reused by
+        normalization.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            node: pyatspi accessible node
+            depth: Depth below the window
+            interactive_only: If True, skip non-interactive nodes
+            app_name: Lowercase application name
+            clip: Extents of the enclosing window (for windows: the region
+                to narrow their extents to, or None)
+
+        Returns:
+            Tuple of (culled, element or None, clip for the node's children)
+        """
+        state = None
+        extents = None
+        if depth == 0:
+            extents = read_linux_extents(node, backend.pyatspi)
+            if clip is None or not extents:
+                clip = extents
+            else:
+                clip = rect_intersection(extents, clip) or clip
+        elif backend.culling.enabled:
+            rule, state, extents = self._cull_rule(backend, node, clip)
+            if rule:
+                backend.culling.count(rule)
+                return True, None, clip
+
+        element = self.build_element(
+            backend, node, interactive_only, app_name, state=state, extents=extents
+        )
+        return False, element, clip
+
+    def visit_leaf(
+        self,
+        backend: Any,
+        node: Any,
+        depth: int,
+        interactive_only: bool,
+        app_name: str,
+        clip: Clip,
+    ) -> Visit:
+        """visit_node for a node whose children are not walked from here."""
+        profiler = backend.profiler
+        if profiler is None:
+            return self.visit_node(
+                backend, node, depth, interactive_only, app_name, clip
+            )
+
+        started = profiler.enter()
+        probe = profiler.wrap(node)
+        try:
+            result = self.visit_node(
+                backend, probe, depth, interactive_only, app_name, clip
+            )
+            self._profile_visit(profiler, started, probe, result[1])
+            return result
+        finally:
+            profiler.leave(started)
+
+    def build_element(
+        self,
+        backend: Any,
+        node: Any,
+        interactive_only: bool,
+        app_name: str,
+        state: Optional[Any] = None,
+        extents: Clip = None,
+    ) -> Optional[ElementRecord]:
+        """
+        Normalize a node into an element record, or None if it is skipped.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            node: pyatspi accessible node
+            interactive_only: If True, skip non-interactive nodes
+            app_name: Application name
+            state: State set if already read
+            extents: Extents if already read
+
+        Returns:
+            Normalized element (not yet stored), or None
+        """
+        capabilities = read_linux_capabilities(node, backend.pyatspi, state)
+        if interactive_only and not (capabilities[0] or capabilities[1]):
+            return None
+
+        normalized = normalize_linux_element(
+            node,
+            backend.pyatspi,
+            app_name,
+            backend.screen_width,
+            backend.screen_height,
+            capabilities=capabilities,
+            extents=extents,
+        )
+        if not normalized:
+            return None
+
+        normalized.native_ref = node
+        normalized.is_bottom = (
+            normalized.center[1] > backend.screen_height * 0.75
+            if normalized.center
+            else False
+        )
+        normalized.title = normalized.label
+        return normalized
+
+    @staticmethod
+    def _cull_rule(
+        backend: Any, node: Any, clip: Clip
+    ) -> Tuple[Optional[str], Any, Clip]:
+        """
+        Decide whether a node's whole subtree can be skipped.
+
+        Returns:
+            Tuple of (rule name or None, state set read, extents read)
+        """
+        state = None
+        if backend.culling.hidden:
+            try:
+                state = node.getState()
+            except Exception:
+                state = None
+            if state is not None and not (
+                state.contains(backend.pyatspi.STATE_SHOWING)
+                and state.contains(backend.pyatspi.STATE_VISIBLE)
+            ):
+                return "hidden", state, None
+
+        extents = None
+        if backend.culling.offscreen and clip:
+            extents = read_linux_extents(node, backend.pyatspi)
+            if extents and rect_outside(extents, clip):
+                return "offscreen", state, extents
+
+        return None, state, extents
+
+    @staticmethod
+    def _profile_visit(
+        profiler: TraversalProfiler,
+        started: float,
+        probe: Any,
+        element: Optional[Dict[str, Any]],
+    ) -> None:
+        """Report a visited node and restore its element's native node."""
+        if element is not None:
+            element.native_ref = probe.target
+        role = probe.role_name
+        if role is None:
+            try:
+                role = probe.target.getRoleName()
+            except Exception:
+                role = None
+        profiler.visited(started, role)
@@ -0,0 +1,386 @@
+"""
+Warm start from on-disk UI skeletons.
+
+The first walk of an app in a session is the most expensive one. When a
+skeleton of an earlier full walk is stored for the same app version, the
+app is diffed against it instead: window summaries, element paths and the
+child counts of unchanged nodes are checked, and only nodes the earlier
+walk culled are walked again. Any mismatch falls back to a full walk.
+Skeletons also answer searches before the first walk.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..skeleton_cache import (
+    ChildPath,
+    Skeleton,
+    SkeletonCache,
+    SkeletonNode,
+    SkeletonWindow,
+)
+from .subtree_cache import SubtreeRecord, node_key
+
+SKELETON_MISMATCH = object()
+"""Returned by WarmStart._diff when the app no longer matches its skeleton."""
+
+
+class WarmStart:
+    """
+    Skeleton warm walks and skeleton persistence for one backend.
+
+    Attributes:
+        skeletons: On-disk skeleton store, or None when disabled
+    """
+
+    def __init__(self, skeletons: Optional[SkeletonCache]):
+        self.skeletons = skeletons
+        self._walked_keys: Set[str] = set()
+        self._saved: Dict[str, int] = {}
+        self._element_apps: Dict[str, str] = {}
+        self._versions: Dict[Any, str] = {}
+
+    def first_walk(self, cache_key: str) -> bool:
+        """Record a walk of a cache key; True if it is the first one."""
+        if cache_key in self._walked_keys:
+            return False
+        self._walked_keys.add(cache_key)
+        return True
+
+    def claim_element(self, element_id: str) -> Optional[str]:
+        """
+        App name of an element served from a skeleton, once.
+
+        The caller walks that app so the ID resolves to a live node.
+        """
+        return self._element_apps.pop(element_id, None)
+
+    def clear(self) -> None:
+        """Forget app versions (apps may have been restarted)."""
+        self._versions.clear()
+
+    def walk(
+        self, backend: Any, app_name: str, interactive_only: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Diff the app against a stored skeleton instead of walking it.
+
+        The known paths are re-validated first: each window summary must
+        match, and each remembered element must still be at its child path
+        with the same role and label. The rest of the tree is then diffed
+        against the skeleton's structure: a node that produced no element
+        is only asked for its child count, which must be unchanged, and
+        nodes the walk culled are visited again.
+
+        Args:
+            backend: LinuxAccessibility instance doing the AT-SPI calls
+            app_name: Application name
+            interactive_only: If True, only register interactive elements
+
+        Returns:
+            Elements in walk order, or None if the skeleton is unusable or
+            the app changed
+        """
+        if self.skeletons is None:
+            return None
+        app = backend._get_app_impl(app_name)
+        if not app:
+            return None
+        skeleton = self.skeletons.load(
+            app_name, self.app_version(app), interactive_only
+        )
+        if skeleton is None or not skeleton.walkable:
+            return None
+
+        nodes: Dict[ChildPath, Any] = {(): app}
+        for window in skeleton.windows:
+            node = self._node_at_path(nodes, (window.index,))
+            if node is None or self._window_summary(node, window.index) != window:
+                return None
+
+        entries = {entry.path: entry for entry in skeleton.nodes}
+        for path in entries:
+            if self._node_at_path(nodes, path) is None:
+                return None
+
+        try:
+            if app.childCount != skeleton.structure.get(()):
+                return None
+        except Exception:
+            return None
+
+        app_name_lower = app_name.lower()
+        elements: List[Dict[str, Any]] = []
+        root = SubtreeRecord(app, -1)
+        for window in skeleton.windows:
+            path = (window.index,)
+            record = self._diff(
+                backend,
+                nodes[path],
+                path,
+                skeleton.structure,
+                entries,
+                nodes,
+                elements,
+                interactive_only,
+                app_name_lower,
+                None,
+            )
+            if record is SKELETON_MISMATCH or record is None:
+                return None
+            record.index = window.index
+            root.children.append(record)
+
+        if backend._cancelled():
+            return None
+        backend._subtrees.put(f"{app_name_lower}:{interactive_only}", root)
+        return elements
+
+    def _diff(
+        self,
+        backend: Any,
+        node: Any,
+        path: ChildPath,
+        structure: Dict[ChildPath, int],
+        entries: Dict[ChildPath, SkeletonNode],
+        nodes: Dict[ChildPath, Any],
+        elements: List[Dict[str, Any]],
+        interactive_only: bool,
+        app_name: str,
+        clip: Optional[Tuple[int, int, int, int]],
+    ) -> Any:
+        """
+        Diff one node and its descendants against a skeleton.
+
+        Nodes the skeleton does not know (culled by the earlier walk) are
+        walked with the backend's TreeWalker.
+
+        Returns:
+            Record of the node, None if it is culled or beyond the depth
+            limit, or SKELETON_MISMATCH if it no longer matches
+        """
+        depth = len(path) - 1
+        count = structure.get(path)
+        entry = entries.get(path)
+        if count is None and entry is None:
+            return backend._walker.traverse(
+                backend, node, elements, interactive_only, depth, app_name, clip
+            )
+
+        record = SubtreeRecord(node, depth)
+        record.clip = clip
+        if entry is not None or depth == 0:
+            culled, element, record.clip = backend._walker.visit_node(
+                backend, node, depth, interactive_only, app_name, clip
+            )
+            if entry is None:
+                if element is not None:
+                    return SKELETON_MISMATCH
+            elif (
+                culled
+                or element is None
+                or element.get("role") != entry.role
+                or element.get("label") != entry.label
+            ):
+                return SKELETON_MISMATCH
+            else:
+                backend._store_element(element, app_name)
+                elements.append(element)
+                record.element = element
+                if count is None:
+                    if backend._tables.attach(backend, node, element, record.clip):
+                        return record
+                    return SKELETON_MISMATCH
+
+        try:
+            child_count = node.childCount
+        except Exception:
+            return SKELETON_MISMATCH
+        if child_count != count:
+            return SKELETON_MISMATCH
+        record.child_count = child_count
+
+        for i in range(child_count):
+            child_path = path + (i,)
+            child = nodes.get(child_path)
+            try:
+                if child is None:
+                    child = node.getChildAtIndex(i)
+            except Exception:
+                continue
+            child_record = self._diff(
+                backend,
+                child,
+                child_path,
+                structure,
+                entries,
+                nodes,
+                elements,
+                interactive_only,
+                app_name,
+                record.clip,
+            )
+            if child_record is SKELETON_MISMATCH:
+                return SKELETON_MISMATCH
+            if child_record is not None:
+                child_record.index = i
+                record.children.append(child_record)
+        return record
+
+    def save(
+        self,
+        app: Any,
+        root: SubtreeRecord,
+        elements: List[Dict[str, Any]],
+        interactive_only: bool,
+        app_name: str,
+    ) -> None:
+        """
+        Persist the skeleton of a full walk when its elements changed.
+
+        Elements found by bulk queries and collapsed handles have no child
+        path; they are still saved for searching, but make the skeleton
+        unusable for warm walks (which would not collapse the handle).
+
+        Args:
+            app: Application node
+            root: Record of the walked app
+            elements: Elements of the walk
+            interactive_only: Whether the walk kept only interactive elements
+            app_name: Lowercase application name
+        """
+        if self.skeletons is None:
+            return
+        cache_key = f"{app_name}:{interactive_only}"
+        signature = hash(tuple(e.get("element_id") for e in elements))
+        if self._saved.get(cache_key) == signature:
+            return
+
+        windows: List[SkeletonWindow] = []
+        nodes: List[SkeletonNode] = []
+        structure: Dict[ChildPath, int] = {}
+        try:
+            structure[()] = app.childCount
+        except Exception:
+            return
+        for window_record in root.children:
+            try:
+                index = window_record.node.getIndexInParent()
+            except Exception:
+                index = -1
+            summary = self._window_summary(window_record.node, index)
+            if index >= 0 and summary is not None:
+                windows.append(summary)
+                stack = [(window_record, (index,))]
+            else:
+                stack = [(window_record, None)]
+            while stack:
+                record, path = stack.pop()
+                if path is not None and record.child_count >= 0:
+                    structure[path] = record.child_count
+                if record.element is not None:
+                    center = record.element.get("center")
+                    nodes.append(
+                        SkeletonNode(
+                            element_id=record.element.get("element_id", ""),
+                            role=record.element.get("role", ""),
+                            label=record.element.get("label", ""),
+                            identifier=record.element.get("identifier", ""),
+                            path=None if record.element.get("collapsed") else path,
+                            center=tuple(center[:2]) if center else None,
+                        )
+                    )
+                for child in reversed(record.children):
+                    child_path = (
+                        path + (child.index,)
+                        if path is not None and child.index >= 0
+                        else None
+                    )
+                    stack.append((child, child_path))
+
+        skeleton = Skeleton(
+            app_name,
+            self.app_version(app),
+            interactive_only,
+            windows,
+            nodes,
+            structure,
+        )
+        if self.skeletons.save(skeleton):
+            self._saved[cache_key] = signature
+
+    def elements(self, backend: Any, app_name: str) -> List[Dict[str, Any]]:
+        """
+        Elements of an app's stored interactive skeleton.
+
+        Empty once the app has been walked in this session, since the walk
+        is then the better answer.
+        """
+        if self.skeletons is None:
+            return []
+        if f"{app_name.lower()}:True" in self._walked_keys:
+            return []
+        app = backend._get_app_impl(app_name)
+        if not app:
+            return []
+        skeleton = self.skeletons.load(app_name, self.app_version(app), True)
+        if skeleton is None:
+            return []
+        for node in skeleton.nodes:
+            self._element_apps[node.element_id] = app_name
+        return [node.to_element(app_name) for node in skeleton.nodes]
+
+    def app_version(self, app: Any) -> str:
+        """
+        Version string that keys an app's skeletons.
+
+        AT-SPI reports only the toolkit version, so the size and mtime of
+        the process executable stand in for the app's own version.
+        """
+        key = node_key(app)
+        version = self._versions.get(key)
+        if version is not None:
+            return version
+
+        parts = []
+        try:
+            iface = app.queryApplication()
+            parts.append(f"{iface.toolkitName} {iface.version}")
+        except Exception:
+            pass
+        try:
+            stat = os.stat(f"/proc/{app.get_process_id()}/exe")
+            parts.append(f"{stat.st_size}:{int(stat.st_mtime)}")
+        except Exception:
+            pass
+        version = "|".join(parts)
+        self._versions[key] = version
+        return version
+
+    def _node_at_path(self, nodes: Dict[ChildPath, Any], path: ChildPath) -> Any:
+        """Follow a child path from the app, reusing already resolved prefixes."""
+        node = nodes.get(path)
+        if node is not None:
+            return node
+        parent = self._node_at_path(nodes, path[:-1])
+        if parent is None:
+            return None
+        try:
+            node = parent.getChildAtIndex(path[-1])
+        except Exception:
+            return None
+        nodes[path] = node
+        return node
+
+    @staticmethod
+    def _window_summary(window: Any, index: int) -> Optional[SkeletonWindow]:
+        """Summary of a window compared before a skeleton's paths are trusted."""
+        try:
+            return SkeletonWindow(
+                index,
+                window.getRoleName().lower(),
+                window.name or "",
+                window.childCount,
+            )
+        except Exception:
+            return None
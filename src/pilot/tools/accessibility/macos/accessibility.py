@@ -16,6 +16,8 @@ import time
 from ..protocol import AccessibilityProtocol
 from ..element_store import SimpleElementStore
 from ..cache_manager import AccessibilityCacheManager
+from ..containers import ContainerPage, ExpansionOptions, mark_collapsed
+from ..traversal import TraversalScope, rect_intersection
 from .role_normalizer import normalize_macos_element
 
 
@@ -51,6 +53,18 @@ def _safe_iter(value: Any) -> list:
         return []
 
 
+def _preview_label(node: Any) -> str:
+    """Label of a collapsed container's child, for the container's preview."""
+    for attr in ("AXTitle", "AXDescription", "AXValue"):
+        try:
+            value = getattr(node, attr, None)
+        except Exception:
+            continue
+        if value and isinstance(value, str):
+            return value
+    return ""
+
+
 def _safe_str(value: Any, max_len: int = 100) -> str:
     """
     Safely convert a value to string. Handles atomacos objects that crash on str().
@@ -76,6 +90,9 @@ class MacOSAccessibility(AccessibilityProtocol):
     semantic element IDs through the shared registry.
     """
 
+    DIALOG_SUBROLES = ("AXDialog", "AXSystemDialog")
+    COLLAPSIBLE_ROLES = ("AXList", "AXOutline", "AXTable", "AXBrowser")
+
     def __init__(self, screen_width: int = 0, screen_height: int = 0):
         if screen_width == 0 or screen_height == 0:
             self.screen_width, self.screen_height = self._detect_screen_size()
@@ -90,6 +107,7 @@ class MacOSAccessibility(AccessibilityProtocol):
         self._max_elements = 500
         self._max_depth = 25
         self._lock = threading.RLock()
+        self.expansion = ExpansionOptions()
 
         if self.available:
             self._initialize_api()
@@ -149,7 +167,7 @@ class MacOSAccessibility(AccessibilityProtocol):
         with self._lock:
             self._cache.invalidate(app_name)
             if app_name:
-                self._store.clear_app(app_name)
+                self._store.begin_generation(app_name)
             else:
                 self._store.clear_all()
 
@@ -329,6 +347,8 @@ class MacOSAccessibility(AccessibilityProtocol):
 
         elements: List[Dict[str, Any]] = []
         app_name_lower = app_name.lower()
+        if self.profiler is not None:
+            self.profiler.begin_walk()
 
         windows = self.get_windows(app)
 
@@ -373,6 +393,144 @@ class MacOSAccessibility(AccessibilityProtocol):
         self._cache.set_elements(cache_key, elements)
         return elements
 
+    def get_scoped_elements(
+        self,
+        app_name: str,
+        scope: TraversalScope,
+        interactive_only: bool = True,
+    ) -> List[Dict[str, Any]]:
+        return self._run_accessibility(
+            self._get_scoped_elements_impl, app_name, scope, interactive_only
+        )
+
+    def _get_scoped_elements_impl(
+        self, app_name: str, scope: TraversalScope, interactive_only: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Walk only the roots of a scope.
+
+        Region scopes walk the windows whose frame intersects the region and
+        keep the elements intersecting it.
+        """
+        if not self.available:
+            return []
+        if scope.whole_app:
+            return self._get_elements_impl(app_name, interactive_only)
+
+        elements: List[Dict[str, Any]] = []
+        app_name_lower = app_name.lower()
+        if self.profiler is not None:
+            self.profiler.begin_walk()
+        for root in self._scope_roots(app_name, scope):
+            self._traverse(root, elements, interactive_only, 0, app_name_lower)
+        return [e for e in elements if scope.contains(e)]
+
+    def _scope_roots(self, app_name: str, scope: TraversalScope) -> List[Any]:
+        """
+        Native roots of a scope.
+
+        The focused window is AXFocusedWindow (else AXMainWindow, else the
+        frontmost window). The topmost dialog is the first sheet attached to
+        a window, or window with a dialog subrole, in front-to-back order
+        starting at the focused window.
+        """
+        if scope.kind == "subtree":
+            _, node, error = self._store.resolve(scope.element_id)
+            return [] if error else [node]
+
+        app = self.get_app(app_name)
+        if not app:
+            return []
+        windows = self.get_windows(app)
+
+        if scope.kind == "region":
+            return [w for w in windows if self._window_intersects(w, scope.region)]
+
+        focused = None
+        for attr in ("AXFocusedWindow", "AXMainWindow"):
+            try:
+                focused = getattr(app, attr, None)
+            except Exception:
+                focused = None
+            if focused is not None:
+                break
+
+        if scope.kind == "window":
+            if focused is not None:
+                return [focused]
+            return windows[:1]
+
+        ordered = ([focused] if focused is not None else []) + windows
+        for window in ordered:
+            try:
+                for child in _safe_iter(getattr(window, "AXChildren", None)):
+                    if str(getattr(child, "AXRole", "") or "") == "AXSheet":
+                        return [child]
+                role = str(getattr(window, "AXRole", "") or "")
+                subrole = str(getattr(window, "AXSubrole", "") or "")
+            except Exception:
+                continue
+            if role == "AXSheet" or subrole in self.DIALOG_SUBROLES:
+                return [window]
+        return []
+
+    def _window_intersects(
+        self, window: Any, region: Tuple[int, int, int, int]
+    ) -> bool:
+        """True if a window's frame intersects region (or is unknown)."""
+        try:
+            pos = window.AXPosition
+            size = window.AXSize
+            frame = (int(pos[0]), int(pos[1]), int(size[0]), int(size[1]))
+        except Exception:
+            return True
+        return rect_intersection(frame, region) is not None
+
+    def expand_container(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
+        return self._run_accessibility(
+            self._expand_container_impl, element_id, offset, limit, interactive_only
+        )
+
+    def _expand_container_impl(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
+        """Walk one page of a container's children (AXChildren is one read)."""
+        page = ContainerPage(element_id, offset=max(0, offset))
+        if not self.available:
+            page.error = "Accessibility is not available."
+            return page
+        container, node, error = self._store.resolve(element_id)
+        if error:
+            page.error = error
+            return page
+
+        if limit is None:
+            limit = self.expansion.page_size
+        try:
+            children = _safe_iter(node.AXChildren)
+        except Exception as e:
+            page.error = f"Could not read the children of '{element_id}': {e}"
+            return page
+
+        app_name = str(container.get("app_name") or "").lower()
+        if self.profiler is not None:
+            self.profiler.begin_walk()
+        page.total = len(children)
+        for child in children[page.offset : page.offset + max(0, limit)]:
+            page.children_read += 1
+            self._traverse(child, page.elements, interactive_only, 1, app_name)
+        return page
+
     def _is_element_interactive(self, node: Any) -> bool:
         """
         Check if element is interactive by querying the API, NOT by role name.
@@ -467,6 +625,8 @@ class MacOSAccessibility(AccessibilityProtocol):
 
         Uses _batch_fetch_attributes() to minimize IPC calls to the macOS
         accessibility daemon. All attributes are fetched once per node.
+        Lists, outlines and tables with at least expansion.min_children
+        children are registered as collapsed handles and not descended into.
 
         Args:
             node: Current accessibility node
@@ -481,35 +641,58 @@ class MacOSAccessibility(AccessibilityProtocol):
         if depth > self._max_depth or len(elements) >= self._max_elements:
             return False
 
-        attrs = self._batch_fetch_attributes(node)
-        if attrs is None:
-            return True
+        profiler = self.profiler
+        if profiler is None:
+            attrs = self._batch_fetch_attributes(node)
+        else:
+            started = profiler.enter()
+            attrs = self._batch_fetch_attributes(profiler.wrap(node))
+            profiler.visited(started, attrs["role"] if attrs else None)
+        try:
+            if attrs is None:
+                return True
+
+            role = attrs["role"]
 
-        role = attrs["role"]
+            if role == "AXApplication":
+                children = attrs["children"]
+                for child in _safe_iter(children):
+                    if not self._traverse(
+                        child, elements, interactive_only, depth + 1, app_name
+                    ):
+                        return False
+                return True
+
+            has_actions = _is_nonempty_list(attrs["actions"])
+            is_interactive = has_actions or attrs["enabled"]
+            children = _safe_iter(attrs["children"])
+            collapses = (
+                self.expansion.collapses(depth, len(children))
+                and role in self.COLLAPSIBLE_ROLES
+            )
+
+            element = None
+            if collapses or not interactive_only or is_interactive:
+                element = self._register_element_from_attrs(
+                    node, attrs, app_name, elements
+                )
+            if collapses and element is not None:
+                preview = children[: self.expansion.preview]
+                mark_collapsed(
+                    element, len(children), [_preview_label(c) for c in preview]
+                )
+                return True
 
-        if role == "AXApplication":
-            children = attrs["children"]
-            for child in _safe_iter(children):
+            for child in children:
                 if not self._traverse(
                     child, elements, interactive_only, depth + 1, app_name
                 ):
                     return False
-            return True
-
-        has_actions = _is_nonempty_list(attrs["actions"])
-        is_interactive = has_actions or attrs["enabled"]
-
-        if not interactive_only or is_interactive:
-            self._register_element_from_attrs(node, attrs, app_name, elements)
 
-        children = attrs["children"]
-        for child in _safe_iter(children):
-            if not self._traverse(
-                child, elements, interactive_only, depth + 1, app_name
-            ):
-                return False
-
-        return True
+            return True
+        finally:
+            if profiler is not None:
+                profiler.leave(started)
 
     def _register_element(
         self, node: Any, app_name: str, elements: List[Dict[str, Any]]
@@ -545,7 +728,7 @@ class MacOSAccessibility(AccessibilityProtocol):
         attrs: Dict[str, Any],
         app_name: str,
         elements: List[Dict[str, Any]],
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Register element using pre-fetched attributes (no additional IPC calls).
 
@@ -554,21 +737,24 @@ class MacOSAccessibility(AccessibilityProtocol):
             attrs: Pre-fetched attributes from _batch_fetch_attributes()
             app_name: Application name
             elements: List to append the registered element to
+
+        Returns:
+            The registered element, or None if it has no usable bounds
         """
         pos = attrs.get("position")
         size = attrs.get("size")
 
         if pos is None or size is None:
-            return
+            return None
 
         try:
             x, y = pos[0], pos[1]
             w, h = size[0], size[1]
         except (IndexError, TypeError):
-            return
+            return None
 
         if w <= 0 or h <= 0:
-            return
+            return None
 
         identifier = attrs.get("identifier", "")
         short_id = identifier if identifier and len(identifier) <= 10 else ""
@@ -600,9 +786,9 @@ class MacOSAccessibility(AccessibilityProtocol):
         }
 
         if normalized["bounds"][0] > self.screen_width * 2:
-            return
+            return None
         if normalized["bounds"][1] > self.screen_height * 2:
-            return
+            return None
 
         element_id = self._store.store(normalized, app_name)
         normalized["element_id"] = element_id
@@ -612,6 +798,7 @@ class MacOSAccessibility(AccessibilityProtocol):
         normalized["_app_name"] = app_name
 
         elements.append(normalized)
+        return normalized
 
     def _normalize_role(self, ax_role: str) -> str:
         """
@@ -657,8 +844,9 @@ class MacOSAccessibility(AccessibilityProtocol):
         """
         Click element by its unique ID.
 
-        Simple lookup and click - no staleness checks. If click fails,
-        return error suggesting to refresh elements.
+        Elements missing from the app's latest scan are reported as stale
+        rather than clicked. If click fails, return error suggesting to
+        refresh elements.
 
         Args:
             element_id: Unique element ID from get_elements
@@ -670,22 +858,14 @@ class MacOSAccessibility(AccessibilityProtocol):
         if not self.available:
             return (False, "Accessibility not available")
 
-        element = self._store.get(element_id)
-
-        if not element:
-            return (
-                False,
-                f"Element '{element_id}' not found. Call get_accessible_elements() to refresh.",
-            )
+        element, node, error = self._store.resolve(element_id)
+        if error:
+            return (False, error)
 
-        node = element.get("_native_ref") or element.get("_element")
         label = element.get("label", element_id)
         role = element.get("role", "")
         app_name = element.get("app_name", "")
 
-        if not node:
-            return (False, f"Element '{element_id}' has no native reference.")
-
         if role in ("StaticText", "Text"):
             parent = self._find_clickable_parent(node)
             if parent:
@@ -751,7 +931,10 @@ class MacOSAccessibility(AccessibilityProtocol):
                     node.AXPress()
                     time.sleep(ui_settle_delay)
                     self._cache.on_interaction(invalidate_target)
-                    return (True, f"Clicked '{label}' via AXPress{check_focus_suffix()}")
+                    return (
+                        True,
+                        f"Clicked '{label}' via AXPress{check_focus_suffix()}",
+                    )
 
             preferred_substrings: Tuple[str, ...]
             if normalized == "right":
@@ -769,7 +952,10 @@ class MacOSAccessibility(AccessibilityProtocol):
                         getattr(node, action)()
                         time.sleep(ui_settle_delay)
                         self._cache.on_interaction(invalidate_target)
-                        return (True, f"Clicked '{label}' via {action}{check_focus_suffix()}")
+                        return (
+                            True,
+                            f"Clicked '{label}' via {action}{check_focus_suffix()}",
+                        )
 
                     if hasattr(node, "performAction") and callable(
                         getattr(node, "performAction")
@@ -777,7 +963,10 @@ class MacOSAccessibility(AccessibilityProtocol):
                         node.performAction(action)
                         time.sleep(ui_settle_delay)
                         self._cache.on_interaction(invalidate_target)
-                        return (True, f"Clicked '{label}' via {action}{check_focus_suffix()}")
+                        return (
+                            True,
+                            f"Clicked '{label}' via {action}{check_focus_suffix()}",
+                        )
 
             if normalized in {"double", "right"}:
                 return (False, f"No native {normalized}-click action for '{label}'")
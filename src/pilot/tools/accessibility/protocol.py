@@ -7,7 +7,14 @@ platform-specific code - no AX, UIA, AT-SPI references allowed.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import Future
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+
+from .fingerprint import UIFingerprint
+from .instrumentation import TraversalProfiler
+from .tables import TableColumn, TableOptions
+from .containers import ContainerPage, ExpansionOptions
+from .traversal import ElementStream, TraversalBudget, TraversalScope
 
 
 class AccessibilityProtocol(ABC):
@@ -19,6 +26,16 @@ class AccessibilityProtocol(ABC):
     """
 
     available: bool
+    supports_background_walks: bool = False
+    """True if submit_elements() returns before the walk finishes."""
+    supports_text_extraction: bool = False
+    """True if stream_text() reads document text, not only element labels."""
+    profiler: Optional[TraversalProfiler] = None
+    """Traversal instrumentation, None unless enable_profiling() was called."""
+    expansion: Optional[ExpansionOptions] = None
+    """Large-container collapsing, None if the backend never collapses."""
+    table_extraction: Optional[TableOptions] = None
+    """Bulk table reads, None if the backend walks tables cell by cell."""
 
     @abstractmethod
     def get_elements(
@@ -131,6 +148,253 @@ class AccessibilityProtocol(ABC):
         """Check if an application is running."""
         ...
 
+    def stream_elements(
+        self,
+        app_name: str,
+        interactive_only: bool = True,
+        budget: Optional[TraversalBudget] = None,
+        cursor: Optional[str] = None,
+    ) -> ElementStream:
+        """
+        Get UI elements as a stream, optionally bounded by a budget.
+
+        Default implementation returns the complete get_elements() result.
+        Backends that can walk incrementally override this to yield while
+        walking and to stop at the budget with a resume cursor.
+
+        Args:
+            app_name: Application name to get elements from
+            interactive_only: If True, only return interactive elements
+            budget: Node/time limits for this call
+            cursor: Resume token from a previous truncated stream
+
+        Returns:
+            ElementStream of element dictionaries
+        """
+        return ElementStream.from_elements(
+            self.get_elements(app_name, interactive_only)
+        )
+
+    def get_scoped_elements(
+        self,
+        app_name: str,
+        scope: TraversalScope,
+        interactive_only: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get UI elements from part of an application.
+
+        Backends walk only the scope's roots: the focused window, the
+        topmost dialog, the subtree under scope.element_id, or the windows
+        intersecting scope.region (pruning what lies outside it). Scoped
+        results are registered like get_elements() results, so their IDs
+        can be clicked, but they do not replace the app's cached snapshot.
+
+        Default implementation filters the complete get_elements() result,
+        which is only exact for "app" and "region".
+
+        Args:
+            app_name: Application name to get elements from
+            scope: Part of the app to walk
+            interactive_only: If True, only return interactive elements
+
+        Returns:
+            Element dictionaries in walk order; [] if the scope's root does
+            not exist (no dialog open, unknown or stale element_id)
+        """
+        elements = self.get_elements(app_name, interactive_only)
+        return [e for e in elements if scope.contains(e)]
+
+    def expand_container(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
+        """
+        Read one page of the children of a collapsed container handle.
+
+        Walks children [offset, offset + limit) of the container like any
+        other subtree and registers their elements, so their IDs can be
+        clicked. Containers too large to walk eagerly are collapsed again.
+
+        Default implementation returns an error page (backends that never
+        collapse containers have nothing to expand).
+
+        Args:
+            element_id: Element ID of a container (usually "collapsed")
+            offset: Index of the first child to read
+            limit: Number of children to read (default: expansion.page_size)
+            interactive_only: If True, only return interactive elements
+
+        Returns:
+            ContainerPage; its error is set if the container is unknown,
+            stale or cannot be expanded
+        """
+        return ContainerPage(
+            element_id,
+            offset=offset,
+            error="Expanding containers is not supported on this platform.",
+        )
+
+    def stream_text(self, app_name: str) -> Iterator[str]:
+        """
+        Yield the text of an app while it is read.
+
+        Default implementation yields the labels returned by get_text().
+        Backends with supports_text_extraction also yield the document text
+        of editors, documents and terminals, in pieces, as it is read.
+
+        Args:
+            app_name: Application name
+
+        Yields:
+            Text strings in traversal order
+        """
+        yield from self.get_text(app_name)
+
+    def click_table_cell(
+        self,
+        element_id: str,
+        row: int,
+        column: TableColumn = None,
+        click_type: str = "single",
+    ) -> Tuple[bool, str]:
+        """
+        Click one cell of a table element that carries a "table" snapshot.
+
+        Cells are not registered as elements; they are addressed by row and
+        column and resolved to their native node only when clicked.
+
+        Default implementation reports that tables are not supported
+        (backends without table extraction register cells as elements).
+
+        Args:
+            element_id: Element ID of the table
+            row: 1-based row number
+            column: 1-based column number or header label (default: first)
+            click_type: Click type - single, double, or right
+
+        Returns:
+            Tuple of (success, message) naming the cell clicked
+        """
+        return (False, "Table cells are not addressable on this platform.")
+
+    def submit_elements(
+        self, app_name: str, interactive_only: bool = True, use_cache: bool = True
+    ) -> Future:
+        """
+        Request elements without waiting for the traversal.
+
+        Default implementation runs get_elements() in the calling thread
+        and returns an already resolved future. Backends with a dedicated
+        accessibility thread queue the walk and return immediately.
+
+        Args:
+            app_name: Application name to get elements from
+            interactive_only: If True, only return interactive elements
+            use_cache: Whether to use cached results
+
+        Returns:
+            Future resolved with the element list
+        """
+        future: Future = Future()
+        try:
+            future.set_result(
+                self.get_elements(app_name, interactive_only, use_cache=use_cache)
+            )
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def probe_fingerprint(self, app_name: str) -> Optional[UIFingerprint]:
+        """
+        Cheap summary of an app's windows and focus.
+
+        Default implementation returns None (fingerprints unsupported).
+
+        Args:
+            app_name: Application name
+
+        Returns:
+            UIFingerprint, or None if unsupported or the app is not found
+        """
+        return None
+
+    def revalidate_cache(self, app_name: str) -> bool:
+        """
+        Check whether the cached snapshot of an app still matches the UI.
+
+        Default implementation cannot tell, so it invalidates the app's
+        cache. Backends with probe_fingerprint() reuse the snapshot when
+        the fingerprint is unchanged.
+
+        Args:
+            app_name: Application name
+
+        Returns:
+            True if the cached snapshot can be reused as is
+        """
+        self.invalidate_cache(app_name)
+        return False
+
+    def get_skeleton_elements(self, app_name: str) -> List[Dict[str, Any]]:
+        """
+        Elements remembered on disk from an earlier session.
+
+        Lets searches be answered before the app's first walk. Returned
+        elements carry from_skeleton=True and no native reference; clicking
+        one walks the app first. Default implementation returns [].
+
+        Args:
+            app_name: Application name
+
+        Returns:
+            Skeleton elements, or [] once the app has been walked this
+            session or when no skeleton is stored
+        """
+        return []
+
+    def enable_profiling(self, top_n: int = 10) -> TraversalProfiler:
+        """
+        Start counting IPC calls and timing nodes during traversals.
+
+        Args:
+            top_n: Number of slowest role paths in reports
+
+        Returns:
+            The active profiler (existing one if already enabled)
+        """
+        if self.profiler is None:
+            self.profiler = TraversalProfiler(top_n)
+        return self.profiler
+
+    def disable_profiling(self) -> Dict[str, Any]:
+        """
+        Stop instrumentation and return its final report.
+
+        Returns:
+            Last profile report, or {} if profiling was not enabled
+        """
+        report = self.get_traversal_profile()
+        self.profiler = None
+        return report
+
+    def get_traversal_profile(self, top_n: Optional[int] = None) -> Dict[str, Any]:
+        """
+        IPC counts, per-node time histogram and slowest role paths.
+
+        Args:
+            top_n: Number of slowest role paths (default: profiler's top_n)
+
+        Returns:
+            TraversalProfiler.report() result, or {} if profiling is disabled
+        """
+        if self.profiler is None:
+            return {}
+        return self.profiler.report(top_n)
+
     def set_active_app(self, app_name: str) -> None:
         """
         Set and cache the active application.
@@ -164,3 +428,15 @@ class AccessibilityProtocol(ABC):
     def clear_app_cache(self) -> None:
         """Backward compatible alias for clear_cache."""
         self.clear_cache()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Element cache counters for diagnostics.
+
+        Returns:
+            Hit, miss, eviction and age counters (empty if no cache)
+        """
+        cache = getattr(self, "_cache", None)
+        if cache is None or not hasattr(cache, "stats"):
+            return {}
+        return cache.stats().to_dict()
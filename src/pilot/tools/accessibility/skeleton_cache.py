@@ -0,0 +1,378 @@
+"""
+On-disk UI skeletons for warm-start element discovery.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+A skeleton is the compact outcome of one full walk of an app: for every
+element its stable ID, role, label, identifier, center and the path of
+child indices leading to it from the application node, the child count of
+every walked node, plus a summary of each window. Skeletons are kept per
+app, app version and interactive_only flag in a local SQLite file, so a
+new session can answer searches before walking the app and re-validate
+the known paths instead of walking the whole tree.
+
+The file location comes from PILOT_SKELETON_CACHE (a path, or "off" to
+disable); by default it lives under the user cache directory.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+ChildPath = Tuple[int, ...]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skeletons (
+    app TEXT NOT NULL,
+    version TEXT NOT NULL,
+    interactive INTEGER NOT NULL,
+    saved_at REAL NOT NULL,
+    windows TEXT NOT NULL,
+    PRIMARY KEY (app, version, interactive)
+);
+CREATE TABLE IF NOT EXISTS skeleton_nodes (
+    app TEXT NOT NULL,
+    version TEXT NOT NULL,
+    interactive INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    element_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    label TEXT NOT NULL,
+    identifier TEXT NOT NULL,
+    path TEXT,
+    x INTEGER,
+    y INTEGER,
+    PRIMARY KEY (app, version, interactive, position)
+);
+CREATE TABLE IF NOT EXISTS skeleton_structure (
+    app TEXT NOT NULL,
+    version TEXT NOT NULL,
+    interactive INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    child_count INTEGER NOT NULL,
+    PRIMARY KEY (app, version, interactive, path)
+);
+"""
+
+_TABLES = ("skeletons", "skeleton_nodes", "skeleton_structure")
+
+
+class SkeletonWindow(NamedTuple):
+    """Top-level summary of one window, checked before paths are followed."""
+
+    index: int
+    role: str
+    title: str
+    child_count: int
+
+
+@dataclass
+class SkeletonNode:
+    """One element remembered from a full walk."""
+
+    element_id: str
+    role: str
+    label: str
+    identifier: str = ""
+    path: Optional[ChildPath] = None
+    center: Optional[Tuple[int, int]] = None
+
+    def to_element(self, app_name: str) -> Dict[str, Any]:
+        """
+        Element dictionary for searching, without a native reference.
+
+        Args:
+            app_name: Application the skeleton belongs to
+
+        Returns:
+            Element dictionary marked with from_skeleton
+        """
+        return {
+            "element_id": self.element_id,
+            "role": self.role,
+            "label": self.label,
+            "identifier": self.identifier,
+            "center": list(self.center) if self.center else None,
+            "app_name": app_name,
+            "from_skeleton": True,
+        }
+
+
+@dataclass
+class Skeleton:
+    """
+    Skeleton of one app version for one interactive_only setting.
+
+    structure maps the path of every node the walk listed children of to
+    its child count; nodes the walk culled have no entry.
+    """
+
+    app_name: str
+    version: str
+    interactive_only: bool
+    windows: List[SkeletonWindow] = field(default_factory=list)
+    nodes: List[SkeletonNode] = field(default_factory=list)
+    structure: Dict[ChildPath, int] = field(default_factory=dict)
+    saved_at: float = 0.0
+
+    @property
+    def walkable(self) -> bool:
+        """True if the structure and every node's path are known."""
+        return (
+            bool(self.windows)
+            and bool(self.structure)
+            and all(node.path is not None for node in self.nodes)
+        )
+
+
+class SkeletonCache:
+    """
+    SQLite store of app skeletons.
+
+    The database is opened on first use. Any SQLite error disables the
+    cache for the rest of the session instead of failing a walk.
+    """
+
+    ENV_VAR = "PILOT_SKELETON_CACHE"
+    """Database path, or "off" to disable skeletons."""
+
+    FILE_NAME = "ui_skeletons.sqlite3"
+
+    MAX_VERSIONS = 2
+    """Versions of one app kept; older ones are deleted on save."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (":memory:" for a private database)
+        """
+        self.path = str(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["SkeletonCache"]:
+        """
+        Create the cache configured by PILOT_SKELETON_CACHE.
+
+        Returns:
+            SkeletonCache, or None when skeletons are disabled
+        """
+        value = os.getenv(cls.ENV_VAR, "").strip()
+        if value.lower() in ("0", "off", "false", "no"):
+            return None
+        if value:
+            return cls(Path(value).expanduser())
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return cls(Path(base) / "pilot" / cls.FILE_NAME)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._broken:
+            return self._conn
+        try:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            self._broken = True
+        return self._conn
+
+    def save(self, skeleton: Skeleton) -> bool:
+        """
+        Replace the stored skeleton for its app, version and setting.
+
+        Args:
+            skeleton: Skeleton built from a full walk
+
+        Returns:
+            True if it was written
+        """
+        key = (
+            skeleton.app_name.lower(),
+            skeleton.version,
+            int(skeleton.interactive_only),
+        )
+        windows = json.dumps([list(w) for w in skeleton.windows])
+        rows = [
+            key
+            + (
+                position,
+                node.element_id,
+                node.role,
+                node.label,
+                node.identifier,
+                _encode_path(node.path),
+                node.center[0] if node.center else None,
+                node.center[1] if node.center else None,
+            )
+            for position, node in enumerate(skeleton.nodes)
+        ]
+        structure = [
+            key + (_encode_path(path), count)
+            for path, count in skeleton.structure.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return False
+            try:
+                with conn:
+                    for table in _TABLES[1:]:
+                        conn.execute(
+                            f"DELETE FROM {table} "
+                            "WHERE app = ? AND version = ? AND interactive = ?",
+                            key,
+                        )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO skeletons VALUES (?, ?, ?, ?, ?)",
+                        key + (skeleton.saved_at or time.time(), windows),
+                    )
+                    conn.executemany(
+                        "INSERT INTO skeleton_nodes "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.executemany(
+                        "INSERT INTO skeleton_structure VALUES (?, ?, ?, ?, ?)",
+                        structure,
+                    )
+                    self._trim_versions(conn, key[0])
+            except sqlite3.Error:
+                self._broken = True
+                return False
+        return True
+
+    def load(
+        self, app_name: str, version: str, interactive_only: bool
+    ) -> Optional[Skeleton]:
+        """
+        Load the skeleton stored for an app version.
+
+        Args:
+            app_name: Application name
+            version: App version string reported by the backend
+            interactive_only: Setting the skeleton was walked with
+
+        Returns:
+            Skeleton, or None if none is stored
+        """
+        key = (app_name.lower(), version, int(interactive_only))
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                header = conn.execute(
+                    "SELECT saved_at, windows FROM skeletons "
+                    "WHERE app = ? AND version = ? AND interactive = ?",
+                    key,
+                ).fetchone()
+                if header is None:
+                    return None
+                rows = conn.execute(
+                    "SELECT element_id, role, label, identifier, path, x, y "
+                    "FROM skeleton_nodes "
+                    "WHERE app = ? AND version = ? AND interactive = ? "
+                    "ORDER BY position",
+                    key,
+                ).fetchall()
+                structure = conn.execute(
+                    "SELECT path, child_count FROM skeleton_structure "
+                    "WHERE app = ? AND version = ? AND interactive = ?",
+                    key,
+                ).fetchall()
+            except sqlite3.Error:
+                self._broken = True
+                return None
+
+        return Skeleton(
+            app_name=app_name,
+            version=version,
+            interactive_only=interactive_only,
+            windows=[SkeletonWindow(*w) for w in json.loads(header[1])],
+            nodes=[
+                SkeletonNode(
+                    element_id=eid,
+                    role=role,
+                    label=label,
+                    identifier=identifier,
+                    path=_decode_path(path),
+                    center=(x, y) if x is not None and y is not None else None,
+                )
+                for eid, role, label, identifier, path, x, y in rows
+            ],
+            structure={_decode_path(path): count for path, count in structure},
+            saved_at=header[0],
+        )
+
+    def drop(self, app_name: Optional[str] = None) -> None:
+        """
+        Delete stored skeletons for one app, or all of them.
+
+        Args:
+            app_name: App whose skeletons to delete, or None for all
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    if app_name is None:
+                        for table in _TABLES:
+                            conn.execute(f"DELETE FROM {table}")
+                    else:
+                        for table in _TABLES:
+                            conn.execute(
+                                f"DELETE FROM {table} WHERE app = ?",
+                                (app_name.lower(),),
+                            )
+            except sqlite3.Error:
+                self._broken = True
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _trim_versions(self, conn: sqlite3.Connection, app: str) -> None:
+        """Delete skeletons of all but the most recently saved versions."""
+        stale = conn.execute(
+            "SELECT DISTINCT version FROM skeletons WHERE app = ? "
+            "AND version NOT IN (SELECT version FROM skeletons WHERE app = ? "
+            "GROUP BY version ORDER BY MAX(saved_at) DESC LIMIT ?)",
+            (app, app, self.MAX_VERSIONS),
+        ).fetchall()
+        for (version,) in stale:
+            for table in _TABLES:
+                conn.execute(
+                    f"DELETE FROM {table} WHERE app = ? AND version = ?",
+                    (app, version),
+                )
+
+
+def _encode_path(path: Optional[ChildPath]) -> Optional[str]:
+    if path is None:
+        return None
+    return ".".join(str(i) for i in path)
+
+
+def _decode_path(text: Optional[str]) -> Optional[ChildPath]:
+    if text is None:
+        return None
+    return tuple(int(part) for part in text.split(".")) if text else ()
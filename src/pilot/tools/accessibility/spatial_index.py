@@ -0,0 +1,277 @@
+"""
+Grid index over element bounds for point and rectangle queries.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+Tools that map screen coordinates back to elements (OCR matches, click
+points) ask the index instead of scanning every element. Elements are
+bucketed by the grid cells their bounds cover and, separately, by the cell
+of their center. Very large elements (windows, scroll areas) would cover
+hundreds of cells, so they are kept in a short list checked on every query.
+
+Bounds are closed rectangles: a point on the edge is inside, matching the
+x <= px <= x + w checks used by the tools.
+"""
+
+import heapq
+import math
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+Cell = Tuple[int, int]
+Rect = Tuple[int, int, int, int]
+
+
+def _bounds_of(element: Mapping[str, Any]) -> Optional[Rect]:
+    bounds = element.get("bounds") or []
+    if len(bounds) != 4:
+        return None
+    return bounds[0], bounds[1], bounds[2], bounds[3]
+
+
+def _center_of(element: Mapping[str, Any]) -> Optional[Tuple[float, float]]:
+    center = element.get("center") or []
+    if len(center) != 2:
+        return None
+    return center[0], center[1]
+
+
+class SpatialIndex:
+    """
+    Uniform grid over a fixed element snapshot.
+
+    Build it where the snapshot is taken and keep it next to the snapshot
+    for as long as that is queried; the index does not notice later changes
+    to the list. Results are returned in snapshot order unless stated
+    otherwise.
+    """
+
+    CELL_SIZE = 64
+    MAX_CELLS_PER_ELEMENT = 64
+
+    def __init__(self, elements: Iterable[Mapping[str, Any]], cell_size: int = 0):
+        """
+        Index elements by bounds and center.
+
+        Args:
+            elements: Element dicts with "bounds" [x, y, w, h] and/or
+                "center" [x, y]; elements without them are ignored
+            cell_size: Grid cell size in pixels (0 = CELL_SIZE)
+        """
+        self.cell_size = cell_size or self.CELL_SIZE
+        self.elements: List[Mapping[str, Any]] = list(elements)
+        self._rects: Dict[int, Rect] = {}
+        self._centers: Dict[int, Tuple[float, float]] = {}
+        self._rect_cells: Dict[Cell, List[int]] = {}
+        self._center_cells: Dict[Cell, List[int]] = {}
+        self._oversized: List[int] = []
+
+        for i, element in enumerate(self.elements):
+            rect = _bounds_of(element)
+            if rect is not None and rect[2] >= 0 and rect[3] >= 0:
+                self._rects[i] = rect
+                self._add_rect(i, rect)
+            center = _center_of(element)
+            if center is not None:
+                self._centers[i] = center
+                self._center_cells.setdefault(self._cell(*center), []).append(i)
+
+        cells = list(self._center_cells)
+        self._extent = (
+            min(c for c, _ in cells) if cells else 0,
+            max(c for c, _ in cells) if cells else 0,
+            min(r for _, r in cells) if cells else 0,
+            max(r for _, r in cells) if cells else 0,
+        )
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def containing(self, x: float, y: float) -> List[Mapping[str, Any]]:
+        """
+        Elements whose bounds contain a point.
+
+        Args:
+            x: Screen x
+            y: Screen y
+
+        Returns:
+            Elements in snapshot order
+        """
+        return [self.elements[i] for i in sorted(self._containing_ids(x, y))]
+
+    def around(self, x: float, y: float, radius: float) -> List[Mapping[str, Any]]:
+        """
+        Elements containing a point or centered within a radius of it.
+
+        Args:
+            x: Screen x
+            y: Screen y
+            radius: Distance in pixels
+
+        Returns:
+            Elements in snapshot order
+        """
+        found = self._containing_ids(x, y) | self._within_ids(x, y, radius)
+        return [self.elements[i] for i in sorted(found)]
+
+    def intersecting(self, rect: Rect) -> List[Mapping[str, Any]]:
+        """
+        Elements whose bounds overlap a rectangle (edges touching count).
+
+        Args:
+            rect: (x, y, width, height)
+
+        Returns:
+            Elements in snapshot order
+        """
+        x, y, w, h = rect
+        (c0, r0), (c1, r1) = self._cell(x, y), self._cell(x + w, y + h)
+        found = set()
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                found.update(self._rect_cells.get((col, row), ()))
+        found.update(self._oversized)
+        return [
+            self.elements[i]
+            for i in sorted(found)
+            if self._overlaps(self._rects[i], rect)
+        ]
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        n: int = 1,
+        max_distance: Optional[float] = None,
+    ) -> List[Mapping[str, Any]]:
+        """
+        Elements whose centers are closest to a point.
+
+        Searches rings of grid cells outward from the point and stops as
+        soon as no unvisited cell can hold a closer center.
+
+        Args:
+            x: Screen x
+            y: Screen y
+            n: Number of elements to return
+            max_distance: Ignore centers farther than this (None = no limit)
+
+        Returns:
+            Up to n elements, closest first
+        """
+        if n <= 0 or not self._centers:
+            return []
+
+        col, row = self._cell(x, y)
+        min_col, max_col, min_row, max_row = self._extent
+        last_ring = max(
+            abs(col - min_col),
+            abs(col - max_col),
+            abs(row - min_row),
+            abs(row - max_row),
+        )
+        heap: List[Tuple[float, int]] = []
+        ring = 0
+        while ring <= last_ring:
+            for cell in self._ring_cells(col, row, ring):
+                for i in self._center_cells.get(cell, ()):
+                    cx, cy = self._centers[i]
+                    distance = math.hypot(cx - x, cy - y)
+                    if max_distance is not None and distance > max_distance:
+                        continue
+                    if len(heap) < n:
+                        heapq.heappush(heap, (-distance, -i))
+                    elif -heap[0][0] > distance:
+                        heapq.heapreplace(heap, (-distance, -i))
+
+            reach = ring * self.cell_size
+            if len(heap) == n and -heap[0][0] <= reach:
+                break
+            if max_distance is not None and reach > max_distance:
+                break
+            ring += 1
+
+        ordered = sorted((-d, -i) for d, i in heap)
+        return [self.elements[i] for _, i in ordered]
+
+    def within(self, x: float, y: float, radius: float) -> List[Mapping[str, Any]]:
+        """
+        Elements whose centers lie within a radius of a point.
+
+        Args:
+            x: Screen x
+            y: Screen y
+            radius: Distance in pixels
+
+        Returns:
+            Elements in snapshot order
+        """
+        return [self.elements[i] for i in sorted(self._within_ids(x, y, radius))]
+
+    def _containing_ids(self, x: float, y: float) -> Set[int]:
+        found = {
+            i
+            for i in self._rect_cells.get(self._cell(x, y), ())
+            if self._contains(self._rects[i], x, y)
+        }
+        found.update(i for i in self._oversized if self._contains(self._rects[i], x, y))
+        return found
+
+    def _within_ids(self, x: float, y: float, radius: float) -> Set[int]:
+        c0, r0 = self._cell(x - radius, y - radius)
+        c1, r1 = self._cell(x + radius, y + radius)
+        found = set()
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                for i in self._center_cells.get((col, row), ()):
+                    cx, cy = self._centers[i]
+                    if math.hypot(cx - x, cy - y) <= radius:
+                        found.add(i)
+        return found
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _add_rect(self, i: int, rect: Rect) -> None:
+        x, y, w, h = rect
+        (c0, r0), (c1, r1) = self._cell(x, y), self._cell(x + w, y + h)
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > self.MAX_CELLS_PER_ELEMENT:
+            self._oversized.append(i)
+            return
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                self._rect_cells.setdefault((col, row), []).append(i)
+
+    def _ring_cells(self, col: int, row: int, ring: int) -> Iterable[Cell]:
+        if ring == 0:
+            yield (col, row)
+            return
+        for dc in range(-ring, ring + 1):
+            yield (col + dc, row - ring)
+            yield (col + dc, row + ring)
+        for dr in range(-ring + 1, ring):
+            yield (col - ring, row + dr)
+            yield (col + ring, row + dr)
+
+    @staticmethod
+    def _contains(rect: Rect, x: float, y: float) -> bool:
+        rx, ry, rw, rh = rect
+        return rx <= x <= rx + rw and ry <= y <= ry + rh
+
+    @staticmethod
+    def _overlaps(a: Rect, b: Rect) -> bool:
+        ax, ay, aw, ah = a
+        bx, by, bw, bh = b
+        return ax <= bx + bw and bx <= ax + aw and ay <= by + bh and by <= ay + ah
@@ -0,0 +1,181 @@
+"""
+Table-aware extraction: one element per table with addressable cells.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+A backend that can read a table through its platform's table interface
+registers the table as a single element whose "table" key holds a
+TableSnapshot dict: its dimensions, column headers and the text of the
+rows currently on screen. Cells are not registered as elements; a cell is
+addressed as "row 12, column Subject" and resolved to its native node only
+when it is clicked.
+
+Rows and columns are numbered from 1 in everything the caller sees, since
+that is how they are shown to the agent.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+TableColumn = Union[int, str, None]
+
+
+@dataclass
+class TableOptions:
+    """
+    Limits for table extraction.
+
+    Attributes:
+        enabled: Read tables in bulk instead of walking their cells
+        max_rows: Maximum visible rows read per table
+        max_columns: Maximum columns read per row
+    """
+
+    enabled: bool = True
+    max_rows: int = 50
+    max_columns: int = 16
+
+
+@dataclass
+class TableSnapshot:
+    """
+    Dimensions, headers and visible rows of one table.
+
+    Attributes:
+        rows: Total number of rows
+        columns: Column header labels ("" when a column has no header)
+        first_row: 1-based number of the first row in cells
+        cells: Text of the visible rows, one list of column texts per row
+        caption: Table caption, if any
+    """
+
+    rows: int
+    columns: List[str]
+    first_row: int = 1
+    cells: List[List[str]] = field(default_factory=list)
+    caption: str = ""
+
+    @property
+    def last_row(self) -> int:
+        """1-based number of the last row in cells (first_row - 1 if none)."""
+        return self.first_row + len(self.cells) - 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict stored under an element's "table" key."""
+        return {
+            "rows": self.rows,
+            "columns": list(self.columns),
+            "first_row": self.first_row,
+            "cells": [list(row) for row in self.cells],
+            "caption": self.caption,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TableSnapshot":
+        """Rebuild a snapshot from an element's "table" dict."""
+        return cls(
+            rows=int(data.get("rows", 0)),
+            columns=list(data.get("columns") or []),
+            first_row=int(data.get("first_row", 1)),
+            cells=[list(row) for row in data.get("cells") or []],
+            caption=data.get("caption", "") or "",
+        )
+
+
+def column_name(columns: List[str], index: int) -> str:
+    """
+    Display name of a 0-based column.
+
+    Returns:
+        The header label, or "N" (1-based) when the column has no header
+    """
+    if 0 <= index < len(columns) and columns[index]:
+        return columns[index]
+    return str(index + 1)
+
+
+def resolve_column(
+    columns: List[str], column_count: int, column: TableColumn
+) -> Optional[int]:
+    """
+    Map a column reference to a 0-based column index.
+
+    Args:
+        columns: Column header labels
+        column_count: Number of columns in the table
+        column: 1-based column number, header label (case-insensitive,
+            exact match first, then prefix), or None for the first column
+
+    Returns:
+        0-based index, or None if no column matches
+    """
+    if column is None or column == "":
+        return 0 if column_count > 0 else None
+    if isinstance(column, int) or str(column).strip().isdigit():
+        index = int(column) - 1
+        return index if 0 <= index < column_count else None
+
+    wanted = str(column).strip().lower()
+    headers = [(header or "").strip().lower() for header in columns]
+    for index, header in enumerate(headers):
+        if header == wanted:
+            return index
+    for index, header in enumerate(headers):
+        if header and header.startswith(wanted):
+            return index
+    return None
+
+
+def describe_cell(columns: List[str], row: int, index: int) -> str:
+    """Address of a cell as shown to the agent, e.g. "row 12, column Subject"."""
+    return f"row {row}, column {column_name(columns, index)}"
+
+
+def visible_row_range(
+    rows: int,
+    row_extent: Callable[[int], Optional[Tuple[int, int]]],
+    viewport: Tuple[int, int, int, int],
+    max_rows: int,
+) -> Tuple[int, int]:
+    """
+    Find the rows that intersect a viewport, reading O(log n) row extents.
+
+    Rows are assumed to be laid out top to bottom in index order. The first
+    visible row is found by binary search; rows are then taken until one
+    starts below the viewport or max_rows is reached.
+
+    Args:
+        rows: Number of rows
+        row_extent: Returns (y, height) of a 0-based row, or None if unknown
+        viewport: (x, y, width, height) of the visible part of the table
+        max_rows: Maximum rows in the range
+
+    Returns:
+        (start, end) 0-based half-open range of visible rows
+    """
+    top = viewport[1]
+    bottom = viewport[1] + viewport[3]
+
+    low, high = 0, rows
+    while low < high:
+        middle = (low + high) // 2
+        extent = row_extent(middle)
+        if extent is None:
+            break
+        y, height = extent
+        if y + height <= top:
+            low = middle + 1
+        else:
+            high = middle
+    start = low
+
+    end = start
+    while end < rows and end - start < max_rows:
+        extent = row_extent(end)
+        if extent is not None and extent[0] >= bottom:
+            break
+        end += 1
+    return start, end
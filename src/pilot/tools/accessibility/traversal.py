@@ -0,0 +1,320 @@
+"""
+Budgeted, resumable element traversal primitives.
+
+This module is PLATFORM-AGNOSTIC. It contains ZERO references to:
+- macOS: No "AX" prefix, no AppKit, no atomacos
+- Windows: No "UIA", no pywinauto
+- Linux: No "AT-SPI", no pyatspi
+
+A backend that can walk incrementally returns an ElementStream: elements
+are yielded while the walk is still running, and when a TraversalBudget
+runs out the stream is marked truncated and carries a cursor token. Passing
+the token back continues the walk from where it stopped.
+
+A TraversalScope limits a walk to part of an app (the focused window, the
+topmost dialog, the subtree under an element or a screen region), so the
+common "a dialog just opened" case does not pay for every window.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class TraversalBudget:
+    """
+    Limits for a single traversal call.
+
+    Attributes:
+        max_nodes: Maximum nodes to visit (None = unlimited)
+        max_seconds: Maximum wall-clock time (None = unlimited)
+    """
+
+    max_nodes: Optional[int] = None
+    max_seconds: Optional[float] = None
+
+    def node_allowance(self, visited: int, batch: int) -> int:
+        """
+        Number of nodes the next batch may visit.
+
+        Args:
+            visited: Nodes visited so far in this call
+            batch: Preferred batch size
+
+        Returns:
+            Nodes allowed in the next batch (0 = budget exhausted)
+        """
+        if self.max_nodes is None:
+            return batch
+        return max(0, min(batch, self.max_nodes - visited))
+
+    def time_left(self, started: float) -> bool:
+        """True if the time budget is not yet spent."""
+        if self.max_seconds is None:
+            return True
+        return time.monotonic() - started < self.max_seconds
+
+
+@dataclass
+class CullingOptions:
+    """
+    Rules for skipping whole subtrees that cannot be seen.
+
+    A culled node is not normalized and its children are never visited.
+    Top-level windows are never culled.
+
+    Attributes:
+        hidden: Skip nodes the platform reports as not showing or not visible
+        offscreen: Skip nodes whose bounds lie entirely outside their window
+        pruned: Number of nodes skipped per rule ("hidden", "offscreen")
+    """
+
+    hidden: bool = True
+    offscreen: bool = True
+    pruned: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def enabled(self) -> bool:
+        """True if any rule is active."""
+        return self.hidden or self.offscreen
+
+    def count(self, rule: str) -> None:
+        """Record one node pruned by a rule."""
+        self.pruned[rule] = self.pruned.get(rule, 0) + 1
+
+    def reset_counters(self) -> None:
+        """Reset pruning counters."""
+        self.pruned.clear()
+
+
+def rect_outside(
+    rect: Tuple[int, int, int, int], clip: Tuple[int, int, int, int]
+) -> bool:
+    """
+    True if a non-empty rect does not intersect the clip rect at all.
+
+    Empty rects (zero width or height) are never considered outside, since
+    some toolkits report zero-sized containers with visible children.
+
+    Args:
+        rect: (x, y, width, height) of the node
+        clip: (x, y, width, height) of the enclosing window
+
+    Returns:
+        True if the rect lies entirely outside the clip
+    """
+    x, y, w, h = rect
+    cx, cy, cw, ch = clip
+    if w <= 0 or h <= 0 or cw <= 0 or ch <= 0:
+        return False
+    return x >= cx + cw or y >= cy + ch or x + w <= cx or y + h <= cy
+
+
+def rect_intersection(
+    rect: Tuple[int, int, int, int], clip: Tuple[int, int, int, int]
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Overlap of two rects.
+
+    Args:
+        rect: (x, y, width, height)
+        clip: (x, y, width, height)
+
+    Returns:
+        (x, y, width, height) of the overlap, or None if they do not overlap
+    """
+    x = max(rect[0], clip[0])
+    y = max(rect[1], clip[1])
+    right = min(rect[0] + rect[2], clip[0] + clip[2])
+    bottom = min(rect[1] + rect[3], clip[1] + clip[3])
+    if right <= x or bottom <= y:
+        return None
+    return (x, y, right - x, bottom - y)
+
+
+SCOPE_KINDS = ("app", "window", "dialog", "subtree", "region")
+
+
+@dataclass(frozen=True)
+class TraversalScope:
+    """
+    Part of an application a walk is limited to.
+
+    Attributes:
+        kind: "app" (every window), "window" (the focused window), "dialog"
+            (the topmost dialog), "subtree" (element_id and everything below
+            it) or "region" (elements intersecting region)
+        element_id: Root element for "subtree"
+        region: (x, y, width, height) in screen coordinates for "region"
+    """
+
+    kind: str = "app"
+    element_id: Optional[str] = None
+    region: Optional[Tuple[int, int, int, int]] = None
+
+    def __post_init__(self):
+        if self.kind not in SCOPE_KINDS:
+            raise ValueError(
+                f"Unknown scope '{self.kind}'. Use one of: {', '.join(SCOPE_KINDS)}"
+            )
+        if self.kind == "subtree" and not self.element_id:
+            raise ValueError("Scope 'subtree' requires element_id")
+        if self.kind == "region":
+            if not self.region or len(self.region) != 4:
+                raise ValueError("Scope 'region' requires region (x, y, width, height)")
+            if self.region[2] <= 0 or self.region[3] <= 0:
+                raise ValueError("Scope 'region' requires a non-empty region")
+
+    @classmethod
+    def parse(
+        cls,
+        kind: Optional[str],
+        element_id: Optional[str] = None,
+        region: Any = None,
+    ) -> "TraversalScope":
+        """
+        Build a scope from tool arguments.
+
+        Args:
+            kind: Scope name (None or "" = "app")
+            element_id: Root element for "subtree"
+            region: {x, y, width, height} dict or (x, y, width, height)
+
+        Returns:
+            TraversalScope
+
+        Raises:
+            ValueError: If the scope name or its arguments are invalid
+        """
+        if isinstance(region, dict):
+            try:
+                region = tuple(
+                    int(region[key]) for key in ("x", "y", "width", "height")
+                )
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(
+                    "region needs integer x, y, width and height"
+                ) from None
+        elif region is not None:
+            region = tuple(int(v) for v in region)
+        return cls((kind or "app").strip().lower(), element_id or None, region)
+
+    @property
+    def whole_app(self) -> bool:
+        """True if the scope covers every window of the app."""
+        return self.kind == "app"
+
+    def contains(self, element: Dict[str, Any]) -> bool:
+        """
+        True if an element walked under this scope belongs in the result.
+
+        Only "region" filters: elements must have bounds intersecting it.
+        """
+        if self.kind != "region":
+            return True
+        bounds = element.get("bounds")
+        if not bounds or len(bounds) != 4:
+            return False
+        return rect_intersection(tuple(bounds), self.region) is not None
+
+    def describe(self) -> str:
+        """Short human-readable description, e.g. "topmost dialog"."""
+        if self.kind == "window":
+            return "focused window"
+        if self.kind == "dialog":
+            return "topmost dialog"
+        if self.kind == "subtree":
+            return f"subtree of {self.element_id}"
+        if self.kind == "region":
+            return "region ({}, {}, {}x{})".format(*self.region)
+        return "all windows"
+
+
+class ElementStream:
+    """
+    Single-pass iterator of elements produced while a traversal runs.
+
+    After iteration ends, truncated tells whether the budget stopped the
+    walk early and cursor holds the token to resume it.
+
+    Attributes:
+        truncated: True if the walk stopped before visiting every node
+        cursor: Resume token when truncated, else None
+        nodes_visited: Nodes visited by this call
+    """
+
+    def __init__(self, producer: Callable[["ElementStream"], Iterable[Dict[str, Any]]]):
+        """
+        Initialize the stream.
+
+        Args:
+            producer: Called with this stream, returns the element iterable.
+                It may set truncated, cursor and nodes_visited while running.
+        """
+        self.truncated = False
+        self.cursor: Optional[str] = None
+        self.nodes_visited = 0
+        self._iterator: Iterator[Dict[str, Any]] = iter(producer(self))
+
+    @classmethod
+    def from_elements(cls, elements: List[Dict[str, Any]]) -> "ElementStream":
+        """Wrap an already complete element list."""
+        return cls(lambda stream: elements)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._iterator
+
+    def collect(self) -> List[Dict[str, Any]]:
+        """Consume the stream into a list."""
+        return list(self._iterator)
+
+
+class TraversalCursors:
+    """
+    Bounded store of paused walks addressed by opaque tokens.
+
+    Walk state is backend specific and never leaves the process; callers
+    only see the token. Old entries are evicted first.
+    """
+
+    MAX_CURSORS = 16
+
+    def __init__(self):
+        self._states: "OrderedDict[str, Any]" = OrderedDict()
+
+    def save(self, state: Any) -> str:
+        """
+        Store walk state and return its token.
+
+        Args:
+            state: Backend specific walk state
+
+        Returns:
+            Cursor token such as "cur_1a2b3c4d"
+        """
+        token = f"cur_{secrets.token_hex(4)}"
+        self._states[token] = state
+        while len(self._states) > self.MAX_CURSORS:
+            self._states.popitem(last=False)
+        return token
+
+    def take(self, token: Optional[str]) -> Optional[Any]:
+        """
+        Remove and return the walk state for a token.
+
+        Args:
+            token: Cursor token from a truncated stream
+
+        Returns:
+            Walk state, or None if unknown or evicted
+        """
+        if not token:
+            return None
+        return self._states.pop(token, None)
+
+    def clear(self) -> None:
+        """Drop all paused walks."""
+        self._states.clear()
@@ -15,6 +15,8 @@ import platform
 from ..protocol import AccessibilityProtocol
 from ..element_store import SimpleElementStore
 from ..cache_manager import AccessibilityCacheManager
+from ..containers import ContainerPage, ExpansionOptions, mark_collapsed
+from ..traversal import TraversalScope, rect_intersection
 from .role_normalizer import normalize_windows_element
 
 
@@ -26,6 +28,8 @@ class WindowsAccessibility(AccessibilityProtocol):
     semantic element IDs through the shared registry.
     """
 
+    COLLAPSIBLE_TYPES = ("List", "Tree", "Table", "DataGrid")
+
     def __init__(self, screen_width: int = 1920, screen_height: int = 1080):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -36,6 +40,7 @@ class WindowsAccessibility(AccessibilityProtocol):
         self._cache = AccessibilityCacheManager()
         self._max_depth = 25
         self._lock = threading.RLock()
+        self.expansion = ExpansionOptions()
 
         if self.available:
             self._initialize_api()
@@ -75,7 +80,7 @@ class WindowsAccessibility(AccessibilityProtocol):
         with self._lock:
             self._cache.invalidate(app_name)
             if app_name:
-                self._store.clear_app(app_name)
+                self._store.begin_generation(app_name)
             else:
                 self._store.clear_all()
 
@@ -136,11 +141,130 @@ class WindowsAccessibility(AccessibilityProtocol):
 
         elements: List[Dict[str, Any]] = []
         app_name_lower = app_name.lower()
+        if self.profiler is not None:
+            self.profiler.begin_walk()
         self._traverse(app, elements, interactive_only, 0, app_name_lower)
 
         self._cache.set_elements(cache_key, elements)
         return elements
 
+    def get_scoped_elements(
+        self,
+        app_name: str,
+        scope: TraversalScope,
+        interactive_only: bool = True,
+    ) -> List[Dict[str, Any]]:
+        return self._run_accessibility(
+            self._get_scoped_elements_impl, app_name, scope, interactive_only
+        )
+
+    def _get_scoped_elements_impl(
+        self, app_name: str, scope: TraversalScope, interactive_only: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Walk only the roots of a scope.
+
+        Region scopes walk the window if its rectangle intersects the region
+        and keep the elements intersecting it.
+        """
+        if not self.available:
+            return []
+        if scope.whole_app:
+            return self._get_elements_impl(app_name, interactive_only)
+
+        elements: List[Dict[str, Any]] = []
+        app_name_lower = app_name.lower()
+        if self.profiler is not None:
+            self.profiler.begin_walk()
+        for root in self._scope_roots(app_name, scope):
+            self._traverse(root, elements, interactive_only, 0, app_name_lower)
+        return [e for e in elements if scope.contains(e)]
+
+    def _scope_roots(self, app_name: str, scope: TraversalScope) -> List[Any]:
+        """
+        Native roots of a scope.
+
+        The app's window is its focused window. The topmost dialog is the
+        frontmost dialog window of the app's process, else the last Window
+        child of the app's window (owned modal dialogs appear there).
+        """
+        if scope.kind == "subtree":
+            _, node, error = self._store.resolve(scope.element_id)
+            return [] if error else [node]
+
+        app = self.get_app(app_name)
+        if not app:
+            return []
+        if scope.kind == "window":
+            return [app]
+        if scope.kind == "region":
+            try:
+                rect = app.rectangle()
+                frame = (rect.left, rect.top, rect.width(), rect.height())
+            except Exception:
+                return [app]
+            return [app] if rect_intersection(frame, scope.region) else []
+
+        try:
+            desktop = self.Desktop(backend="uia")
+            for window in desktop.windows(process=app.process_id()):
+                if window != app and window.is_dialog():
+                    return [window]
+        except Exception:
+            pass
+        try:
+            children = app.children(control_type="Window")
+            if children:
+                return [children[-1]]
+        except Exception:
+            pass
+        return []
+
+    def expand_container(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
+        return self._run_accessibility(
+            self._expand_container_impl, element_id, offset, limit, interactive_only
+        )
+
+    def _expand_container_impl(
+        self,
+        element_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        interactive_only: bool = True,
+    ) -> ContainerPage:
+        """Walk one page of a container's children."""
+        page = ContainerPage(element_id, offset=max(0, offset))
+        if not self.available:
+            page.error = "Accessibility is not available."
+            return page
+        container, node, error = self._store.resolve(element_id)
+        if error:
+            page.error = error
+            return page
+
+        if limit is None:
+            limit = self.expansion.page_size
+        try:
+            children = node.children()
+        except Exception as e:
+            page.error = f"Could not read the children of '{element_id}': {e}"
+            return page
+
+        app_name = str(container.get("app_name") or "").lower()
+        if self.profiler is not None:
+            self.profiler.begin_walk()
+        page.total = len(children)
+        for child in children[page.offset : page.offset + max(0, limit)]:
+            page.children_read += 1
+            self._traverse(child, page.elements, interactive_only, 1, app_name)
+        return page
+
     def _is_element_interactive(self, node: Any) -> bool:
         """
         Check if element is interactive by querying the API, NOT by control type.
@@ -172,6 +296,8 @@ class WindowsAccessibility(AccessibilityProtocol):
 
         Dynamic detection: Elements are registered based on their actual
         capabilities (is_enabled), NOT based on hardcoded control type lists.
+        Lists, trees and tables with at least expansion.min_children
+        children are registered as collapsed handles and not descended into.
 
         Args:
             node: Current pywinauto element
@@ -183,29 +309,62 @@ class WindowsAccessibility(AccessibilityProtocol):
         if depth > self._max_depth:
             return
 
+        profiler = self.profiler
+        started = profiler.enter() if profiler is not None else 0.0
+        probe = profiler.wrap(node) if profiler is not None else node
         try:
-            if not interactive_only or self._is_element_interactive(node):
-                self._register_element(node, app_name, elements)
-
             try:
-                for child in node.children():
-                    self._traverse(
-                        child, elements, interactive_only, depth + 1, app_name
-                    )
+                children = probe.children()
             except Exception:
-                pass
+                children = []
+            collapses = (
+                self.expansion.collapses(depth, len(children))
+                and self._control_type(node) in self.COLLAPSIBLE_TYPES
+            )
+
+            element = None
+            if collapses or not interactive_only or self._is_element_interactive(probe):
+                element = self._register_element(node, app_name, elements)
+            if profiler is not None:
+                profiler.visited(started, self._control_type(node))
+            if collapses and element is not None:
+                preview = children[: self.expansion.preview]
+                mark_collapsed(
+                    element, len(children), [self._preview_label(c) for c in preview]
+                )
+                return
+
+            for child in children:
+                self._traverse(child, elements, interactive_only, depth + 1, app_name)
 
         except Exception:
             pass
+        finally:
+            if profiler is not None:
+                profiler.leave(started)
+
+    def _control_type(self, node: Any) -> Optional[str]:
+        """Control type of a node (for collapsing and profile role paths)."""
+        try:
+            return str(node.element_info.control_type)
+        except Exception:
+            return None
+
+    def _preview_label(self, node: Any) -> str:
+        """Label of a collapsed container's child, for the container's preview."""
+        try:
+            return node.window_text() or ""
+        except Exception:
+            return ""
 
     def _register_element(
         self, node: Any, app_name: str, elements: List[Dict[str, Any]]
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         normalized = normalize_windows_element(
             node, app_name, self.screen_width, self.screen_height
         )
         if not normalized:
-            return
+            return None
 
         normalized["_native_ref"] = node
         element_id = self._store.store(normalized, app_name)
@@ -222,6 +381,7 @@ class WindowsAccessibility(AccessibilityProtocol):
         normalized["_app_name"] = app_name
 
         elements.append(normalized)
+        return normalized
 
     def click_by_id(
         self, element_id: str, click_type: str = "single"
@@ -234,21 +394,13 @@ class WindowsAccessibility(AccessibilityProtocol):
         if not self.available:
             return (False, "Accessibility not available")
 
-        element = self._store.get(element_id)
-
-        if not element:
-            return (
-                False,
-                f"Element '{element_id}' not found. Call get_accessible_elements() to refresh.",
-            )
+        element, node, error = self._store.resolve(element_id)
+        if error:
+            return (False, error)
 
-        node = element.get("_native_ref") or element.get("_element")
         label = element.get("label", element_id)
         app_name = element.get("app_name", "")
 
-        if not node:
-            return (False, f"Element '{element_id}' has no native reference.")
-
         try:
             self._perform_click(node, click_type)
             self._cache.on_interaction(app_name if app_name else None)
@@ -0,0 +1,94 @@
+"""Coalescing of concurrent identical requests into one in-flight call."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class FlightStats:
+    """Counters describing how much duplicate work was avoided."""
+
+    requests: int = 0
+    started: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Plain dict of the counters."""
+        return asdict(self)
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent requests for the same key.
+
+    The first request for a key starts the call; later requests made while
+    it is still running receive the same future instead of starting their
+    own. Once the future resolves the key is released, so the next request
+    starts a new call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, Tuple[Future, Any]] = {}
+        self._stats = FlightStats()
+
+    def submit(
+        self,
+        key: Hashable,
+        start: Callable[[], Future],
+        tag: Any = None,
+        can_join: Optional[Callable[[Any], bool]] = None,
+    ) -> Future:
+        """
+        Join the in-flight call for key, or start one.
+
+        Args:
+            key: Identity of the request
+            start: Starts the call and returns its future
+            tag: Stored with a started call and passed to can_join later
+            can_join: Decides from the in-flight call's tag whether this
+                request may share it (None = always)
+
+        Returns:
+            Future of the shared or newly started call
+        """
+        with self._lock:
+            self._stats.requests += 1
+            flight = self._flights.get(key)
+            if flight is not None and not flight[0].done():
+                if can_join is None or can_join(flight[1]):
+                    self._stats.coalesced += 1
+                    return flight[0]
+
+            future = start()
+            self._stats.started += 1
+            self._flights[key] = (future, tag)
+
+        future.add_done_callback(lambda done: self._release(key, done))
+        return future
+
+    def in_flight(self, key: Hashable) -> Optional[Future]:
+        """Future of the unfinished call for key, if any."""
+        with self._lock:
+            flight = self._flights.get(key)
+            return flight[0] if flight and not flight[0].done() else None
+
+    def stats(self) -> FlightStats:
+        """Copy of the request counters."""
+        with self._lock:
+            return FlightStats(**asdict(self._stats))
+
+    def reset_stats(self) -> None:
+        """Zero the request counters."""
+        with self._lock:
+            self._stats = FlightStats()
+
+    def _release(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight[0] is future:
+                del self._flights[key]
@@ -0,0 +1,203 @@
+"""Dedicated worker thread that runs callables from a priority queue."""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Optional
+
+PRIORITY_ACTION = 0
+PRIORITY_QUERY = 10
+PRIORITY_SNAPSHOT = 20
+
+
+class WorkFuture(Future):
+    """
+    Future of a queued call that can also be cancelled while running.
+
+    Future.cancel() only succeeds before a call starts. cancel() here
+    additionally flags a running call, which can poll
+    PriorityWorker.cancel_requested() and stop early.
+    """
+
+    def __init__(self, priority: int):
+        super().__init__()
+        self.priority = priority
+        self.abandoned = threading.Event()
+
+    def cancel(self) -> bool:
+        self.abandoned.set()
+        return super().cancel()
+
+
+class PriorityWorker:
+    """
+    Single thread that owns a resource and serves calls in priority order.
+
+    Lower priority values run first; calls with equal priority run in
+    submission order. Calls made from the worker thread itself run inline,
+    so queued work may call back into the same API without deadlocking.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the worker. The thread starts on first submit().
+
+        Args:
+            name: Thread name
+        """
+        self.name = name
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
+        self._current: Optional[WorkFuture] = None
+
+    def on_worker_thread(self) -> bool:
+        """True if the caller is running on this worker's thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_QUERY,
+        **kwargs: Any,
+    ) -> WorkFuture:
+        """
+        Queue a call and return its future.
+
+        Args:
+            func: Callable to run on the worker thread
+            *args: Positional arguments for func
+            priority: Queue priority (PRIORITY_ACTION runs before PRIORITY_SNAPSHOT)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future resolved with func's result or exception
+        """
+        future = WorkFuture(priority)
+        if self.on_worker_thread():
+            self._run(future, func, args, kwargs)
+            return future
+
+        self._ensure_started()
+        with self._pending_lock:
+            self._pending.add(future)
+        self._queue.put((priority, next(self._counter), future, func, args, kwargs))
+        return future
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_QUERY,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a call on the worker thread and wait for its result.
+
+        On timeout the call is cancelled (or flagged, if already running)
+        before TimeoutError is raised.
+
+        Raises:
+            TimeoutError: If no result arrived within timeout
+            CancelledError: If the call was cancelled
+        """
+        if self.on_worker_thread():
+            return func(*args, **kwargs)
+
+        future = self.submit(func, *args, priority=priority, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def cancel_requested(self) -> bool:
+        """True if the call currently running on the worker was cancelled."""
+        current = self._current
+        return current is not None and current.abandoned.is_set()
+
+    def cancel_all(self, min_priority: int = PRIORITY_ACTION) -> int:
+        """
+        Cancel queued and running calls at or below an urgency level.
+
+        Args:
+            min_priority: Only calls with priority >= this value are cancelled
+
+        Returns:
+            Number of calls cancelled
+        """
+        with self._pending_lock:
+            targets = [f for f in self._pending if f.priority >= min_priority]
+        for future in targets:
+            future.cancel()
+        return len(targets)
+
+    def _ensure_started(self) -> None:
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name=self.name, daemon=True
+                )
+                self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            _, _, future, func, args, kwargs = self._queue.get()
+            self._run(future, func, args, kwargs)
+            with self._pending_lock:
+                self._pending.discard(future)
+
+    def _run(
+        self,
+        future: WorkFuture,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        previous, self._current = self._current, future
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            if future.abandoned.is_set():
+                future.set_exception(CancelledError())
+            else:
+                future.set_result(result)
+        finally:
+            self._current = previous
+
+
+_accessibility_worker: Optional[PriorityWorker] = None
+_accessibility_lock = threading.Lock()
+
+
+def get_accessibility_worker() -> PriorityWorker:
+    """
+    Shared worker for accessibility APIs that are not thread-safe.
+
+    Every backend instance uses the same thread, so native calls are
+    never issued from two threads at once.
+    """
+    global _accessibility_worker
+    with _accessibility_lock:
+        if _accessibility_worker is None:
+            _accessibility_worker = PriorityWorker("accessibility")
+        return _accessibility_worker
+
+
+def cancel_accessibility_work() -> int:
+    """Cancel queued and running accessibility snapshots."""
+    if _accessibility_worker is None:
+        return 0
+    return _accessibility_worker.cancel_all(PRIORITY_SNAPSHOT)
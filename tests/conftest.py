@@ -5,6 +5,7 @@ This module provides real tool registry setup for testing against actual applica
 NO MOCKING - all tests interact with REAL apps and REAL UI elements.
 """
 
+import os
 import sys
 import time
 import subprocess
@@ -18,6 +19,7 @@ def pytest_configure(config):
     """Configure pytest."""
     src_path = Path(__file__).parent.parent / "src"
     sys.path.insert(0, str(src_path))
+    os.environ.setdefault("PILOT_SKELETON_CACHE", "off")
 
     config.addinivalue_line("markers", "real: mark test as using real apps")
     config.addinivalue_line("markers", "workflow: mark test as workflow test")
@@ -0,0 +1,636 @@
+"""
+In-memory stand-in for the pyatspi module.
+
+Provides just enough of the pyatspi surface used by LinuxAccessibility to
+exercise traversal and caching logic without a desktop session. Every
+method that would be a D-Bus round trip against a real AT-SPI registry is
+counted in FakeAtspi.calls, so tests can assert how much IPC a code path
+performs.
+"""
+
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+STATE_ENABLED = "enabled"
+STATE_FOCUSED = "focused"
+STATE_ACTIVE = "active"
+STATE_SHOWING = "showing"
+STATE_VISIBLE = "visible"
+DESKTOP_COORDS = 0
+
+SCREEN_SIZE = (1920, 1080)
+CONTAINER_ROLES = ("panel", "filler", "scroll pane", "page tab", "tool bar")
+INTERACTIVE_ROLES = (
+    ("push button", ["click"]),
+    ("check box", ["click"]),
+    ("menu item", ["click"]),
+    ("link", ["jump"]),
+    ("text", []),
+    ("combo box", ["press"]),
+)
+LABEL_WORDS = (
+    "Save Open Close File Edit View Insert Format Tools Help New Delete Copy "
+    "Paste Cut Undo Redo Find Replace Print Export Import Settings Account "
+    "Search Filter Sort Refresh Share Send Reply Forward Archive Move Rename "
+    "Download Upload Preview Zoom Back Next Previous Cancel Apply Confirm"
+).split()
+
+
+class FakeExtents:
+    """Extents returned by Component.getExtents()."""
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+class FakeStateSet:
+    """State set returned by Accessible.getState()."""
+
+    def __init__(self, states: set):
+        self._states = set(states)
+
+    def contains(self, state: str) -> bool:
+        return state in self._states
+
+
+class FakeComponent:
+    """Component interface of a node."""
+
+    def __init__(self, node: "FakeNode"):
+        self._node = node
+
+    def getExtents(self, coord_type: int) -> FakeExtents:
+        self._node.atspi.calls["getExtents"] += 1
+        return FakeExtents(*self._node.extents)
+
+
+class FakeAction:
+    """Action interface of a node."""
+
+    def __init__(self, node: "FakeNode"):
+        self._node = node
+
+    @property
+    def nActions(self) -> int:
+        self._node.atspi.calls["nActions"] += 1
+        return len(self._node.actions)
+
+    def getName(self, index: int) -> str:
+        self._node.atspi.calls["getActionName"] += 1
+        return self._node.actions[index]
+
+    def doAction(self, index: int) -> bool:
+        self._node.atspi.calls["doAction"] += 1
+        self._node.performed.append(self._node.actions[index])
+        return True
+
+
+class FakeTable:
+    """Table interface of a node whose children are rows of cells."""
+
+    def __init__(self, node: "FakeNode"):
+        self._node = node
+
+    @property
+    def nRows(self) -> int:
+        self._node.atspi.calls["nRows"] += 1
+        return len(self._node.children)
+
+    @property
+    def nColumns(self) -> int:
+        self._node.atspi.calls["nColumns"] += 1
+        return len(self._node.columns)
+
+    @property
+    def caption(self) -> Optional["FakeNode"]:
+        self._node.atspi.calls["caption"] += 1
+        return None
+
+    def getColumnHeader(self, column: int) -> "FakeNode":
+        self._node.atspi.calls["getColumnHeader"] += 1
+        return FakeNode(self._node.atspi, "column header", self._node.columns[column])
+
+    def getAccessibleAt(self, row: int, column: int) -> "FakeNode":
+        self._node.atspi.calls["getAccessibleAt"] += 1
+        return self._node.children[row].children[column]
+
+    def addRowSelection(self, row: int) -> bool:
+        self._node.atspi.calls["addRowSelection"] += 1
+        self._node.selected_rows.add(row)
+        return True
+
+
+class FakeText:
+    """Text interface returning ranges of a node's text."""
+
+    def __init__(self, node: "FakeNode"):
+        self._node = node
+
+    @property
+    def characterCount(self) -> int:
+        self._node.atspi.calls["characterCount"] += 1
+        return len(self._node.text)
+
+    def getText(self, start: int, end: int) -> str:
+        self._node.atspi.calls["getText"] += 1
+        return self._node.text[start:end]
+
+
+class FakeStateSetFactory(FakeStateSet):
+    """pyatspi.StateSet constructor taking states as arguments."""
+
+    def __init__(self, *states: str):
+        super().__init__(set(states))
+
+
+class FakeMatchRule:
+    """Match rule built by Collection.createMatchRule()."""
+
+    def __init__(self, states: FakeStateSet, interfaces: List[str]):
+        self.states = states._states
+        self.interfaces = [i.lower() for i in interfaces]
+
+    def matches(self, node: "FakeNode") -> bool:
+        if not self.states.issubset(node.states):
+            return False
+        if "action" in self.interfaces and not node.actions:
+            return False
+        return True
+
+
+class FakeCollection:
+    """Collection interface evaluating match rules on the server side."""
+
+    MATCH_ALL = 1
+    MATCH_ANY = 2
+    SORT_ORDER_CANONICAL = 1
+
+    def __init__(self, node: "FakeNode"):
+        self._node = node
+
+    def createMatchRule(
+        self,
+        states: FakeStateSet,
+        state_match: int,
+        attributes: dict,
+        attribute_match: int,
+        roles: list,
+        role_match: int,
+        interfaces: List[str],
+        interface_match: int,
+        invert: bool,
+    ) -> FakeMatchRule:
+        return FakeMatchRule(states, interfaces)
+
+    def getMatches(
+        self, rule: FakeMatchRule, sort_by: int, count: int, traverse: bool
+    ) -> List["FakeNode"]:
+        self._node.atspi.calls["getMatches"] += 1
+        matches = []
+        stack = list(reversed(self._node.children))
+        while stack:
+            node = stack.pop()
+            if rule.matches(node):
+                matches.append(node)
+            stack.extend(reversed(node.children))
+        return matches
+
+
+class FakeNode:
+    """Accessible node with role, name, extents, states and children."""
+
+    def __init__(
+        self,
+        atspi: "FakeAtspi",
+        role: str,
+        name: str = "",
+        extents: Tuple[int, int, int, int] = (0, 0, 0, 0),
+        states: Optional[set] = None,
+        actions: Optional[List[str]] = None,
+    ):
+        self.atspi = atspi
+        self.role = role
+        self._name = name
+        self.description = ""
+        self.extents = extents
+        self.states = set(
+            states
+            if states is not None
+            else {STATE_ENABLED, STATE_SHOWING, STATE_VISIBLE}
+        )
+        self.actions = list(actions or [])
+        self.children: List["FakeNode"] = []
+        self._parent: Optional["FakeNode"] = None
+        self.performed: List[str] = []
+        self.columns: Optional[List[str]] = None
+        self.text: Optional[str] = None
+        self.pid: Optional[int] = None
+        self.selected_rows: set = set()
+
+    @property
+    def name(self) -> str:
+        self.atspi.calls["name"] += 1
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+
+    @property
+    def parent(self) -> Optional["FakeNode"]:
+        self.atspi.calls["parent"] += 1
+        return self._parent
+
+    def getParent(self) -> Optional["FakeNode"]:
+        return self.parent
+
+    @property
+    def childCount(self) -> int:
+        self.atspi.calls["childCount"] += 1
+        return len(self.children)
+
+    def getChildAtIndex(self, index: int) -> "FakeNode":
+        self.atspi.calls["getChildAtIndex"] += 1
+        return self.children[index]
+
+    def getIndexInParent(self) -> int:
+        self.atspi.calls["getIndexInParent"] += 1
+        if self._parent is None:
+            return -1
+        return self._parent.children.index(self)
+
+    def get_process_id(self) -> int:
+        self.atspi.calls["get_process_id"] += 1
+        return self.pid if self.pid is not None else -1
+
+    def getRoleName(self) -> str:
+        self.atspi.calls["getRoleName"] += 1
+        return self.role
+
+    def getLocalizedRoleName(self) -> str:
+        self.atspi.calls["getLocalizedRoleName"] += 1
+        return self.role
+
+    def getState(self) -> FakeStateSet:
+        self.atspi.calls["getState"] += 1
+        return FakeStateSet(self.states)
+
+    def queryComponent(self) -> FakeComponent:
+        self.atspi.calls["queryComponent"] += 1
+        return FakeComponent(self)
+
+    def queryCollection(self) -> FakeCollection:
+        self.atspi.calls["queryCollection"] += 1
+        if not self.atspi.supports_collection:
+            raise NotImplementedError("Collection interface not implemented")
+        return FakeCollection(self)
+
+    def queryTable(self) -> FakeTable:
+        self.atspi.calls["queryTable"] += 1
+        if self.columns is None:
+            raise NotImplementedError("Table interface not implemented")
+        return FakeTable(self)
+
+    def queryText(self) -> FakeText:
+        self.atspi.calls["queryText"] += 1
+        if self.text is None:
+            raise NotImplementedError("Text interface not implemented")
+        return FakeText(self)
+
+    def queryAction(self) -> FakeAction:
+        self.atspi.calls["queryAction"] += 1
+        if not self.actions:
+            raise NotImplementedError("Action interface not implemented")
+        return FakeAction(self)
+
+    def add(self, child: "FakeNode") -> "FakeNode":
+        """Append a child without emitting events."""
+        child._parent = self
+        self.children.append(child)
+        return child
+
+    def __iter__(self):
+        return iter(self.children)
+
+
+class FakeEvent:
+    """Event delivered to registered listeners."""
+
+    def __init__(
+        self,
+        event_type: str,
+        source: FakeNode,
+        detail1: int = 1,
+        any_data: Optional[FakeNode] = None,
+    ):
+        self.type = event_type
+        self.source = source
+        self.detail1 = detail1
+        self.any_data = any_data
+
+
+class FakeRegistry:
+    """Registry holding the desktop and event listeners."""
+
+    def __init__(self, atspi: "FakeAtspi"):
+        self._atspi = atspi
+        self.listeners: Dict[str, List[Callable[[Any], None]]] = {}
+
+    def getDesktop(self, index: int) -> FakeNode:
+        return self._atspi.desktop
+
+    def registerEventListener(self, callback: Callable, event_type: str) -> None:
+        self.listeners.setdefault(event_type, []).append(callback)
+
+    def deregisterEventListener(self, callback: Callable, event_type: str) -> None:
+        callbacks = self.listeners.get(event_type, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+
+class FakeAtspi:
+    """
+    Module-like object exposing pyatspi constants, Registry and a desktop.
+
+    Events are delivered synchronously, which is what pump() would
+    observe after the GLib main context drained its queue.
+    """
+
+    STATE_ENABLED = STATE_ENABLED
+    STATE_FOCUSED = STATE_FOCUSED
+    STATE_ACTIVE = STATE_ACTIVE
+    STATE_SHOWING = STATE_SHOWING
+    STATE_VISIBLE = STATE_VISIBLE
+    DESKTOP_COORDS = DESKTOP_COORDS
+    Collection = FakeCollection
+    StateSet = FakeStateSetFactory
+
+    def __init__(self, supports_collection: bool = True):
+        self.supports_collection = supports_collection
+        self.calls: Counter = Counter()
+        self.desktop = FakeNode(self, "desktop frame", "main")
+        self.Registry = FakeRegistry(self)
+
+    def node(self, role: str, name: str = "", **kwargs: Any) -> FakeNode:
+        """Create a detached node."""
+        return FakeNode(self, role, name, **kwargs)
+
+    def reset_calls(self) -> None:
+        """Reset round-trip counters."""
+        self.calls.clear()
+
+    @property
+    def round_trips(self) -> int:
+        """Total number of counted round trips."""
+        return sum(self.calls.values())
+
+    def emit(
+        self,
+        event_type: str,
+        source: FakeNode,
+        detail1: int = 1,
+        any_data: Optional[FakeNode] = None,
+    ) -> None:
+        """Deliver an event to listeners registered for a matching prefix."""
+        event = FakeEvent(event_type, source, detail1, any_data)
+        for prefix, callbacks in list(self.Registry.listeners.items()):
+            if event_type.startswith(prefix):
+                for callback in list(callbacks):
+                    callback(event)
+
+    def add_child(self, parent: FakeNode, child: FakeNode) -> FakeNode:
+        """Append a child and emit children-changed on the parent."""
+        parent.add(child)
+        self.emit("object:children-changed:add", parent, any_data=child)
+        return child
+
+    def remove_child(self, parent: FakeNode, child: FakeNode) -> None:
+        """Remove a child and emit children-changed on the parent."""
+        parent.children.remove(child)
+        child._parent = None
+        self.emit("object:children-changed:remove", parent, any_data=child)
+
+    def set_text(self, node: FakeNode, text: str) -> None:
+        """Replace a node's text and emit text-changed on it."""
+        node.text = text
+        self.emit("object:text-changed:insert", node)
+
+    def rename(self, node: FakeNode, name: str) -> None:
+        """Change a node's name and emit property-change on it."""
+        node.name = name
+        self.emit("object:property-change:accessible-name", node)
+
+
+def build_app(
+    atspi: FakeAtspi,
+    name: str = "Editor",
+    buttons: int = 10,
+    panels: int = 2,
+    labels: int = 0,
+) -> Tuple[FakeNode, FakeNode, List[FakeNode]]:
+    """
+    Build an application with one frame, panels and clickable buttons.
+
+    Args:
+        atspi: Fake module the nodes belong to
+        name: Application name
+        buttons: Buttons per panel
+        panels: Number of panels in the frame
+        labels: Static (non-interactive) labels per panel
+
+    Returns:
+        Tuple of (app, frame, panels)
+    """
+    app = atspi.desktop.add(atspi.node("application", name))
+    width = max(1200, buttons * 40, labels * 40)
+    height = max(800, panels * 300)
+    frame = app.add(
+        atspi.node("frame", f"{name} Window", extents=(0, 0, width, height))
+    )
+    panel_nodes = []
+    for p in range(panels):
+        panel = frame.add(
+            atspi.node("panel", f"Panel {p}", extents=(0, p * 300, 1200, 300))
+        )
+        panel_nodes.append(panel)
+        for b in range(buttons):
+            panel.add(
+                atspi.node(
+                    "push button",
+                    f"Button {p}-{b}",
+                    extents=(b * 40, p * 300 + 10, 30, 20),
+                    actions=["click"],
+                )
+            )
+        for i in range(labels):
+            panel.add(
+                atspi.node(
+                    "label",
+                    f"Label {p}-{i}",
+                    extents=(i * 40, p * 300 + 40, 30, 20),
+                    states={STATE_SHOWING, STATE_VISIBLE},
+                )
+            )
+    return app, frame, panel_nodes
+
+
+@dataclass
+class SyntheticTreeSpec:
+    """
+    Shape of a generated application tree.
+
+    Attributes:
+        nodes: Nodes below the application (frame included); fewer are
+            built if depth and fan_out cannot hold them
+        depth: Maximum depth below the frame
+        fan_out: Maximum children per container
+        static_ratio: Fraction of leaves that are static labels
+        unlabeled_ratio: Fraction of leaves without a name
+        vocabulary: Distinct words labels are drawn from; words are picked
+            with Zipf weights, so a few labels repeat often
+        tables: Table regions placed directly under the frame
+        table_rows: Rows per table
+        table_columns: Cells per row
+        seed: Random seed (the same spec always builds the same tree)
+    """
+
+    nodes: int = 1000
+    depth: int = 6
+    fan_out: int = 8
+    static_ratio: float = 0.3
+    unlabeled_ratio: float = 0.1
+    vocabulary: int = len(LABEL_WORDS)
+    tables: int = 0
+    table_rows: int = 50
+    table_columns: int = 4
+    seed: int = 0
+
+
+class _SyntheticBuilder:
+    """Builds a SyntheticTreeSpec into FakeNodes."""
+
+    def __init__(self, atspi: FakeAtspi, spec: SyntheticTreeSpec):
+        self.atspi = atspi
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.words = LABEL_WORDS[: max(1, min(spec.vocabulary, len(LABEL_WORDS)))]
+        self.weights = [1.0 / (rank + 1) for rank in range(len(self.words))]
+        self.built = 0
+
+    def extents(self, width: int = 30, height: int = 20) -> Tuple[int, int, int, int]:
+        """Lay nodes out on a grid over the screen, so none is offscreen."""
+        columns = SCREEN_SIZE[0] // 40
+        rows = SCREEN_SIZE[1] // 25
+        n = self.built
+        x = (n % columns) * 40
+        y = (n // columns) % rows * 25
+        return (x, y, min(width, SCREEN_SIZE[0] - x), min(height, SCREEN_SIZE[1] - y))
+
+    def node(self, parent: FakeNode, role: str, name: str, **kwargs: Any) -> FakeNode:
+        self.built += 1
+        kwargs.setdefault("extents", self.extents())
+        return parent.add(self.atspi.node(role, name, **kwargs))
+
+    def label(self) -> str:
+        if self.rng.random() < self.spec.unlabeled_ratio:
+            return ""
+        count = self.rng.randint(1, 3)
+        return " ".join(self.rng.choices(self.words, self.weights, k=count))
+
+    def leaf(self, parent: FakeNode) -> None:
+        if self.rng.random() < self.spec.static_ratio:
+            states = {STATE_SHOWING, STATE_VISIBLE}
+            self.node(parent, "label", self.label(), states=states)
+            return
+        role, actions = self.rng.choice(INTERACTIVE_ROLES)
+        self.node(parent, role, self.label(), actions=actions)
+
+    def container(self, parent: FakeNode, depth: int, budget: int) -> None:
+        """Add a subtree of up to budget nodes below parent."""
+        if budget <= 0:
+            return
+        if depth >= self.spec.depth or budget == 1:
+            self.leaf(parent)
+            return
+        role = self.rng.choice(CONTAINER_ROLES)
+        node = self.node(parent, role, "", extents=self.extents(400, 300))
+        self.children(node, depth + 1, budget - 1)
+
+    def children(self, parent: FakeNode, depth: int, budget: int) -> None:
+        """Split a node budget over up to fan_out children."""
+        count = min(self.spec.fan_out, budget)
+        for i in range(count):
+            share = budget // (count - i)
+            self.container(parent, depth, share)
+            budget -= share
+
+    def table(self, parent: FakeNode, index: int) -> None:
+        spec = self.spec
+        pane = self.node(parent, "scroll pane", "", extents=self.extents(800, 600))
+        table = self.node(pane, "table", f"Table {index}", extents=pane.extents)
+        for r in range(spec.table_rows):
+            row = self.node(table, "table row", "", extents=self.extents(800, 20))
+            for c in range(spec.table_columns):
+                self.node(row, "table cell", f"R{r}C{c} {self.label()}".rstrip())
+
+
+def build_synthetic_app(
+    atspi: FakeAtspi, name: str = "Synthetic", spec: Optional[SyntheticTreeSpec] = None
+) -> Tuple[FakeNode, FakeNode]:
+    """
+    Build a generated application for benchmarks and large-tree tests.
+
+    Table regions are built first; the remaining node budget is split
+    evenly over nested containers, so leaves sit near the maximum depth.
+    All nodes are showing, visible and on screen.
+
+    Args:
+        atspi: Fake module the nodes belong to
+        name: Application name
+        spec: Tree shape (default: SyntheticTreeSpec())
+
+    Returns:
+        Tuple of (app, frame)
+    """
+    spec = spec or SyntheticTreeSpec()
+    builder = _SyntheticBuilder(atspi, spec)
+    app = atspi.desktop.add(atspi.node("application", name))
+    frame = builder.node(app, "frame", f"{name} Window", extents=(0, 0, *SCREEN_SIZE))
+    for t in range(spec.tables):
+        builder.table(frame, t)
+    builder.children(frame, 1, spec.nodes - builder.built)
+    return app, frame
+
+
+def make_linux_accessibility(atspi: FakeAtspi, track_changes: bool = True):
+    """
+    Create a LinuxAccessibility bound to a fake pyatspi module.
+
+    Args:
+        atspi: Fake module to use instead of pyatspi
+        track_changes: Subscribe the subtree cache to fake events
+
+    Returns:
+        LinuxAccessibility instance
+    """
+    from pilot.tools.accessibility.linux.accessibility import LinuxAccessibility
+    from pilot.tools.accessibility.linux.collection import CollectionQuery
+    from pilot.tools.accessibility.linux.event_listener import AtspiEventListener
+
+    acc = LinuxAccessibility(screen_width=1920, screen_height=1080)
+    acc.pyatspi = atspi
+    acc.desktop = atspi.Registry.getDesktop(0)
+    acc.available = True
+    acc._collection = CollectionQuery(atspi)
+
+    if track_changes:
+        listener = AtspiEventListener(atspi)
+        listener.active = True
+        acc._attach_listener(listener)
+        acc._events = listener
+    return acc
@@ -0,0 +1,142 @@
+"""
+Tests for the dedicated accessibility thread and its priority queue.
+"""
+
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.utils.threading.worker import (
+    PRIORITY_ACTION,
+    PRIORITY_SNAPSHOT,
+    PriorityWorker,
+    cancel_accessibility_work,
+)
+
+
+class TestPriorityWorker:
+    """Calls run on one thread, most urgent first, and can be cancelled."""
+
+    def test_actions_run_before_queued_snapshots(self):
+        worker = PriorityWorker("test-worker")
+        gate = threading.Event()
+        order = []
+
+        blocker = worker.submit(gate.wait, priority=PRIORITY_SNAPSHOT)
+        snapshots = [
+            worker.submit(order.append, f"snapshot{i}", priority=PRIORITY_SNAPSHOT)
+            for i in range(3)
+        ]
+        click = worker.submit(order.append, "click", priority=PRIORITY_ACTION)
+        gate.set()
+
+        for future in [blocker, click, *snapshots]:
+            future.result(timeout=2)
+        assert order == ["click", "snapshot0", "snapshot1", "snapshot2"]
+
+    def test_timeout_cancels_queued_call(self):
+        worker = PriorityWorker("test-worker")
+        gate = threading.Event()
+        ran = []
+        worker.submit(gate.wait)
+
+        with pytest.raises(TimeoutError):
+            worker.call(ran.append, 1, timeout=0.05)
+        gate.set()
+        worker.call(lambda: None, timeout=2)
+
+        assert ran == []
+
+    def test_running_call_observes_cancellation(self):
+        worker = PriorityWorker("test-worker")
+        started = threading.Event()
+
+        def long_walk():
+            started.set()
+            while not worker.cancel_requested():
+                threading.Event().wait(0.001)
+            return "partial"
+
+        future = worker.submit(long_walk, priority=PRIORITY_SNAPSHOT)
+        started.wait(2)
+        assert worker.cancel_all(PRIORITY_SNAPSHOT) == 1
+
+        with pytest.raises(CancelledError):
+            future.result(timeout=2)
+
+    def test_nested_calls_run_inline(self):
+        worker = PriorityWorker("test-worker")
+
+        def outer():
+            return worker.call(threading.current_thread)
+
+        assert worker.call(outer, timeout=2).name == "test-worker"
+
+
+class TestLinuxAccessibilityThread:
+    """LinuxAccessibility issues AT-SPI calls from the worker thread only."""
+
+    def test_walk_runs_on_worker_thread(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=3)
+        acc = make_linux_accessibility(atspi)
+        threads = set()
+        visit = acc._walker.visit_node
+
+        def tracking_visit(*args):
+            threads.add(threading.current_thread().name)
+            return visit(*args)
+
+        acc._walker.visit_node = tracking_visit
+        elements = acc.submit_elements("Editor").result(timeout=2)
+
+        assert elements
+        assert threads == {"accessibility"}
+
+    def test_parent_click_runs_on_worker_thread(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, frame, _ = build_app(atspi, buttons=1)
+        label = frame.add(atspi.node("label", "Caption"))
+        acc = make_linux_accessibility(atspi)
+        threads = set()
+        perform = acc._clicks.perform
+
+        def tracking_click(*args):
+            threads.add(threading.current_thread().name)
+            return perform(*args)
+
+        acc._clicks.perform = tracking_click
+        frame.actions = ["click"]
+
+        assert acc.try_click_element_or_parent({"_native_ref": label}) == (
+            True,
+            "parent_1",
+        )
+        assert threads == {"accessibility"}
+        assert frame.performed == ["click"]
+
+    def test_cancelled_walk_is_not_cached(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=20, panels=3)
+        acc = make_linux_accessibility(atspi)
+        started, release = threading.Event(), threading.Event()
+        visit = acc._walker.visit_node
+
+        def slow_visit(*args):
+            started.set()
+            release.wait(2)
+            return visit(*args)
+
+        acc._walker.visit_node = slow_visit
+        future = acc.submit_elements("Editor")
+        started.wait(2)
+        cancel_accessibility_work()
+        release.set()
+
+        with pytest.raises(CancelledError):
+            future.result(timeout=2)
+        acc._walker.visit_node = visit
+        assert len(acc.get_elements("Editor")) == 1 + 3 + 3 * 20
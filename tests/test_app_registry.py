@@ -0,0 +1,148 @@
+"""
+Tests for the indexed application registry.
+"""
+
+import os
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.tools.accessibility.app_registry import (
+    AppEntry,
+    AppRegistry,
+    ProcessIndex,
+    normalize_app_name,
+)
+
+
+def _registry():
+    registry = AppRegistry()
+    registry.sync(
+        [
+            AppEntry("term", "Terminal", pid=10, executable="gnome-terminal-server"),
+            AppEntry("chrome", "Google Chrome", pid=11, executable="chrome"),
+            AppEntry("calc", "Calculator", pid=12),
+            AppEntry("text", "Text Editor", pid=13),
+            AppEntry("edit", "Editor", pid=14),
+        ]
+    )
+    return registry
+
+
+def _names(entries):
+    return [entry.name for entry in entries]
+
+
+class TestAppRegistry:
+    """Ranked, deterministic matching over the indexes."""
+
+    def test_normalize(self):
+        assert normalize_app_name(" Gnome-Terminal.exe ") == "gnome terminal"
+        assert normalize_app_name("org.gnome.Nautilus") == "org gnome nautilus"
+
+    def test_ranking(self):
+        registry = _registry()
+
+        assert registry.best("editor").name == "Editor"
+        assert registry.best("CHROME").name == "Google Chrome"
+        assert registry.best("gnome terminal server").name == "Terminal"
+        assert registry.best("calc").name == "Calculator"
+        assert _names(registry.match("edit")) == ["Editor", "Text Editor"]
+        assert _names(registry.match("ditor")) == ["Editor", "Text Editor"]
+        assert registry.best("calculator app").name == "Calculator"
+        assert registry.best("spreadsheet") is None
+
+    def test_ties_keep_registration_order(self):
+        registry = AppRegistry(aliases={})
+        registry.add(AppEntry(2, "Notes B"))
+        registry.add(AppEntry(1, "Notes A"))
+
+        assert _names(registry.match("notes")) == ["Notes B", "Notes A"]
+
+    def test_repeated_lookups_are_memoized(self):
+        registry = _registry()
+        registry.best("edit")
+
+        registry.best("Edit")
+        hits = registry.hits
+        registry.add(AppEntry("ed", "Ed", pid=15))
+
+        assert hits == 1
+        assert registry.best("ed").name == "Ed"
+        assert registry.misses == 2
+
+    def test_sync_applies_diff(self):
+        registry = _registry()
+        registry.best("calc")
+
+        unchanged = registry.sync([registry.get(k) for k in registry._entries])
+        registry.best("calc")
+        changed = registry.sync([AppEntry("calc", "Calculator", pid=12)])
+
+        assert unchanged == (0, 0) and registry.hits == 1
+        assert changed == (0, 4) and registry.names() == ["Calculator"]
+
+    def test_remove_pid(self):
+        registry = _registry()
+
+        registry.remove_pid(11)
+
+        assert registry.best("chrome") is None
+        assert registry.by_pid(11) == []
+
+    def test_process_index_diffs_pids(self):
+        index = ProcessIndex()
+
+        started, _ = index.refresh()
+        again, exited = index.refresh()
+
+        assert os.getpid() in started
+        assert os.getpid() not in again and os.getpid() not in exited
+        assert index.name(os.getpid())
+
+
+class TestLinuxAppLookups:
+    """Lookups use the registry and follow desktop add/remove events."""
+
+    def test_repeated_lookup_costs_no_ipc(self):
+        atspi = FakeAtspi()
+        app, _, _ = build_app(atspi, "Editor")
+        build_app(atspi, "Text Editor")
+        acc = make_linux_accessibility(atspi)
+
+        assert acc.get_app("editor") is app
+        atspi.reset_calls()
+        assert acc.is_app_running("Editor")
+
+        assert atspi.round_trips == 0
+
+    def test_follows_desktop_events(self):
+        atspi = FakeAtspi()
+        build_app(atspi, "Editor")
+        acc = make_linux_accessibility(atspi)
+        acc.get_app("editor")
+
+        atspi.reset_calls()
+        calculator = atspi.add_child(
+            atspi.desktop, atspi.node("application", "Calculator")
+        )
+        found = acc.get_app("calc")
+        added_calls = atspi.calls["name"]
+        atspi.remove_child(atspi.desktop, calculator)
+
+        assert found is calculator
+        assert added_calls == 1
+        assert not acc.is_app_running("calc")
+        assert acc.get_running_apps() == ["Editor"]
+
+    def test_rescans_without_events(self):
+        atspi = FakeAtspi()
+        build_app(atspi, "Editor")
+        acc = make_linux_accessibility(atspi, track_changes=False)
+        assert not acc.is_app_running("Calculator")
+
+        atspi.desktop.add(atspi.node("application", "Calculator"))
+        cached = acc.is_app_running("Calculator")
+        acc.APP_REFRESH_SECONDS = 0
+
+        assert not cached
+        assert acc.is_app_running("Calculator")
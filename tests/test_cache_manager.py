@@ -0,0 +1,137 @@
+"""
+Tests for the bounded, per-app accessibility cache manager.
+"""
+
+import time
+
+from pilot.tools.accessibility.cache_manager import (
+    AccessibilityCacheManager,
+    format_cache_stats,
+)
+
+
+def _elements(count):
+    return [{"element_id": f"e_{i}"} for i in range(count)]
+
+
+class TestPerAppGrouping:
+    """Invalidating one app leaves apps with similar names alone."""
+
+    def test_prefix_app_is_not_wiped(self):
+        cache = AccessibilityCacheManager()
+        cache.set_elements("note:True", _elements(1))
+        cache.set_elements("notepad:True", _elements(2))
+
+        cache.on_interaction("note")
+
+        assert cache.get_elements("note:True") is None
+        assert len(cache.get_elements("notepad:True")[1]) == 2
+
+    def test_all_modes_of_an_app_are_dropped(self):
+        cache = AccessibilityCacheManager()
+        cache.set_elements("notes:True", _elements(1))
+        cache.set_elements("notes:False", _elements(1))
+
+        cache.on_interaction("Notes")
+
+        assert cache.stats().entries == 0
+
+
+class TestPerAppTTL:
+    """An interaction shortens the TTL only for the app interacted with."""
+
+    def test_interaction_shortens_only_that_app(self):
+        cache = AccessibilityCacheManager()
+        cache.on_interaction("calculator")
+
+        assert cache.ttl_for("calculator") == cache.POST_INTERACTION_TTL
+        assert cache.ttl_for("notes") == cache.DEFAULT_TTL
+
+    def test_expired_entry_is_a_miss(self):
+        cache = AccessibilityCacheManager()
+        cache.set_elements("notes:True", _elements(1))
+        cache._element_cache["notes:True"].timestamp -= cache.DEFAULT_TTL + 1
+
+        assert cache.get_elements("notes:True") is None
+        assert cache.stats().expirations == 1
+
+    def test_post_interaction_snapshot_expires_sooner(self):
+        cache = AccessibilityCacheManager()
+        cache.on_interaction("notes")
+        cache.set_elements("notes:True", _elements(1))
+        cache.set_elements("mail:True", _elements(1))
+        for entry in cache._element_cache.values():
+            entry.timestamp -= cache.POST_INTERACTION_TTL + 1
+        cache._interactions["notes"] -= cache.POST_INTERACTION_TTL + 1
+
+        assert cache.get_elements("notes:True") is None
+        assert cache.get_elements("mail:True") is not None
+
+
+class TestBounds:
+    """Least recently used entries are evicted past the limits."""
+
+    def test_entry_limit_evicts_least_recently_used(self):
+        cache = AccessibilityCacheManager(max_entries=2)
+        cache.set_elements("a:True", _elements(1))
+        cache.set_elements("b:True", _elements(1))
+        cache.get_elements("a:True")
+        cache.set_elements("c:True", _elements(1))
+
+        assert cache.get_elements("b:True") is None
+        assert cache.get_elements("a:True") is not None
+        assert cache.stats().evictions == 1
+
+    def test_byte_limit(self):
+        cache = AccessibilityCacheManager(
+            max_bytes=AccessibilityCacheManager.ELEMENT_BYTES * 150
+        )
+        cache.set_elements("a:True", _elements(100))
+        cache.set_elements("b:True", _elements(100))
+
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.estimated_bytes <= cache.max_bytes
+
+    def test_app_references_are_bounded(self):
+        cache = AccessibilityCacheManager(max_apps=2)
+        for name in ("a", "b", "c"):
+            cache.set_app(name, object())
+
+        assert cache.get_app("a") is None
+        assert cache.get_app("c") is not None
+
+
+class TestStats:
+    """Hit, miss and age counters are readable."""
+
+    def test_counters(self):
+        cache = AccessibilityCacheManager()
+        cache.get_elements("notes:True")
+        cache.set_elements("notes:True", _elements(3))
+        time.sleep(0.01)
+        cache.get_elements("notes:True")
+
+        stats = cache.stats().to_dict()
+
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+        assert stats["mean_hit_age"] > 0
+        assert stats["per_app"]["notes"] == {"hits": 1, "misses": 1}
+
+        cache.reset_stats()
+        assert cache.stats().hits == 0
+
+    def test_format_for_dashboard(self):
+        cache = AccessibilityCacheManager()
+        cache.get_elements("notes:True")
+        cache.set_elements("notes:True", _elements(3))
+        cache.get_elements("notes:True")
+        stats = cache.stats().to_dict()
+        stats["traversals"] = {"requests": 3, "started": 1, "coalesced": 2, "walks": 1}
+
+        lines = format_cache_stats(stats)
+
+        assert lines[0].startswith("Element cache: 1 hits / 1 misses (50%)")
+        assert lines[-1] == "Walks: 1 for 3 requests (2 coalesced)"
+        assert format_cache_stats({}) == []
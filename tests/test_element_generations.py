@@ -0,0 +1,169 @@
+"""
+Tests for scan generations shared by SimpleElementStore and the registry.
+
+A new scan makes an app's elements stale in O(1); elements seen again
+become current with the same IDs, and the rest explain that they are
+stale instead of "not found" until amortized pruning drops them.
+"""
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.tools.accessibility.element_registry import VersionedElementRegistry
+from pilot.tools.accessibility.element_store import (
+    NOT_FOUND,
+    STALE,
+    VALID,
+    SimpleElementStore,
+)
+
+
+def _button(i, label=None, app="Editor"):
+    return {
+        "role": "Button",
+        "label": label if label is not None else f"Button {i}",
+        "identifier": "",
+        "app_name": app,
+        "center": [i * 40 + 15, 20],
+        "_native_ref": object(),
+    }
+
+
+class _CountingDict(dict):
+    """Dict counting reads, to show how many entries an operation touches."""
+
+    reads = 0
+
+    def get(self, key, default=None):
+        self.reads += 1
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def _scan(store, elements, app="Editor"):
+    store.begin_generation(app)
+    return [store.store(element, app) for element in elements]
+
+
+class TestStoreGenerations:
+    """begin_generation() ages elements without touching them."""
+
+    def test_unseen_elements_become_stale(self):
+        store = SimpleElementStore()
+        ids = _scan(store, [_button(i) for i in range(3)])
+
+        _scan(store, [_button(0), _button(2)])
+
+        assert [store.status(eid) for eid in ids] == [VALID, STALE, VALID]
+        assert store.status("e_but_missing") == NOT_FOUND
+        assert len(store.get_app_elements("Editor")) == 2
+        assert len(store.get_app_elements("Editor", include_stale=True)) == 3
+
+    def test_rescan_keeps_ids(self):
+        store = SimpleElementStore()
+        first = _scan(store, [_button(i, label="") for i in range(4)])
+
+        second = _scan(store, [_button(i, label="") for i in range(4)])
+
+        assert second == first
+        assert all(store.status(eid) == VALID for eid in second)
+
+    def test_generations_are_per_app(self):
+        store = SimpleElementStore()
+        editor = _scan(store, [_button(0)])
+        viewer = _scan(store, [_button(0, app="Viewer")], app="Viewer")
+
+        store.begin_generation("Editor")
+
+        assert store.status(editor[0]) == STALE
+        assert store.status(viewer[0]) == VALID
+
+    def test_resolve_messages(self):
+        store = SimpleElementStore()
+        ids = _scan(store, [_button(0), _button(1)])
+        _scan(store, [_button(0)])
+
+        element, node, error = store.resolve(ids[0])
+        assert error == "" and node is element["_native_ref"]
+
+        _, node, error = store.resolve(ids[1])
+        assert node is None and "is stale" in error
+
+        _, _, error = store.resolve("e_but_gone")
+        assert "not found" in error
+
+    def test_long_stale_elements_are_pruned(self):
+        store = SimpleElementStore(max_stale_generations=2)
+        ids = _scan(store, [_button(i) for i in range(10)])
+
+        for _ in range(5):
+            _scan(store, [_button(0)])
+
+        assert store.status(ids[0]) == VALID
+        assert all(store.status(eid) == NOT_FOUND for eid in ids[1:])
+        assert store.count == 1
+
+    def test_begin_generation_benchmark(self):
+        store = SimpleElementStore()
+        _scan(store, [_button(i) for i in range(20000)])
+        store._elements = _CountingDict(store._elements)
+        store._stamps = _CountingDict(store._stamps)
+
+        for _ in range(1000):
+            store.begin_generation("Editor")
+
+        touched = store._elements.reads + store._stamps.reads
+        print(f"\n1000 generations over 20k elements: {touched} entry reads")
+        assert touched <= 1000 * store.PRUNE_STEP
+
+
+class TestRegistryOnStore:
+    """VersionedElementRegistry keeps its API on top of the store."""
+
+    def test_refresh_reports_matched_new_and_stale(self):
+        registry = VersionedElementRegistry()
+        first = registry.refresh_elements([_button(i) for i in range(3)])
+        registry.advance_epoch()
+
+        stats = registry.refresh_elements([_button(0), _button(1), _button(9)])
+
+        assert first["new"] == 3
+        assert stats["matched"] == 2 and stats["new"] == 1
+        assert len(stats["stale"]) == 1
+        entry, status = registry.get_element(stats["stale"][0])
+        assert status == "stale" and entry.is_stale
+        assert len(registry.get_valid_elements()) == 3
+
+    def test_not_found_after_clear(self):
+        registry = VersionedElementRegistry()
+        registry.refresh_elements([_button(0)])
+        eid = registry.get_valid_elements()[0].element_id
+
+        registry.clear()
+
+        assert registry.get_element(eid) == (None, "not_found")
+
+
+class TestLinuxClickAfterRescan:
+    """click_by_id() distinguishes stale IDs from unknown ones."""
+
+    def test_removed_button_reports_stale(self):
+        atspi = FakeAtspi()
+        _, _, panels = build_app(atspi, buttons=3, panels=1)
+        acc = make_linux_accessibility(atspi, track_changes=False)
+        elements = acc.get_elements("Editor")
+        removed = next(e for e in elements if e["label"] == "Button 0-2")
+        kept = next(e for e in elements if e["label"] == "Button 0-0")
+
+        panels[0].children.pop()
+        acc.invalidate_cache("Editor")
+        rescanned = acc.get_elements("Editor")
+
+        assert kept["element_id"] in {e["element_id"] for e in rescanned}
+        assert acc.click_by_id(kept["element_id"])[0]
+        clicked, message = acc.click_by_id(removed["element_id"])
+        assert not clicked and "is stale" in message
+        clicked, message = acc.click_by_id("e_but_unknown")
+        assert not clicked and "not found" in message
@@ -0,0 +1,92 @@
+"""
+Tests for the per-application, incrementally synced element index.
+"""
+
+from pilot.services.element_index import AppElementIndexes, ElementIndex
+
+
+def _elem(i, label=None, role="Button"):
+    return {
+        "element_id": f"e_{i}",
+        "role": role,
+        "label": label if label is not None else f"Item {i}",
+        "enabled": True,
+    }
+
+
+class TestIncrementalSync:
+    """sync() applies only added and removed elements."""
+
+    def test_sync_matches_full_rebuild(self):
+        index = ElementIndex()
+        index.sync([_elem(i) for i in range(10)])
+        index.sync([_elem(i) for i in range(5, 15)] + [_elem(99, "Save file")])
+
+        rebuilt = ElementIndex()
+        rebuilt.index_elements(
+            [_elem(i) for i in range(5, 15)] + [_elem(99, "Save file")]
+        )
+
+        assert index.element_count == rebuilt.element_count == 11
+        assert index.get_role_summary() == rebuilt.get_role_summary()
+        assert "e_3" not in [r.element_id for r in index.search("item 3")]
+        assert [r.element_id for r in index.search("save")] == ["e_99"]
+
+    def test_sync_reports_only_changes(self):
+        index = ElementIndex()
+        index.sync([_elem(i) for i in range(100)])
+
+        added, removed = index.sync([_elem(i) for i in range(1, 101)])
+
+        assert (added, removed) == (1, 1)
+
+    def test_unchanged_elements_are_not_reindexed(self):
+        index = ElementIndex()
+        index.sync([_elem(1)])
+        calls = []
+        original = index._extract_words
+        index._extract_words = lambda text: calls.append(text) or original(text)
+
+        refreshed = _elem(1)
+        index.sync([refreshed])
+
+        assert calls == []
+        assert index.get_by_id("e_1") is refreshed
+
+    def test_changed_label_moves_word_entries(self):
+        index = ElementIndex()
+        index.sync([_elem(1, "Open")])
+
+        index.sync([_elem(1, "Close")])
+
+        assert index.search("open") == []
+        assert [r.element_id for r in index.search("close")] == ["e_1"]
+
+    def test_removed_role_bucket_disappears(self):
+        index = ElementIndex()
+        index.sync([_elem(1, role="Slider"), _elem(2)])
+
+        index.sync([_elem(2)])
+
+        assert "slider" not in index.get_role_summary()
+
+
+class TestAppElementIndexes:
+    """One index per app, bounded by least-recent use."""
+
+    def test_apps_keep_separate_indexes(self):
+        indexes = AppElementIndexes()
+        indexes.sync("Notes", [_elem(1, "Note A")])
+        indexes.sync("Calculator", [_elem(2, "Seven")])
+
+        assert [r.element_id for r in indexes.get("notes").search("note")] == ["e_1"]
+        assert indexes.get("Calculator").search("note") == []
+
+    def test_least_recently_used_app_is_evicted(self):
+        indexes = AppElementIndexes(max_apps=2)
+        indexes.sync("A", [_elem(1)])
+        indexes.sync("B", [_elem(2)])
+        indexes.get("A")
+        indexes.sync("C", [_elem(3)])
+
+        assert indexes.apps == ["a", "c"]
@@ -0,0 +1,84 @@
+"""
+Tests for background element prefetch after launch and target changes.
+"""
+
+import pytest
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.services.state.app_state import AppStateManager
+from pilot.services.state.prefetch import ElementPrefetcher
+
+
+@pytest.fixture
+def app_state(monkeypatch):
+    monkeypatch.setattr(AppStateManager, "_instance", None)
+    return AppStateManager()
+
+
+def _accessibility():
+    atspi = FakeAtspi(supports_collection=False)
+    build_app(atspi, buttons=10)
+    build_app(atspi, name="Terminal", buttons=4)
+    return make_linux_accessibility(atspi)
+
+
+class TestElementPrefetcher:
+    """Prefetched snapshots serve the next get_elements call."""
+
+    def test_next_call_consumes_prefetched_snapshot(self):
+        acc = _accessibility()
+        prefetcher = ElementPrefetcher.create(acc)
+
+        prefetched = prefetcher.prefetch("Editor").result(timeout=2)
+        elements = acc.get_elements("Editor")
+
+        assert elements is prefetched
+        assert acc.get_cache_stats()["traversals"]["walks"] == 1
+
+    def test_revalidated_snapshot_serves_stream(self):
+        acc = _accessibility()
+        prefetcher = ElementPrefetcher.create(acc)
+        prefetched = prefetcher.prefetch("Editor").result(timeout=2)
+
+        assert acc.revalidate_cache("Editor")
+        streamed = acc.stream_elements("Editor").collect()
+
+        assert streamed == prefetched
+        assert acc.get_cache_stats()["traversals"]["walks"] == 1
+
+    def test_disabled_by_env_or_backend(self, monkeypatch):
+        class SyncBackend:
+            available = True
+
+        assert ElementPrefetcher.create(SyncBackend()) is None
+        monkeypatch.setenv(ElementPrefetcher.ENV_VAR, "off")
+        assert ElementPrefetcher.create(_accessibility()) is None
+
+
+class TestTargetAppPrefetch:
+    """Changing the target app starts a background snapshot."""
+
+    def test_target_change_prefetches_once(self, app_state):
+        acc = _accessibility()
+        app_state.set_accessibility_tool(acc)
+
+        app_state.set_target_app("Editor")
+        app_state.set_target_app("editor")
+        app_state.set_target_app("Terminal", prefetch=False)
+        acc.get_elements("Editor")
+
+        traversals = acc.get_cache_stats()["traversals"]
+        assert app_state._prefetcher.requested == 1
+        assert traversals["walks"] == 1
+
+    def test_fresh_prefetch_replaces_early_snapshot(self, app_state):
+        acc = _accessibility()
+        app_state.set_accessibility_tool(acc)
+        early = acc.get_elements("Terminal")
+
+        app_state.prefetch_elements("Terminal", fresh=True)
+        later = acc.get_elements("Terminal")
+
+        assert later is not early
+        assert [e["element_id"] for e in later] == [e["element_id"] for e in early]
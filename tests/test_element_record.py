@@ -0,0 +1,125 @@
+"""
+Tests for the slotted ElementRecord and its dict-compatible view.
+"""
+
+import sys
+import time
+
+from pilot.tools.accessibility.element_record import ElementRecord
+from pilot.tools.accessibility.element_store import SimpleElementStore
+
+
+def _fields(i):
+    x, y = (i % 50) * 24, (i // 50) * 20
+    return {
+        "role": "Button",
+        "label": f"Item {i}",
+        "identifier": str(i % 50),
+        "app_name": "editor",
+        "center": [x + 10, y + 10],
+        "bounds": [x, y, 20, 20],
+        "has_actions": True,
+        "enabled": True,
+        "focused": False,
+        "role_description": "push button",
+        "parent_path": "",
+    }
+
+
+def _as_dict(i, node):
+    element = _fields(i)
+    element["_native_ref"] = node
+    element["is_bottom"] = False
+    element["title"] = element["label"]
+    element["_element"] = node
+    element["_app_name"] = "editor"
+    return element
+
+
+def _as_record(i, node):
+    record = ElementRecord(_fields(i), _native_ref=node)
+    record.is_bottom = False
+    record.title = record.label
+    return record
+
+
+def _measure(build, count=5000):
+    nodes = [object() for _ in range(count)]
+    started = time.perf_counter()
+    elements = [build(i, nodes[i]) for i in range(count)]
+    built = time.perf_counter() - started
+
+    store = SimpleElementStore()
+    for element in elements:
+        store.store(element, "editor")
+    started = time.perf_counter()
+    for element in elements:
+        (element.get("label"), element.get("center"), element.get("_native_ref"))
+    read = time.perf_counter() - started
+
+    retained = 0
+    for element in elements:
+        retained += sys.getsizeof(element)
+        extra = getattr(element, "extra", None)
+        if extra:
+            retained += sys.getsizeof(extra)
+    return retained, built, read
+
+
+class TestElementRecord:
+    """ElementRecord behaves like the element dicts it replaces."""
+
+    def test_mapping_access_and_aliases(self):
+        node = object()
+        record = ElementRecord(_fields(1), _native_ref=node)
+
+        assert record["label"] == "Item 1"
+        assert record.get("_element") is node
+        assert record["_app_name"] == "editor"
+        assert "title" not in record
+        assert record.get("title", "") == ""
+
+        record["title"] = "Save"
+        record["custom"] = 3
+
+        assert record.title == "Save"
+        assert record["custom"] == 3
+        assert dict(record)["_native_ref"] is node
+        assert len(record) == len(record.to_dict())
+
+    def test_missing_key_raises_key_error(self):
+        record = ElementRecord(role="Button")
+
+        try:
+            record["center"]
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("expected KeyError")
+
+    def test_roles_are_interned(self):
+        a = ElementRecord(role="".join(["But", "ton"]))
+        b = ElementRecord(role="".join(["Butt", "on"]))
+
+        assert a.role is b.role
+
+    def test_store_assigns_element_id(self):
+        store = SimpleElementStore()
+        record = ElementRecord(_fields(7))
+
+        element_id = store.store(record, "editor")
+
+        assert record["element_id"] == element_id
+        assert store.get(element_id) is record
+
+    def test_5k_snapshot_memory_and_time(self):
+        dict_bytes, dict_built, dict_read = _measure(_as_dict)
+        record_bytes, record_built, record_read = _measure(_as_record)
+
+        print(
+            f"\n5k elements: dict {dict_bytes / 1024:.0f} KiB, "
+            f"build {dict_built * 1000:.1f} ms, read {dict_read * 1000:.1f} ms; "
+            f"record {record_bytes / 1024:.0f} KiB, "
+            f"build {record_built * 1000:.1f} ms, read {record_read * 1000:.1f} ms"
+        )
+        assert record_bytes < dict_bytes / 2
@@ -0,0 +1,174 @@
+"""
+Tests for trigram fuzzy search and ranking in ElementIndex.
+"""
+
+import random
+import time
+
+import pytest
+
+from pilot.services import element_index
+from pilot.services.element_index import ElementIndex, bounded_edit_distance
+
+
+def _elem(i, label, role="Button", identifier=""):
+    return {
+        "element_id": f"e_{i}",
+        "role": role,
+        "label": label,
+        "identifier": identifier,
+        "enabled": True,
+    }
+
+
+def _labels(results):
+    return [r.label for r in results]
+
+
+def _snapshot(count, seed=3):
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocab = ["open", "save", "preferences", "settings", "export", "table", "cell"]
+    vocab += [
+        "".join(rng.choice(letters) for _ in range(rng.randint(4, 10)))
+        for _ in range(3000)
+    ]
+    roles = ["Button", "TextField", "MenuItem", "Cell", "CheckBox", "StaticText"]
+    elements = [
+        _elem(
+            i,
+            " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 3))),
+            rng.choice(roles),
+            str(i % 40),
+        )
+        for i in range(count // 2)
+    ]
+    elements += [
+        _elem(i, "table cell", "Cell", str(i % 100)) for i in range(count // 2, count)
+    ]
+    return elements
+
+
+class TestFuzzySearch:
+    """Partial words and typos still find the intended element."""
+
+    def test_abbreviation_finds_full_word(self):
+        index = ElementIndex()
+        index.index_elements(
+            [_elem(1, "Preferences"), _elem(2, "Print"), _elem(3, "Profile")]
+        )
+
+        assert _labels(index.search("prefs"))[0] == "Preferences"
+
+    def test_typo_falls_back_to_edit_distance(self):
+        index = ElementIndex()
+        index.index_elements([_elem(1, "Settings"), _elem(2, "Sidebar")])
+
+        results = index.search("setings")
+
+        assert _labels(results)[0] == "Settings"
+
+    def test_unrelated_query_finds_nothing(self):
+        index = ElementIndex()
+        index.index_elements([_elem(1, "Open"), _elem(2, "Save")])
+
+        assert index.search("qqqqqq") == []
+
+    def test_role_filter_applies_to_candidates(self):
+        index = ElementIndex()
+        index.index_elements(
+            [_elem(1, "Save"), _elem(2, "Save", role="MenuItem"), _elem(3, "Saved")]
+        )
+
+        results = index.search("save", role_filter="menuitem")
+
+        assert [r.element_id for r in results] == ["e_2"]
+
+    def test_exact_label_outranks_longer_labels(self):
+        index = ElementIndex()
+        index.index_elements(
+            [
+                _elem(1, "Save as template"),
+                _elem(2, "Autosave settings"),
+                _elem(3, "Save"),
+            ]
+        )
+
+        assert [r.element_id for r in index.search("save")][0] == "e_3"
+
+    def test_max_results_and_order(self):
+        index = ElementIndex()
+        index.index_elements([_elem(i, f"Row {i}") for i in range(100)])
+
+        results = index.search("row", max_results=5)
+
+        assert len(results) == 5
+        scores = [r.match_score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_identical_labels_share_one_document(self):
+        index = ElementIndex()
+        index.index_elements([_elem(i, "Table cell") for i in range(500)])
+
+        assert len(index._documents) == 1
+        index.sync([_elem(i, "Table cell") for i in range(10)])
+        assert len(index._documents) == 1
+        assert len(index.search("cell", max_results=50)) == 10
+
+
+class TestBoundedEditDistance:
+    """bounded_edit_distance stops once the limit is exceeded."""
+
+    def test_distances(self):
+        assert bounded_edit_distance("setings", "settings", 2) == 1
+        assert bounded_edit_distance("save", "save", 2) == 0
+        assert bounded_edit_distance("abc", "xyzxyz", 2) > 2
+
+
+class TestSearchBenchmark:
+    """Queries over a 20k element snapshot score a bounded shortlist."""
+
+    QUERIES = ["prefs", "save", "setings", "open file", "tabel cel", "export"]
+
+    def test_20k_queries_score_bounded_shortlist(self, monkeypatch):
+        index = ElementIndex()
+        index.sync(_snapshot(20000))
+        scored = []
+        distances = []
+        compute_score = index._compute_score
+
+        def counting_score(*args):
+            scored.append(args)
+            return compute_score(*args)
+
+        def counting_distance(*args):
+            distances.append(args)
+            return bounded_edit_distance(*args)
+
+        monkeypatch.setattr(index, "_compute_score", counting_score)
+        monkeypatch.setattr(element_index, "bounded_edit_distance", counting_distance)
+        limit = max(20 * ElementIndex.RERANK_FACTOR, ElementIndex.RERANK_MIN)
+
+        for query in self.QUERIES:
+            scored.clear()
+            assert index.search(query)
+            assert len(scored) <= limit
+        assert distances == []
+
+    @pytest.mark.slow
+    def test_20k_queries(self):
+        index = ElementIndex()
+        index.sync(_snapshot(20000))
+
+        timings = {}
+        for query in self.QUERIES:
+            started = time.perf_counter()
+            for _ in range(50):
+                index.search(query)
+            timings[query] = (time.perf_counter() - started) / 50 * 1000
+
+        print(
+            "\n20k elements: "
+            + ", ".join(f"{q!r} {ms:.3f} ms" for q, ms in timings.items())
+        )
+        assert sum(timings.values()) / len(timings) < 1.0
@@ -0,0 +1,91 @@
+"""
+Tests for element ID collision resolution in SimpleElementStore.
+
+Large homogeneous tables (unlabeled cells normalized to label = role) share
+one base ID, so collision handling must not probe every earlier cell.
+"""
+
+from pilot.tools.accessibility.element_store import SimpleElementStore
+
+
+def _cell(row, col, label="table cell"):
+    return {
+        "role": "Cell",
+        "label": label,
+        "identifier": "",
+        "center": [col * 80 + 40, row * 20 + 10],
+    }
+
+
+def _table(rows, cols):
+    return [_cell(r, c) for r in range(rows) for c in range(cols)]
+
+
+class TestCollisionResolution:
+    """Numbered suffixes are handed out without rescanning the base ID."""
+
+    def test_colliding_cells_get_sequential_suffixes(self):
+        store = SimpleElementStore()
+        ids = [store.store(cell, "Sheet") for cell in _table(2, 2)]
+
+        base = ids[0]
+        assert ids[1:] == [f"{base}_1", f"{base}_2", f"{base}_3"]
+
+    def test_restoring_same_cells_keeps_ids(self):
+        store = SimpleElementStore()
+        first = [store.store(cell, "Sheet") for cell in _table(5, 5)]
+        moved = _table(5, 5)
+        for cell in moved:
+            cell["center"] = [cell["center"][0] + 3, cell["center"][1] - 2]
+
+        second = [store.store(cell, "Sheet") for cell in moved]
+
+        assert second == first
+        assert store.count == 25
+
+    def test_clear_app_restarts_suffixes(self):
+        store = SimpleElementStore()
+        first = [store.store(cell, "Sheet") for cell in _table(3, 3)]
+        store.clear_app("Sheet")
+
+        second = [store.store(cell, "Sheet") for cell in reversed(_table(3, 3))]
+
+        assert sorted(second) == sorted(first)
+
+    def test_elements_without_center_never_merge(self):
+        store = SimpleElementStore()
+        a = store.store({"role": "Cell", "label": "x"}, "Sheet")
+        b = store.store({"role": "Cell", "label": "x"}, "Sheet")
+
+        assert a != b
+
+    def test_store_10k_cell_table_benchmark(self):
+        store = SimpleElementStore()
+        comparisons = 0
+        probes = 0
+        original_same = store._is_same_element
+        original_status = store.status
+
+        def counting_same(existing, new):
+            nonlocal comparisons
+            comparisons += 1
+            return original_same(existing, new)
+
+        def counting_status(element_id):
+            nonlocal probes
+            probes += 1
+            return original_status(element_id)
+
+        store._is_same_element = counting_same
+        store.status = counting_status
+        cells = _table(100, 100)
+
+        ids = [store.store(cell, "Sheet") for cell in cells]
+
+        print(
+            f"\nstored {len(cells)} colliding cells: "
+            f"{comparisons} comparisons, {probes} suffix probes"
+        )
+        assert len(set(ids)) == len(cells)
+        assert comparisons == 0
+        assert probes == 0
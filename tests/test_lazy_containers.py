@@ -0,0 +1,165 @@
+"""
+Tests for collapsed container handles and paginated expansion.
+"""
+
+from unittest.mock import Mock
+
+from tests.fake_atspi import (
+    STATE_SHOWING,
+    STATE_VISIBLE,
+    FakeAtspi,
+    build_app,
+    make_linux_accessibility,
+)
+
+from pilot.crew_tools.gui_basic_tools import (
+    ExpandContainerTool,
+    _format_elements_smart_compact,
+    _select_smart_compact_elements,
+)
+from pilot.tools.accessibility.containers import ContainerPage, ExpansionOptions
+
+ITEMS = 250
+
+
+def _mailbox(items=ITEMS, supports_collection=False):
+    """Editor app plus an inbox list with items laid out on screen."""
+    atspi = FakeAtspi(supports_collection=supports_collection)
+    app, frame, _ = build_app(atspi, buttons=5)
+    inbox = frame.add(
+        atspi.node(
+            "list",
+            "Inbox",
+            extents=(0, 300, 1200, 400),
+            states={STATE_SHOWING, STATE_VISIBLE},
+        )
+    )
+    for i in range(items):
+        inbox.add(
+            atspi.node(
+                "list item",
+                f"Message {i}",
+                extents=((i % 20) * 60, 300 + (i // 20) * 30, 50, 20),
+                actions=["activate"],
+            )
+        )
+    return atspi, inbox
+
+
+class TestExpansionOptions:
+    """Collapse rules and page arithmetic."""
+
+    def test_collapses(self):
+        options = ExpansionOptions(min_children=10)
+
+        assert options.collapses(1, 10)
+        assert not options.collapses(1, 9)
+        assert not options.collapses(0, 500)
+        assert not ExpansionOptions(min_children=0).collapses(1, 500)
+
+    def test_next_offset(self):
+        first = ContainerPage("e", offset=0, total=120, children_read=50)
+        last = ContainerPage("e", offset=100, total=120, children_read=20)
+
+        assert first.next_offset == 50
+        assert last.next_offset is None
+
+
+class TestLinuxContainerHandles:
+    """Large containers are returned as handles and expanded on demand."""
+
+    def test_snapshot_returns_handle(self):
+        atspi, _ = _mailbox()
+        acc = make_linux_accessibility(atspi)
+
+        atspi.reset_calls()
+        elements = acc.get_elements("Editor")
+
+        handle = next(e for e in elements if e["label"] == "Inbox")
+        assert handle["collapsed"] and handle["child_count"] == ITEMS
+        assert handle["preview"] == ["Message 0", "Message 1", "Message 2"]
+        assert not any(e["label"].startswith("Message") for e in elements)
+        assert atspi.calls["getChildAtIndex"] < 20
+
+    def test_expand_pages(self):
+        atspi, _ = _mailbox()
+        acc = make_linux_accessibility(atspi)
+        handle = next(e for e in acc.get_elements("Editor") if e.get("collapsed"))
+
+        first = acc.expand_container(handle["element_id"], limit=100)
+        last = acc.expand_container(handle["element_id"], offset=first.next_offset * 2)
+
+        assert [e["label"] for e in first.elements[:2]] == ["Message 0", "Message 1"]
+        assert (first.total, first.next_offset) == (ITEMS, 100)
+        assert len(last.elements) == ITEMS - 200 and last.next_offset is None
+        assert acc.click_by_id(last.elements[-1]["element_id"])[0]
+
+    def test_expand_unknown_element(self):
+        acc = make_linux_accessibility(FakeAtspi())
+
+        page = acc.expand_container("e_missing")
+
+        assert page.error and page.elements == []
+
+    def test_disabled_expansion_walks_everything(self):
+        atspi, _ = _mailbox()
+        acc = make_linux_accessibility(atspi)
+        acc.expansion.min_children = 0
+
+        elements = acc.get_elements("Editor")
+
+        assert not any(e.get("collapsed") for e in elements)
+        assert sum(e["label"].startswith("Message") for e in elements) == ITEMS
+
+    def test_repair_keeps_handle_current(self):
+        atspi, inbox = _mailbox()
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.add_child(inbox, atspi.node("list item", "Message new"))
+        atspi.rename(inbox, "Inbox (1)")
+        elements = acc.get_elements("Editor")
+
+        handle = next(e for e in elements if e.get("collapsed"))
+        assert handle["label"] == "Inbox (1)"
+        assert handle["child_count"] == ITEMS + 1
+
+    def test_stream_emits_handle(self):
+        atspi, _ = _mailbox()
+        acc = make_linux_accessibility(atspi)
+
+        elements = acc.stream_elements("Editor").collect()
+
+        handles = [e for e in elements if e.get("collapsed")]
+        assert [h["label"] for h in handles] == ["Inbox"]
+        assert not any(e["label"].startswith("Message") for e in elements)
+
+
+class TestContainerDisplay:
+    """Handles survive compact selection and show their item counts."""
+
+    def test_handle_is_listed(self):
+        atspi, _ = _mailbox()
+        elements = make_linux_accessibility(atspi).get_elements("Editor")
+
+        selected, _ = _select_smart_compact_elements(elements, max_total=3)
+        summary = _format_elements_smart_compact(selected, 0)
+
+        assert "Inbox(" in summary
+        assert "[250 items: Message 0, Message 1, Message 2, …]" in summary
+
+    def test_expand_container_tool_pages(self):
+        atspi, _ = _mailbox()
+        acc = make_linux_accessibility(atspi)
+        handle = next(e for e in acc.get_elements("Editor") if e.get("collapsed"))
+        tool = ExpandContainerTool()
+        tool._tool_registry = Mock(get_tool=Mock(return_value=acc))
+
+        result = tool._run(element_id=handle["element_id"], offset=200, limit=40)
+
+        assert result.success
+        assert result.action_taken.startswith("Items 201-240 of 250 in ")
+        assert "offset=240" in result.action_taken
+        assert result.data["next_offset"] == 240
+        assert len(result.data["elements"]) == 40
+        assert not tool._run(element_id="e_missing").success
@@ -0,0 +1,120 @@
+"""
+Tests for the pipelined AT-SPI client.
+
+The D-Bus transport is replaced by an in-memory tree that answers each
+call after a fixed latency, which shows whether calls overlap.
+"""
+
+import asyncio
+
+from pilot.tools.accessibility.linux.async_client import (
+    COMPONENT,
+    PROPERTIES,
+    REGISTRY_BUS,
+    ROOT_PATH,
+    AsyncAtspiClient,
+)
+
+STATE_ENABLED = 8
+LATENCY = 0.005
+
+
+class LatencyBoundClient(AsyncAtspiClient):
+    """Client whose bus is a dict of nodes answering after LATENCY."""
+
+    def __init__(self, nodes):
+        super().__init__()
+        self.nodes = nodes
+        self._start_loop()
+        self._bus = object()
+
+    async def _call(self, ref, interface, member, signature="", body=None):
+        async with self._semaphore:
+            self.calls += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            await asyncio.sleep(LATENCY)
+            self._in_flight -= 1
+
+        node = self.nodes[ref]
+        if interface == PROPERTIES:
+            return node.get(body[1])
+        if interface == COMPONENT:
+            return node.get("extents")
+        return {
+            "GetRoleName": node["role"],
+            "GetLocalizedRoleName": node["role"],
+            "GetState": node.get("states", [0, 0]),
+            "GetIndexInParent": node.get("index", 0),
+            "GetChildren": node.get("children", []),
+        }.get(member)
+
+
+def _build_tree(buttons: int):
+    app = ("app.bus", "/app")
+    nodes = {
+        (REGISTRY_BUS, ROOT_PATH): {"role": "desktop frame", "children": [app]},
+        app: {"role": "application", "Name": "Editor", "children": [("app.bus", "/w")]},
+        ("app.bus", "/w"): {
+            "role": "frame",
+            "Name": "Editor Window",
+            "extents": [0, 0, 1000, 800],
+            "children": [],
+        },
+    }
+    for i in range(buttons):
+        ref = ("app.bus", f"/w/b{i}")
+        nodes[("app.bus", "/w")]["children"].append(ref)
+        nodes[ref] = {
+            "role": "push button",
+            "Name": f"Button {i}",
+            "extents": [i * 10, 10, 8, 8],
+            "states": [1 << STATE_ENABLED, 0],
+            "index": i,
+            "NActions": 1,
+        }
+    return nodes
+
+
+class TestAsyncAtspiClient:
+    """Sibling attributes are fetched concurrently and normalize unchanged."""
+
+    def test_walk_overlaps_sibling_requests(self):
+        client = LatencyBoundClient(_build_tree(buttons=200))
+        try:
+            snapshots = client.walk_app(lambda name: name == "Editor", max_depth=25)
+        finally:
+            client.close()
+
+        assert [s.name for s in snapshots[:3]] == [
+            "Editor Window",
+            "Button 0",
+            "Button 1",
+        ]
+        assert len(snapshots) == 201
+        assert client.max_in_flight > 100
+
+    def test_snapshots_feed_linux_normalizer(self):
+        from pilot.tools.accessibility.linux.role_normalizer import (
+            normalize_linux_element,
+        )
+
+        class Constants:
+            STATE_ENABLED = STATE_ENABLED
+            STATE_FOCUSED = 12
+            DESKTOP_COORDS = 0
+
+        client = LatencyBoundClient(_build_tree(buttons=3))
+        try:
+            snapshots = client.walk_app(lambda name: name == "Editor", max_depth=25)
+        finally:
+            client.close()
+
+        element = normalize_linux_element(snapshots[2], Constants, "editor", 1920, 1080)
+
+        assert element["role"] == "Button"
+        assert element["label"] == "Button 1"
+        assert element["bounds"] == [10, 10, 8, 8]
+        assert element["enabled"] is True
+        assert element["has_actions"] is True
+        assert element["identifier"] == "1"
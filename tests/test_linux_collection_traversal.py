@@ -0,0 +1,133 @@
+"""
+Tests for Collection-based bulk traversal in LinuxAccessibility.
+
+Includes a round-trip benchmark against the in-memory pyatspi stand-in:
+the walk issues several D-Bus calls per node, the Collection path issues
+one GetMatches per window plus one attribute pass per matched element.
+"""
+
+import pytest
+
+from tests.fake_atspi import (
+    STATE_SHOWING,
+    STATE_VISIBLE,
+    FakeAtspi,
+    build_app,
+    make_linux_accessibility,
+)
+
+
+def _walk_elements(atspi, **app_kwargs):
+    build_app(atspi, **app_kwargs)
+    acc = make_linux_accessibility(atspi)
+    acc.use_collection = False
+    atspi.reset_calls()
+    return acc.get_elements("Editor")
+
+
+class TestCollectionTraversal:
+    """Bulk matching returns the same elements with fewer round trips."""
+
+    def test_same_elements_as_walk(self):
+        """
+        Two GetMatches calls replace the walk; getChildAtIndex is only used
+        to list the windows once for the walk and once for the fingerprint.
+        """
+        walked = _walk_elements(FakeAtspi(), buttons=8, labels=4)
+
+        atspi = FakeAtspi()
+        app, _, _ = build_app(atspi, buttons=8, labels=4)
+        matched = make_linux_accessibility(atspi).get_elements("Editor")
+
+        assert sorted(e["element_id"] for e in matched) == sorted(
+            e["element_id"] for e in walked
+        )
+        assert atspi.calls["getMatches"] == 2
+        assert atspi.calls["getChildAtIndex"] == 2 * len(app.children)
+
+    def test_falls_back_to_walk_without_collection(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=4)
+        acc = make_linux_accessibility(atspi)
+
+        elements = acc.get_elements("Editor")
+
+        assert len(elements) == 1 + 2 + 2 * 4
+        assert atspi.calls["getChildAtIndex"] > 0
+        assert not acc._collection.is_supported("editor")
+
+    def test_non_interactive_request_walks_tree(self):
+        atspi = FakeAtspi()
+        build_app(atspi, buttons=4, labels=2)
+        acc = make_linux_accessibility(atspi)
+
+        elements = acc.get_elements("Editor", interactive_only=False)
+
+        assert "Label 0-1" in [e["label"] for e in elements]
+        assert atspi.calls["getMatches"] == 0
+
+    def test_event_below_match_requeries_window(self):
+        atspi = FakeAtspi()
+        _, _, panels = build_app(atspi, buttons=4)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.reset_calls()
+        atspi.add_child(
+            panels[0],
+            atspi.node(
+                "push button", "Added", extents=(500, 10, 30, 20), actions=["click"]
+            ),
+        )
+        elements = acc.get_elements("Editor")
+
+        assert "Added" in [e["label"] for e in elements]
+        assert atspi.calls["getMatches"] == 2
+        assert atspi.calls["getRoleName"] == 1
+
+    def test_disabled_actionable_keeps_document_order(self):
+        atspi = FakeAtspi()
+        _, frame, _ = build_app(atspi, buttons=0, panels=0)
+        panel = frame.add(atspi.node("panel", "Panel", extents=(0, 0, 600, 300)))
+        for name, states, actions in [
+            ("First", None, ["click"]),
+            ("Status", None, []),
+            ("Disabled", {STATE_SHOWING, STATE_VISIBLE}, ["click"]),
+            ("Hint", None, []),
+            ("Last", None, ["click"]),
+        ]:
+            panel.add(atspi.node("push button", name, states=states, actions=actions))
+        acc = make_linux_accessibility(atspi)
+
+        matches = acc._collection.interactive_descendants(frame, "editor")
+
+        assert [m.name for m in matches] == [
+            "Panel",
+            "First",
+            "Status",
+            "Disabled",
+            "Hint",
+            "Last",
+        ]
+
+    @pytest.mark.parametrize("buttons,labels", [(25, 25), (100, 100)])
+    def test_round_trips_per_element_benchmark(self, buttons, labels):
+        walk_atspi = FakeAtspi()
+        walked = _walk_elements(walk_atspi, buttons=buttons, labels=labels, panels=4)
+        walk_per_element = walk_atspi.round_trips / len(walked)
+
+        bulk_atspi = FakeAtspi()
+        build_app(bulk_atspi, buttons=buttons, labels=labels, panels=4)
+        acc = make_linux_accessibility(bulk_atspi)
+        bulk_atspi.reset_calls()
+        matched = acc.get_elements("Editor")
+        bulk_per_element = bulk_atspi.round_trips / len(matched)
+
+        print(
+            f"\n{len(matched)} elements ({4 * labels} static nodes): "
+            f"walk {walk_per_element:.2f} round trips/element, "
+            f"collection {bulk_per_element:.2f} round trips/element"
+        )
+
+        assert len(matched) == len(walked)
+        assert bulk_per_element < walk_per_element * 0.75
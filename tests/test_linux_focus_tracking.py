@@ -0,0 +1,88 @@
+"""
+Tests for event-tracked frontmost app and focus in LinuxAccessibility.
+"""
+
+from tests.fake_atspi import (
+    STATE_ACTIVE,
+    FakeAtspi,
+    build_app,
+    make_linux_accessibility,
+)
+
+
+def _desktop():
+    atspi = FakeAtspi(supports_collection=False)
+    _, editor, _ = build_app(atspi, buttons=2)
+    _, terminal, _ = build_app(atspi, name="Terminal", buttons=2)
+    for _ in range(5):
+        build_app(atspi, name="Background", buttons=1)
+    editor.states.add(STATE_ACTIVE)
+    return atspi, editor, terminal
+
+
+def _activate(atspi, old, new):
+    old.states.discard(STATE_ACTIVE)
+    atspi.emit("window:deactivate", old)
+    new.states.add(STATE_ACTIVE)
+    atspi.emit("window:activate", new)
+
+
+class TestFocusTracking:
+    """Frontmost-app queries scan once, then follow window events."""
+
+    def test_repeated_queries_do_not_scan(self):
+        atspi, _, _ = _desktop()
+        acc = make_linux_accessibility(atspi)
+
+        assert acc.get_frontmost_app() == "Editor"
+        atspi.reset_calls()
+        for _ in range(10):
+            assert acc.is_app_frontmost("Editor")
+
+        assert atspi.calls["getState"] == 0
+        assert acc._focus.scans == 1
+
+    def test_window_activation_switches_frontmost(self):
+        atspi, editor, terminal = _desktop()
+        acc = make_linux_accessibility(atspi)
+        acc.get_frontmost_app()
+
+        _activate(atspi, editor, terminal)
+        atspi.reset_calls()
+
+        assert acc.get_frontmost_app() == "Terminal"
+        assert atspi.calls["getState"] == 0
+
+    def test_focus_stolen_by_other_app(self):
+        atspi, editor, terminal = _desktop()
+        acc = make_linux_accessibility(atspi)
+        acc.get_frontmost_app()
+
+        editor.states.discard(STATE_ACTIVE)
+        terminal.states.add(STATE_ACTIVE)
+        atspi.emit("object:state-changed:active", editor, detail1=0)
+        atspi.emit("object:state-changed:focused", terminal.children[0])
+
+        assert acc.get_frontmost_app() == "Terminal"
+        assert acc._focus.focused is terminal.children[0]
+
+    def test_deactivation_without_successor_falls_back_to_scan(self):
+        atspi, editor, _ = _desktop()
+        acc = make_linux_accessibility(atspi)
+        acc.get_frontmost_app()
+
+        editor.states.discard(STATE_ACTIVE)
+        atspi.emit("window:deactivate", editor)
+
+        assert acc.get_frontmost_app() is None
+        assert acc._focus.scans == 2
+
+    def test_without_events_every_query_scans(self):
+        atspi, editor, terminal = _desktop()
+        acc = make_linux_accessibility(atspi, track_changes=False)
+        acc.get_frontmost_app()
+
+        editor.states.discard(STATE_ACTIVE)
+        terminal.states.add(STATE_ACTIVE)
+
+        assert acc.get_frontmost_app() == "Terminal"
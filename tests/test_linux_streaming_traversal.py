@@ -0,0 +1,84 @@
+"""
+Tests for budgeted breadth-first streaming in LinuxAccessibility.
+"""
+
+from tests.fake_atspi import (
+    STATE_ACTIVE,
+    STATE_ENABLED,
+    FakeAtspi,
+    build_app,
+    make_linux_accessibility,
+)
+from pilot.tools.accessibility.traversal import TraversalBudget
+
+
+class TestStreamingTraversal:
+    """Streams yield early, stop at the budget and resume from a cursor."""
+
+    def test_unbudgeted_stream_matches_get_elements(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=10, labels=3)
+        acc = make_linux_accessibility(atspi)
+
+        stream = acc.stream_elements("Editor")
+        streamed = stream.collect()
+
+        assert not stream.truncated
+        assert stream.cursor is None
+        assert sorted(e["element_id"] for e in streamed) == sorted(
+            e["element_id"] for e in acc.get_elements("Editor")
+        )
+
+    def test_node_budget_truncates_and_cursor_resumes(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=40, panels=3)
+        acc = make_linux_accessibility(atspi)
+
+        first = acc.stream_elements("Editor", budget=TraversalBudget(max_nodes=30))
+        first_page = first.collect()
+
+        assert first.truncated
+        assert first.nodes_visited == 30
+        assert first.cursor
+
+        rest = acc.stream_elements("Editor", cursor=first.cursor)
+        remaining = rest.collect()
+
+        assert not rest.truncated
+        labels = [e["label"] for e in first_page + remaining]
+        assert len(labels) == len(set(labels)) == 1 + 3 + 3 * 40
+
+    def test_breadth_first_with_active_window_first(self):
+        atspi = FakeAtspi(supports_collection=False)
+        app, _, _ = build_app(atspi, buttons=5)
+        dialog = app.add(
+            atspi.node(
+                "dialog",
+                "Save",
+                extents=(100, 100, 300, 200),
+                states={STATE_ENABLED, STATE_ACTIVE},
+            )
+        )
+        dialog.add(
+            atspi.node(
+                "push button", "OK", extents=(120, 250, 40, 20), actions=["click"]
+            )
+        )
+        acc = make_linux_accessibility(atspi)
+
+        labels = [e["label"] for e in acc.stream_elements("Editor")]
+
+        assert labels[:2] == ["Save", "Editor Window"]
+        assert labels.index("OK") < labels.index("Panel 0") < labels.index("Button 0-0")
+
+    def test_completed_walk_feeds_subtree_cache(self):
+        atspi = FakeAtspi()
+        build_app(atspi, buttons=5)
+        acc = make_linux_accessibility(atspi)
+        acc.stream_elements("Editor").collect()
+
+        acc.invalidate_cache("Editor")
+        atspi.reset_calls()
+        acc.stream_elements("Editor").collect()
+
+        assert atspi.calls["getRoleName"] == 0
@@ -0,0 +1,110 @@
+"""
+Tests for event-driven subtree invalidation in LinuxAccessibility.
+
+Runs against the in-memory pyatspi stand-in from fake_atspi, so it needs
+no desktop session and executes on every platform.
+"""
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+
+def _labels(elements):
+    return [e["label"] for e in elements]
+
+
+class TestSubtreeInvalidation:
+    """get_elements() re-walks only the branches that AT-SPI reported."""
+
+    def test_unchanged_tree_is_reused_without_ipc(self):
+        atspi = FakeAtspi()
+        build_app(atspi, buttons=20)
+        acc = make_linux_accessibility(atspi)
+
+        first = acc.get_elements("Editor")
+        acc.invalidate_cache("Editor")
+        atspi.reset_calls()
+        second = acc.get_elements("Editor")
+
+        assert _labels(second) == _labels(first)
+        assert atspi.calls["getRoleName"] == 0
+        assert acc.get_element_by_id(second[0]["element_id"]) is second[0]
+
+    def test_children_changed_rewalks_only_that_parent(self):
+        atspi = FakeAtspi()
+        _, _, panels = build_app(atspi, buttons=20, panels=3)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.reset_calls()
+        atspi.add_child(
+            panels[1],
+            atspi.node(
+                "push button", "Added", extents=(900, 310, 30, 20), actions=["click"]
+            ),
+        )
+        elements = acc.get_elements("Editor")
+
+        assert "Added" in _labels(elements)
+        assert atspi.calls["getRoleName"] == 1
+        assert atspi.calls["getChildAtIndex"] <= len(panels[1].children)
+
+    def test_removed_child_disappears(self):
+        atspi = FakeAtspi()
+        _, _, panels = build_app(atspi, buttons=5)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.remove_child(panels[0], panels[0].children[0])
+
+        assert "Button 0-0" not in _labels(acc.get_elements("Editor"))
+
+    def test_repair_keeps_child_indexes(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, _, panels = build_app(atspi, buttons=5)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.remove_child(panels[0], panels[0].children[0])
+        atspi.add_child(
+            panels[0],
+            atspi.node(
+                "push button", "Added", extents=(900, 310, 30, 20), actions=["click"]
+            ),
+        )
+        acc.get_elements("Editor")
+
+        stack = [acc._subtrees.get("editor:True")]
+        panel = None
+        while stack and panel is None:
+            record = stack.pop()
+            panel = record if record.node is panels[0] else None
+            stack.extend(record.children)
+        assert [child.index for child in panel.children] == [
+            panels[0].children.index(child.node) for child in panel.children
+        ]
+        assert len(panel.children) == 5
+
+    def test_property_change_renormalizes_single_node(self):
+        atspi = FakeAtspi()
+        _, _, panels = build_app(atspi, buttons=5)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.reset_calls()
+        atspi.rename(panels[0].children[2], "Renamed")
+        elements = acc.get_elements("Editor")
+
+        assert "Renamed" in _labels(elements)
+        assert atspi.calls["getRoleName"] == 1
+
+    def test_without_events_invalidation_forces_full_walk(self):
+        atspi = FakeAtspi()
+        build_app(atspi, buttons=5)
+        acc = make_linux_accessibility(atspi, track_changes=False)
+        acc.get_elements("Editor")
+
+        acc.invalidate_cache("Editor")
+        atspi.reset_calls()
+        acc.get_elements("Editor")
+
+        assert atspi.calls["getRoleName"] > 0
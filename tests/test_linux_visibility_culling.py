@@ -0,0 +1,138 @@
+"""
+Tests for pruning hidden and offscreen subtrees during Linux traversal.
+
+Runs against the in-memory pyatspi stand-in from fake_atspi.
+"""
+
+from tests.fake_atspi import (
+    STATE_ENABLED,
+    STATE_SHOWING,
+    STATE_VISIBLE,
+    FakeAtspi,
+    build_app,
+    make_linux_accessibility,
+)
+
+
+def _labels(elements):
+    return [e["label"] for e in elements]
+
+
+def _add_hidden_tab(atspi, frame, buttons=10):
+    tab = frame.add(
+        atspi.node("panel", "Hidden Tab", extents=(0, 0, 1200, 800), states=set())
+    )
+    for b in range(buttons):
+        tab.add(
+            atspi.node(
+                "push button",
+                f"Hidden {b}",
+                extents=(b * 40, 10, 30, 20),
+                actions=["click"],
+            )
+        )
+    return tab
+
+
+def _add_offscreen_rows(atspi, panel, rows=10):
+    for r in range(rows):
+        row = panel.add(
+            atspi.node("table row", f"Row {r}", extents=(1300, r * 20, 200, 20))
+        )
+        row.add(
+            atspi.node(
+                "push button",
+                f"Row button {r}",
+                extents=(1300, r * 20, 30, 20),
+                actions=["click"],
+            )
+        )
+
+
+class TestVisibilityCulling:
+    """Subtrees that cannot be seen are skipped along with their children."""
+
+    def test_hidden_subtree_is_pruned_and_counted(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, frame, _ = build_app(atspi, buttons=3)
+        _add_hidden_tab(atspi, frame, buttons=10)
+        acc = make_linux_accessibility(atspi)
+
+        labels = _labels(acc.get_elements("Editor"))
+
+        assert "Button 0-0" in labels
+        assert not any(label.startswith("Hidden") for label in labels)
+        assert acc.culling.pruned["hidden"] == 1
+
+    def test_offscreen_rows_are_pruned(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, _, panels = build_app(atspi, buttons=3)
+        _add_offscreen_rows(atspi, panels[0], rows=10)
+        acc = make_linux_accessibility(atspi)
+
+        atspi.reset_calls()
+        labels = _labels(acc.get_elements("Editor"))
+
+        assert not any(label.startswith("Row button") for label in labels)
+        assert acc.culling.pruned["offscreen"] == 10
+        assert atspi.calls["getRoleName"] < 20
+
+    def test_disabled_culling_walks_everything(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, frame, panels = build_app(atspi, buttons=3)
+        _add_hidden_tab(atspi, frame, buttons=4)
+        _add_offscreen_rows(atspi, panels[0], rows=2)
+        acc = make_linux_accessibility(atspi)
+        acc.culling.hidden = False
+        acc.culling.offscreen = False
+
+        labels = _labels(acc.get_elements("Editor"))
+
+        assert "Hidden 3" in labels
+        assert "Row button 1" in labels
+        assert acc.culling.pruned == {}
+
+    def test_collection_query_skips_hidden_matches(self):
+        atspi = FakeAtspi()
+        _, frame, _ = build_app(atspi, buttons=3)
+        hidden = frame.add(
+            atspi.node(
+                "push button",
+                "Invisible",
+                extents=(10, 10, 30, 20),
+                states={STATE_ENABLED},
+                actions=["click"],
+            )
+        )
+        acc = make_linux_accessibility(atspi)
+
+        labels = _labels(acc.get_elements("Editor"))
+
+        assert hidden.name not in labels
+        assert "Button 1-2" in labels
+
+    def test_shown_subtree_reappears_after_state_change(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, frame, _ = build_app(atspi, buttons=2)
+        tab = _add_hidden_tab(atspi, frame, buttons=3)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        tab.states |= {STATE_SHOWING, STATE_VISIBLE}
+        atspi.emit("object:state-changed:showing", tab)
+        labels = _labels(acc.get_elements("Editor"))
+
+        assert "Hidden 2" in labels
+
+    def test_hidden_walked_subtree_is_dropped_on_state_change(self):
+        atspi = FakeAtspi(supports_collection=False)
+        _, _, panels = build_app(atspi, buttons=3, panels=2)
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        panels[1].states -= {STATE_SHOWING}
+        atspi.emit("object:state-changed:showing", panels[1])
+        labels = _labels(acc.get_elements("Editor"))
+
+        assert "Button 0-0" in labels
+        assert "Button 1-0" not in labels
@@ -0,0 +1,126 @@
+"""
+Tests for scoped traversals (focused window, dialog, subtree, region).
+"""
+
+import pytest
+
+from tests.fake_atspi import (
+    STATE_ACTIVE,
+    FakeAtspi,
+    build_app,
+    make_linux_accessibility,
+)
+
+from pilot.tools.accessibility.traversal import TraversalScope
+
+
+def _desktop(dialog=True):
+    atspi = FakeAtspi(supports_collection=False)
+    app, frame, _ = build_app(atspi, buttons=20, panels=3)
+    if dialog:
+        dialog_node = app.add(
+            atspi.node("dialog", "Save changes?", extents=(400, 300, 400, 200))
+        )
+        for i, label in enumerate(["Save", "Discard", "Cancel"]):
+            dialog_node.add(
+                atspi.node(
+                    "push button",
+                    label,
+                    extents=(420 + i * 100, 450, 80, 30),
+                    actions=["click"],
+                )
+            )
+        dialog_node.states.add(STATE_ACTIVE)
+    else:
+        frame.states.add(STATE_ACTIVE)
+    return atspi
+
+
+class TestTraversalScope:
+    """Scope arguments are validated when parsed."""
+
+    def test_parse(self):
+        scope = TraversalScope.parse(
+            "Region", region={"x": 0, "y": 0, "width": 10, "height": 5}
+        )
+
+        assert scope.region == (0, 0, 10, 5)
+        assert TraversalScope.parse(None).whole_app
+        assert scope.contains({"bounds": [5, 2, 10, 10]})
+        assert not scope.contains({"bounds": [20, 2, 10, 10]})
+
+    @pytest.mark.parametrize(
+        "kind, element_id, region",
+        [
+            ("toolbar", None, None),
+            ("subtree", None, None),
+            ("region", None, None),
+            ("region", None, {"x": 0, "y": 0, "width": 0, "height": 5}),
+        ],
+    )
+    def test_invalid_scopes(self, kind, element_id, region):
+        with pytest.raises(ValueError):
+            TraversalScope.parse(kind, element_id, region)
+
+
+class TestLinuxScopedElements:
+    """Scoped queries walk only the scope's roots."""
+
+    def test_dialog_scope_skips_main_window(self):
+        atspi = _desktop()
+        acc = make_linux_accessibility(atspi)
+
+        atspi.reset_calls()
+        elements = acc.get_scoped_elements("Editor", TraversalScope("dialog"))
+        scoped_calls = atspi.round_trips
+
+        atspi.reset_calls()
+        acc.get_elements("Editor", use_cache=False)
+
+        assert [e["label"] for e in elements] == [
+            "Save changes?",
+            "Save",
+            "Discard",
+            "Cancel",
+        ]
+        assert scoped_calls * 5 < atspi.round_trips
+        assert acc.click_by_id(elements[1]["element_id"])[0]
+
+    def test_dialog_scope_without_dialog(self):
+        atspi = _desktop(dialog=False)
+        acc = make_linux_accessibility(atspi)
+
+        assert acc.get_scoped_elements("Editor", TraversalScope("dialog")) == []
+        window = acc.get_scoped_elements("Editor", TraversalScope("window"))
+        assert window[0]["label"] == "Editor Window"
+        assert len(window) == 1 + 3 + 3 * 20
+
+    def test_subtree_scope(self):
+        atspi = _desktop()
+        acc = make_linux_accessibility(atspi)
+        panel = next(e for e in acc.get_elements("Editor") if e["label"] == "Panel 1")
+
+        elements = acc.get_scoped_elements(
+            "Editor", TraversalScope("subtree", element_id=panel["element_id"])
+        )
+
+        assert elements[0]["element_id"] == panel["element_id"]
+        assert {e["label"] for e in elements[1:]} == {
+            f"Button 1-{b}" for b in range(20)
+        }
+        stale = TraversalScope("subtree", element_id="e_missing")
+        assert acc.get_scoped_elements("Editor", stale) == []
+
+    def test_region_scope_culls_outside(self):
+        atspi = _desktop(dialog=False)
+        acc = make_linux_accessibility(atspi)
+        scope = TraversalScope("region", region=(0, 0, 200, 120))
+
+        elements = acc.get_scoped_elements("Editor", scope)
+
+        labels = {e["label"] for e in elements}
+        assert {f"Button 0-{b}" for b in range(5)} <= labels
+        assert "Button 0-5" not in labels
+        assert "Panel 1" not in labels
+        assert acc.culling.pruned["offscreen"] == 2 + 15
+        assert all(scope.contains(e) for e in elements)
@@ -0,0 +1,98 @@
+"""
+Tests for coalescing concurrent get_elements calls into one walk.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.utils.threading.single_flight import SingleFlight
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert predicate()
+
+
+class TestSingleFlight:
+    """Requests for a key share the in-flight future until it resolves."""
+
+    def test_concurrent_requests_share_future(self):
+        flights = SingleFlight()
+        pending = Future()
+
+        first = flights.submit("editor", lambda: pending)
+        second = flights.submit("editor", Future)
+        other = flights.submit("terminal", Future)
+
+        assert second is first
+        assert other is not first
+        pending.set_result([])
+        assert flights.submit("editor", Future) is not first
+        assert flights.stats().to_dict() == {
+            "requests": 4,
+            "started": 3,
+            "coalesced": 1,
+        }
+
+    def test_can_join_rejects_incompatible_flight(self):
+        flights = SingleFlight()
+        cached = flights.submit("editor", Future, tag=True)
+
+        fresh = flights.submit("editor", Future, tag=False, can_join=lambda t: not t)
+
+        assert fresh is not cached
+        assert flights.in_flight("editor") is fresh
+
+
+class TestCoalescedGetElements:
+    """Concurrent callers of one app trigger a single traversal."""
+
+    def _blocked(self, acc):
+        gate = threading.Event()
+        acc._worker.submit(gate.wait)
+        return gate
+
+    def test_concurrent_fresh_requests_walk_once(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=10)
+        acc = make_linux_accessibility(atspi)
+        gate = self._blocked(acc)
+        results = []
+
+        def fetch():
+            results.append(acc.get_elements("Editor", use_cache=False))
+
+        callers = [threading.Thread(target=fetch) for _ in range(5)]
+        for caller in callers:
+            caller.start()
+        _wait_for(lambda: acc.get_cache_stats()["traversals"]["requests"] == 5)
+        gate.set()
+        for caller in callers:
+            caller.join(2)
+
+        traversals = acc.get_cache_stats()["traversals"]
+        assert len(results) == 5
+        assert all(r is results[0] for r in results)
+        assert traversals["started"] == 1
+        assert traversals["coalesced"] == 4
+        assert traversals["walks"] == 1
+
+    def test_fresh_request_does_not_join_cached_request(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=3)
+        acc = make_linux_accessibility(atspi)
+        gate = self._blocked(acc)
+
+        cached = acc.submit_elements("Editor", use_cache=True)
+        fresh = acc.submit_elements("Editor", use_cache=False)
+        later = acc.submit_elements("Editor", use_cache=True)
+        gate.set()
+
+        assert fresh is not cached
+        assert later is fresh
+        assert cached.result(2) and fresh.result(2)
@@ -0,0 +1,151 @@
+"""
+Tests for on-disk UI skeletons and warm-start element discovery.
+
+Each "session" is a fresh LinuxAccessibility bound to the same fake
+desktop and the same SQLite file, as after restarting the agent.
+"""
+
+import time
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.services.element_index import ElementIndex
+from pilot.tools.accessibility.skeleton_cache import (
+    Skeleton,
+    SkeletonCache,
+    SkeletonNode,
+    SkeletonWindow,
+)
+
+
+def _session(atspi, db_path):
+    acc = make_linux_accessibility(atspi, track_changes=False)
+    acc._warm_start.skeletons = SkeletonCache(db_path)
+    return acc
+
+
+def _ids(elements):
+    return [e["element_id"] for e in elements]
+
+
+class TestSkeletonCache:
+    """Skeletons round-trip through SQLite per app version."""
+
+    def test_save_and_load(self, tmp_path):
+        cache = SkeletonCache(tmp_path / "skeletons.sqlite3")
+        skeleton = Skeleton(
+            "Editor",
+            "gtk 3.24",
+            True,
+            windows=[SkeletonWindow(0, "frame", "Editor Window", 2)],
+            nodes=[
+                SkeletonNode("e_but_save_1", "Button", "Save", "", (0, 0, 1), (15, 20)),
+                SkeletonNode("e_but_open_2", "Button", "Open", "", None, None),
+            ],
+            structure={(): 1, (0,): 2, (0, 0): 3},
+        )
+
+        assert cache.save(skeleton)
+        loaded = SkeletonCache(tmp_path / "skeletons.sqlite3").load(
+            "editor", "gtk 3.24", True
+        )
+
+        assert loaded.windows == skeleton.windows
+        assert loaded.nodes == skeleton.nodes
+        assert loaded.structure == skeleton.structure
+        assert not loaded.walkable
+        assert cache.load("Editor", "gtk 3.24", False) is None
+        assert cache.load("Editor", "gtk 4.0", True) is None
+
+    def test_only_recent_versions_are_kept(self, tmp_path):
+        cache = SkeletonCache(tmp_path / "skeletons.sqlite3")
+        for i, version in enumerate(("1", "2", "3")):
+            cache.save(Skeleton("Editor", version, True, saved_at=100.0 + i))
+
+        assert cache.load("Editor", "1", True) is None
+        assert cache.load("Editor", "3", True) is not None
+
+    def test_env_disables_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(SkeletonCache.ENV_VAR, "off")
+        assert SkeletonCache.from_env() is None
+
+        monkeypatch.setenv(SkeletonCache.ENV_VAR, str(tmp_path / "s.db"))
+        assert SkeletonCache.from_env().path == str(tmp_path / "s.db")
+
+
+class TestWarmStart:
+    """A stored skeleton replaces the first full walk of a session."""
+
+    def test_warm_walk_matches_cold_walk(self, tmp_path):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=20, panels=4, labels=80)
+        db = tmp_path / "skeletons.sqlite3"
+
+        cold = _session(atspi, db)
+        atspi.reset_calls()
+        started = time.perf_counter()
+        cold_elements = cold.get_elements("Editor")
+        cold_time = time.perf_counter() - started
+        cold_calls = atspi.round_trips
+
+        warm = _session(atspi, db)
+        atspi.reset_calls()
+        started = time.perf_counter()
+        warm_elements = warm.get_elements("Editor")
+        warm_time = time.perf_counter() - started
+        warm_calls = atspi.round_trips
+
+        print(
+            f"\nfirst walk: cold {cold_time * 1000:.2f}ms / {cold_calls} calls, "
+            f"warm {warm_time * 1000:.2f}ms / {warm_calls} calls"
+        )
+        assert _ids(warm_elements) == _ids(cold_elements)
+        assert warm_calls < cold_calls * 0.6
+        assert warm.click_by_id(warm_elements[-1]["element_id"])[0]
+
+    def test_changed_ui_falls_back_to_full_walk(self, tmp_path):
+        atspi = FakeAtspi(supports_collection=False)
+        _, _, panels = build_app(atspi, buttons=5, panels=2)
+        db = tmp_path / "skeletons.sqlite3"
+        _session(atspi, db).get_elements("Editor")
+
+        panels[1].children[0].name = "Renamed"
+        elements = _session(atspi, db).get_elements("Editor")
+
+        labels = [e["label"] for e in elements]
+        assert "Renamed" in labels and "Button 1-0" not in labels
+
+    def test_node_added_below_unchanged_window_is_found(self, tmp_path):
+        atspi = FakeAtspi(supports_collection=False)
+        _, frame, panels = build_app(atspi, buttons=5, panels=2)
+        db = tmp_path / "skeletons.sqlite3"
+        _session(atspi, db).get_elements("Editor")
+        window_children = len(frame.children)
+
+        panels[1].add(
+            atspi.node(
+                "push button", "Added", extents=(300, 310, 30, 20), actions=["click"]
+            )
+        )
+        elements = _session(atspi, db).get_elements("Editor")
+
+        assert len(frame.children) == window_children
+        assert "Added" in [e["label"] for e in elements]
+
+    def test_search_before_first_walk(self, tmp_path):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=30, panels=3, labels=10)
+        db = tmp_path / "skeletons.sqlite3"
+        _session(atspi, db).get_elements("Editor")
+
+        acc = _session(atspi, db)
+        atspi.reset_calls()
+        skeleton = acc.get_skeleton_elements("Editor")
+        results = ElementIndex()
+        results.index_elements(skeleton)
+        found = results.search("Button 2-17")
+
+        assert atspi.round_trips < 10
+        assert found and found[0].label == "Button 2-17"
+        assert acc.click_by_id(found[0].element_id)[0]
+        assert acc.get_skeleton_elements("Editor") == []
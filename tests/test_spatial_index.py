@@ -0,0 +1,157 @@
+"""
+Tests for the grid spatial index used to map coordinates to elements.
+
+Query results are compared against brute-force scans over the same
+randomly generated snapshot.
+"""
+
+import math
+import random
+import time
+
+from pilot.tools.accessibility.spatial_index import SpatialIndex
+
+
+def _snapshot(count, seed=7):
+    rng = random.Random(seed)
+    elements = []
+    for i in range(count):
+        w, h = rng.randint(1, 120), rng.randint(1, 40)
+        x, y = rng.randint(0, 1900), rng.randint(0, 1060)
+        elements.append(
+            {
+                "element_id": f"e{i}",
+                "bounds": [x, y, w, h],
+                "center": [x + w // 2, y + h // 2],
+            }
+        )
+    elements.append(
+        {"element_id": "window", "bounds": [0, 0, 1920, 1080], "center": [960, 540]}
+    )
+    return elements
+
+
+def _inside(e, x, y):
+    bx, by, bw, bh = e["bounds"]
+    return bx <= x <= bx + bw and by <= y <= by + bh
+
+
+def _ids(elements):
+    return [e["element_id"] for e in elements]
+
+
+class TestSpatialIndex:
+    """Grid queries return exactly what a full scan would."""
+
+    def test_containing_matches_scan(self):
+        elements = _snapshot(2000)
+        index = SpatialIndex(elements)
+        rng = random.Random(1)
+
+        for _ in range(200):
+            x, y = rng.randint(0, 1920), rng.randint(0, 1080)
+            expected = [e for e in elements if _inside(e, x, y)]
+            assert _ids(index.containing(x, y)) == _ids(expected)
+
+    def test_edges_are_inside(self):
+        index = SpatialIndex([{"element_id": "a", "bounds": [10, 10, 54, 54]}])
+
+        assert _ids(index.containing(64, 64)) == ["a"]
+        assert index.containing(65, 64) == []
+
+    def test_intersecting_matches_scan(self):
+        elements = _snapshot(1000)
+        index = SpatialIndex(elements)
+        rect = (300, 200, 250, 120)
+
+        expected = [
+            e
+            for e in elements
+            if e["bounds"][0] <= rect[0] + rect[2]
+            and rect[0] <= e["bounds"][0] + e["bounds"][2]
+            and e["bounds"][1] <= rect[1] + rect[3]
+            and rect[1] <= e["bounds"][1] + e["bounds"][3]
+        ]
+        assert _ids(index.intersecting(rect)) == _ids(expected)
+
+    def test_nearest_matches_scan(self):
+        elements = _snapshot(1500)
+        index = SpatialIndex(elements)
+        rng = random.Random(2)
+
+        for _ in range(50):
+            x, y = rng.randint(-200, 2100), rng.randint(-200, 1200)
+            distances = sorted(
+                math.hypot(e["center"][0] - x, e["center"][1] - y) for e in elements
+            )
+            found = index.nearest(x, y, n=5)
+            got = [math.hypot(e["center"][0] - x, e["center"][1] - y) for e in found]
+            assert got == distances[:5]
+
+    def test_around_is_union_of_containing_and_radius(self):
+        elements = _snapshot(800)
+        index = SpatialIndex(elements)
+
+        found = _ids(index.around(500, 500, 100))
+
+        expected = [
+            e
+            for e in elements
+            if _inside(e, 500, 500)
+            or math.hypot(e["center"][0] - 500, e["center"][1] - 500) <= 100
+        ]
+        assert found == _ids(expected)
+
+    def test_ocr_matching_benchmark(self):
+        elements = _snapshot(600)
+        points = [
+            (random.Random(i).randint(0, 1920), random.Random(-i).randint(0, 1080))
+            for i in range(400)
+        ]
+
+        started = time.perf_counter()
+        scanned = [[e for e in elements if _inside(e, x, y)] for x, y in points]
+        scan_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        index = SpatialIndex(elements)
+        indexed = [index.containing(x, y) for x, y in points]
+        index_seconds = time.perf_counter() - started
+
+        print(
+            f"\n600 elements x 400 OCR boxes: scan {scan_seconds * 1000:.1f} ms, "
+            f"index (incl. build) {index_seconds * 1000:.1f} ms"
+        )
+        assert indexed == scanned
+
+
+class TestOcrLabels:
+    """_apply_ocr_labels assigns OCR text through the index."""
+
+    def test_best_ocr_item_inside_each_element_wins(self):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        from pilot.crew_tools.gui_basic_tools import _apply_ocr_labels
+
+        elements = [
+            {"role": "Button", "label": "button", "bounds": [0, 0, 50, 20]},
+            {"role": "Button", "label": "button", "bounds": [100, 0, 50, 20]},
+            {"role": "Button", "label": "Keep", "bounds": [200, 0, 50, 20]},
+        ]
+        screenshot = MagicMock()
+        screenshot_tool = SimpleNamespace(capture=lambda: screenshot)
+        ocr_items = [
+            SimpleNamespace(text="Low", center=(10, 10), confidence=0.5),
+            SimpleNamespace(text="Open", center=(20, 10), confidence=0.9),
+            SimpleNamespace(text="Save", center=(120, 10), confidence=0.8),
+            SimpleNamespace(text="Other", center=(220, 10), confidence=0.99),
+        ]
+        ocr_tool = SimpleNamespace(extract_all_text=lambda image: ocr_items)
+        registry = SimpleNamespace(
+            get_tool=lambda name: {"screenshot": screenshot_tool, "ocr": ocr_tool}[name]
+        )
+
+        _apply_ocr_labels(elements, "App", None, registry, "x", None)
+
+        assert [e["label"] for e in elements] == ["Open", "Save", "Keep"]
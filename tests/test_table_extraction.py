@@ -0,0 +1,189 @@
+"""
+Tests for bulk table extraction and addressable table cells.
+"""
+
+from unittest.mock import Mock, patch
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.crew_tools.gui_basic_tools import (
+    _format_elements_smart_compact,
+    _select_smart_compact_elements,
+)
+from pilot.crew_tools.gui_interaction_tools import ClickElementTool, ClickInput
+from pilot.tools.accessibility.tables import (
+    TableSnapshot,
+    describe_cell,
+    resolve_column,
+    visible_row_range,
+)
+
+ROWS = 500
+FIRST_VISIBLE = 200
+COLUMNS = ["From", "Subject", "Date"]
+
+
+def _messages(supports_collection=False):
+    """Editor app plus a 500-row table scrolled to row 201."""
+    atspi = FakeAtspi(supports_collection=supports_collection)
+    app, frame, _ = build_app(atspi, buttons=5, panels=1)
+    table = frame.add(atspi.node("table", "Messages", extents=(0, 300, 1200, 400)))
+    table.columns = list(COLUMNS)
+    for r in range(ROWS):
+        y = 300 + (r - FIRST_VISIBLE) * 20
+        row = table.add(atspi.node("table row", "", extents=(0, y, 1200, 20)))
+        for c, column in enumerate(COLUMNS):
+            row.add(
+                atspi.node(
+                    "table cell",
+                    f"{column} {r}",
+                    extents=(c * 400, y, 400, 20),
+                    actions=["click"],
+                )
+            )
+    return atspi, table
+
+
+class TestTableHelpers:
+    """Column resolution and visible-row search."""
+
+    def test_resolve_column(self):
+        assert resolve_column(COLUMNS, 3, "subject") == 1
+        assert resolve_column(COLUMNS, 3, "Da") == 2
+        assert resolve_column(COLUMNS, 3, "3") == 2
+        assert resolve_column(COLUMNS, 3, None) == 0
+        assert resolve_column(COLUMNS, 3, 4) is None
+        assert resolve_column(COLUMNS, 3, "Size") is None
+        assert describe_cell(["", "Subject"], 7, 0) == "row 7, column 1"
+
+    def test_visible_row_range_reads_few_rows(self):
+        read = []
+
+        def row_extent(r):
+            read.append(r)
+            return (r * 10, 10)
+
+        start, end = visible_row_range(10_000, row_extent, (0, 50_000, 100, 100), 50)
+
+        assert (start, end) == (5_000, 5_010)
+        assert len(read) < 30
+
+    def test_snapshot_round_trip(self):
+        snapshot = TableSnapshot(3, ["A"], first_row=2, cells=[["x"], ["y"]])
+
+        assert TableSnapshot.from_dict(snapshot.to_dict()) == snapshot
+        assert snapshot.last_row == 3
+
+
+class TestLinuxTables:
+    """Tables are read through the Table interface instead of walked."""
+
+    def test_snapshot_holds_visible_rows(self):
+        atspi, _ = _messages()
+        acc = make_linux_accessibility(atspi)
+
+        atspi.reset_calls()
+        elements = acc.get_elements("Editor")
+
+        table = next(e for e in elements if e["role"] == "Table")
+        snapshot = TableSnapshot.from_dict(table["table"])
+        assert (snapshot.rows, snapshot.columns) == (ROWS, COLUMNS)
+        assert snapshot.first_row == FIRST_VISIBLE + 1 and len(snapshot.cells) == 20
+        assert snapshot.cells[0] == ["From 200", "Subject 200", "Date 200"]
+        assert not any(e["role"] in ("TableCell", "TableRow") for e in elements)
+        assert atspi.calls["getAccessibleAt"] < 20 * 3 + 30
+        assert atspi.calls["getChildAtIndex"] < 20
+
+    def test_click_cell_by_header(self):
+        atspi, table = _messages()
+        acc = make_linux_accessibility(atspi)
+        table_id = next(e for e in acc.get_elements("Editor") if "table" in e)[
+            "element_id"
+        ]
+
+        success, message = acc.click_table_cell(table_id, 212, "subject")
+
+        assert success and "row 212, column Subject" in message
+        assert table.children[211].children[1].performed
+        assert not acc.click_table_cell(table_id, ROWS + 1)[0]
+        assert not acc.click_table_cell(table_id, 1, "Size")[0]
+
+    def test_click_cell_without_action_selects_row(self):
+        atspi, table = _messages()
+        table.children[4].children[0].actions = []
+        acc = make_linux_accessibility(atspi)
+        table_id = next(e for e in acc.get_elements("Editor") if "table" in e)[
+            "element_id"
+        ]
+
+        assert acc.click_table_cell(table_id, 5)[0]
+        assert table.selected_rows == {4}
+
+    def test_click_tool_accepts_column_number(self):
+        atspi, table = _messages()
+        acc = make_linux_accessibility(atspi)
+        table_id = next(e for e in acc.get_elements("Editor") if "table" in e)[
+            "element_id"
+        ]
+        args = ClickInput(element_id=table_id, row=212, column=3)
+        tool = ClickElementTool()
+        tool._tool_registry = Mock(get_tool={"accessibility": acc}.get)
+
+        with patch(
+            "pilot.crew_tools.gui_interaction_tools.check_cancellation",
+            return_value=None,
+        ):
+            result = tool._run(
+                element_id=args.element_id, row=args.row, column=args.column
+            )
+
+        assert args.column == 3
+        assert result.success and "row 212, column Date" in result.action_taken
+        assert table.children[211].children[2].performed
+
+    def test_collection_path_drops_cells(self):
+        atspi, _ = _messages(supports_collection=True)
+        acc = make_linux_accessibility(atspi)
+
+        elements = acc.get_elements("Editor")
+
+        assert [e["role"] for e in elements if "table" in e] == ["Table"]
+        assert not any(e["role"] == "TableCell" for e in elements)
+
+    def test_repair_rereads_changed_cell(self):
+        atspi, table = _messages()
+        acc = make_linux_accessibility(atspi)
+        acc.get_elements("Editor")
+
+        atspi.rename(table.children[FIRST_VISIBLE].children[1], "Re: Lunch")
+        elements = acc.get_elements("Editor")
+
+        snapshot = next(e for e in elements if "table" in e)["table"]
+        assert snapshot["cells"][0][1] == "Re: Lunch"
+
+    def test_disabled_extraction_walks_cells(self):
+        atspi, _ = _messages()
+        acc = make_linux_accessibility(atspi)
+        acc.table_extraction.enabled = False
+        acc.expansion.min_children = 0
+
+        elements = acc.get_elements("Editor")
+
+        assert not any("table" in e for e in elements)
+        rows_in_window = 800 // 20
+        assert sum(e["role"] == "TableCell" for e in elements) == rows_in_window * 3
+
+
+class TestTableDisplay:
+    """Tables survive compact selection and show their visible rows."""
+
+    def test_table_is_listed(self):
+        atspi, _ = _messages()
+        elements = make_linux_accessibility(atspi).get_elements("Editor")
+
+        selected, _ = _select_smart_compact_elements(elements, max_total=3)
+        summary = _format_elements_smart_compact(selected, 0)
+
+        assert "[500 rows × 3 columns: From | Subject | Date]" in summary
+        assert "  row 201: From 200 | Subject 200 | Date 200" in summary
+        assert "(rows 201-210 of 500 shown)" in summary
@@ -0,0 +1,103 @@
+"""
+Tests for document text read through the Text interface.
+"""
+
+from unittest.mock import Mock, patch
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.crew_tools.gui_basic_tools import ReadScreenTextTool
+
+LINES = 400
+CHUNK = 1000
+
+
+def _terminal(track_changes=True):
+    """Editor app with a terminal buffer, an unnamed paragraph and a password."""
+    atspi = FakeAtspi(supports_collection=False)
+    app, frame, _ = build_app(atspi, buttons=2, panels=1)
+    terminal = frame.add(
+        atspi.node("terminal", "Terminal", extents=(0, 300, 1200, 400))
+    )
+    terminal.text = "".join(f"line {i}: build step output\n" for i in range(LINES))
+    paragraph = frame.add(atspi.node("paragraph", "", extents=(0, 720, 600, 40)))
+    paragraph.text = "Release notes\ufffc for 2.0"
+    password = frame.add(atspi.node("password text", "PIN", extents=(0, 770, 200, 20)))
+    password.text = "hunter2"
+    acc = make_linux_accessibility(atspi, track_changes=track_changes)
+    acc._texts.chunk_size = CHUNK
+    return atspi, acc, terminal
+
+
+class TestLinuxTextExtraction:
+    """Text-bearing nodes are read in chunks and cached until they change."""
+
+    def test_reads_document_text_in_chunks(self):
+        atspi, acc, terminal = _terminal()
+
+        atspi.reset_calls()
+        texts = acc.get_text("Editor")
+
+        document = [t for t in texts if t.startswith("line ")]
+        assert "".join(document) == terminal.text
+        assert all(t.endswith("\n") for t in document)
+        assert atspi.calls["getText"] == len(terminal.text) // CHUNK + 2
+        assert "Release notes for 2.0" in texts
+        assert "Terminal" in texts and "PIN" in texts
+        assert "hunter2" not in texts
+
+    def test_stream_yields_before_document_is_read(self):
+        atspi, acc, _ = _terminal()
+        stream = acc.stream_text("Editor")
+
+        first = next(t for t in stream if t.startswith("line "))
+
+        assert first.startswith("line 0:")
+        assert atspi.calls["getText"] == 1
+
+    def test_cached_until_text_changes(self):
+        atspi, acc, terminal = _terminal()
+        acc.get_text("Editor")
+
+        atspi.reset_calls()
+        acc.get_text("Editor")
+        cached_reads = atspi.calls["getText"]
+
+        atspi.set_text(terminal, "$ make\nok\n")
+        texts = acc.get_text("Editor")
+
+        assert cached_reads == 0
+        assert atspi.calls["getText"] == 1
+        assert "$ make\nok\n" in texts
+
+    def test_rereads_without_change_tracking(self):
+        atspi, acc, _ = _terminal(track_changes=False)
+        acc.get_text("Editor")
+
+        atspi.reset_calls()
+        acc.get_text("Editor")
+
+        assert atspi.calls["getText"] > 0
+
+
+class TestReadScreenText:
+    """Reading an app's text prefers the accessibility API over OCR."""
+
+    def test_reads_without_ocr(self):
+        _, acc, terminal = _terminal()
+        ocr = Mock()
+        tools = {"accessibility": acc, "ocr": ocr}
+        registry = Mock(get_tool=tools.get)
+        tool = ReadScreenTextTool(max_accessible_chars=5_000)
+        tool._tool_registry = registry
+
+        with patch(
+            "pilot.crew_tools.gui_basic_tools.check_cancellation", return_value=None
+        ):
+            result = tool._run(app_name="Editor")
+
+        assert result.success and result.method_used == "accessibility"
+        assert result.data["truncated"]
+        assert "line 0: build step output\nline 1:" in result.data["text"]
+        assert acc._texts.chunks_read < len(terminal.text) // CHUNK
+        ocr.extract_all_text.assert_not_called()
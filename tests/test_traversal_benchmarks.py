@@ -0,0 +1,132 @@
+"""
+Benchmarks for traversal, element IDs, search and compact selection.
+
+Runs against generated trees (see build_synthetic_app), so it needs no
+desktop session. Each benchmark fails if its median exceeds the regression
+threshold for its size; thresholds are several times the medians measured
+on a developer laptop, so only real regressions trip them. The 100k-node
+cases are marked slow (use --run-slow). Compare runs with
+pytest-benchmark's --benchmark-autosave / --benchmark-compare.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from tests.fake_atspi import (
+    FakeAtspi,
+    SyntheticTreeSpec,
+    build_synthetic_app,
+    make_linux_accessibility,
+)
+
+from pilot.crew_tools.gui_basic_tools import _select_smart_compact_elements
+from pilot.services.element_index import ElementIndex
+from pilot.tools.accessibility.element_store import SimpleElementStore
+
+APP_NAME = "Synthetic"
+SIZES = [
+    pytest.param(1_000, id="1k"),
+    pytest.param(10_000, id="10k"),
+    pytest.param(100_000, id="100k", marks=pytest.mark.slow),
+]
+QUERIES = ["save", "export settings", "R10C2", "downlaod", "check box"]
+
+THRESHOLDS = {
+    "get_elements": {1_000: 0.25, 10_000: 2.5, 100_000: 30.0},
+    "store": {1_000: 0.05, 10_000: 0.5, 100_000: 6.0},
+    "search": {1_000: 0.01, 10_000: 0.03, 100_000: 0.15},
+    "select_compact": {1_000: 0.01, 10_000: 0.1, 100_000: 1.0},
+}
+"""Maximum median seconds per benchmark and tree size."""
+
+ROUNDS = {1_000: 10, 10_000: 5, 100_000: 2}
+
+
+def _spec(nodes):
+    return SyntheticTreeSpec(nodes=nodes, tables=max(1, nodes // 5_000))
+
+
+class _Tree:
+    """A generated app and the elements of one walk over it."""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.atspi = FakeAtspi(supports_collection=False)
+        build_synthetic_app(self.atspi, APP_NAME, _spec(nodes))
+        self.accessibility = make_linux_accessibility(self.atspi, track_changes=False)
+        self.elements = self.accessibility.get_elements(APP_NAME, use_cache=False)
+
+
+@pytest.fixture(scope="module")
+def tree(request):
+    return _Tree(request.param)
+
+
+def _check_threshold(benchmark, name, nodes):
+    if benchmark.stats is None:
+        return
+    median = benchmark.stats.stats.median
+    limit = THRESHOLDS[name][nodes]
+    assert median <= limit, f"{name} at {nodes} nodes: {median:.4f}s > {limit}s"
+
+
+@pytest.mark.parametrize("tree", SIZES, indirect=True)
+class TestTraversalBenchmarks:
+    """Median cost of each stage on generated trees of growing size."""
+
+    def test_get_elements(self, benchmark, tree):
+        acc = tree.accessibility
+        nodes = tree.nodes
+
+        elements = benchmark.pedantic(
+            acc.get_elements,
+            args=(APP_NAME,),
+            kwargs={"use_cache": False},
+            rounds=ROUNDS[nodes],
+        )
+
+        assert len(elements) == len(tree.elements)
+        _check_threshold(benchmark, "get_elements", nodes)
+
+    def test_store(self, benchmark, tree):
+        nodes = tree.nodes
+
+        def store_all(store):
+            for element in tree.elements:
+                store.store(element, APP_NAME)
+            return store
+
+        store = benchmark.pedantic(
+            store_all,
+            setup=lambda: ((SimpleElementStore(),), {}),
+            rounds=ROUNDS[nodes],
+        )
+
+        assert store.count == len({e["element_id"] for e in tree.elements})
+        _check_threshold(benchmark, "store", nodes)
+
+    def test_search(self, benchmark, tree):
+        nodes = tree.nodes
+        index = ElementIndex()
+        index.index_elements(tree.elements)
+
+        results = benchmark.pedantic(
+            lambda: [index.search(query) for query in QUERIES],
+            rounds=ROUNDS[nodes],
+        )
+
+        assert all(results[:3])
+        _check_threshold(benchmark, "search", nodes)
+
+    def test_select_compact(self, benchmark, tree):
+        nodes = tree.nodes
+
+        selected, hidden = benchmark.pedantic(
+            _select_smart_compact_elements,
+            args=(tree.elements, 30),
+            rounds=ROUNDS[nodes],
+        )
+
+        assert len(selected) + hidden == len(tree.elements)
+        _check_threshold(benchmark, "select_compact", nodes)
@@ -0,0 +1,96 @@
+"""
+Tests for optional traversal instrumentation.
+"""
+
+from collections import Counter
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.tools.accessibility.instrumentation import (
+    CountingProxy,
+    TraversalProfiler,
+    format_profile,
+)
+
+
+class TestTraversalProfiler:
+    """The profiler aggregates timing by role path."""
+
+    def test_role_paths_and_histogram(self):
+        profiler = TraversalProfiler()
+        profiler.begin_walk()
+        root = profiler.enter()
+        profiler.visited(root, "frame")
+        for _ in range(3):
+            child = profiler.enter()
+            profiler.visited(child, "push button")
+            profiler.leave(child)
+        profiler.leave(root)
+
+        report = profiler.report()
+        paths = {e["path"]: e for e in report["slowest_subtrees"]}
+        assert report["nodes"] == 4
+        assert sum(b["count"] for b in report["histogram"]) == 4
+        assert paths["frame/push button"]["nodes"] == 3
+        assert paths["frame"]["total_ms"] >= paths["frame/push button"]["total_ms"]
+
+    def test_proxy_counts_calls_not_lookups(self):
+        class Node:
+            name = "OK"
+
+            def getRoleName(self):
+                return "push button"
+
+        counts = Counter()
+        proxy = CountingProxy(Node(), counts)
+
+        assert hasattr(proxy, "getRoleName")
+        assert proxy.getRoleName() == "push button"
+        assert proxy.name == "OK"
+        assert counts == {"getRoleName": 1, "name": 1}
+        assert proxy.role_name == "push button"
+
+
+class TestLinuxInstrumentation:
+    """Instrumented Linux walks report the same IPC the fake desktop saw."""
+
+    def test_ipc_counts_match_round_trips(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=8, panels=3, labels=4)
+        acc = make_linux_accessibility(atspi)
+        profiler = acc.enable_profiling(top_n=3)
+        app = acc.get_app("Editor")
+        windows = acc.get_windows(app)
+        atspi.reset_calls()
+
+        elements = []
+        for window in windows:
+            acc._walker.walk_window(acc, window, elements, True, "editor")
+        report = acc.get_traversal_profile()
+
+        assert report["nodes"] == 1 + 3 + 3 * (8 + 4)
+        assert report["ipc"]["getState"] == atspi.calls["getState"]
+        assert report["ipc"]["childCount"] == atspi.calls["childCount"]
+        assert report["slowest_subtrees"][0]["path"].startswith("frame/panel/")
+        assert len(report["slowest_subtrees"]) == 3
+        assert all(e.native_ref is not None for e in elements)
+        assert not any(isinstance(e.native_ref, CountingProxy) for e in elements)
+        assert acc.click_by_id(elements[-1]["element_id"])[0]
+        assert profiler.walks == 0
+
+    def test_disabled_profiling_reports_nothing(self):
+        atspi = FakeAtspi(supports_collection=False)
+        build_app(atspi, buttons=3)
+        acc = make_linux_accessibility(atspi)
+
+        acc.get_elements("Editor")
+        assert acc.profiler is None
+        assert acc.get_traversal_profile() == {}
+
+        acc.enable_profiling()
+        acc.get_elements("Editor", use_cache=False)
+        report = acc.disable_profiling()
+
+        assert report["walks"] == 1 and report["nodes"] > 0
+        assert format_profile(report)[0].startswith("Traversal:")
+        assert acc.profiler is None
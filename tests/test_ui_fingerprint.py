@@ -0,0 +1,129 @@
+"""
+Tests for reusing cached snapshots when the UI fingerprint is unchanged.
+
+Runs against the in-memory pyatspi stand-in from fake_atspi.
+"""
+
+from tests.fake_atspi import FakeAtspi, build_app, make_linux_accessibility
+
+from pilot.tools.accessibility.fingerprint import UIFingerprint, WindowFingerprint
+
+
+def _labels(elements):
+    return [e["label"] for e in elements]
+
+
+def _add_dialog(atspi, app, buttons=20):
+    dialog = app.add(atspi.node("dialog", "Find", extents=(0, 0, 1200, 800)))
+    for b in range(buttons):
+        dialog.add(
+            atspi.node(
+                "push button",
+                f"Find {b}",
+                extents=(b * 40, 400, 30, 20),
+                actions=["click"],
+            )
+        )
+    return dialog
+
+
+class TestUIFingerprint:
+    """changed_windows() names only the windows that differ."""
+
+    def test_changed_and_new_windows(self):
+        before = UIFingerprint(
+            (
+                WindowFingerprint("a", "frame", "Doc", 3, True),
+                WindowFingerprint("b", "dialog", "Find", 2, False),
+            )
+        )
+        after = UIFingerprint(
+            (
+                WindowFingerprint("a", "frame", "Doc", 3, True),
+                WindowFingerprint("b", "dialog", "Find", 4, False),
+                WindowFingerprint("c", "dialog", "Replace", 1, False),
+            )
+        )
+
+        assert after.changed_windows(before) == ["b", "c"]
+        assert after.window_set_changed(before)
+
+    def test_focus_change_points_at_active_window(self):
+        windows = (
+            WindowFingerprint("a", "frame", "Doc", 3, True),
+            WindowFingerprint("b", "dialog", "Find", 2, False),
+        )
+
+        after = UIFingerprint(windows, focused="field")
+
+        assert after.changed_windows(UIFingerprint(windows)) == ["a"]
+
+
+class TestRevalidateCache:
+    """revalidate_cache() keeps snapshots the probe confirms."""
+
+    def test_unchanged_ui_reuses_snapshot_without_walk(self):
+        atspi = FakeAtspi()
+        build_app(atspi, buttons=50, panels=4)
+        acc = make_linux_accessibility(atspi, track_changes=False)
+
+        assert acc.revalidate_cache("Editor") is False
+        first = acc.get_elements("Editor")
+        atspi.reset_calls()
+
+        assert acc.revalidate_cache("Editor") is True
+        probe_calls = atspi.round_trips
+        second = acc.get_elements("Editor")
+
+        assert second is first
+        assert probe_calls <= 8
+        assert atspi.round_trips == probe_calls
+
+    def test_only_changed_window_is_rewalked(self):
+        atspi = FakeAtspi(supports_collection=False)
+        app, frame, _ = build_app(atspi, buttons=30, panels=3)
+        _add_dialog(atspi, app)
+        acc = make_linux_accessibility(atspi, track_changes=False)
+        acc.revalidate_cache("Editor")
+        acc.get_elements("Editor")
+
+        app.children[1].children[0].name = "Find next"
+        app.children[1].add(
+            atspi.node(
+                "push button", "Close", extents=(900, 500, 30, 20), actions=["click"]
+            )
+        )
+        atspi.reset_calls()
+
+        assert acc.revalidate_cache("Editor") is False
+        elements = acc.get_elements("Editor")
+
+        labels = _labels(elements)
+        assert "Close" in labels and "Find next" in labels
+        assert "Button 2-29" in labels
+        assert atspi.calls["getRoleName"] < 40
+
+    def test_interaction_forces_full_walk(self):
+        atspi = FakeAtspi()
+        build_app(atspi, buttons=5)
+        acc = make_linux_accessibility(atspi, track_changes=False)
+        acc.revalidate_cache("Editor")
+        elements = acc.get_elements("Editor")
+
+        button = next(e for e in elements if e["label"] == "Button 0-1")
+        assert acc.click_by_id(button["element_id"])[0]
+        atspi.reset_calls()
+
+        assert acc.revalidate_cache("Editor") is False
+        acc.get_elements("Editor")
+        assert atspi.calls["getRoleName"] > 5
+
+    def test_default_implementation_invalidates(self):
+        from unittest.mock import Mock
+
+        from pilot.tools.accessibility.protocol import AccessibilityProtocol
+
+        backend = Mock(spec=AccessibilityProtocol)
+
+        assert AccessibilityProtocol.revalidate_cache(backend, "Notes") is False
+        backend.invalidate_cache.assert_called_once_with("Notes")